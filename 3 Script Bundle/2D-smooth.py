@@ -1,6 +1,6 @@
 # this script is used to generate an ICEM model with user defined dimensions and mesh parameters
 # geometry type: 2D, smooth reactor wall
-# the files rpl_gen_fnc.py and rpl_gen_obj.py are required to run this file
+# the files rpl_gen_fnc.py, rpl_gen_obj.py and rpl_gen_mdl.py are required to run this file
 
 
 # specify part names (retaining default names recommended)
@@ -24,7 +24,9 @@ size_ymax = 1e-4            # maximum y cell size [m]
 # dependencies
 import rpl_gen_fnc as fnc                       # function source file
 import rpl_gen_obj as obj                       # class source file
+import rpl_gen_mdl as mdl                       # model source file
 import os                                       # operating system operations
+import sys                                      # command line arguments
 from colorama import Fore, Style, init          # console output formatting (validated to run on a windows system)
 
 
@@ -33,11 +35,32 @@ geomprec = obj.geomprec             # numerical precision for geometry operation
 meshprec = obj.meshprec             # numerical precision for mesh calculations
 
 
+# part names and cell sizes of default meshing for model generation
+names = {"fluid": name_fluid, "finlet": name_finlet, "fwall": name_fwall, "foutlet": name_foutlet, "gwall": name_gwall, "gtop": name_gtop, "distr": name_distr}
+sizes = {"film": size_film, "distr": size_distr, "xmax": size_xmax, "ymax": size_ymax}
+
+
 ################################################################# PROGRAM START #################################################################
 # initialize console formatting
 init(autoreset=True)
 
 
+# cell budget given as command line option (--max-cells), checked before the files are written
+maxcells, args = fnc.getmaxcells(sys.argv)
+
+
+# mesh files given as command line option (--export msh), written next to the .rpl file
+exports, args = fnc.getexports(args)
+
+
+# preview of geometry and meshed edges given as command line option (--preview), written next to the .rpl file
+preview, args = fnc.getpreview(args)
+
+
+# read parameter file given as command line argument, no user input required if specified
+spec = fnc.getspec(args)
+
+
 # change to directory containing the script
 sourcedir = os.path.dirname(os.path.abspath(__file__))
 os.chdir(sourcedir)
@@ -51,582 +74,357 @@ print("For information on how to use this script, please refer to the documentat
 print("\nIf not already present, it will create a project folder containing:\n\t> .rpl file to be read into ICEM\n\t> .conf file containing the parameters specified")
 print("The created folder will be located in a folder corresponding to the geometry variant.")
 print("\nSteps to generate the mesh in ICEM:\n\t1) Load the .rpl file (File > Replay Scripts > Load script file)\n\t2) Execute all commands (do all)")
-input("\nPress any key to continue...")
-
+if spec is None:
+    input("\nPress any key to continue...")
+
+
+# parameter file input, no user input required
+if spec is not None:
+    # reference config file in script folder and subfolders
+    fnc.specconf(sourcedir, spec)
+
+    # model generation from parameter file
+    try:
+        model = mdl.build_2d_smooth(spec, names, sizes)
+    except ValueError as err:
+        fnc.specerror(str(err))
+    geomtype = model.getgeomtype()
+    print(f"\nGeometry variant: {Fore.GREEN}'{geomtype}'{Style.RESET_ALL}")
+    if spec.get("meshing") == "nearest":
+        print(f"{Fore.GREEN}\nMeshing with closest config file ~\\{os.path.relpath(model.getmeshref(), sourcedir)}{Style.RESET_ALL}")
+
+    # create and change to variant folder
+    folderdir = os.path.join(sourcedir, geomtype)
+    if not os.path.exists(folderdir):
+        os.makedirs(folderdir)
+        print(f"\nCreated new folder {Fore.GREEN}~\{geomtype}{Style.RESET_ALL} for current variant.")
+    os.chdir(folderdir)
+
+    # project name from parameter file
+    projname = fnc.specname(folderdir, spec)
+
+    # filename definition
+    print(f"\nCreating ICEM project {Fore.GREEN}'{projname}'.{Style.RESET_ALL}")
+    rplfile = projname + ".rpl"
+    conffile = projname + ".conf"
+    projdir = os.path.join(folderdir, projname)
+
+    # print summary of geometric and meshing parameters
+    print(f"{Style.BRIGHT}\n\nSummary of geometric parameters:{Style.RESET_ALL}")
+    for dim, geoms in zip(["x", "y", "z"], model.getgeoms()):
+        print(f"{dim}-dimension:")
+        for geom in geoms:
+            geom.printinfo()
+    print(f"{Style.BRIGHT}\n\nSummary of meshing parameters:{Style.RESET_ALL}")
+    for dim, sects in zip(["x", "y", "z"], model.getsects()):
+        print(f"{dim}-dimension:")
+        for sect in sects:
+            sect.printinfo()
 
-# input geometry type
-print(f"{Style.BRIGHT}\n\n############################################################### GEOMETRY VARIANTS ###############################################################{Style.RESET_ALL}")
-print("\n\nDifferent variants are available for the film inlet region of the geometry.\nSee documentation for the differences between the variants.")
 
+# user input
+else:
+    # input geometry type
+    print(f"{Style.BRIGHT}\n\n############################################################### GEOMETRY VARIANTS ###############################################################{Style.RESET_ALL}")
+    print("\n\nDifferent variants are available for the film inlet region of the geometry.\nSee documentation for the differences between the variants.")
 
-geomtype = "2D-smooth-"
-xgeom = []
-ygeom = []
 
-# film inlet variants
-while True:
-    print("\nAvailable film inlet variants:")
-    print("\t- 1: Domain with simple film inlet region\n\t\t- suitable for periodic boundaries")
-    print("\t- 2: Domain with additional gas space above film inlet")
-    q_inlettype = input("Choose inlet variant to be created:\n>>> ")
+    geomtype = "2D-smooth-"
 
-    if q_inlettype == "1" or q_inlettype == "2": 
-        break
-    else:
-        print(f"{Fore.RED}Invalid input.{Style.RESET_ALL} Please enter the number corresponding to the variant.")
-
-# film outlet variants
-q_outlettype = "1"
-
-# geometric variants
-if q_inlettype == "1" and q_outlettype == "1":
-    # type 1
-    # simple film inlet
-    # simple film outlet
-    geomtype += "1"
-    geomnum = 1
-
-elif q_inlettype == "2" and q_outlettype == "1":
-    # type 2
-    # additional gas space above film inlet
-    # simple film outlet
-    geomtype += "2"
-    geomnum = 2
-
-# periodic boundaries for type 1
-if geomnum == 1:
+    # film inlet variants
     while True:
-        q_periodic = input("\nUse periodic boundaries? (y/n)\n>>> ").lower()
+        print("\nAvailable film inlet variants:")
+        print("\t- 1: Domain with simple film inlet region\n\t\t- suitable for periodic boundaries")
+        print("\t- 2: Domain with additional gas space above film inlet")
+        q_inlettype = input("Choose inlet variant to be created:\n>>> ")
 
-        if q_periodic == "y":
-            periodic = True
-            break
-        elif q_periodic == "n":
-            periodic = False
+        if q_inlettype == "1" or q_inlettype == "2": 
             break
         else:
-            print(f"{Fore.RED}Invalid input.{Style.RESET_ALL} Please enter 'y' or 'n'.")
-else:
-    periodic = False
+            print(f"{Fore.RED}Invalid input.{Style.RESET_ALL} Please enter the number corresponding to the variant.")
+
+    # film outlet variants
+    q_outlettype = "1"
+
+    # geometric variants
+    if q_inlettype == "1" and q_outlettype == "1":
+        # type 1
+        # simple film inlet
+        # simple film outlet
+        geomtype += "1"
+        geomnum = 1
+
+    elif q_inlettype == "2" and q_outlettype == "1":
+        # type 2
+        # additional gas space above film inlet
+        # simple film outlet
+        geomtype += "2"
+        geomnum = 2
+
+    # periodic boundaries for type 1
+    if geomnum == 1:
+        while True:
+            q_periodic = input("\nUse periodic boundaries? (y/n)\n>>> ").lower()
 
-print(f"\nGeometry variant: {Fore.GREEN}'{geomtype}'{Style.RESET_ALL}") 
+            if q_periodic == "y":
+                periodic = True
+                break
+            elif q_periodic == "n":
+                periodic = False
+                break
+            else:
+                print(f"{Fore.RED}Invalid input.{Style.RESET_ALL} Please enter 'y' or 'n'.")
+    else:
+        periodic = False
 
-# add xgeom objects
-xgeom.append(obj.Geometry(obj.ht_geomname, obj.ht_geomdescr))
-xgeom.append(obj.Geometry(obj.hi_geomname, obj.hi_geomdescr))
-xgeom.append(obj.Geometry(obj.hd_geomname, obj.hd_geomdescr))
+    print(f"\nGeometry variant: {Fore.GREEN}'{geomtype}'{Style.RESET_ALL}") 
 
-# add ygeom objects
-ygeom.append(obj.Geometry(obj.lt_geomname, obj.lt_geomdescr))
-if q_inlettype == "2":
-    ygeom.append(obj.Geometry(obj.lag_geomname, obj.lag_geomdescr))         # inlet type 2
+    # geometry objects of variant
+    xgeom, ygeom = mdl.geometry_2d_smooth(q_inlettype)
 
-# create and change to variant folder 
-folderdir = os.path.join(sourcedir, geomtype)
-if not os.path.exists(folderdir):
-    os.makedirs(folderdir)
-    print(f"\nCreated new folder {Fore.GREEN}~\{geomtype}{Style.RESET_ALL} for current variant.")
-os.chdir(folderdir)
+    # create and change to variant folder 
+    folderdir = os.path.join(sourcedir, geomtype)
+    if not os.path.exists(folderdir):
+        os.makedirs(folderdir)
+        print(f"\nCreated new folder {Fore.GREEN}~\{geomtype}{Style.RESET_ALL} for current variant.")
+    os.chdir(folderdir)
 
 
-# project name input
-print(f"{Style.BRIGHT}\n\n############################################################### PROJECT DEFINITION ##############################################################{Style.RESET_ALL}")
-while True:    
-    projname = input("Choose ICEM project name:\n>>> ")
+    # project name input
+    print(f"{Style.BRIGHT}\n\n############################################################### PROJECT DEFINITION ##############################################################{Style.RESET_ALL}")
+    while True:    
+        projname = input("Choose ICEM project name:\n>>> ")
     
-    if fnc.checkname(folderdir, projname):
-        break
+        if fnc.checkname(folderdir, projname):
+            break
 
-# filename definition
-print(f"\nCreating ICEM project {Fore.GREEN}'{projname}'.{Style.RESET_ALL}")
-rplfile = projname + ".rpl"
-conffile = projname + ".conf"
-projdir = os.path.join(folderdir, projname)
+    # filename definition
+    print(f"\nCreating ICEM project {Fore.GREEN}'{projname}'.{Style.RESET_ALL}")
+    rplfile = projname + ".rpl"
+    conffile = projname + ".conf"
+    projdir = os.path.join(folderdir, projname)
 
 
-# read from existing config file
-print(f"{Style.BRIGHT}\n\n############################################################# REFERENCE FILE INPUT ##############################################################{Style.RESET_ALL}")
-while True:
-    # query to read from .conf file
-    q_conf = input("Use an existing config file for input parameters? (y/n)\n>>> ").lower()
+    # read from existing config file
+    print(f"{Style.BRIGHT}\n\n############################################################# REFERENCE FILE INPUT ##############################################################{Style.RESET_ALL}")
+    while True:
+        # query to read from .conf file
+        q_conf = input("Use an existing config file for input parameters? (y/n)\n>>> ").lower()
     
-    if q_conf == "y":
-        # get reference config file
-        refconffile = fnc.getconf(sourcedir, geomtype)
-        break
-    elif q_conf == "n":
-        break
-    else:
-        print(f"{Fore.RED}Invalid input.{Style.RESET_ALL} Please enter 'y' or 'n'.\n")    
+        if q_conf == "y":
+            # get reference config file
+            refconffile = fnc.getconf(sourcedir, geomtype)
+            break
+        elif q_conf == "n":
+            break
+        else:
+            print(f"{Fore.RED}Invalid input.{Style.RESET_ALL} Please enter 'y' or 'n'.\n")    
  
     
-################################################################ PARAMETER INPUT ################################################################
-print(f"{Style.BRIGHT}\n\n################################################################ PARAMETER INPUT ################################################################{Style.RESET_ALL}")
+    ################################################################ PARAMETER INPUT ################################################################
+    print(f"{Style.BRIGHT}\n\n################################################################ PARAMETER INPUT ################################################################{Style.RESET_ALL}")
 
 
-# geometric parameters
-print("\n\n############################################################## GEOMETRIC PARAMETERS #############################################################")
-while True:
-    # reference data only available if reference file has been defined
-    if q_conf == "y":
-        while True:
-            # query whether geometry data from config file should be used
-            q_confgeom = input("Use config file data for geometric parameters? (y/n)\n>>> ").lower()
-            if q_confgeom == "y":
-                break               
-            elif q_confgeom == "n":
-                print()
-                print()
-                break
-            else:
-                print(f"{Fore.RED}Invalid input.{Style.RESET_ALL} Please enter 'y' or 'n'.")
-    else:
-        q_confgeom = "n"
+    # geometric parameters
+    print("\n\n############################################################## GEOMETRIC PARAMETERS #############################################################")
+    while True:
+        # reference data only available if reference file has been defined
+        if q_conf == "y":
+            while True:
+                # query whether geometry data from config file should be used
+                q_confgeom = input("Use config file data for geometric parameters? (y/n)\n>>> ").lower()
+                if q_confgeom == "y":
+                    break               
+                elif q_confgeom == "n":
+                    print()
+                    print()
+                    break
+                else:
+                    print(f"{Fore.RED}Invalid input.{Style.RESET_ALL} Please enter 'y' or 'n'.")
+        else:
+            q_confgeom = "n"
 
-    # using file input for geometric parameters
-    if q_confgeom == "y":
-        # extract and assign xgeom
-        confxgeom = fnc.getconfgeom(refconffile, "xgeom")
-        fnc.assignconfgeom(xgeom, confxgeom)
+        # using file input for geometric parameters
+        if q_confgeom == "y":
+            # extract and assign xgeom
+            confxgeom = fnc.getconfgeom(refconffile, "xgeom")
+            fnc.assignconfgeom(xgeom, confxgeom)
         
-        # check xgeom for nonzero values and valid dimensions
-        if not fnc.checkgeom(xgeom) or not fnc.checkxgeom(xgeom):
-            # manual geometry input
-            fnc.setxgeom(xgeom)
+            # check xgeom for nonzero values and valid dimensions
+            if not fnc.checkgeom(xgeom) or not fnc.checkxgeom(xgeom):
+                # manual geometry input
+                fnc.setxgeom(xgeom)
             
-            # reference meshing not available if geometry allocation failed
-            q_confgeom = "n"
+                # reference meshing not available if geometry allocation failed
+                q_confgeom = "n"
 
 
-        # extract and assign ygeom
-        confygeom = fnc.getconfgeom(refconffile, "ygeom")
-        fnc.assignconfgeom(ygeom, confygeom)
+            # extract and assign ygeom
+            confygeom = fnc.getconfgeom(refconffile, "ygeom")
+            fnc.assignconfgeom(ygeom, confygeom)
         
-        # check ygeom for nonzero values and valid dimensions
-        if not fnc.checkgeom(ygeom):
-            # manual geometry input
-            fnc.setygeom_smooth(ygeom)
+            # check ygeom for nonzero values and valid dimensions
+            if not fnc.checkgeom(ygeom):
+                # manual geometry input
+                fnc.setygeom_smooth(ygeom)
 
-            # reference meshing not available if geometry allocation failed
-            q_confgeom = "n"
+                # reference meshing not available if geometry allocation failed
+                q_confgeom = "n"
 
         
-    # user defined input of geometric features
-    if q_conf == "n" or q_confgeom == "n":
-        # parameter definition in x
-        print(f"{Style.BRIGHT}Parameters for x-dimension:{Style.RESET_ALL}")
-        fnc.setxgeom(xgeom)
-
-        # parameter definition in y
-        print(f"{Style.BRIGHT}\n\nParameters for y-dimension:{Style.RESET_ALL}")
-        fnc.setygeom_smooth(ygeom)
+        # user defined input of geometric features
+        if q_conf == "n" or q_confgeom == "n":
+            # parameter definition in x
+            print(f"{Style.BRIGHT}Parameters for x-dimension:{Style.RESET_ALL}")
+            fnc.setxgeom(xgeom)
+
+            # parameter definition in y
+            print(f"{Style.BRIGHT}\n\nParameters for y-dimension:{Style.RESET_ALL}")
+            fnc.setygeom_smooth(ygeom)
         
 
-    # print summary of geometric parameters
-    print(f"{Style.BRIGHT}\n\nSummary of geometric parameters:{Style.RESET_ALL}")
-    print("x-dimension:")
-    for geom in xgeom:
-        geom.printinfo()
-    print("y-dimension:")
-    for geom in ygeom:
-        geom.printinfo()
+        # print summary of geometric parameters
+        print(f"{Style.BRIGHT}\n\nSummary of geometric parameters:{Style.RESET_ALL}")
+        print("x-dimension:")
+        for geom in xgeom:
+            geom.printinfo()
+        print("y-dimension:")
+        for geom in ygeom:
+            geom.printinfo()
    
-    # query to proceed with geometric values
-    while True:
-        q_proc1 = input("\nProceed with the above values? (y/n)\n>>> ").lower()
-        if q_proc1 == "y":
-            break
-        elif q_proc1 == "n":
-            if q_conf == "y":
-                q_conf = "n"
-            print()
-            print()
-            break
-        else:
-            print(f"{Fore.RED}Invalid input.{Style.RESET_ALL} Please enter 'y' or 'n'.")
-    if q_proc1 == "y":
-        break
-
-
-# final values of geometric parameters
-# x geometry parameters
-ht_geom = fnc.getobj(obj.ht_geomname, xgeom).getval()           # total domain size
-hi_geom = fnc.getobj(obj.hi_geomname, xgeom).getval()           # film inlet
-hd_geom = fnc.getobj(obj.hd_geomname, xgeom).getval()           # distributor
-hg_geom = ht_geom - (hi_geom + hd_geom)                         # gas space
-
-# y geometry parameters
-lt_geom = fnc.getobj(obj.lt_geomname, ygeom).getval()           # film wall
-if q_inlettype == "2":
-    lag_geom = fnc.getobj(obj.lag_geomname, ygeom).getval()     # inlet: additional gas space
-
-
-# creating meshing sections based on final geometric parameters provided
-xsects = []
-ysects = []
-
-# x-dimension 
-xsects.append(obj.Section(obj.hi_sectname, hi_geom))            # film inlet
-xsects.append(obj.Section(obj.hd_sectname, hd_geom))            # distributor
-xsects.append(obj.Section(obj.hg_sectname, hg_geom))            # gas space
-
-# y-dimension
-ysects.append(obj.Section(obj.lt_sectname, lt_geom))            # structures
-if q_inlettype == "2":
-    ysects.append(obj.Section(obj.lag_sectname, lag_geom))      # inlet: additional gas space     
-
-
-# meshing parameters
-print("\n\n############################################################### MESHING PARAMETERS ##############################################################")
-while True:
-    # read meshing from config file if geometry parameters are identical
-    if q_confgeom == "y":
+        # query to proceed with geometric values
         while True:
-            q_confmesh = input("Use config file data for meshing parameters? (y/n)\n>>> ").lower()
-            if q_confmesh == "y":
-                break               
-            elif q_confmesh == "n":
+            q_proc1 = input("\nProceed with the above values? (y/n)\n>>> ").lower()
+            if q_proc1 == "y":
+                break
+            elif q_proc1 == "n":
+                if q_conf == "y":
+                    q_conf = "n"
                 print()
                 print()
                 break
             else:
                 print(f"{Fore.RED}Invalid input.{Style.RESET_ALL} Please enter 'y' or 'n'.")
-    else:
-        q_confmesh = "n"
+        if q_proc1 == "y":
+            break
+
+
+    # creating meshing sections based on final geometric parameters provided
+    xsects, ysects = mdl.sections_2d_smooth(q_inlettype, xgeom, ygeom)
+
+    # meshing parameters
+    print("\n\n############################################################### MESHING PARAMETERS ##############################################################")
+    while True:
+        # read meshing from config file if geometry parameters are identical
+        if q_confgeom == "y":
+            while True:
+                q_confmesh = input("Use config file data for meshing parameters? (y/n)\n>>> ").lower()
+                if q_confmesh == "y":
+                    break               
+                elif q_confmesh == "n":
+                    print()
+                    print()
+                    break
+                else:
+                    print(f"{Fore.RED}Invalid input.{Style.RESET_ALL} Please enter 'y' or 'n'.")
+        # suggest closest existing config files for meshing
+        else:
+            suggestion = fnc.suggestconf(sourcedir, geomtype, [xgeom, ygeom], projdir)
+            if suggestion is not None:
+                refconffile = suggestion
+                q_confmesh = "y"
+            else:
+                q_confmesh = "n"
     
-    # using config file input for meshing parameters
-    if q_confmesh == "y":
-        # refinement factor definition
-        factor = fnc.confmeshing_factor()
-
-        # meshing with specified refinement factor
-        # x-dimension
-        fnc.confmeshing(refconffile, xsects, factor)
+        # using config file input for meshing parameters
+        if q_confmesh == "y":
+            # refinement factor definition
+            factor = fnc.confmeshing_factor()
+
+            # meshing with specified refinement factor
+            # x-dimension
+            fnc.confmeshing(refconffile, xsects, factor)
         
-        # y-dimension
-        fnc.confmeshing(refconffile, ysects, factor)
+            # y-dimension
+            fnc.confmeshing(refconffile, ysects, factor)
     
 
-    # user defined input of geometric features
-    if q_conf == "n" or q_confmesh == "n":
-        while True:
-            print(f"{Style.BRIGHT}Default meshing:{Style.RESET_ALL}")
-            print("x-dimension:")
-            print(f"\t- Within film section (h_nu): Uniform distribution of cells with maximum size of {round(size_film*1000000.0, meshprec)} µm.")
-            print(f"\t- Within distributor section (h_d): Geometric1 distribution of cells, growth from {round(size_film*1000000.0, meshprec)} µm to {round(size_distr*1000000.0, meshprec)} µm.")
-            print(f"\t- Within gas section (h_g): Geometric1 distribution of cells, growth from {round(size_distr*1000000.0, meshprec)} µm to {round(size_xmax*1000000.0, meshprec)} µm.")
-            print("y-dimension:")
-            print(f"\t- For all sections: Uniform distribution of cells with maximum size of {round(size_ymax*1000000.0, meshprec)} µm")
+        # user defined input of geometric features
+        if q_confmesh == "n":
+            while True:
+                print(f"{Style.BRIGHT}Default meshing:{Style.RESET_ALL}")
+                print("x-dimension:")
+                print(f"\t- Within film section (h_nu): Uniform distribution of cells with maximum size of {round(size_film*1000000.0, meshprec)} µm.")
+                print(f"\t- Within distributor section (h_d): Geometric1 distribution of cells, growth from {round(size_film*1000000.0, meshprec)} µm to {round(size_distr*1000000.0, meshprec)} µm.")
+                print(f"\t- Within gas section (h_g): Geometric1 distribution of cells, growth from {round(size_distr*1000000.0, meshprec)} µm to {round(size_xmax*1000000.0, meshprec)} µm.")
+                print("y-dimension:")
+                print(f"\t- For all sections: Uniform distribution of cells with maximum size of {round(size_ymax*1000000.0, meshprec)} µm")
             
-            # use default meshing parameters
-            q_defmsh = input("Do you want to use default meshing parameters? (y/n)\n>>> ").lower()
-
-            # default meshing
-            if q_defmsh == "y":
-                # x-dimension
-                fnc.uniform(fnc.getobj(obj.hi_sectname, xsects), size_film)                 # film inlet
-                fnc.geo1(fnc.getobj(obj.hd_sectname, xsects), size_film, size_distr)        # distributor
-                fnc.geo1(fnc.getobj(obj.hg_sectname, xsects), size_distr, size_xmax)        # gas space
-
-                # y-dimension
-                fnc.uniform(fnc.getobj(obj.lt_sectname, ysects), size_ymax)                 # total domain
-                if q_inlettype == "2":
-                    fnc.uniform(fnc.getobj(obj.lag_sectname, ysects), size_ymax)            # inlet: additional gas space
-                break
+                # use default meshing parameters
+                q_defmsh = input("Do you want to use default meshing parameters? (y/n)\n>>> ").lower()
+
+                # default meshing
+                if q_defmsh == "y":
+                    mdl.defaultmeshing_2d_smooth(q_inlettype, xsects, ysects, sizes)
+                    break
             
-            # custom meshing
-            elif q_defmsh == "n":
-                # print custom meshing messages
-                fnc.custommeshing_info()
+                # custom meshing
+                elif q_defmsh == "n":
+                    # print custom meshing messages
+                    fnc.custommeshing_info()
                 
-                # parameter definition in x
-                print(f"{Style.BRIGHT}\n\nMesh definition in x-dimension:{Style.RESET_ALL}")
-                for sect in xsects:
-                    fnc.custommeshing(sect)
-
-                # parameter definition in y
-                print(f"{Style.BRIGHT}\n\nMesh definition in y-dimension:{Style.RESET_ALL}")
-                for sect in ysects:
-                    fnc.custommeshing(sect)      
-                break
+                    # parameter definition in x
+                    print(f"{Style.BRIGHT}\n\nMesh definition in x-dimension:{Style.RESET_ALL}")
+                    for sect in xsects:
+                        fnc.custommeshing(sect)
+
+                    # parameter definition in y
+                    print(f"{Style.BRIGHT}\n\nMesh definition in y-dimension:{Style.RESET_ALL}")
+                    for sect in ysects:
+                        fnc.custommeshing(sect)      
+                    break
             
+                else:
+                    print(f"{Fore.RED}Invalid input.{Style.RESET_ALL} Please enter 'y' or 'n'.")
+
+        # print summary of meshing parameters
+        print(f"{Style.BRIGHT}\n\nSummary of meshing parameters:{Style.RESET_ALL}")
+        print("x-dimension:")
+        for sect in xsects:
+            sect.printinfo()
+        print("y-dimension:")
+        for sect in ysects:
+            sect.printinfo()
+    
+        # query to proceed with meshing parameters
+        while True:
+            q_proc2 = input("\nProceed with the above values? (y/n)\n>>> ").lower()
+            if q_proc2 == "y":
+                break
+            elif q_proc2 == "n":
+                print()
+                print()
+                break
             else:
                 print(f"{Fore.RED}Invalid input.{Style.RESET_ALL} Please enter 'y' or 'n'.")
-
-    # print summary of meshing parameters
-    print(f"{Style.BRIGHT}\n\nSummary of meshing parameters:{Style.RESET_ALL}")
-    print("x-dimension:")
-    for sect in xsects:
-        sect.printinfo()
-    print("y-dimension:")
-    for sect in ysects:
-        sect.printinfo()
-    
-    # query to proceed with meshing parameters
-    while True:
-        q_proc2 = input("\nProceed with the above values? (y/n)\n>>> ").lower()
         if q_proc2 == "y":
             break
-        elif q_proc2 == "n":
-            print()
-            print()
-            break
-        else:
-            print(f"{Fore.RED}Invalid input.{Style.RESET_ALL} Please enter 'y' or 'n'.")
-    if q_proc2 == "y":
-        break
 
 
-# final values of meshing parameters
-# x meshing parameters
-hi_mesh = fnc.getobj(obj.hi_sectname, xsects).getmesh()         # film inlet
-hd_mesh = fnc.getobj(obj.hd_sectname, xsects).getmesh()         # distributor
-hg_mesh = fnc.getobj(obj.hg_sectname, xsects).getmesh()         # gas space
-
-# y meshing parameters
-lt_mesh = fnc.getobj(obj.lt_sectname, ysects).getmesh()         # film wall
-if q_inlettype == "2":
-    lag_mesh = fnc.getobj(obj.lag_sectname, ysects).getmesh()   # additional gas space
+    # model generation from final geometric and meshing parameters
+    model = mdl.model_2d_smooth(projname, q_inlettype, periodic, xgeom, ygeom, xsects, ysects, names)
 
 
 ############################################################### SCRIPT GENERATION ###############################################################
 print(f"{Style.BRIGHT}\n\n############################################################### SCRIPT GENERATION ###############################################################{Style.RESET_ALL}")
+print("Generated geometry, blocking and meshing:")
+model.printinfo()
 
-############################################################## GEOMETRY GENERATION ##############################################################
-print("Generating geometry...")
-# geometry object lists
-prts = []       # parts
-pnts = []       # points
-crvs = []       # curves
-
-
-# part creation
-# body parts 
-prts.append(obj.Body(name_fluid, ht_geom/2.0, lt_geom/2.0, 0.0))    # fluid
-
-# boundary parts
-prts.append(obj.Part(name_finlet))      # inlet
-prts.append(obj.Part(name_fwall))       # film wall
-prts.append(obj.Part(name_foutlet))     # film outlet
-prts.append(obj.Part(name_gwall))       # gas wall
-if not periodic:
-    prts.append(obj.Part(name_gtop))        # gas top
-    prts.append(obj.Part(name_distr))       # distributor
-print("\t- done part setup")
-
- 
-# film inlet region
-# inlet variant 1: simple film inlet
-if q_inlettype == "1":
-    # point definition
-    # points at lt_geom
-    pnts.append(obj.Point(ht_geom, lt_geom, 0.0))
-    pnts.append(obj.Point((hi_geom + hd_geom), lt_geom, 0.0))
-    pnts.append(obj.Point(hi_geom, lt_geom, 0.0))
-    pnts.append(obj.Point(0.0, lt_geom, 0.0))
-
-
-    # curve definition
-    # curves in x direction
-    crvs.append(obj.Curve(pnts[-4], pnts[-3]))
-    if periodic:
-        fnc.getobj(name_finlet, prts).addgeom(crvs[-1])
-    else:
-        fnc.getobj(name_gtop, prts).addgeom(crvs[-1])
-    crvs.append(obj.Curve(pnts[-3], pnts[-2]))
-    if periodic:
-        fnc.getobj(name_finlet, prts).addgeom(crvs[-1])
-    else:
-        fnc.getobj(name_distr, prts).addgeom(crvs[-1])
-    crvs.append(obj.Curve(pnts[-2], pnts[-1]))
-    fnc.getobj(name_finlet, prts).addgeom(crvs[-1])
-
-
-# inlet variant 2: additional gas space
-elif q_inlettype == "2":
-    # point definition
-    # points at (lt_geom + lag_geom)
-    pnts.append(obj.Point(ht_geom, (lt_geom + lag_geom), 0.0))
-    pnts.append(obj.Point((hi_geom + hd_geom), (lt_geom + lag_geom), 0.0))
-    
-    # points at lt_geom
-    pnts.append(obj.Point(ht_geom, lt_geom, 0.0))
-    pnts.append(obj.Point((hi_geom + hd_geom), lt_geom, 0.0))
-    pnts.append(obj.Point(hi_geom, lt_geom, 0.0))
-    pnts.append(obj.Point(0.0, lt_geom, 0.0))
-
-
-    # curve definition
-    # curves in y direction
-    crvs.append(obj.Curve(pnts[-6], pnts[-4]))
-    fnc.getobj(name_gwall, prts).addgeom(crvs[-1])
-    crvs.append(obj.Curve(pnts[-5], pnts[-3]))
-    fnc.getobj(name_distr, prts).addgeom(crvs[-1])
-
-    # curves in x direction
-    crvs.append(obj.Curve(pnts[-6], pnts[-5]))
-    fnc.getobj(name_gtop, prts).addgeom(crvs[-1])
-    crvs.append(obj.Curve(pnts[-3], pnts[-2]))
-    fnc.getobj(name_distr, prts).addgeom(crvs[-1])
-    crvs.append(obj.Curve(pnts[-2], pnts[-1]))
-    fnc.getobj(name_finlet, prts).addgeom(crvs[-1])
-print("\t- done film inlet region")
-
-
-
-# film outlet region
-# outlet variant 1: simple film outlet
-if q_outlettype == "1":
-    # point definition
-    # points at lt_geom
-    pnts.append(obj.Point(ht_geom, 0.0, 0.0))
-    pnts.append(obj.Point((hi_geom + hd_geom), 0.0, 0.0))
-    pnts.append(obj.Point(hi_geom, 0.0, 0.0))
-    pnts.append(obj.Point(0.0, 0.0, 0.0))
-
-    # number of points of film outlet region
-    numpnts_foutlet = 4
-
-    # curve definition
-    # curves in y direction
-    crvs.append(obj.Curve(pnts[-numpnts_foutlet-4], pnts[-4]))
-    fnc.getobj(name_gwall, prts).addgeom(crvs[-1])
-    crvs.append(obj.Curve(pnts[-numpnts_foutlet-1], pnts[-1]))
-    fnc.getobj(name_fwall, prts).addgeom(crvs[-1])
-
-    # curves in x direction
-    crvs.append(obj.Curve(pnts[-4], pnts[-3]))
-    fnc.getobj(name_foutlet, prts).addgeom(crvs[-1])
-    crvs.append(obj.Curve(pnts[-3], pnts[-2]))
-    fnc.getobj(name_foutlet, prts).addgeom(crvs[-1])
-    crvs.append(obj.Curve(pnts[-2], pnts[-1]))
-    fnc.getobj(name_foutlet, prts).addgeom(crvs[-1])
-print("\t- done film outlet region")
-
-
-
-################################################################### BLOCKING ####################################################################
-print("\nGenerating blocking...")
-blkg = []        # blocking operations (split, deletion)
-edges = []       # edge-curve associations
-
-
-# block modification
-# geometry type 1
-if geomnum == 1:
-    # block splits
-    # film inlet region
-    # x splits
-    blkg.append(obj.Split(pnts[2], 13, 21, prts))       # hi_geom
-    blkg.append(obj.Split(pnts[1], 34, 21, prts))       # (hi_geom + hd_geom)
-    print("\t- done x splits")
-
-
-# geometry type 2
-elif geomnum == 2:
-    # block splits
-    # film inlet region
-    # x splits
-    blkg.append(obj.Split(pnts[4], 13, 21, prts))       # hi_geom
-    blkg.append(obj.Split(pnts[3], 34, 21, prts))       # (hi_geom + hd_geom)
-    print("\t- done x splits")
-
-    # y splits
-    blkg.append(obj.Split(pnts[5], 11, 13, prts))       # lt_geom
-    print("\t- done y splits")
-
-
-    # block deletion
-    # film inlet region
-    blkg.append(obj.Delete(16))                         # delete block above inlet
-    blkg.append(obj.Delete(17))                         # delete block above inlet
-
-
-# edge-curve associations
-print("\nAssociating edges to curves...")
-
-
-# geometry type 1
-if geomnum == 1:
-    # film inlet region
-    # x direction
-    edges.append(obj.Edge(38, 21, crvs[0]))
-    edges.append(obj.Edge(34, 38, crvs[1]))
-    edges.append(obj.Edge(13, 34, crvs[2]))
-    print("\t- done film inlet region")
-
-
-    # film outlet region
-    # y direction
-    edges.append(obj.Edge(19, 21, crvs[-5]))
-    edges.append(obj.Edge(11, 13, crvs[-4]))
-    
-    # x direction
-    edges.append(obj.Edge(37, 19, crvs[-3]))
-    edges.append(obj.Edge(33, 37, crvs[-2]))
-    edges.append(obj.Edge(11, 33, crvs[-1]))
-    print("\t- done film outlet region")
-
-
-# geometry type 2
-elif geomnum == 2:
-    # film inlet region
-    # y direction
-    edges.append(obj.Edge(44, 21, crvs[0]))
-    edges.append(obj.Edge(43, 38, crvs[1]))
-    
-    # x direction
-    edges.append(obj.Edge(38, 21, crvs[2]))
-    edges.append(obj.Edge(42, 43, crvs[3]))
-    edges.append(obj.Edge(41, 42, crvs[4]))
-    print("\t- done film inlet region")
-
-
-    # film outlet region
-    # y direction
-    edges.append(obj.Edge(19, 44, crvs[-5]))
-    edges.append(obj.Edge(11, 41, crvs[-4]))
-    
-    # x direction
-    edges.append(obj.Edge(37, 19, crvs[-3]))
-    edges.append(obj.Edge(33, 37, crvs[-2]))
-    edges.append(obj.Edge(11, 33, crvs[-1]))
-    print("\t- done film outlet region")
-
-
-#################################################################### MESHING ####################################################################
-print("\nMeshing...")
-mshg = []        # meshing operations
-
-
-# geometry type 1
-if geomnum == 1:
-    # x direction
-    mshg.append(obj.Mesh(13, 34, hi_mesh))      # film
-    mshg.append(obj.Mesh(34, 38, hd_mesh))      # distributor
-    mshg.append(obj.Mesh(38, 21, hg_mesh))      # gas space
-    print("\t- done x direction")
-
-
-    # y direction
-    mshg.append(obj.Mesh(11, 13, lt_mesh))     # total domain
-    print("\t- done y direction")
-
-
-# geometry type 2
-elif geomnum == 2:
-    # x direction
-    mshg.append(obj.Mesh(41, 42, hi_mesh))      # film
-    mshg.append(obj.Mesh(42, 43, hd_mesh))      # distributor
-    mshg.append(obj.Mesh(43, 44, hg_mesh))      # gas space
-    print("\t- done x direction")
-
-
-    # y direction
-    mshg.append(obj.Mesh(43, 38, lag_mesh))     # additional gas space
-    mshg.append(obj.Mesh(11, 41, lt_mesh))      # total domain
-    print("\t- done y direction")
+# predicted number of cells and nodes, script is aborted if the cell budget is exceeded
+fnc.printmeshcount(model, maxcells)
 
+# predicted mesh quality, script is aborted if a quality limit is exceeded
+fnc.printmeshquality(model)
 
 
 ################################################################# WRITE TO FILE #################################################################
@@ -638,73 +436,27 @@ os.chdir(projdir)                           # change to project folder
 
 # write to .rpl file
 print("Writing to file " + rplfile + "...")
-rpllines = []                               # list containing all lines of .rpl file
-
-# add lines at the start of script
-rpllines = fnc.rpl_start(rpllines)
-
-
-# add lines for point definition (geometry)
-rpllines = fnc.rpl_obj(rpllines, pnts)
-
-# add lines for curve definition (geometry)
-rpllines = fnc.rpl_obj(rpllines, crvs)
-
-# add lines for part association (geometry)
-rpllines = fnc.rpl_obj(rpllines, prts)
-
-# add lines for blocking creation (blocking)
-rpllines = fnc.rpl_2Dblocking(rpllines, fnc.getobj(name_fluid, prts))
-
-# add lines for block modifications (blocking)
-rpllines = fnc.rpl_obj(rpllines, blkg)
-
-# add lines for blocking associations (blocking)
-rpllines = fnc.rpl_obj(rpllines, edges)
-
-# add lines for meshing (meshing)
-rpllines = fnc.rpl_obj(rpllines, mshg)
-
-# add lines at the end of script
-rpllines = fnc.rpl_end(rpllines)
 
 # write lines to new .rpl file, overwrite old one if it exists
+# lines are streamed to the buffered file handle as they are created
 try:
-    with open(rplfile, 'x') as file:
+    with open(rplfile, 'x', buffering=obj.writebuffer) as file:
         print(f" - {Fore.GREEN}writing new .rpl file{Style.RESET_ALL}")
-        file.writelines(rpllines)
+        fnc.rpl_model(model, obj.Stream(file))
     file.close()
 except FileExistsError:
-    with open(rplfile, 'w') as file:
+    with open(rplfile, 'w', buffering=obj.writebuffer) as file:
         print(f" - {Fore.RED}overwriting existing .rpl file{Style.RESET_ALL}")
-        file.writelines(rpllines)
+        fnc.rpl_model(model, obj.Stream(file))
     file.close()
+if obj.rplprune:
+    print(f" - redundant commands removed: {model.getpruned()} lines")
 print(" - done write to file")
 
 
 # write to .conf file
 print("\nWriting to file " + conffile + "...")
-conflines = []                                   # list containing all lines of .conf file
-
-# project name
-conflines = fnc.conf_start(conflines, projname)
-
-# geometry configuration (user)
-conflines = fnc.conf_geom2D(conflines, xgeom, ygeom)
-
-# mesh configuration (user)
-conflines = fnc.conf_mesh2D(conflines, xsects, ysects)
-
-# mesh type
-conflines = fnc.conf_type(conflines, geomtype)
-
-# geometry configuration (script)
-conflines = fnc.conf_geomdata(conflines, "xgeom", xgeom)
-conflines = fnc.conf_geomdata(conflines, "ygeom", ygeom)
-
-# mesh configuration (script)
-conflines = fnc.conf_meshdata(conflines, xsects)
-conflines = fnc.conf_meshdata(conflines, ysects)
+conflines = fnc.conf_model(model)           # list containing all lines of .conf file
 
 # write lines to new .conf file, overwrite old one if it exists
 try:
@@ -719,4 +471,12 @@ except FileExistsError:
     file.close()
 print(" - done write to file")
 
+# write preview file, computed from the model without replay of the .rpl file
+if preview:
+    fnc.writepreview(model, projname)
+
+# write mesh files, mesh computed from the blocking and meshing of the .rpl file
+if exports:
+    fnc.writeexports(fnc.replayrpl(rplfile), projname, exports)
+
 print(f"{Style.BRIGHT}{Fore.GREEN}\n\n##################################################################### DONE ######################################################################{Style.RESET_ALL}")
\ No newline at end of file
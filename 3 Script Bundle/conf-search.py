@@ -0,0 +1,46 @@
+# this script is used to search the config files in the script folder and subfolders by geometry type and geometry values
+# usage: python conf-search.py [geometry type] [name=value] [name=min:max] ..., e.g. python conf-search.py 3D-horizontal-1 n_s=3 l_s=0.5:1.0
+# lengths in [mm], numbers without unit, the files rpl_gen_fnc.py and rpl_gen_obj.py are required to run this file
+
+
+############################################################### DO NOT EDIT BELOW ###############################################################
+# dependencies
+import rpl_gen_fnc as fnc                       # function source file
+import rpl_gen_obj as obj                       # class source file
+import os                                       # operating system operations
+import sys                                      # command line arguments
+from colorama import Fore, Style, init          # console output formatting (validated to run on a windows system)
+
+
+################################################################# PROGRAM START #################################################################
+# initialize console formatting
+init(autoreset=True)
+
+# geometry type and geometry values from command line
+print(f"{Style.BRIGHT}############################################################## CONFIG FILE SEARCH ###############################################################{Style.RESET_ALL}")
+sourcedir = os.path.dirname(os.path.abspath(__file__))
+geomtype = None
+params = {}
+for arg in sys.argv[1:]:
+    if "=" in arg:
+        name, val = arg.split("=", 1)
+        params[name] = val.split(":") if ":" in val else val
+    elif geomtype is None:
+        geomtype = arg
+    else:
+        fnc.specerror(f"Invalid argument '{arg}'. Usage: python conf-search.py [geometry type] [name=value] [name=min:max] ...")
+
+# search config file catalog
+try:
+    conffiles = fnc.searchconf(sourcedir, geomtype, params)
+except ValueError as error:
+    fnc.specerror(str(error))
+
+print(f"Found {len(conffiles)} config files" + (f" of geometry type '{geomtype}'" if geomtype is not None else "") + ":")
+for conffile in conffiles:
+    conf = fnc.readconf(conffile)
+    # searched geometry values, conversion from [m] to [mm]
+    vals = [f"{name}={val if val is None else int(val) if name == obj.ns_geomname else round(val*1000.0, fnc.geomprec)}" for dim in ["xgeom", "ygeom", "zgeom"] for name, val in conf.getgeoms(dim).items() if name in params]
+    print(f"\t- ~\\{os.path.relpath(conffile, sourcedir)} ({conf.getgeomtype()}) {' '.join(vals)}".rstrip())
+
+print(f"{Style.BRIGHT}{Fore.GREEN}\n\n##################################################################### DONE ######################################################################{Style.RESET_ALL}")
@@ -0,0 +1,61 @@
+# this script is used to compare the run time of the node count and growth rate search of geometric distributions (geomcalc) with the previous loop
+# usage: python geomfit-benchmark.py, geo1 and geo2 distributions of random sections are calculated at every mesh precision (meshprec)
+# the files rpl_gen_fnc.py and rpl_gen_obj.py are required to run this file
+
+
+# number of random sections, default = 20
+samples = 20
+# seed of random sections, default = 1
+seed = 1
+# mesh precisions (decimal places of growth rates and relative sizes), default = [6, 10, 12]
+precisions = [6, 10, 12]
+# mesh precisions of the timed previous loop (run time grows with 10**meshprec, hours per section from 10), default = [6]
+loopprecisions = [6]
+# number of timed runs (the minimum run time is shown), default = 3
+repeat = 3
+
+
+############################################################### DO NOT EDIT BELOW ###############################################################
+# dependencies
+import rpl_gen_fnc as fnc                       # function source file
+import numpy as np                              # numerical python
+import time                                     # run times
+from colorama import Fore, Style, init          # console output formatting (validated to run on a windows system)
+
+
+################################################################# PROGRAM START #################################################################
+# initialize console formatting
+init(autoreset=True)
+
+print(f"{Style.BRIGHT}############################################################ GEOMETRIC FIT BENCHMARK ############################################################{Style.RESET_ALL}")
+# random sections: length 1 to 100 mm, minimum cell size 0.2 % to 30 % of the length, maximum cell size 1 to 100 times the minimum cell size
+rng = np.random.default_rng(seed)
+length = 10**rng.uniform(-3, -1, samples)
+hmin = length*10**rng.uniform(np.log10(0.002), np.log10(0.3), samples)
+hmax = np.maximum(np.minimum(hmin*10**rng.uniform(0, 2, samples), 0.99*length - hmin), hmin)
+print(f"\n{samples} random sections, seed {seed}, run time: minimum of {repeat} runs (previous loop: 1 run)")
+
+
+print(f"{Style.BRIGHT}\n\n################################################################ BENCHMARK RUNS #################################################################{Style.RESET_ALL}")
+for prec in precisions:
+    fnc.meshprec = prec
+    times = {}
+    for rule in ["geo1", "geo2"]:
+        runs = []
+        for run in range(max(repeat, 1)):
+            start = time.perf_counter()
+            fnc.meshdistr(rule, length, hmin, hmax)
+            runs.append(time.perf_counter() - start)
+        times[rule] = min(runs)
+    line = f"\t- meshprec {prec}: geo1 {times['geo1']*1000:.1f} ms, geo2 {times['geo2']*1000:.1f} ms ({times['geo1']/samples*1000:.2f} ms per section)"
+    if prec in loopprecisions:
+        start = time.perf_counter()
+        for section in zip(length.tolist(), hmin.tolist(), hmax.tolist()):
+            fnc.geomcalc_loop(*section)
+        loop = time.perf_counter() - start
+        line += f", previous loop {loop*1000:.1f} ms ({loop/times['geo1']:.0f}x)"
+    else:
+        line += ", previous loop not timed"
+    print(line)
+
+print(f"{Style.BRIGHT}{Fore.GREEN}\n\n##################################################################### DONE ######################################################################{Style.RESET_ALL}")
@@ -0,0 +1,94 @@
+# this script is used to check the node count and growth rate search of geometric distributions (geomcalc) against the previous loop (geomcalc_loop)
+# usage: python geomfit-check.py, random sections (hmin == hmax included) are compared at the mesh precision meshprec of rpl_gen_obj.py
+# sections with sizes rounding to the same value at the mesh precision are meshed in both orders with the mesh cache (meshcalc)
+# the files rpl_gen_fnc.py and rpl_gen_obj.py are required to run this file, the exit code is 1 if a result differs from the previous loop or the cache
+
+
+# number of random sections, default = 100
+samples = 100
+# seed of random sections, default = 1
+seed = 1
+# share of random sections with equal minimum and maximum cell size, default = 0.1
+equalshare = 0.1
+
+
+############################################################### DO NOT EDIT BELOW ###############################################################
+# dependencies
+import rpl_gen_fnc as fnc                       # function source file
+import numpy as np                              # numerical python
+import time                                     # run time of searches
+from colorama import Fore, Style, init          # console output formatting (validated to run on a windows system)
+
+
+################################################################# PROGRAM START #################################################################
+# initialize console formatting
+init(autoreset=True)
+
+print(f"{Style.BRIGHT}################################################################# GEOMETRIC FIT #################################################################{Style.RESET_ALL}")
+# random sections: length 1 to 100 mm, minimum cell size 0.2 % to 30 % of the length, maximum cell size 1 to 100 times the minimum cell size
+# every second section is rounded to the mesh precision (sizes of parameter files), hmin + hmax <= 0.99*length (3 nodes fit after rounding)
+rng = np.random.default_rng(seed)
+length = 10**rng.uniform(-3, -1, samples)
+hmin = length*10**rng.uniform(np.log10(0.002), np.log10(0.3), samples)
+hmax = np.where(rng.random(samples) < equalshare, hmin, hmin*10**rng.uniform(0, 2, samples))
+rounded = np.arange(samples) % 2 == 0
+length[rounded], hmin[rounded], hmax[rounded] = np.round(length[rounded], fnc.meshprec), np.round(hmin[rounded], fnc.meshprec), np.round(hmax[rounded], fnc.meshprec)
+hmax = np.maximum(np.minimum(hmax, 0.99*length - hmin), hmin)
+print(f"\n{samples} random sections, {np.count_nonzero(hmin == hmax)} with hmin == hmax, mesh precision {fnc.meshprec}, seed {seed}")
+
+
+print(f"{Style.BRIGHT}\n\n################################################################## COMPARISON ###################################################################{Style.RESET_ALL}")
+start = time.perf_counter()
+rate, nodes = fnc.geomcalc(length, hmin, hmax)
+fittime = time.perf_counter() - start
+start = time.perf_counter()
+reference = [fnc.geomcalc_loop(*section) for section in zip(length.tolist(), hmin.tolist(), hmax.tolist())]
+looptime = time.perf_counter() - start
+
+# properties: results of the previous loop, distributions fit the sections
+# the previous loop lowers the growth rate by repeated subtraction, its rounding errors (about 1e-16 per step) can move the rounded sum across 1
+# such sections are compared with the loop lowering the growth rate as rate - steps*step (as geomcalc) and listed separately
+failed = []
+drift = []
+for i, (refrate, refnodes) in enumerate(reference):
+    if (rate[i], nodes[i]) != (refrate, refnodes) and (rate[i], nodes[i]) == fnc.geomcalc_loop(length[i].item(), hmin[i].item(), hmax[i].item(), accumulate=False):
+        drift.append(f"section {i} (length {length[i].item()!r}, hmin {hmin[i].item()!r}, hmax {hmax[i].item()!r}): rate {rate[i]}, previous loop: rate {refrate}")
+    elif (rate[i], nodes[i]) != (refrate, refnodes):
+        failed.append(f"section {i} (length {length[i].item()!r}, hmin {hmin[i].item()!r}, hmax {hmax[i].item()!r}): rate {rate[i]}, nodes {nodes[i]}, previous loop: rate {refrate}, nodes {refnodes}")
+    elif round(fnc.geomsum_calc(hmin[i]/length[i], int(nodes[i]), float(rate[i])), fnc.meshprec) > 1:
+        failed.append(f"section {i} (length {length[i].item()!r}, hmin {hmin[i].item()!r}, hmax {hmax[i].item()!r}): rate {rate[i]}, nodes {nodes[i]} exceed the section")
+print(f"\t- geomcalc: {fittime*1000:.1f} ms, previous loop: {looptime*1000:.1f} ms")
+print(f"\t- {samples - len(failed) - len(drift)} of {samples} sections identical to the previous loop")
+if drift:
+    print(f"\t- {len(drift)} sections differ by the rounding errors of the repeated subtraction in the previous loop, identical without:")
+for line in drift:
+    print(f"\t\t{line}")
+for line in failed[:20]:
+    print(f"\t- {Fore.RED}{line}{Style.RESET_ALL}")
+if failed:
+    fnc.specerror(f"\n{len(failed)} of {samples} sections differ from the previous loop.")
+
+
+print(f"{Style.BRIGHT}\n\n################################################################## MESH CACHE ###################################################################{Style.RESET_ALL}")
+# pairs of sections (rule, length, hmin, hmax) with sizes rounding to the same value at the mesh precision (e.g. film cell size 0.0125 and 0.013 mm)
+# every section is meshed in one process after the other section of its pair, results of meshcalc equal the calculation without cache (meshdistr)
+pairs = [(("geo1", 3e-4, 1.25e-5, 1e-4), ("geo1", 3e-4, 1.3e-5, 1e-4)),
+         (("geo2", 1e-3, 2.48e-5, 2e-4), ("geo2", 1e-3, 2.52e-5, 2e-4)),
+         (("uniform", 2e-3, 4.48e-5, 4.48e-5), ("uniform", 2e-3, 4.52e-5, 4.52e-5))]
+failed = []
+for pair in pairs:
+    if [round(size, fnc.meshprec) for size in pair[0][1:]] != [round(size, fnc.meshprec) for size in pair[1][1:]]:
+        fnc.specerror(f"\nSections {pair[0]} and {pair[1]} do not round to the same sizes at the mesh precision {fnc.meshprec}.")
+    for first, second in (pair, pair[::-1]):
+        for section in (first, second):
+            cached = [col.item() for col in fnc.meshcalc(*section)]
+            exact = [col.item() for col in fnc.meshdistr(*section)]
+            if cached != exact:
+                failed.append(f"section {section} ({first} meshed first): {cached}, without cache: {exact}")
+print(f"\t- {2*len(pairs)} sections meshed in both orders, {4*len(pairs) - len(failed)} of {4*len(pairs)} results equal without cache")
+for line in failed:
+    print(f"\t- {Fore.RED}{line}{Style.RESET_ALL}")
+if failed:
+    fnc.specerror(f"\n{len(failed)} results of the mesh cache differ from the calculation without cache.")
+
+print(f"{Style.BRIGHT}{Fore.GREEN}\n\n##################################################################### DONE ######################################################################{Style.RESET_ALL}")
@@ -0,0 +1,66 @@
+# this script is used to record the run time and peak memory of the mesh export (option --export) against the number of cells
+# usage: python mesh-benchmark.py, every export runs in a new process with buffers in memory and in memory-mapped .npy files (see mapcells in rpl_gen_obj.py)
+# the files rpl_gen_fnc.py, rpl_gen_obj.py and rpl_gen_mdl.py are required to run this file
+
+
+# numbers of structures of the benchmark model (3D horizontal structures, inlet type 1, cells increase linearly), default = [10, 30, 100, 300, 1000]
+nsvalues = [10, 30, 100, 300, 1000]
+# mesh export format, default = "msh"
+exportformat = "msh"
+# history file of results next to this script, default = "mesh-benchmark.csv"
+historyfile = "mesh-benchmark.csv"
+
+
+############################################################### DO NOT EDIT BELOW ###############################################################
+# dependencies
+import rpl_gen_fnc as fnc                       # function source file
+import rpl_gen_mdl as mdl                       # model source file
+import os                                       # operating system operations
+import csv                                      # history file
+import time                                     # date of benchmark run
+import tempfile                                 # folder of mesh files
+from concurrent.futures import ProcessPoolExecutor      # new process per export (peak memory of the export)
+from colorama import Fore, Style, init          # console output formatting (validated to run on a windows system)
+
+
+################################################################# PROGRAM START #################################################################
+# exports are run by worker processes importing this file, the benchmark is only run from the main process
+if __name__ == "__main__":
+    # initialize console formatting
+    init(autoreset=True)
+
+    # benchmark models
+    print(f"{Style.BRIGHT}################################################################# MESH BENCHMARK ################################################################{Style.RESET_ALL}")
+    sourcedir = os.path.dirname(os.path.abspath(__file__))
+    if exportformat not in fnc.meshexports:
+        fnc.specerror(f"Invalid export format '{exportformat}'. Available formats: {', '.join(fnc.meshexports)}.")
+    cases = {name: (script, spec) for name, (script, spec) in fnc.benchcases(nsvalues).items() if name.startswith("3dh-i1-") and not name.endswith("-p")}
+    modes = {"memory": -1, "mapped": 0}         # mode: obj.mapcells of the export
+    print(f"\n{len(cases)} models, {len(modes)} exports per model: buffers in memory, buffers in memory-mapped .npy files" + ("" if fnc.resource else f"\n{Fore.RED}peak memory not available on this system{Style.RESET_ALL}"))
+
+    print(f"{Style.BRIGHT}\n\n################################################################ BENCHMARK RUNS #################################################################{Style.RESET_ALL}")
+    date = time.strftime("%Y-%m-%d %H:%M:%S")
+    rows = []
+    with tempfile.TemporaryDirectory() as dir:
+        for name, (script, spec) in cases.items():
+            for mode, mapcells in modes.items():
+                file = fnc.exportfile(os.path.join(dir, name), exportformat)
+                with ProcessPoolExecutor(max_workers=1) as pool:
+                    entry = pool.submit(fnc.benchexport, mdl.builds[script], spec, file, exportformat, mapcells).result()
+                os.remove(file)
+                growth = entry["peak"] - entry["before"] if fnc.resource else None
+                rows.append({"date": date, "case": name, "mode": mode, "cells": entry["cells"], "time": round(entry["time"], 3), "peak": entry["peak"], "growth": growth, "size": entry["size"]})
+                memory = f"peak {entry['peak']/2**20:,.0f} MB (export {growth/2**20:,.0f} MB)" if fnc.resource else "peak N/A"
+                print(f"\t- {name} {mode}: {entry['cells']:,} cells, {entry['time']:.1f} s, {memory}, file {entry['size']/2**20:,.0f} MB")
+
+    print(f"{Style.BRIGHT}\n\n################################################################# WRITE TO FILE #################################################################{Style.RESET_ALL}")
+    newfile = not os.path.isfile(os.path.join(sourcedir, historyfile))
+    with open(os.path.join(sourcedir, historyfile), 'a', newline='') as file:
+        writer = csv.DictWriter(file, fieldnames=list(rows[0]))
+        if newfile:
+            writer.writeheader()
+        writer.writerows(rows)
+    file.close()
+    print(f" - run times and peak memory added to {historyfile}")
+
+    print(f"{Style.BRIGHT}{Fore.GREEN}\n\n##################################################################### DONE ######################################################################{Style.RESET_ALL}")
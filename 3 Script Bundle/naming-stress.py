@@ -0,0 +1,78 @@
+# this script is used to check the entity names of a large model (more than 100,000 surfaces) for several pad widths (namepad in rpl_gen_obj.py)
+# usage: python naming-stress.py, the .rpl lines of a 3D horizontal structures model are replayed without ICEM (every name created once)
+# the files rpl_gen_fnc.py, rpl_gen_obj.py and rpl_gen_mdl.py are required to run this file, the exit code is 1 if a check fails
+
+
+# number of structures of the 3D horizontal structures model (20 surfaces per structure), default = 6000
+nsvalue = 6000
+# minimum numbers of digits of entity numbers, default = [4, 7]
+namepads = [4, 7]
+
+
+############################################################### DO NOT EDIT BELOW ###############################################################
+# dependencies
+import rpl_gen_fnc as fnc                       # function source file
+import rpl_gen_obj as obj                       # class source file
+import rpl_gen_mdl as mdl                       # model source file
+import time                                     # run time of checks
+from colorama import Fore, Style, init          # console output formatting (validated to run on a windows system)
+
+
+################################################################# PROGRAM START #################################################################
+# initialize console formatting
+init(autoreset=True)
+
+print(f"{Style.BRIGHT}################################################################# NAMING STRESS #################################################################{Style.RESET_ALL}")
+script, spec = fnc.benchcases([nsvalue])[f"3dh-i1-ns{nsvalue}"]
+print(f"\n3D horizontal structures with n_s = {nsvalue}, pad widths: {', '.join(str(pad) for pad in namepads)}")
+
+
+print(f"{Style.BRIGHT}\n\n################################################################## NAME CHECKS ##################################################################{Style.RESET_ALL}")
+failed = 0
+for pad in namepads:
+    obj.namepad = pad
+    start = time.perf_counter()
+    fnc.resetcounts()
+    model = mdl.builds[script](spec)
+    replay = fnc.replaylines(fnc.rpl_model(model))
+    store = model.getstore()
+    problems = []
+
+    # every name created once (replay reports existing names), all entities of the entity store created
+    if replay.geterrors():
+        problems.append(f"{len(replay.geterrors())} invalid commands in replay, first: {replay.geterrors()[0][1]}")
+    counts = {"pnt": store.getpnts()["num"], "crv": store.getcrvs()["num"], "srf": store.getsrfs()["num"]}
+    names = {"pnt": list(replay.pnts), "crv": list(replay.crvs), "srf": list(replay.srfs)}
+    if counts["srf"].size <= 100000:
+        problems.append(f"only {counts['srf'].size:,} surfaces, increase nsvalue")
+
+    # names: prefix and number of at least pad digits, numbers parsed from the names equal the numbers of the entity store
+    # names of equal width sort as their numbers, all names sort as their numbers if no number is wider than pad
+    wide = 0
+    for prefix, entnames in names.items():
+        nums = [int(name.split(".")[1]) for name in entnames]
+        if len(entnames) != len(counts[prefix]) or sorted(nums) != sorted(counts[prefix].tolist()):
+            problems.append(f"{prefix}: numbers of {len(entnames):,} names differ from the {len(counts[prefix]):,} entities of the entity store")
+        if any(not name.startswith(prefix + ".") or len(name) - len(prefix) - 1 < pad or f"{prefix}.{num:0{pad}d}" != name for name, num in zip(entnames, nums)):
+            problems.append(f"{prefix}: names not zero-padded to {pad} digits")
+        widths = {}
+        for name, num in zip(entnames, nums):
+            widths.setdefault(len(name), []).append((name, num))
+        for entries in widths.values():
+            if [num for name, num in sorted(entries)] != sorted(num for name, num in entries):
+                problems.append(f"{prefix}: names of equal width do not sort as their numbers")
+        if max(widths) - len(prefix) - 1 <= pad and [int(name.split(".")[1]) for name in sorted(entnames)] != sorted(nums):
+            problems.append(f"{prefix}: names do not sort as their numbers")
+        wide += sum(len(entries) for width, entries in widths.items() if width - len(prefix) - 1 > pad)
+
+    line = f"\t- namepad {pad}: {len(names['pnt']):,} points, {len(names['crv']):,} curves, {len(names['srf']):,} surfaces, {wide:,} names wider than {pad} digits, {time.perf_counter() - start:.1f} s"
+    if problems:
+        failed += 1
+        print(f"{line}, {Fore.RED}{'; '.join(problems)}{Style.RESET_ALL}")
+    else:
+        print(f"{line}, names unique and parsed" + (", names sorted" if not wide else ""))
+
+if failed:
+    fnc.specerror(f"\nNames of {failed} of {len(namepads)} pad widths failed the checks.")
+
+print(f"{Style.BRIGHT}{Fore.GREEN}\n\n##################################################################### DONE ######################################################################{Style.RESET_ALL}")
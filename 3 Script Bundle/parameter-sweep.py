@@ -0,0 +1,130 @@
+# this script is used to generate ICEM models for all members of a parameter sweep in parallel
+# usage: python parameter-sweep.py sweep.json (or sweep.toml), optional cell budget of sweep members: --max-cells 1000000
+# the files rpl_gen_fnc.py, rpl_gen_obj.py and rpl_gen_mdl.py are required to run this file
+
+
+# number of parallel processes, default = None (number of processors)
+workers = None
+
+
+############################################################### DO NOT EDIT BELOW ###############################################################
+# dependencies
+import rpl_gen_fnc as fnc                       # function source file
+import rpl_gen_mdl as mdl                       # model source file
+import os                                       # operating system operations
+import sys                                      # command line arguments
+import csv                                      # manifest file
+import json                                     # parameter files of sweep members
+import time                                     # total run time
+from concurrent.futures import ProcessPoolExecutor      # parallel generation of sweep members
+from colorama import Fore, Style, init          # console output formatting (validated to run on a windows system)
+
+
+################################################################# PROGRAM START #################################################################
+# sweep members are generated by worker processes importing this file, the sweep is only run from the main process
+if __name__ == "__main__":
+    # initialize console formatting
+    init(autoreset=True)
+
+    # read sweep file
+    print(f"{Style.BRIGHT}################################################################ PARAMETER SWEEP ################################################################{Style.RESET_ALL}")
+    maxcells, args = fnc.getmaxcells(sys.argv)       # cell budget of sweep members (--max-cells)
+    if len(args) < 2:
+        fnc.specerror("Specify a sweep file: python parameter-sweep.py sweep.json")
+    sweep = fnc.getspec(args)
+    sweepname = os.path.splitext(os.path.basename(args[1]))[0]
+
+    # script generating the sweep members, models are generated in-process by the corresponding build function
+    sourcedir = os.path.dirname(os.path.abspath(__file__))
+    script = str(sweep.get("script", ""))
+    if script not in mdl.builds:
+        fnc.specerror(f"Script '{script}' for sweep members not found. Available scripts: {', '.join(mdl.builds)}.")
+
+    # parameter file of sweep members, without parameters of the design
+    base = sweep.get("base", {})
+    if not isinstance(base, dict):
+        fnc.specerror("Invalid values for 'base' in sweep file.")
+    base.setdefault("overwrite", True)
+    base["specdir"] = sweep["specdir"]
+    fnc.specconf(sourcedir, base)                   # reference relative to sweep file or in script folder and subfolders
+    del base["specdir"]
+    prefix = str(base.get("project", sweepname))
+
+
+    # design of sweep
+    params = sweep.get("parameters", {})
+    if not isinstance(params, dict) or len(params) == 0:
+        fnc.specerror("No 'parameters' in sweep file.")
+
+    design = sweep.get("design", "grid")
+    try:
+        # full factorial design: list of values per parameter
+        if design == "grid":
+            members = fnc.sweepgrid(params)
+        # latin hypercube design: range [min, max] per parameter
+        elif design == "lhs":
+            members = fnc.sweeplhs(params, int(sweep.get("samples", 10)), sweep.get("seed"))
+        else:
+            fnc.specerror(f"Invalid design '{design}' in sweep file. Use 'grid' or 'lhs'.")
+    except (TypeError, ValueError):
+        fnc.specerror(f"Invalid parameters for design '{design}' in sweep file.")
+    print(f"\n{len(members)} sweep members, design '{design}':")
+    for key in params:
+        print(f"\t- {key}: {params[key]}")
+
+
+    # write parameter files of sweep members
+    specdir = os.path.join(sweep["specdir"], sweepname)
+    if not os.path.exists(specdir):
+        os.makedirs(specdir)
+
+    projnames = []
+    specfiles = []
+    for i, member in enumerate(members):
+        spec = json.loads(json.dumps(base))         # copy of nested tables
+        for key in member:
+            fnc.setspecval(spec, key, member[key])
+        projnames.append(f"{prefix}-{i:0{len(str(len(members) - 1))}d}")
+        spec["project"] = projnames[-1]
+        specfiles.append(os.path.join(specdir, projnames[-1] + ".json"))
+        with open(specfiles[-1], 'w') as file:
+            json.dump(spec, file, indent=4)
+        file.close()
+
+
+    # generate sweep members
+    print(f"{Style.BRIGHT}\n\n############################################################### SCRIPT GENERATION ###############################################################{Style.RESET_ALL}")
+    numworkers = sweep.get("workers", workers)
+    print(f"Generating sweep members with {numworkers or os.cpu_count()} processes...")
+
+    start = time.perf_counter()
+    rows = []
+    with ProcessPoolExecutor(max_workers=numworkers) as executor:
+        for i, entries in enumerate(executor.map(fnc.sweepmember, [mdl.builds[script]]*len(members), specfiles, [sourcedir]*len(members), [maxcells]*len(members))):
+            rows.append(dict({"member": i, "project": projnames[i]}, **members[i], **entries))
+            if entries["status"] == "done" and entries["quality"]:
+                print(f"\t- {projnames[i]}: {entries['cells']} cells, {entries['time']} s, {Fore.RED}mesh quality limits exceeded ({entries['quality']}){Style.RESET_ALL}")
+            elif entries["status"] == "done":
+                print(f"\t- {projnames[i]}: {entries['cells']} cells, {entries['time']} s")
+            else:
+                print(f"\t- {projnames[i]}: {Fore.RED}{entries['status']}{Style.RESET_ALL}")
+    duration = round(time.perf_counter() - start, 3)
+
+
+    # write manifest
+    print(f"{Style.BRIGHT}\n\n################################################################# WRITE TO FILE #################################################################{Style.RESET_ALL}")
+    manifest = os.path.join(sweep["specdir"], str(sweep.get("manifest", sweepname + ".csv")))
+    print("Writing to file " + os.path.basename(manifest) + "...")
+    with open(manifest, 'w', newline='') as file:
+        writer = csv.DictWriter(file, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+    file.close()
+    print(" - done write to file")
+
+    failed = sum(row["status"] != "done" for row in rows)
+    if failed > 0:
+        print(f"{Fore.RED}\n{failed} of {len(rows)} sweep members failed.{Style.RESET_ALL}")
+    print(f"\nTotal run time: {duration} s")
+
+    print(f"{Style.BRIGHT}{Fore.GREEN}\n\n##################################################################### DONE ######################################################################{Style.RESET_ALL}")
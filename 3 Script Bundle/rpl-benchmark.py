@@ -0,0 +1,148 @@
+# this script is used to check the output of all scripts against stored golden files and to record the run time and peak memory of every phase
+# usage: python rpl-benchmark.py [case] ..., e.g. python rpl-benchmark.py 3dh (all cases starting with "3dh"), write golden files: --update
+# the files rpl_gen_fnc.py, rpl_gen_obj.py and rpl_gen_mdl.py are required to run this file, the exit code is 1 if an output differs from its golden file
+
+
+# numbers of structures of the horizontal structures cases, default = [1, 3, 10, 30]
+nsvalues = [1, 3, 10, 30]
+# number of timed runs per case (the minimum run time is recorded), default = 3
+repeat = 3
+# run time regression: run time above slowdown times the median of the last 5 runs in the history file, default = 1.25
+slowdown = 1.25
+# folder of golden files and history file (run times and peak memory of all runs) next to this script, default = "golden" and "benchmark.csv"
+goldendir = "golden"
+historyfile = "benchmark.csv"
+
+
+############################################################### DO NOT EDIT BELOW ###############################################################
+# dependencies
+import rpl_gen_fnc as fnc                       # function source file
+import rpl_gen_obj as obj                       # class source file
+import rpl_gen_mdl as mdl                       # model source file
+import os                                       # operating system operations
+import sys                                      # command line arguments
+import csv                                      # history file
+import json                                     # manifest of golden files
+import time                                     # date of benchmark run
+from colorama import Fore, Style, init          # console output formatting (validated to run on a windows system)
+
+
+################################################################# PROGRAM START #################################################################
+# initialize console formatting
+init(autoreset=True)
+
+# benchmark cases from command line
+print(f"{Style.BRIGHT}################################################################### BENCHMARK ###################################################################{Style.RESET_ALL}")
+sourcedir = os.path.dirname(os.path.abspath(__file__))
+update = "--update" in sys.argv
+prefixes = [arg for arg in sys.argv[1:] if arg != "--update"]
+cases = {name: case for name, case in fnc.benchcases(nsvalues).items() if not prefixes or name.startswith(tuple(prefixes))}
+if not cases:
+    fnc.specerror(f"No benchmark cases starting with {', '.join(prefixes)}. Available cases: {', '.join(fnc.benchcases(nsvalues))}.")
+
+# manifest of golden files: settings of rpl_gen_obj.py and hashes of the outputs
+golden = os.path.join(sourcedir, goldendir)
+manifestfile = os.path.join(golden, "golden.json")
+manifest = {"settings": {}, "cases": {}}
+if os.path.isfile(manifestfile):
+    with open(manifestfile, 'r') as file:
+        manifest = json.load(file)
+    file.close()
+settings = {name: getattr(obj, name) for name in fnc.benchsettings}
+if not update and manifest["settings"] and manifest["settings"] != settings:
+    changed = [f"{name} = {settings[name]!r} (golden files: {manifest['settings'].get(name)!r})" for name in settings if manifest["settings"].get(name) != settings[name]]
+    print(f"{Fore.RED}\nSettings in rpl_gen_obj.py differ from the settings of the golden files, outputs are expected to differ:{Style.RESET_ALL}")
+    for line in changed:
+        print(f"\t- {line}")
+print(f"\n{len(cases)} cases, run time: minimum of {repeat} runs, peak memory: additional traced run" + (", golden files are updated" if update else ""))
+
+
+############################################################### BENCHMARK RUNS ##################################################################
+print(f"{Style.BRIGHT}\n\n################################################################ BENCHMARK RUNS #################################################################{Style.RESET_ALL}")
+history = fnc.benchhistory(os.path.join(sourcedir, historyfile))
+date = time.strftime("%Y-%m-%d %H:%M:%S")
+rows = []
+failed = 0
+regressions = 0
+totals = {}
+for name, (script, spec) in cases.items():
+    entries = fnc.benchmember(mdl.builds[script], spec, repeat)
+    replay = entries["replay"]
+
+    # output compared with golden files, replay of .rpl lines validated
+    problems = []
+    if update:
+        if not os.path.exists(golden):
+            os.makedirs(golden)
+        fnc.writegolden(fnc.goldenfile(golden, name, "rpl"), entries["rpl"])
+        fnc.writegolden(fnc.goldenfile(golden, name, "conf"), entries["conf"])
+        manifest["cases"][name] = {"rpl": fnc.goldenhash(entries["rpl"]), "conf": fnc.goldenhash(entries["conf"]), "cells": entries["cells"]}
+    elif name not in manifest["cases"]:
+        problems.append("no golden file")
+    else:
+        for ext in ["rpl", "conf"]:
+            if fnc.goldenhash(entries[ext]) != manifest["cases"][name][ext]:
+                file = fnc.goldenfile(golden, name, ext)
+                lineno = fnc.comparegolden(file, entries[ext]) if os.path.isfile(file) else None
+                problems.append(f".{ext} differs" + (f" from line {lineno}" if lineno is not None else ""))
+    if replay.geterrors():
+        problems.append(f"{len(replay.geterrors())} invalid commands in replay")
+    elif replay.getcells(replay.getbody()) != entries["cells"]:
+        problems.append(f"replayed cells ({replay.getcells(replay.getbody())}) differ from predicted cells ({entries['cells']})")
+
+    # structure of OpenFOAM export of replayed blocking: one hex block per block of the fluid part, cells equal predicted cells
+    if not replay.geterrors():
+        try:
+            counts = fnc.foamcount(fnc.foamlines(fnc.structmesh(replay)))
+            if counts["blocks"] != len(replay.getblocks(replay.getbody())) or counts["cells"] != entries["cells"]:
+                problems.append(f"blockMeshDict with {counts['blocks']} blocks and {counts['cells']} cells (replayed blocks: {len(replay.getblocks(replay.getbody()))}, predicted cells: {entries['cells']})")
+        except ValueError as error:
+            problems.append(f"no mesh export ({error})")
+    status = "; ".join(problems) if problems else "updated" if update else "identical"
+    if problems:
+        failed += 1
+
+    # run times compared with history
+    slower = []
+    for phase, duration in entries["time"].items():
+        totals[phase] = totals.get(phase, 0.0) + duration
+        median = fnc.benchregression(history.get((name, phase), []), duration, slowdown)
+        if median is not None:
+            slower.append(f"{phase} {duration/median:.2f}x")
+        rows.append({"date": date, "case": name, "phase": phase, "time": round(duration, 6), "memory": entries["memory"][phase], "cells": entries["cells"], "status": status})
+    regressions += len(slower)
+
+    times = ", ".join(f"{phase} {duration*1000:.1f} ms" for phase, duration in entries["time"].items())
+    peak = max(entries["memory"].values())/1024
+    line = f"\t- {name}: {entries['cells']:,} cells, {times}, peak {peak:,.0f} kB"
+    if not problems:
+        print(f"{line}, {status}" + (f" {Fore.RED}(slower than median: {', '.join(slower)}){Style.RESET_ALL}" if slower else ""))
+    else:
+        print(f"{line}, {Fore.RED}{status}{Style.RESET_ALL}")
+
+
+################################################################# WRITE TO FILE #################################################################
+print(f"{Style.BRIGHT}\n\n################################################################# WRITE TO FILE #################################################################{Style.RESET_ALL}")
+if update:
+    manifest["settings"] = settings
+    with open(manifestfile, 'w') as file:
+        json.dump(manifest, file, indent=4)
+    file.close()
+    print(f" - golden files of {len(cases)} cases written to ~\\{goldendir}")
+
+newfile = not os.path.isfile(os.path.join(sourcedir, historyfile))
+with open(os.path.join(sourcedir, historyfile), 'a', newline='') as file:
+    writer = csv.DictWriter(file, fieldnames=list(rows[0]))
+    if newfile:
+        writer.writeheader()
+    writer.writerows(rows)
+file.close()
+print(f" - run times and peak memory added to {historyfile}")
+
+print("\nTotal run time per phase: " + ", ".join(f"{phase} {duration:.3f} s" for phase, duration in totals.items()))
+if regressions:
+    print(f"{Fore.RED}{regressions} phases slower than {slowdown} times the median of the last runs.{Style.RESET_ALL}")
+if failed:
+    fnc.specerror(f"\n{failed} of {len(cases)} cases differ from their golden files or have an invalid replay.")
+
+print(f"{Style.BRIGHT}{Fore.GREEN}\n\n##################################################################### DONE ######################################################################{Style.RESET_ALL}")
@@ -0,0 +1,39 @@
+# this script is used to validate and benchmark .rpl files without ICEM, the files are replayed by a stand-in for the subset of ICEM Tcl written by the scripts
+# usage: python rpl-replay.py [.rpl file] [.rpl file] ..., e.g. python rpl-replay.py 3D-horizontal-1/test/test.rpl, write mesh files next to the .rpl files: --export msh
+# the files rpl_gen_fnc.py and rpl_gen_obj.py are required to run this file, the exit code is 1 if a file contains invalid commands
+
+
+############################################################### DO NOT EDIT BELOW ###############################################################
+# dependencies
+import rpl_gen_fnc as fnc                       # function source file
+import os                                       # operating system operations
+import sys                                      # command line arguments
+import time                                     # run time of replay
+from colorama import Fore, Style, init          # console output formatting (validated to run on a windows system)
+
+
+################################################################# PROGRAM START #################################################################
+# initialize console formatting
+init(autoreset=True)
+
+# .rpl files from command line
+print(f"{Style.BRIGHT}################################################################# .RPL REPLAY ###################################################################{Style.RESET_ALL}")
+exports, rplfiles = fnc.getexports(sys.argv[1:])
+if not rplfiles:
+    fnc.specerror("No .rpl file specified. Usage: python rpl-replay.py [.rpl file] [.rpl file] ... [--export msh]")
+
+invalid = 0
+for rplfile in rplfiles:
+    if not os.path.isfile(rplfile):
+        fnc.specerror(f"File '{rplfile}' not found.")
+    start = time.perf_counter()
+    replay = fnc.replayrpl(rplfile)
+    print(f"{Style.BRIGHT}\nReplayed {rplfile} in {(time.perf_counter() - start)*1000:.1f} ms{Style.RESET_ALL}")
+    if fnc.printreplay(replay):
+        invalid += 1
+    elif exports:
+        fnc.writeexports(replay, os.path.splitext(rplfile)[0], exports)
+
+if invalid:
+    fnc.specerror(f"\n{invalid} of {len(rplfiles)} files contain invalid commands.")
+print(f"{Style.BRIGHT}{Fore.GREEN}\n\n##################################################################### DONE ######################################################################{Style.RESET_ALL}")
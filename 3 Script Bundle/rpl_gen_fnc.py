@@ -8,7 +8,37 @@ import numpy as np                          # numerical python
 import rpl_gen_obj as obj                   # import class source file
 import re                                   # regular expressions
 import os                                   # operating system operations
+import sys                                  # command line arguments
+import json                                 # .json parameter files
+import time                                 # run time of sweep members
+import itertools                            # parameter combinations of sweeps, lattice of mesh blocks
+import functools                            # products of section cell counts
+import csv                                  # history file of benchmark
+import gzip                                 # golden files of benchmark
+import hashlib                              # hashes of golden files
+import tracemalloc                          # peak memory of benchmark phases
+import tempfile                             # memory-mapped buffers of mesh export
+import contextlib                           # mesh export without memory-mapped buffers
+import base64                               # binary data arrays of .vtp preview files
+import multiprocessing                      # zones of CGNS export in worker processes
+from concurrent.futures import ProcessPoolExecutor      # zones of CGNS export in worker processes
 from colorama import Fore, Style, init      # console output formatting (validated to run on a windows system)
+try:
+    import tomllib                          # .toml parameter files (Python 3.11 or newer)
+except ImportError:
+    tomllib = None
+try:
+    from scipy.spatial import cKDTree       # nearest config files (optional, searched without index if not installed)
+except ImportError:
+    cKDTree = None
+try:
+    import h5py                             # CGNS export (optional, .cgns files are only written if installed)
+except ImportError:
+    h5py = None
+try:
+    import resource                         # peak memory of mesh export benchmark (not available on windows)
+except ImportError:
+    resource = None
 
 
 # numerical precision (specify in obj!)
@@ -16,21 +46,50 @@ geomprec = obj.geomprec         	# numerical precision of point locations
 meshprec = obj.meshprec             # numerical precision for mesh calculations
 
 
+# script folder, config files are searched in this folder and subfolders
+scriptdir = os.path.dirname(os.path.abspath(__file__))
+
+
+# mesh cache (specify in obj!), SQLite file is placed next to the scripts
+meshcache = obj.MeshCache(obj.meshcache_size, os.path.join(scriptdir, obj.meshcache_file) if obj.meshcache_file else "", obj.meshcache_filesize)
+
+
+# parsed config files by path, reused as long as modification time and size of the file are unchanged
+confcache = {}
+
+
+# config file catalog (specify in obj!), SQLite file is placed next to the scripts
+confcatalog = obj.ConfCatalog(os.path.join(scriptdir, obj.confcatalog_file) if obj.confcatalog_file else "")
+
+
+# index of geometry vectors of config files per folder, geometry type and geometry names, rebuilt if the config files change
+confindex = {}
+
+
 ################################################################# PROGRAM START #################################################################
 # initialize console formatting
 init(autoreset=True)
 
 
 # check for valid project name
-def checkname(dir, projname):
+# overwrite: use existing project folder (True/False) without prompt, prompt if None
+def checkname(dir, projname, overwrite=None):
     allowedchars = r'^[a-zA-Z0-9_+\-]+$'            # only letters, numbers and '_', '+', '-' are allowed
     validname = False
 
     if re.match(allowedchars, projname):
         projdir = os.path.join(dir, projname)       # project directory
 
+        # directory already exists, no prompt
+        if os.path.exists(projdir) and overwrite is not None:
+            if overwrite:
+                print(f"{Fore.RED}\nA folder with the specified project name '{projname}' already exists.{Style.RESET_ALL} Existing files in this folder with the project name will be overwritten.")
+                validname = True
+            else:
+                print(f"{Fore.RED}\nA folder with the specified project name '{projname}' already exists.{Style.RESET_ALL} Set 'overwrite' to use this folder anyway.\n")
+
         # directory already exists
-        if os.path.exists(projdir):
+        elif os.path.exists(projdir):
             while True:
                 # prompt to continue with existing folder
                 q_folder = input(f"{Fore.RED}\nA folder with the specified project name '{projname}' already exists.{Style.RESET_ALL} Existing files in this folder with the project name will be overwritten.\nUse this folder anyway? (y/n)\n>>> ").lower()                
@@ -56,21 +115,285 @@ def checkname(dir, projname):
     return validname
 
 
+# read config file into obj.ConfFile, the file is parsed once and reused until it is modified
+def readconf(conffile):
+    path = os.path.abspath(conffile)
+    key = confkey(path)
+    if path in confcache and confcache[path][0] == key:
+        return confcache[path][1]
+
+    conf = parseconf(path)
+    confcache[path] = (key, conf)
+    return conf
+
+
+# modification time and size of config file, parsed config files are valid as long as this key is unchanged
+def confkey(path):
+    stat = os.stat(path)
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+# config files in dir and subfolders, read without catalog, returns list of obj.ConfFile (unreadable files are skipped)
+def walkconfs(dir):
+    confs = []
+    for foldername, subfolders, filenames in os.walk(dir):
+        for filename in sorted(filenames):
+            if filename.endswith(".conf"):
+                try:
+                    confs.append(readconf(os.path.join(foldername, filename)))
+                except (OSError, UnicodeDecodeError):
+                    continue
+    return confs
+
+
+# parse config file into obj.ConfFile
+def parseconf(path):
+    with open(path, 'r') as file:
+        lines = [line.strip() for line in file]
+    
+    # data readable by script follows the separator line
+    for i, line in enumerate(lines):
+        if line.startswith("#"):
+            lines = lines[i + 1:]
+            break
+
+    geomtype = None         # geometry type
+    geoms = {}              # geometry values per dimension
+    meshes = {}             # meshing list per section
+    for line in lines:
+        vals = line.split()
+        if len(vals) == 0:
+            continue
+        
+        # geometry values, e.g. "xgeom  H=0.003 h_i=0.0005", None if no value
+        if vals[0] in ["xgeom", "ygeom", "zgeom"]:
+            if vals[0] not in geoms:
+                geoms[vals[0]] = {confgeom.split("=")[0]: confval(confgeom) for confgeom in vals[1:]}
+        # geometry type, e.g. "3D-horizontal-1"
+        elif len(vals) == 1:
+            if geomtype is None:
+                geomtype = vals[0]
+        # meshing list, e.g. "h_i uniform 43 0.0 0.0 2 2 1.2e-05" or "h_i: N/A"
+        else:
+            meshes.setdefault(vals[0].rstrip(":"), confmesh(vals[1:]))
+    
+    return obj.ConfFile(path, geomtype, geoms, meshes)
+
+
+# value of geometry in config file ("name=val"), None if no valid value
+def confval(confgeom):
+    try:
+        return float(confgeom.split("=")[1])
+    except (IndexError, ValueError):
+        return None
+
+
+# meshing list of section in config file, typed [rule, n, h1rel, h2rel, r1, r2, lmax], unchanged if not meshed
+def confmesh(vals):
+    try:
+        return [vals[0], int(vals[1])] + [float(val) for val in vals[2:]]
+    except (IndexError, ValueError):
+        return vals
+
+
 # checks config file if the geomtype matches the current selection
 def checkconf(conffile, geomtype):
-    typematch = False
-    with open(conffile, 'r') as file:
-        # reset pointer to first line
-        file.seek(0)
-        
-        # check if file contains "geomtype" specification
-        for line in file:
-            line = line.strip()
-            if line == geomtype:
-                typematch = True
-                break
-    file.close()
-    return typematch
+    # geometry type from catalog, config file is read if not in catalog or modified since
+    if confcatalog.getfile():
+        path = os.path.abspath(conffile)
+        entry = confcatalog.getgeomtype(path)
+        if entry is not None and entry[0] == confkey(path):
+            return entry[1] == geomtype
+    return readconf(conffile).getgeomtype() == geomtype
+
+
+# update config file catalog with config files in dir and subfolders
+# unchanged directories (modification time) are not listed again, config files are only read if new or modified
+def updatecatalog(dir):
+    root = os.path.abspath(dir)
+    knowndirs = confcatalog.getdirs(root)       # directories in catalog, {path: (parent, mtime)}
+    knownconfs = confcatalog.getconfs(root)     # config files in catalog, {path: (dir, mtime, size)}
+    subdirs = {}                                # subdirectories per directory in catalog
+    for path, (parent, mtime) in knowndirs.items():
+        subdirs.setdefault(parent, []).append(path)
+    dirconfs = {}                               # config files per directory in catalog
+    for path, (confdir, mtime, size) in knownconfs.items():
+        dirconfs.setdefault(confdir, []).append(path)
+    
+    dirs = []                                   # new or modified directories
+    confs = []                                  # new or modified config files
+    founddirs = set()                           # existing directories
+    foundconfs = set()                          # existing config files
+    stack = [(root, None)]
+    while len(stack) > 0:
+        path, parent = stack.pop()
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            continue
+        founddirs.add(path)
+
+        # unchanged directory, contents from catalog
+        if path in knowndirs and knowndirs[path][1] == mtime:
+            pathdirs = subdirs.get(path, [])
+            pathconfs = dirconfs.get(path, [])
+        # new or modified directory
+        else:
+            pathdirs = []
+            pathconfs = []
+            try:
+                with os.scandir(path) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            pathdirs.append(entry.path)
+                        elif entry.name.endswith(".conf"):
+                            pathconfs.append(entry.path)
+            except OSError:
+                continue
+            dirs.append((path, parent, mtime))
+        stack.extend((pathdir, path) for pathdir in pathdirs)
+
+        # new or modified config files
+        for conffile in pathconfs:
+            try:
+                stat = os.stat(conffile)
+            except OSError:
+                continue
+            foundconfs.add(conffile)
+            if knownconfs.get(conffile, (None, None, None))[1:] != (stat.st_mtime_ns, stat.st_size):
+                try:
+                    conf = parseconf(conffile)
+                except (OSError, UnicodeDecodeError):
+                    conf = obj.ConfFile(conffile, None, {}, {})
+                confs.append((conffile, path, stat.st_mtime_ns, stat.st_size, conf))
+    
+    confcatalog.update(dirs, confs, [path for path in knowndirs if path not in founddirs], [path for path in knownconfs if path not in foundconfs])
+
+
+# config files in dir and subfolders with filename containing name (exact: filename equal to name), from catalog if enabled
+def findconf(dir, name, exact=False):
+    if confcatalog.getfile():
+        updatecatalog(dir)
+        return confcatalog.find(os.path.abspath(dir), name, exact)
+    
+    # search dir and subdirectories for name
+    filelist = []
+    for foldername, subfolders, filenames in os.walk(dir):
+        for filename in filenames:
+            if filename == name or (not exact and name in filename):
+                filelist.append(os.path.abspath(os.path.join(foldername, filename)))
+    return filelist
+
+
+# search config files in dir and subfolders by geometry type (None: all types) and geometry values, from catalog if enabled
+# params: {name: val or [min, max]}, lengths in [mm], numbers without unit, returns paths of matching config files
+def searchconf(dir, geomtype=None, params=None):
+    ranges = {}
+    for name, val in (params or {}).items():
+        try:
+            valmin, valmax = (val, val) if not isinstance(val, (list, tuple)) else val
+            valmin, valmax = float(valmin), float(valmax)
+        except (TypeError, ValueError):
+            raise ValueError(f"Invalid value for '{name}'. Please enter a number or a range [min, max].")
+        # conversion from [mm] to [m], tolerance of numerical precision
+        if name != obj.ns_geomname:
+            valmin, valmax = valmin/1000.0, valmax/1000.0
+        tol = 0.5*10**-geomprec
+        ranges[name] = (valmin - tol, valmax + tol)
+    
+    if confcatalog.getfile():
+        updatecatalog(dir)
+        return confcatalog.search(os.path.abspath(dir), geomtype, ranges)
+    
+    # read config files in dir and subdirectories
+    filelist = []
+    for conf in walkconfs(dir):
+        confvals = {name: val for dim in ["xgeom", "ygeom", "zgeom"] for name, val in conf.getgeoms(dim).items()}
+        if geomtype is not None and conf.getgeomtype() != geomtype:
+            continue
+        if all(confvals.get(name) is not None and valmin <= confvals[name] <= valmax for name, (valmin, valmax) in ranges.items()):
+            filelist.append(conf.getfile())
+    return sorted(filelist)
+
+
+# closest config files in dir and subfolders with geometry type to geometries (list of geometry lists per dimension)
+# geometry vectors are compared on a logarithmic scale by the largest ratio of any geometry value to its value in the config file
+# config files in the folder exclude (e.g. the current project folder) are skipped
+# returns list of (path, deviation) with up to num entries, deviation 0.1 if no geometry value differs by more than a factor of 1.1
+def nearestconf(dir, geomtype, geoms, num=3, exclude=None):
+    root = os.path.abspath(dir)
+    exclude = os.path.abspath(exclude) if exclude else None
+    
+    # geometry vector
+    names = tuple(geom.getname() for dimgeoms in geoms for geom in dimgeoms)
+    vals = np.array([geom.getval() for dimgeoms in geoms for geom in dimgeoms], dtype=float)
+    if np.any(vals <= 0.0):
+        return []
+    
+    # geometry values of config files with geometry type, from catalog if enabled
+    if confcatalog.getfile():
+        updatecatalog(root)
+        state = confcatalog.getstate(root, geomtype)
+        values = None
+    else:
+        confs = [conf for conf in walkconfs(root) if conf.getgeomtype() == geomtype]
+        state = tuple((conf.getfile(), confcache[conf.getfile()][0]) for conf in confs)
+        values = {conf.getfile(): {name: val for dim in ["xgeom", "ygeom", "zgeom"] for name, val in conf.getgeoms(dim).items()} for conf in confs}
+    
+    # index of config files, rebuilt if config files were added, removed or modified
+    key = (root, geomtype, names)
+    if key not in confindex or confindex[key][0] != state:
+        paths = []
+        vectors = []
+        for path, confvals in sorted((values if values is not None else confcatalog.getvalues(root, geomtype)).items()):
+            vector = [confvals.get(name) for name in names]
+            # config files without all geometry values are not comparable
+            if all(val is not None and val > 0.0 for val in vector):
+                paths.append(path)
+                vectors.append(np.log10(vector))
+        vectors = np.array(vectors, dtype=float).reshape(-1, len(names))
+        index = cKDTree(vectors) if cKDTree is not None and len(paths) > 0 else vectors
+        confindex[key] = (state, paths, index)
+    state, paths, index = confindex[key]
+    if len(paths) == 0:
+        return []
+    
+    # closest geometry vectors (largest absolute difference of logarithms), additional entries for skipped config files
+    skipped = sum(os.path.dirname(path) == exclude for path in paths)
+    point = np.log10(vals)
+    if cKDTree is not None:
+        dists, found = index.query(point, k=min(num + skipped, len(paths)), p=np.inf)
+        dists, found = np.atleast_1d(dists), np.atleast_1d(found)
+    else:
+        alldists = np.max(np.abs(index - point), axis=1)
+        found = np.argsort(alldists, kind="stable")[:num + skipped]
+        dists = alldists[found]
+    nearest = [(paths[i], round(float(10**dist - 1.0), meshprec)) for i, dist in zip(found, dists) if os.path.dirname(paths[i]) != exclude]
+    return nearest[:num]
+
+
+# suggest closest config files in dir and subfolders as reference for meshing, except config files in the folder exclude (current project), returns chosen config file or None
+def suggestconf(dir, geomtype, geoms, exclude=None):
+    nearest = nearestconf(dir, geomtype, geoms, exclude=exclude)
+    if len(nearest) == 0:
+        return None
+    
+    print(f"\nFound {len(nearest)} config files of geometry type '{geomtype}' with similar geometry:")
+    for i, (conffile, deviation) in enumerate(nearest):
+        print(f"\t{i + 1}: ~\\{os.path.relpath(conffile, dir)} (largest deviation of a geometry value {round(deviation*100.0, 1)} %)")
+    while True:
+        q_input = input("Enter number of config file to be used for meshing parameters or 'n' to continue without reference:\n>>> ").lower()
+        if q_input == "n":
+            print()
+            return None
+        try:
+            index = int(q_input) - 1
+            if 0 <= index < len(nearest):
+                print(f"{Fore.GREEN}\nReading from file ~\\{os.path.relpath(nearest[index][0], dir)}{Style.RESET_ALL}")
+                return nearest[index][0]
+        except ValueError:
+            pass
+        print(f"{Fore.RED}Invalid input.{Style.RESET_ALL} Please enter a valid number between 1 and {len(nearest)} or 'n'.\n")
 
 
 # use specific config file
@@ -113,16 +436,8 @@ def getconf(dir, geomtype):
             confname = confinput
             conffile = confinput + ".conf"
 
-        # generate filelist matching specified conffile
-        filelist = []
-        # search dir and subdirectories for conffile
-        for foldername, subfolders, filenames in os.walk(dir):
-            for name in filenames:
-                # check for conffile
-                if conffile in name:
-                    filepath = os.path.join(foldername, name)
-                    relpath = os.path.relpath(filepath, dir)
-                    filelist.append(relpath)
+        # generate filelist matching specified conffile, from config file catalog
+        filelist = [os.path.relpath(filepath, dir) for filepath in findconf(dir, conffile)]
         length = len(filelist)
         
         # prompt user to choose file in case of multiple options
@@ -180,37 +495,20 @@ def getobj(name, objs):
             return obj
         
 
-# get geometry info from config file
+# get geometry info from config file, geom: "xgeom", "ygeom" or "zgeom"
 def getconfgeom(conffile, geom):
-    with open(conffile, 'r') as file:
-        for line in file:
-            line = line.strip()
-            if line.startswith(geom):
-                confgeoms = line.split()[1:]
-                break
-    file.close()
-    return confgeoms
+    return readconf(conffile).getgeoms(geom)
 
 
 # assign config geometry to geometry
 def assignconfgeom(geoms, confgeoms):
     for geom in geoms:
-        geommatch = False               # matching geometry found in config file
         name = geom.getname()           # name of geometry
         
         # look for match in config file
-        for confgeom in confgeoms:
-            if confgeom.startswith(name):
-                geommatch = True
-                
-                if "=" in confgeom:
-                    geom.setval(float(confgeom.split("=")[-1]))
-                else:
-                    print(f"{Fore.RED}\nNo reference for '{name}' found.{Style.RESET_ALL} Specify size manually.")
-                    setgeomval(geom)
-                break
-
-        if not geommatch:
+        if confgeoms.get(name) is not None:
+            geom.setval(confgeoms[name])
+        else:
             print(f"{Fore.RED}\nNo reference for '{name}' found.{Style.RESET_ALL} Specify size manually.")
             setgeomval(geom)
 
@@ -359,35 +657,21 @@ def setygeom_hstruc(ygeom):
             if checkygeom_hstruct(ygeom):
                 break
 
-    # calculate number of structures
+    # calculate number of structures or total domain length
+    adjusted = calcygeom_hstruc(ygeom, q_quant)
+    lt_geom = getobj(obj.lt_geomname, ygeom)                # temp object
+    lo_geom = getobj(obj.lo_geomname, ygeom)                # temp object
+    ns_geom = getobj(obj.ns_geomname, ygeom)                # temp object
     if q_quant == "l":
-        ns = int(round(np.floor(round((lt-li-lo-lgr)/(ls+lgr), geomprec))))
-        
-        # set number of structures
-        getobj(obj.ns_geomname, ygeom).setval(ns)
-        ns_geom = getobj(obj.ns_geomname, ygeom)            # temp object
         print(f"{Style.BRIGHT}\nSetting {ns_geom.getdescr()}: {ns_geom.getname()} = {ns_geom.getval()}{Style.RESET_ALL}")
-        
-        # calculating extra length to reach desired total domain length
-        if (li + ns*(ls + lgr) + lgr + lo) < lt:
-            ext = round(lt - (li + ns*(ls + lgr) + lgr + lo), geomprec)     # set remainder of total length minus sum of length computed from inlet
-            lo = round(lo + ext, geomprec)                                  # adjust length of smooth outlet region
-            
-            # adjust value of smooth outlet region
-            getobj(obj.lo_geomname, ygeom).setval(lo)
-            lo_geom = getobj(obj.lo_geomname, ygeom)        # temp object
+        if adjusted:
             print(f"{Style.BRIGHT}\nAdjusting {lo_geom.getdescr()}: {lo_geom.getname()} = {round(lo_geom.getval()*1000.0, geomprec)}{Style.RESET_ALL}")
-
-    # calculate total domain length
     else:
-        lt = round(li + ns*(ls + lgr) + lgr + lo, geomprec)
-        
-        # set total length of domain
-        getobj(obj.lt_geomname, ygeom).setval(lt)
-        lt_geom = getobj(obj.lt_geomname, ygeom)            # temp object
         print(f"{Style.BRIGHT}\nSetting {lt_geom.getdescr()}: {lt_geom.getname()} = {round(lt_geom.getval()*1000.0, geomprec)}{Style.RESET_ALL}")
-        
-        # extend/reduce smooth part at the end of domain to reach a certain y-length
+
+    # extend/reduce smooth part at the end of domain to reach a certain y-length
+    if q_quant == "n":
+        lo = getobj(obj.lo_geomname, ygeom).getval()        # smooth outlet section
         while True:
             q_addl = input("\nDo you want to add/remove domain length at the film outlet (l_o)? (y/n)\n>>> ").lower()
             if q_addl == "y":
@@ -406,14 +690,9 @@ def setygeom_hstruc(ygeom):
                         break
                 
                 # adjust lengths
-                getobj(obj.lt_geomname, ygeom).setval(lt + ext)         # adjust total length of domain
-                lt_geom = getobj(obj.lt_geomname, ygeom)                # temp object
+                extygeom_hstruc(ygeom, ext)
                 print(f"{Style.BRIGHT}\nSetting {lt_geom.getdescr()}: {lt_geom.getname()} = {round(lt_geom.getval()*1000.0, geomprec)}{Style.RESET_ALL}")
-                
-                getobj(obj.lo_geomname, ygeom).setval(lo + ext)         # adjust length of smooth outlet region
-                lo_geom = getobj(obj.lo_geomname, ygeom)                # temp object
                 print(f"{Style.BRIGHT}\nSetting {lo_geom.getdescr()}: {lo_geom.getname()} = {round(lo_geom.getval()*1000.0, geomprec)}{Style.RESET_ALL}")
-
                 break
             elif q_addl == "n":
                 break
@@ -421,6 +700,54 @@ def setygeom_hstruc(ygeom):
                 print(f"{Fore.RED}Invalid input.{Style.RESET_ALL} Please enter 'y' or 'n'.")
 
 
+# calculate number of structures (quant = "l") or total domain length (quant = "n") for ygeom with horizontal structures
+# returns True if the smooth outlet region has been adjusted to reach the total domain length
+def calcygeom_hstruc(ygeom, quant):
+    adjusted = False
+
+    # get values for calculation
+    lt = getobj(obj.lt_geomname, ygeom).getval()        # total domain size
+    ls = getobj(obj.ls_geomname, ygeom).getval()        # structures
+    lgr = getobj(obj.lgr_geomname, ygeom).getval()      # grooves
+    li = getobj(obj.li_geomname, ygeom).getval()        # inlet section
+    lo = getobj(obj.lo_geomname, ygeom).getval()        # outlet section
+    ns = getobj(obj.ns_geomname, ygeom).getval()        # number of structures
+
+    # calculate number of structures
+    if quant == "l":
+        ns = int(round(np.floor(round((lt-li-lo-lgr)/(ls+lgr), geomprec))))
+        
+        # set number of structures
+        getobj(obj.ns_geomname, ygeom).setval(ns)
+        
+        # calculating extra length to reach desired total domain length
+        if (li + ns*(ls + lgr) + lgr + lo) < lt:
+            ext = round(lt - (li + ns*(ls + lgr) + lgr + lo), geomprec)     # set remainder of total length minus sum of length computed from inlet
+            lo = round(lo + ext, geomprec)                                  # adjust length of smooth outlet region
+            
+            # adjust value of smooth outlet region
+            getobj(obj.lo_geomname, ygeom).setval(lo)
+            adjusted = True
+
+    # calculate total domain length
+    else:
+        lt = round(li + ns*(ls + lgr) + lgr + lo, geomprec)
+        
+        # set total length of domain
+        getobj(obj.lt_geomname, ygeom).setval(lt)
+    return adjusted
+
+
+# add/remove domain length at the film outlet for ygeom with horizontal structures
+def extygeom_hstruc(ygeom, ext):
+    lt = getobj(obj.lt_geomname, ygeom).getval()        # total domain size
+    lo = getobj(obj.lo_geomname, ygeom).getval()        # outlet section
+
+    # adjust lengths
+    getobj(obj.lt_geomname, ygeom).setval(lt + ext)         # adjust total length of domain
+    getobj(obj.lo_geomname, ygeom).setval(lo + ext)         # adjust length of smooth outlet region
+
+
 # set values for ygeom with smooth filmwall
 def setygeom_smooth(ygeom):
     for geom in ygeom:
@@ -456,113 +783,248 @@ def setzgeom(zgeom):
         if checkzgeom(zgeom):
             break
 
+    # set side sections
+    calczgeom(zgeom)
+
+
+# calculate side sections of zgeom
+def calczgeom(zgeom):
+    wt = getobj(obj.wt_geomname, zgeom).getval()    # total domain size
+    wc = getobj(obj.wc_geomname, zgeom).getval()    # central section
+
     # set side sections
     val = round((wt - wc)/2.0, geomprec)            # side sections
     getobj(obj.ws_geomname, zgeom).setval(val)
 
         
 ################################################################ MESHING RULES ##################################################################
-# calculate uniform node distribution
-def uniform(sect, h):
-    # create meshing array
-    mesh = [None]*7
-    mesh[0] = "uniform"                             # rule
-    mesh[1] = int(np.ceil(sect.getsize()/h)) + 1    # n
-    mesh[2] = 0.0                                   # h1rel
-    mesh[3] = 0.0                                   # h2rel
-    mesh[4] = 2                                     # r1
-    mesh[5] = 2                                     # r2
-    mesh[6] = h                                     # lmax (absolute)
-
-    sect.setmesh(mesh)
-
+# evaluate calculation on arrays and round results to mesh precision
+def meshround(calc, *args):
+    vals = np.asarray(calc(*args), dtype=float)
+    rounded = np.round(vals, meshprec)
+
+    # numpy and python powers and roundings may differ in the last digit
+    # values close to a rounding tie are evaluated and rounded with python floats, matching a calculation for single sections
+    scaled = np.abs(vals)*10.0**meshprec
+    tie = np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6
+    for i in np.flatnonzero(tie):
+        rounded.flat[i] = round(calc(*[arg.flat[i].item() for arg in args]), meshprec)
+    return rounded
+
+
+# sum of relative cell sizes over all n-1 cells, geometric distribution (floats or arrays), growth rate 1: uniform cells (hmin == hmax)
+def geomsum_calc(hrel, nodes, rate):
+    if np.ndim(rate) == 0:
+        return hrel*(nodes - 1) if rate == 1 else hrel * (1 - rate**(nodes - 1)) / (1 - rate)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(rate == 1, hrel*(nodes - 1), hrel * (1 - rate**(nodes - 1)) / (1 - rate))
+
+# growth rate to fit hrel_min to hrel_max to nodes-1 cells, geometric distribution (floats or arrays)
+def geomrate_calc(hrel_min, hrel_max, nodes):
+    return (hrel_max/hrel_min)**(1/(nodes-2))
 
 # calculate sum of relative cell sizes, geometric distribution
 def geomsum(hrel, nodes, rate):
-    # sum over all n-1 cells
-    sum = hrel * (1 - rate**(nodes - 1)) / (1 - rate)
-    return round(sum, meshprec)
+    hrel, nodes, rate = np.broadcast_arrays(np.asarray(hrel, dtype=float), np.asarray(nodes), np.asarray(rate, dtype=float))
+    return meshround(geomsum_calc, hrel, nodes, rate)
 
 # calculate growth rate, geometric distribution
 def geomrate(hrel_min, hrel_max, nodes):
-    # growth rate to fit hrel_min to hrel_max to nodes-1 cells
-    rate = (hrel_max/hrel_min)**(1/(nodes-2))
-    return round(rate, meshprec)
+    hrel_min, hrel_max, nodes = np.broadcast_arrays(np.asarray(hrel_min, dtype=float), np.asarray(hrel_max, dtype=float), np.asarray(nodes))
+    return meshround(geomrate_calc, hrel_min, hrel_max, nodes)
 
-# calculate geometric node distribution
+# calculate geometric node distributions, all arrays of sections are processed at once
 def geomcalc(length, hmin, hmax):
-    hrel_min = hmin/length                      # relative minimum cell size (fixed)
-    hrel_max = hmax/length                      # relative maximum cell size (max. allowed)
-    nodes = int(np.ceil(1.0/hrel_min) + 1)      # starting number of nodes, corresponding to uniform distribution with max. h1rel
-    rate = geomrate(hrel_min, hrel_max, nodes)  # starting growth rate
-    htot = geomsum(hrel_min, nodes, rate)       # total relative length of all cells combined
+    hrel_min = hmin/length                              # relative minimum cell size (fixed)
+    hrel_max = hmax/length                              # relative maximum cell size (max. allowed)
+    nodes = (np.ceil(1.0/hrel_min) + 1).astype(int)     # starting number of nodes, corresponding to uniform distribution with max. h1rel
+    rate = geomrate(hrel_min, hrel_max, nodes)          # starting growth rate
+    htot = geomsum(hrel_min, nodes, rate)               # total relative length of all cells combined
     
     # calculate maximum possible number of nodes for which hrel_max can be retained (fewer nodes lead to higher values of hrel_max)
-    while htot > 1:
-        nodes -= 1
-        rate = geomrate(hrel_min, hrel_max, nodes)
-        htot = geomsum(hrel_min, nodes, rate)
-    nodes += 1
+    # htot grows monotonically with the number of nodes, so the largest fitting number of nodes is found by bisection
+    over = htot > 1
+    nodes_fit = np.where(over, 3, nodes)                # 3 nodes always fit, as hmin + hmax <= length
+    nodes_over = nodes.copy()                           # smallest number of nodes known to exceed the section
+    search = over & (nodes_over - nodes_fit > 1)
+    while np.any(search):
+        idx = np.flatnonzero(search)
+        mid = (nodes_fit[idx] + nodes_over[idx])//2
+        midover = geomsum(hrel_min[idx], mid, geomrate(hrel_min[idx], hrel_max[idx], mid)) > 1
+        nodes_over[idx[midover]] = mid[midover]
+        nodes_fit[idx[~midover]] = mid[~midover]
+        search[idx] = nodes_over[idx] - nodes_fit[idx] > 1
+    nodes = nodes_fit + 1
     
     # adapt growth rate to maximum possible number of nodes
     rate = geomrate(hrel_min, hrel_max, nodes)
     htot = geomsum(hrel_min, nodes, rate)
-    while htot > 1:
-        rate -= 10**(-meshprec)
-        htot = geomsum(hrel_min, nodes, rate)
-    rate = round(rate, meshprec)
+    over = htot > 1
+    if np.any(over):
+        rate[over] = geomfit(hrel_min[over], nodes[over], rate[over])
+    rate = meshround(lambda rate: rate, rate)
 
     return rate, nodes
 
-# calculate geo1 node distribution
-def geo1(sect, hmin, hmax):
-    size = sect.getsize()
+# lower growth rates in steps of the mesh precision until the geometric distributions fit the sections
+def geomfit(hrel_min, nodes, rate):
+    step = 10**(-meshprec)                                      # smallest change in growth rate
+    steps_max = np.round((rate - 1.0)/step).astype(int) - 1     # largest number of steps keeping the growth rate above 1
+
+    # htot decreases monotonically with the growth rate: bracket the number of steps by doubling, then bisect
+    steps_over = np.zeros(rate.shape, dtype=int)                # largest number of steps known to exceed the section
+    steps_fit = np.ones(rate.shape, dtype=int)                  # candidate number of steps fitting the section
+    search = steps_fit < steps_max
+    while np.any(search):
+        idx = np.flatnonzero(search)
+        fitover = geomsum(hrel_min[idx], nodes[idx], rate[idx] - steps_fit[idx]*step) > 1
+        steps_over[idx[fitover]] = steps_fit[idx[fitover]]
+        steps_fit[idx[fitover]] *= 2
+        search[idx] = fitover & (steps_fit[idx] < steps_max[idx])
+    steps_fit = np.minimum(steps_fit, steps_max)
+    
+    # no fit found for growth rates above 1, continue in single steps
+    single = steps_fit <= steps_over
+    idx = np.flatnonzero(~single)
+    single[idx] = geomsum(hrel_min[idx], nodes[idx], rate[idx] - steps_fit[idx]*step) > 1
+    fitted = rate - steps_fit*step
+    for i in np.flatnonzero(single):
+        hrel_i = hrel_min[i].item()
+        nodes_i = nodes[i].item()
+        rate_i = rate[i].item() - max(steps_fit[i].item(), 0)*step
+        while round(geomsum_calc(hrel_i, nodes_i, rate_i), meshprec) > 1:
+            rate_i -= step
+        fitted[i] = rate_i
+    
+    # smallest number of steps fitting the section
+    search = ~single & (steps_fit - steps_over > 1)
+    while np.any(search):
+        idx = np.flatnonzero(search)
+        steps = (steps_over[idx] + steps_fit[idx])//2
+        stepsover = geomsum(hrel_min[idx], nodes[idx], rate[idx] - steps*step) > 1
+        steps_over[idx[stepsover]] = steps[stepsover]
+        steps_fit[idx[~stepsover]] = steps[~stepsover]
+        search[idx] = steps_fit[idx] - steps_over[idx] > 1
+    fitted[~single] = rate[~single] - steps_fit[~single]*step
+    return fitted
+
+
+# calculate node distributions for arrays of sections, distributions are looked up in the mesh cache first
+# rule: "uniform", "geo1" or "geo2", hmin: minimum cell size (cell size of uniform distributions), hmax: maximum cell size
+# returns arrays in order of the meshing list of a section: rule, n, h1rel, h2rel, r1, r2, lmax
+def meshcalc(rule, length, hmin, hmax):
+    rule = np.array(rule, dtype=object, ndmin=1)
+    length, hmin, hmax = np.broadcast_arrays(np.asarray(length, dtype=float), np.asarray(hmin, dtype=float), np.asarray(hmax, dtype=float))
+    length, hmin, hmax = np.atleast_1d(length, hmin, hmax)
+    rule = np.broadcast_to(rule, length.shape).copy()
+    if length.size == 0:
+        return meshdistr(rule, length, hmin, hmax)
+
+    # cache keys: exact inputs and mesh precision, sizes rounding to the same value at the mesh precision are cached separately
+    inputs = list(zip(rule.ravel().tolist(), length.ravel().tolist(), hmin.ravel().tolist(), hmax.ravel().tolist()))
+    keys = [(r, l, a, b, meshprec) for r, l, a, b in inputs]
+    entries = meshcache.getmany(keys)
+    missing = [i for i, entry in enumerate(entries) if entry is None]
+    if len(missing) > 0:
+        calc = meshdistr(*[[inputs[i][j] for i in missing] for j in range(4)])
+        calc = list(zip(*[col.tolist() for col in calc]))
+        meshcache.putmany([keys[i] for i in missing], calc)
+        for i, entry in zip(missing, calc):
+            entries[i] = entry
+    
+    # create meshing arrays
+    cols = list(zip(*entries))
+    rule = np.array(cols[0], dtype=object).reshape(length.shape)
+    n = np.array(cols[1], dtype=int).reshape(length.shape)
+    h1rel, h2rel, r1, r2, lmax = [np.array(col, dtype=float).reshape(length.shape) for col in cols[2:]]
+
+    return rule, n, h1rel, h2rel, r1, r2, lmax
+
+# calculate node distributions for arrays of sections, without mesh cache (see meshcalc)
+def meshdistr(rule, length, hmin, hmax):
+    rule = np.array(rule, dtype=object, ndmin=1)
+    length, hmin, hmax = np.broadcast_arrays(np.asarray(length, dtype=float), np.asarray(hmin, dtype=float), np.asarray(hmax, dtype=float))
+    length, hmin, hmax = np.atleast_1d(length, hmin, hmax)
+    rule = np.broadcast_to(rule, length.shape).copy()
+    
+    # for unsuitable values of geometric distributions, use uniform distribution (equal minimum and maximum cell size: uniform cells of size hmin)
+    geo = ((rule == "geo1") | (rule == "geo2")) & (hmin + hmax <= length) & (hmin < hmax)
+    rule[~geo] = "uniform"
+    geo1 = rule == "geo1"
+    geo2 = rule == "geo2"
+    uni = ~geo
     
-    # perform geo1 calculation
-    if hmin + hmax <= size:
-        # geo calculation
-        rate, nodes = geomcalc(size, hmin, hmax)
+    # create meshing arrays
+    n = np.zeros(length.shape, dtype=int)
+    h1rel = np.zeros(length.shape)
+    h2rel = np.zeros(length.shape)
+    r1 = np.full(length.shape, 2.0)
+    r2 = np.full(length.shape, 2.0)
+    lmax = np.where(geo, hmax, hmin)
+    
+    # uniform distribution
+    n[uni] = np.ceil(length[uni]/hmin[uni]).astype(int) + 1
+
+    # geometric distributions
+    rate = np.ones(length.shape)
+    if np.any(geo):
+        rate[geo], n[geo] = geomcalc(length[geo], hmin[geo], hmax[geo])
+    h1rel[geo1] = hmin[geo1]/length[geo1]
+    h2rel[geo1] = hmax[geo1]/length[geo1]
+    r1[geo1] = rate[geo1]
+    r2[geo1] = 1.0
+    h1rel[geo2] = hmax[geo2]/length[geo2]
+    h2rel[geo2] = hmin[geo2]/length[geo2]
+    r1[geo2] = 1.0
+    r2[geo2] = rate[geo2]
+
+    return rule, n, h1rel, h2rel, r1, r2, lmax
+
+
+# assign node distribution to section
+def meshsect(sect, rule, hmin, hmax):
+    mesh = [col[0] for col in meshcalc(rule, sect.getsize(), hmin, hmax)]
+    mesh[1:] = [val.item() for val in mesh[1:]]     # python numbers for .conf output
+    
+    # growth rates of uniform distributions are written as integers
+    if mesh[0] == "uniform":
+        mesh[4] = 2                                 # r1
+        mesh[5] = 2                                 # r2
 
-        # create meshing array
-        mesh = [None]*7
-        mesh[0] = "geo1"        # rule
-        mesh[1] = nodes         # n
-        mesh[2] = hmin/size     # h1rel
-        mesh[3] = hmax/size     # h2rel
-        mesh[4] = rate          # r1
-        mesh[5] = 1.0           # r2
-        mesh[6] = hmax          # lmax (absolute)
+    sect.setmesh(mesh)
 
-        sect.setmesh(mesh)
-    
-    # for unsuitable values, use uniform distribution
-    else:
-        uniform(sect, hmin)
-
-# calculate geo2 node distribution
-def geo2(sect, hmin, hmax):
-    size = sect.getsize()
-    
-    # perform geo2 calculation
-    if hmin + hmax <= size:
-        # geo calculation
-        rate, nodes = geomcalc(size, hmin, hmax)
-
-        # create meshing array
-        mesh = [None]*7
-        mesh[0] = "geo2"        # rule
-        mesh[1] = nodes         # n
-        mesh[2] = hmax/size     # h1rel
-        mesh[3] = hmin/size     # h2rel
-        mesh[4] = 1.0           # r1
-        mesh[5] = rate          # r2
-        mesh[6] = hmax          # lmax (absolute)
-
-        sect.setmesh(mesh)
-
-    # for unsuitable values, use uniform distribution
-    else:
-        uniform(sect, hmin)
+
+# calculate uniform node distribution
+def uniform(sect, h):
+    meshsect(sect, "uniform", h, h)
+
+# calculate geo1 node distribution, limited: maximum cell size lowered to keep the growth rate within obj.maxrate (see geomaxsize)
+def geo1(sect, hmin, hmax, limited=False):
+    meshsect(sect, "geo1", hmin, geomaxsize("geo1", sect.getsize(), hmin, hmax) if limited else hmax)
+
+# calculate geo2 node distribution, limited: maximum cell size lowered to keep the growth rate within obj.maxrate (see geomaxsize)
+def geo2(sect, hmin, hmax, limited=False):
+    meshsect(sect, "geo2", hmin, geomaxsize("geo2", sect.getsize(), hmin, hmax) if limited else hmax)
+
+# largest maximum cell size up to hmax of geometric distribution (rule "geo1" or "geo2") with growth rate within the mesh quality limit (obj.maxrate)
+# maximum cell sizes on the grid of the mesh precision are searched by bisection (fewer nodes and higher growth rates for larger sizes), returns hmax if within the limit
+def geomaxsize(rule, length, hmin, hmax):
+    def rate(h):
+        sizes = np.diff(distrnodes([col[0] for col in meshcalc(rule, length, hmin, h)], 0.0, 1.0))
+        return np.max(np.maximum(sizes[1:]/sizes[:-1], sizes[:-1]/sizes[1:])).item() if sizes.size > 1 else 1.0
+    if rate(hmax) <= obj.maxrate:
+        return hmax
+    lower = int(np.ceil(round(hmin*10**meshprec, 3)))          # grid of the mesh precision
+    upper = int(np.floor(round(hmax*10**meshprec, 3)))
+    if lower >= upper or rate(lower/10**meshprec) > obj.maxrate:
+        return hmin
+    while upper - lower > 1:
+        mid = (lower + upper)//2
+        if rate(mid/10**meshprec) <= obj.maxrate:
+            lower = mid
+        else:
+            upper = mid
+    return lower/10**meshprec
 
 
 ############################################################## MESHING FUNCTIONS ################################################################
@@ -864,28 +1326,1491 @@ def confmeshing_fnc(sect, factor, mesh):
 
 # meshing with reference config file
 def confmeshing(conffile, sects, factor):
-    with open(conffile, 'r') as file:        
-        for sect in sects:
-            sectmatch = False               # matching section found in config file        
-            name = sect.getname()
+    conf = readconf(conffile)
+    for sect in sects:
+        name = sect.getname()
+        mesh = conf.getmesh(name)           # matching section in config file
+        
+        # custom meshing
+        if mesh is None:
+            print(f"{Fore.RED}\nNo reference mesh for section '{name}' found.{Style.RESET_ALL} Custom meshing:")
+            custommeshing(sect)
+        # reference meshing   
+        else:
+            confmeshing_fnc(sect, factor, mesh)
+
+
+################################################################ PARAMETER FILE #################################################################
+# read parameter file (.json or .toml) given as first command line argument, no parameter file (interactive input) if None
+def getspec(args):
+    if len(args) < 2:
+        return None
+    
+    specfile = os.path.abspath(args[1])
+    try:
+        # .toml parameter file
+        if specfile.endswith(".toml"):
+            if tomllib is None:
+                specerror("Reading .toml parameter files requires Python 3.11 or newer.")
+            with open(specfile, 'rb') as file:
+                spec = tomllib.load(file)
+        # .json parameter file
+        else:
+            with open(specfile, 'r') as file:
+                spec = json.load(file)
+    except (OSError, ValueError) as err:
+        specerror(f"Parameter file '{args[1]}' could not be read: {err}")
+    
+    if not isinstance(spec, dict):
+        specerror(f"Parameter file '{args[1]}' does not contain a table of parameters.")
+    spec["specdir"] = os.path.dirname(specfile)         # reference config files are searched relative to parameter file
+    
+    print(f"{Fore.GREEN}Reading parameters from file '{args[1]}'.{Style.RESET_ALL}")
+    return spec
+
+
+# cell budget of scripts given as command line option (--max-cells 1000000), checked before the files are written
+# returns cell budget (None if not given) and remaining command line arguments
+def getmaxcells(args):
+    if "--max-cells" not in args:
+        return None, args
+    idx = args.index("--max-cells")
+    try:
+        maxcells = int(float(args[idx + 1]))
+    except (IndexError, ValueError):
+        specerror("Invalid cell budget. Use --max-cells followed by the maximum number of cells.")
+    if maxcells <= 0:
+        specerror("Invalid cell budget. Use --max-cells followed by the maximum number of cells.")
+    return maxcells, args[:idx] + args[idx + 2:]
+
+
+# mesh export formats given as command line option (--export msh), mesh files are written next to the .rpl file
+# returns formats (empty if not given) and remaining command line arguments
+def getexports(args):
+    if "--export" not in args:
+        return [], args
+    idx = args.index("--export")
+    formats = args[idx + 1].lower().split(",") if idx + 1 < len(args) else []
+    if not formats or any(fmt not in meshexports for fmt in formats):
+        specerror(f"Invalid mesh export. Use --export followed by the file formats ({', '.join(meshexports)}), e.g. --export msh.")
+    return formats, args[:idx] + args[idx + 2:]
+
+
+# preview of generated geometry and meshed edges given as command line option (--preview), .vtp file is written next to the .rpl file
+# returns True if given and remaining command line arguments
+def getpreview(args):
+    if "--preview" not in args:
+        return False, args
+    idx = args.index("--preview")
+    return True, args[:idx] + args[idx + 1:]
+
+
+# abort script execution with invalid parameter file
+def specerror(message):
+    print(f"{Fore.RED}{message}{Style.RESET_ALL}")
+    sys.exit(1)
+
+
+# get geometry variant from parameter file
+def specvariant(spec, key, variants):
+    variant = str(spec.get(key, variants[0]))
+    if variant not in variants:
+        raise ValueError(f"Invalid {key} variant '{variant}' in parameter file. Available variants: {', '.join(variants)}.")
+    return variant
+
+
+# get switch from parameter file
+def specbool(spec, key):
+    val = spec.get(key, False)
+    if not isinstance(val, bool):
+        raise ValueError(f"Invalid value for '{key}' in parameter file. Use true or false.")
+    return val
+
+
+# get project name from parameter file
+def specname(dir, spec):
+    projname = str(spec.get("project", ""))
+    try:
+        overwrite = specbool(spec, "overwrite")
+    except ValueError as err:
+        specerror(str(err))
+    if not checkname(dir, projname, overwrite):
+        specerror(f"Project name '{projname}' in parameter file cannot be used.")
+    return projname
+
+
+# get project name from parameter file without checking the project folder
+def specproject(spec):
+    projname = str(spec.get("project", ""))
+    if not re.match(r'^[a-zA-Z0-9_+\-]+$', projname):
+        raise ValueError(f"Invalid project name '{projname}' in parameter file. Only letters, numbers and '_', '+', '-' are allowed.")
+    return projname
+
+
+# find reference config file from parameter file in dir and subdirectories, no reference if None
+# the reference of the parameter file is replaced with the path found
+def specconf(dir, spec):
+    if "reference" not in spec:
+        return None
+    
+    confinput = str(spec["reference"])
+    if confinput.endswith(".conf"):
+        conffile = confinput
+    else:
+        conffile = confinput + ".conf"
+    
+    # path relative to parameter file
+    chosenfile = os.path.join(spec["specdir"], conffile)
+    
+    # search dir and subdirectories for conffile
+    if not os.path.isfile(chosenfile):
+        filelist = findconf(dir, os.path.basename(conffile), exact=True)
+        if len(filelist) != 1:
+            specerror(f"Found {len(filelist)} config files matching the reference '{confinput}'. Specify the path of the config file relative to the parameter file.")
+        chosenfile = filelist[0]
+    
+    print(f"{Fore.GREEN}\nReading from file ~\{os.path.relpath(chosenfile, dir)}{Style.RESET_ALL}")
+    spec["reference"] = chosenfile
+    return chosenfile
+
+
+# get reference config file from parameter file (path relative to parameter file), no reference if None
+def specreference(spec, geomtype):
+    if "reference" not in spec:
+        return None
+    
+    conffile = os.path.join(spec.get("specdir", ""), str(spec["reference"]))
+    if not conffile.endswith(".conf"):
+        conffile += ".conf"
+    if not os.path.isfile(conffile):
+        raise ValueError(f"Reference config file '{spec['reference']}' in parameter file not found.")
+    
+    # geometry types must match, as missing reference values would require user input
+    if not checkconf(conffile, geomtype):
+        raise ValueError(f"Reference config file '{spec['reference']}' was not created for geometry type '{geomtype}'.")
+    return conffile
+
+
+# assign geometry values from parameter file ([mm], numbers without unit)
+# calc: names of geometries calculated by the script, all other geometries are required
+def specgeomval(geoms, dim, vals, calc):
+    if not isinstance(vals, dict):
+        raise ValueError(f"Invalid values for '{dim}' in parameter file.")
+    
+    for name in vals:
+        geom = getobj(name, geoms)
+        if geom is None or name in calc:
+            raise ValueError(f"Invalid geometry '{name}' for '{dim}' in parameter file.")
+        try:
+            # accounting for numbers
+            if "number" in geom.getdescr():
+                val = abs(int(vals[name]))
+            # conversion from [mm] to [m]
+            else:
+                val = abs(float(vals[name])/1000.0)
+        except (TypeError, ValueError):
+            raise ValueError(f"Invalid value for '{name}' in parameter file. Please enter a valid number.")
+        geom.setval(val)
+    
+    for geom in geoms:
+        if geom.getname() not in vals and geom.getname() not in calc:
+            raise ValueError(f"No value for '{geom.getname()}' ({geom.getdescr()}) in '{dim}' of parameter file.")
+
+
+# assign geometry values from reference config file
+def specconfgeom(refconffile, geoms, dim):
+    if refconffile is None:
+        raise ValueError(f"No values for '{dim}' in parameter file.")
+    confgeoms = getconfgeom(refconffile, dim)
+    
+    # missing reference values would require user input
+    for geom in geoms:
+        if confgeoms.get(geom.getname()) is None:
+            raise ValueError(f"No reference for '{geom.getname()}' in '{dim}' of reference config file.")
+    assignconfgeom(geoms, confgeoms)
+
+
+# set values for xgeom from parameter file or reference config file
+def specxgeom(spec, xgeom, refconffile):
+    if "xgeom" in spec:
+        specgeomval(xgeom, "xgeom", spec["xgeom"], [])
+    else:
+        specconfgeom(refconffile, xgeom, "xgeom")
+
+    # check for valid parameters
+    if not checkxgeom(xgeom):
+        raise ValueError("Check x geometry parameters in parameter file.")
+
+
+# set values for ygeom with horizontal structures from parameter file or reference config file
+# either the total domain length (L) or the number of structures (n_s) is specified, optionally with additional domain length (ext)
+def specygeom_hstruc(spec, ygeom, refconffile):
+    if "ygeom" in spec:
+        vals = dict(spec["ygeom"]) if isinstance(spec["ygeom"], dict) else spec["ygeom"]
+        ext = vals.pop("ext", 0.0) if isinstance(vals, dict) else 0.0
+
+        # set total size (L) or number of structures (n_s)
+        if (obj.lt_geomname in vals) == (obj.ns_geomname in vals):
+            raise ValueError(f"Specify either '{obj.lt_geomname}' or '{obj.ns_geomname}' in 'ygeom' of parameter file.")
+        if obj.lt_geomname in vals:
+            quant = "l"
+            specgeomval(ygeom, "ygeom", vals, [obj.ns_geomname])
             
-            # reset pointer to first line
-            file.seek(0)
-
-            for line in file:
-                line = line.strip()
-                if line.startswith(name):
-                    sectmatch = True
-                    mesh = line.split()[1:]
-                    break
-            # custom meshing
-            if not sectmatch:
-                print(f"{Fore.RED}\nNo reference mesh for section '{name}' found.{Style.RESET_ALL} Custom meshing:")
-                custommeshing(sect)
-            # reference meshing   
+            # check for valid parameters
+            if not checkygeom_hstruct(ygeom):
+                raise ValueError("Check y geometry parameters in parameter file.")
+        else:
+            quant = "n"
+            specgeomval(ygeom, "ygeom", vals, [obj.lt_geomname])
+
+        # calculate number of structures or total domain length
+        calcygeom_hstruc(ygeom, quant)
+        
+        # extend/reduce smooth part at the end of domain to reach a certain y-length
+        if ext != 0.0:
+            try:
+                ext = float(ext)/1000.0     # conversion from [mm] to [m]
+            except (TypeError, ValueError):
+                raise ValueError("Invalid value for 'ext' in parameter file. Please enter a valid number.")
+            if quant == "l" or ext <= -getobj(obj.lo_geomname, ygeom).getval():
+                raise ValueError("Invalid value for 'ext' in parameter file.")
+            extygeom_hstruc(ygeom, ext)
+    else:
+        specconfgeom(refconffile, ygeom, "ygeom")
+
+        # check for valid parameters
+        if not checkygeom_hstruct(ygeom):
+            raise ValueError("Check y geometry parameters in reference config file.")
+
+
+# set values for ygeom with smooth filmwall from parameter file or reference config file
+def specygeom_smooth(spec, ygeom, refconffile):
+    if "ygeom" in spec:
+        specgeomval(ygeom, "ygeom", spec["ygeom"], [])
+    else:
+        specconfgeom(refconffile, ygeom, "ygeom")
+
+
+# set values for zgeom from parameter file or reference config file
+def speczgeom(spec, zgeom, refconffile):
+    if "zgeom" in spec:
+        specgeomval(zgeom, "zgeom", spec["zgeom"], [obj.ws_geomname])
+    else:
+        specconfgeom(refconffile, zgeom, "zgeom")
+    
+    # check for valid parameters
+    if not checkzgeom(zgeom):
+        raise ValueError("Check z geometry parameters in parameter file.")
+
+    # set side sections
+    calczgeom(zgeom)
+
+
+# check parameter file for meshing with reference config file ('meshing': 'default', 'reference' or 'nearest')
+def specconfmesh(spec, refconffile):
+    meshing = spec.get("meshing", "default")
+    if meshing == "reference" or meshing == "nearest":
+        if refconffile is None:
+            raise ValueError("Meshing with reference requires a reference config file in parameter file.")
+        return "y"
+    elif meshing == "default":
+        return "n"
+    else:
+        raise ValueError(f"Invalid meshing '{meshing}' in parameter file. Use 'default', 'reference' or 'nearest'.")
+
+
+# closest config file in script folder and subfolders as reference for meshing ('meshing': 'nearest'), except config files of the project projname
+def specnearest(geomtype, geoms, projname=None):
+    nearest = nearestconf(scriptdir, geomtype, geoms, 1, os.path.join(scriptdir, geomtype, projname) if projname else None)
+    if len(nearest) == 0:
+        raise ValueError(f"Meshing 'nearest' requires a config file of geometry type '{geomtype}' in the script folder or subfolders.")
+    return nearest[0][0]
+
+
+# get refinement factor for meshing with config file from parameter file
+def specfactor(spec):
+    try:
+        factor = float(spec.get("factor", 1.0))
+    except (TypeError, ValueError):
+        raise ValueError("Invalid value for 'factor' in parameter file. Please enter a valid number.")
+    if factor <= 0.0:
+        raise ValueError("Invalid value for 'factor' in parameter file. Refinement factor must be larger than zero.")
+    return factor
+
+
+# custom meshing of sections from parameter file, cell sizes in [mm]
+# 'sections': {name: {'rule': 'uni', 'h': h} or {'rule': 'geo1'/'geo2', 'hmin': hmin, 'hmax': hmax}}
+def specmeshing(spec, sects):
+    vals = spec.get("sections", {})
+    if not isinstance(vals, dict):
+        raise ValueError("Invalid values for 'sections' in parameter file.")
+    
+    for name in vals:
+        sect = getobj(name, sects)
+        if sect is None:
+            raise ValueError(f"Invalid section '{name}' in parameter file.")
+        length = sect.getsize()     # edge length in m
+        val = vals[name]
+        distr = val.get("rule") if isinstance(val, dict) else None
+        
+        if distr != "uni" and distr != "geo1" and distr != "geo2":
+            raise ValueError(f"Invalid meshing rule for section '{name}' in parameter file. Use 'uni', 'geo1' or 'geo2'.")
+        
+        # conversion from [mm] to [m]
+        try:
+            if distr == "uni":
+                h = round(float(val["h"])/1000.0, meshprec)
             else:
-                confmeshing_fnc(sect, factor, mesh)
-    file.close()
+                hmin = round(float(val["hmin"])/1000.0, meshprec)
+                hmax = round(float(val["hmax"])/1000.0, meshprec)
+        except (KeyError, TypeError, ValueError):
+            raise ValueError(f"Invalid meshing for section '{name}' in parameter file. Please enter valid cell sizes.")
+        
+        # uniform meshing
+        if distr == "uni":
+            if length < h:
+                raise ValueError(f"Invalid meshing for section '{name}' in parameter file.")
+            uniform(sect, h)
+        
+        # geometric meshing
+        else:
+            if hmin >= hmax or length < hmin or length < hmax:
+                raise ValueError(f"Invalid meshing for section '{name}' in parameter file.")
+            if distr == "geo1":
+                geo1(sect, hmin, hmax)
+            else:
+                geo2(sect, hmin, hmax)
+
+
+################################################################ PARAMETER SWEEP ################################################################
+# reset entity counters and entity store, names of points, curves and surfaces start from 0 for every model
+def resetcounts():
+    obj.Point.count = 0
+    obj.Curve.count = 0
+    obj.Surface.count = 0
+    obj.store = obj.EntityStore()
+
+
+# block topology of meshed geometry: sections of the blocks in order per dimension and active (not deleted) blocks
+# sects: meshing sections of all dimensions, ns: number of structures
+# returns names of sections per dimension and boolean array of active blocks (indices of sections in x, y and z)
+def meshblocks(geomtype, sects, ns=0):
+    names = {sect.getname() for sect in sects}
+
+    # horizontal structures: grooves (x < 0) only within the grooves in y
+    if "horizontal" in geomtype:
+        xnames = [obj.dgr_sectname, obj.hi_sectname, obj.hd_sectname, obj.hg_sectname]
+        ynames = [obj.li_sectname, obj.lgr_sectname] + [obj.ls_sectname, obj.lgr_sectname]*ns + [obj.lo_sectname]
+    # smooth wall: recessed outlet (x < 0) only within the recessed outlet in y
+    else:
+        xnames = [obj.hi_sectname, obj.hd_sectname, obj.hg_sectname]
+        ynames = [obj.lt_sectname]
+        if obj.lro_sectname in names:
+            xnames = [obj.hro_sectname, obj.heo_sectname] + xnames
+            ynames = ynames + [obj.lro_sectname]
+    
+    # additional gas space above film inlet, only above gas space in x
+    if obj.lag_sectname in names:
+        ynames = [obj.lag_sectname] + ynames
+
+    active = np.ones((len(xnames), len(ynames)), dtype=bool)
+    for i, xname in enumerate(xnames):
+        if xname in (obj.dgr_sectname, obj.hro_sectname, obj.heo_sectname):
+            active[i] = [yname in (obj.lgr_sectname, obj.lro_sectname) for yname in ynames]
+    for j, yname in enumerate(ynames):
+        if yname == obj.lag_sectname:
+            active[:, j] = [xname == obj.hg_sectname for xname in xnames]
+
+    # side sections and central section in z, no deleted blocks
+    if geomtype.startswith("3D"):
+        znames = [obj.ws1_sectname, obj.wc_sectname, obj.ws2_sectname]
+        return [xnames, ynames, znames], np.repeat(active[:, :, np.newaxis], len(znames), axis=2)
+    return [xnames, ynames], active
+
+
+# count cells and nodes of meshed geometry (faces for 2D geometries), blocks are meshed with the node counts of their sections
+# sects: meshing sections of all dimensions, ns: number of structures
+# returns number of cells, number of nodes and breakdown per section [(dimension, name, nodes, number of blocks in dimension, cells of blocks)]
+def meshcount(geomtype, sects, ns=0):
+    dims, active = meshblocks(geomtype, sects, ns)
+    
+    # number of cells per section, sections without meshing have no cells
+    cells = {}
+    for sect in sects:
+        if sect.getmesh()[1] is not None:
+            cells[sect.getname()] = sect.getmesh()[1] - 1
+    dimcells = [np.array([cells.get(name, 0) for name in names], dtype=np.int64) for names in dims]
+
+    # cells of active blocks
+    blockcells = active*functools.reduce(np.multiply.outer, dimcells)
+
+    # nodes: every node belongs to one vertex, edge, face or interior of the blocks (in the lattice of block vertices)
+    # lattice elements of active blocks, index 2*k + 1 is the interior of section k, index 2*k the vertex before
+    lattice = np.zeros(tuple(2*len(names) + 1 for names in dims), dtype=bool)
+    for offset in itertools.product(range(3), repeat=len(dims)):
+        lattice[tuple(slice(o, o + 2*len(names), 2) for o, names in zip(offset, dims))] |= active
+    weights = []
+    for names, dimcell in zip(dims, dimcells):
+        weight = np.ones(2*len(names) + 1, dtype=np.int64)
+        weight[1::2] = np.maximum(dimcell - 1, 0)   # nodes within a section
+        weights.append(weight)
+    nodes = int((lattice*functools.reduce(np.multiply.outer, weights)).sum())
+
+    # breakdown per section
+    breakdown = []
+    for axis, (dim, names) in enumerate(zip(["x", "y", "z"], dims)):
+        percells = blockcells.sum(axis=tuple(a for a in range(len(dims)) if a != axis))
+        for name in dict.fromkeys(names):
+            idx = [k for k, other in enumerate(names) if other == name]
+            breakdown.append((dim, name, cells[name] + 1 if name in cells else None, len(idx), int(percells[idx].sum())))
+    return int(blockcells.sum()), nodes, breakdown
+
+
+# node coordinates of meshing list [rule, n, h1rel, h2rel, r1, r2, lmax] from start to end coordinate (geo1: smallest cell at start, geo2: at end)
+# cells of geometric distributions grow with the growth rate from the smallest cell and are scaled to the distance
+def distrnodes(mesh, start, end):
+    cells = np.arange(mesh[1] - 1)
+    if mesh[0] == "geo1":
+        sizes = mesh[2]*mesh[4]**cells
+    elif mesh[0] == "geo2":
+        sizes = (mesh[3]*mesh[5]**cells)[::-1]
+    else:
+        sizes = np.ones(cells.size)
+    return start + (end - start)*np.concatenate(([0.0], np.cumsum(sizes)/np.sum(sizes)))
+
+
+# node coordinates of section in direction of increasing coordinates (as the default meshing), starting at 0.0, None if no distribution is defined
+def meshnodes(sect):
+    mesh = sect.getmesh()
+    if mesh[1] is None:
+        return None
+    return distrnodes(mesh, 0.0, sect.getsize())
+
+
+# mesh quality of meshed geometry from the node coordinates of all sections, sections without distribution are not checked
+# sects: meshing sections of all dimensions, ns: number of structures
+# returns worst values [(check, value, limit, location)] of growth rate within sections, cell size ratio at interfaces of blocks and aspect ratio of cells
+def meshquality(geomtype, sects, ns=0):
+    dims, active = meshblocks(geomtype, sects, ns)
+    dims[1] = dims[1][::-1]                         # blocks in y from the film outlet (increasing coordinates)
+    active = np.flip(active, axis=1)
+    cellsizes = {}
+    for sect in sects:
+        nodes = meshnodes(sect)
+        if nodes is not None:
+            cellsizes[sect.getname()] = np.diff(nodes)
+
+    # growth rate of neighbouring cells within sections
+    rate = (1.0, "")
+    for name, sizes in cellsizes.items():
+        if sizes.size > 1:
+            rate = max(rate, (np.max(np.maximum(sizes[1:]/sizes[:-1], sizes[:-1]/sizes[1:])).item(), name))
+
+    # ratio of cell sizes at interfaces of adjacent active blocks
+    jump = (1.0, "")
+    for axis, names in enumerate(dims):
+        for k in range(len(names) - 1):
+            if names[k] in cellsizes and names[k + 1] in cellsizes and np.any(np.take(active, k, axis) & np.take(active, k + 1, axis)):
+                sizes = (cellsizes[names[k]][-1], cellsizes[names[k + 1]][0])
+                jump = max(jump, ((max(sizes)/min(sizes)).item(), f"{names[k]} -> {names[k + 1]}"))
+
+    # aspect ratio of cells: largest cell size in one dimension over smallest cell size in another dimension, over all active blocks
+    shape = [1]*len(dims)
+    hmax = []
+    hmin = []
+    for axis, names in enumerate(dims):
+        shape[axis] = len(names)
+        hmax.append(np.array([cellsizes[name].max() if name in cellsizes else np.nan for name in names]).reshape(shape))
+        hmin.append(np.array([cellsizes[name].min() if name in cellsizes else np.nan for name in names]).reshape(shape))
+        shape[axis] = 1
+    aspect = np.zeros(active.shape)
+    for a, b in itertools.permutations(range(len(dims)), 2):
+        aspect = np.fmax(aspect, hmax[a]/hmin[b])
+    aspect = np.where(active, aspect, 0.0)
+    block = np.unravel_index(np.argmax(aspect), aspect.shape)
+    location = ", ".join(names[k] for names, k in zip(dims, block))
+    
+    return [("growth rate within sections", rate[0], obj.maxrate, rate[1]),
+            ("cell size ratio at interfaces", jump[0], obj.maxjump, jump[1]),
+            ("aspect ratio of cells", aspect[block].item(), obj.maxaspect, location)]
+
+
+# count cells of meshed geometry (faces for 2D geometries), ns: number of structures
+def cellcount(geomtype, sects, ns=0):
+    return meshcount(geomtype, sects, ns)[0]
+
+
+# print predicted cells and nodes of model before the files are written, cells per section
+# maxcells: cell budget (None for no budget), script execution is aborted if the model exceeds the budget
+def printmeshcount(model, maxcells=None):
+    cells, nodes, breakdown = meshcount(model.getgeomtype(), [sect for sects in model.getsects() for sect in sects], model.getns())
+    print(f"\nPredicted mesh{' (2D)' if model.getdim() == 2 else ''}:")
+    print(f"\t- {'hexa cells' if model.getdim() == 3 else 'quad cells'}: {cells:,}")
+    print(f"\t- nodes: {nodes:,}")
+    print("\t- cells per section:")
+    for dim, name, n, num, sectcells in breakdown:
+        print(f"\t\t{dim} {name}: {n if n is not None else 'N/A'} nodes, {num} {'block' if num == 1 else 'blocks'} in {dim}, {sectcells:,} cells")
+    
+    if maxcells is not None and cells > maxcells:
+        specerror(f"\nPredicted number of cells ({cells:,}) exceeds the cell budget of {maxcells:,} (--max-cells). No files written.")
+    return cells, nodes
+
+
+# print mesh quality of meshed geometry, script is aborted if a limit is exceeded and the check is enabled (meshcheck), otherwise a warning is printed
+def printmeshquality(model):
+    quality = meshquality(model.getgeomtype(), [sect for sects in model.getsects() for sect in sects], model.getns())
+    print("\nMesh quality (predicted from node distributions):")
+    exceeded = []
+    for check, value, limit, location in quality:
+        if value > limit:
+            exceeded.append(check)
+            print(f"\t- {check}: {Fore.RED}{value:.3f} at {location or 'N/A'} (limit {limit:g}){Style.RESET_ALL}")
+        else:
+            print(f"\t- {check}: {value:.3f} at {location or 'N/A'} (limit {limit:g})")
+    
+    if obj.meshcheck and exceeded:
+        specerror(f"\nMesh quality limits exceeded ({', '.join(exceeded)}). Adjust the meshing parameters or the limits in rpl_gen_obj.py. No files written.")
+    elif exceeded:
+        print(f"{Fore.RED}\nWarning: mesh quality limits exceeded ({', '.join(exceeded)}). Files are written anyway (meshcheck in rpl_gen_obj.py).{Style.RESET_ALL}")
+    return quality
+
+
+# set value in parameter file by key, keys of nested tables separated by '.' (e.g. 'ygeom.l_s')
+def setspecval(spec, key, val):
+    keys = key.split(".")
+    for k in keys[:-1]:
+        spec = spec.setdefault(k, {})
+    spec[keys[-1]] = val
+
+
+# full factorial design, all combinations of parameter values
+def sweepgrid(params):
+    keys = list(params)
+    return [dict(zip(keys, vals)) for vals in itertools.product(*[params[key] for key in keys])]
+
+
+# latin hypercube design, parameter ranges [min, max] are divided into as many intervals as samples, every interval is sampled once
+# integer ranges result in integer values (e.g. number of structures), other values are rounded to geometric precision in [mm]
+def sweeplhs(params, samples, seed=None):
+    rng = np.random.default_rng(seed)
+    design = [{} for i in range(samples)]
+    for key in params:
+        lo, hi = params[key]
+        u = (rng.permutation(samples) + rng.random(samples))/samples    # one random position per interval
+        if isinstance(lo, int) and isinstance(hi, int):
+            vals = [int(val) for val in np.minimum(np.floor(lo + u*(hi - lo + 1)), hi)]
+        else:
+            vals = [round(float(val), geomprec - 3) for val in lo + u*(hi - lo)]
+        for member, val in zip(design, vals):
+            member[key] = val
+    return design
+
+
+# generate sweep member with build function of model source file (e.g. build_3d_horizontal) from parameter file
+# files are written to dir\geomtype\project, members exceeding the cell budget maxcells or the mesh quality limits (meshcheck) are not written, returns manifest entries
+# exceeded mesh quality limits are listed in the manifest entry "quality"
+def sweepmember(build, specfile, dir, maxcells=None):
+    entries = {"rpl": "", "conf": "", "cells": "", "quality": "", "time": 0.0, "status": "done"}
+    
+    start = time.perf_counter()
+    try:
+        with open(specfile, 'r') as file:
+            spec = json.load(file)
+        file.close()
+        spec["specdir"] = os.path.dirname(os.path.abspath(specfile))
+        
+        model = build(spec)
+        entries["cells"] = cellcount(model.getgeomtype(), [sect for sects in model.getsects() for sect in sects], model.getns())
+        if maxcells is not None and entries["cells"] > maxcells:
+            raise ValueError(f"{entries['cells']} cells exceed the cell budget of {maxcells} (--max-cells)")
+        exceeded = [f"{check} {value:.3f} at {location}" for check, value, limit, location in meshquality(model.getgeomtype(), [sect for sects in model.getsects() for sect in sects], model.getns()) if value > limit]
+        entries["quality"] = "; ".join(exceeded)
+        if obj.meshcheck and exceeded:
+            raise ValueError(f"mesh quality limits exceeded ({entries['quality']})")
+        entries["rpl"], entries["conf"] = writemodel(model, dir, specbool(spec, "overwrite"))
+    except (OSError, ValueError) as err:
+        entries["status"] = f"failed: {err}"
+    except Exception as err:
+        entries["status"] = f"failed: {err!r}"
+    entries["time"] = round(time.perf_counter() - start, 3)
+    return entries
+
+
+################################################################## MESH EXPORT ##################################################################
+# Fluent face zone types of boundary parts (obj.mshtypes): bc-type of face section
+mshbctypes = {"wall": 3, "pressure-inlet": 4, "pressure-outlet": 5, "symmetry": 7, "velocity-inlet": 10, "mass-flow-inlet": 20, "outflow": 36}
+
+
+# structured mesh (obj.StructMesh) of the blocks of the initial part (fluid) of a replayed .rpl file (obj.Replay), node coordinates from the meshing of the edges
+# boundary faces of blocks (towards blocks of other parts or outside of the blocking) get the part of the surface (3D) or curve (2D) containing the face center,
+# faces without part get "default-wall", raises ValueError if the blocking is not aligned with the coordinate axes or not meshed
+def structmesh(replay, tol=1e-9):
+    dim = replay.getdim()
+    body = replay.getbody()
+    if body is None or not replay.getblocks(body):
+        raise ValueError("No blocking with blocks of the initial part loaded.")
+    phys, coords = replay.getgrid(tol)
+    lines = [replay.getlines(axis) for axis in range(dim)]
+    ranks = [{line: rank for rank, line in enumerate(axislines)} for axislines in lines]
+    blkranks = {blk: tuple(ranks[axis][line] for axis, line in enumerate(replay.getblock(blk))) for blk in replay.getblocks(body)}
+
+    # node coordinates per axis over the vertex lines spanned by the blocks, node index of vertex lines
+    nodes = []
+    index = []
+    for axis in range(dim):
+        first = min(rank[axis] for rank in blkranks.values())
+        last = max(rank[axis] for rank in blkranks.values()) + 1
+        axisnodes = []
+        axisindex = {first: 0}
+        for rank in range(first, last):
+            start, end = coords[axis][rank], coords[axis][rank + 1]
+            if start is None or end is None:
+                raise ValueError(f"Vertex line {lines[axis][rank if start is None else rank + 1]} of axis {axis} without associated geometry.")
+            meshing = replay.getmesh(axis, lines[axis][rank])
+            if meshing is None:
+                raise ValueError(f"Edges of axis {axis} from vertex line {lines[axis][rank]} not meshed.")
+            mesh, reverse = meshing
+            edgenodes = distrnodes(mesh, end, start)[::-1] if reverse else distrnodes(mesh, start, end)
+            edgenodes[0] = start                    # vertex line (exact for reversed distributions)
+            axisnodes.append(edgenodes[:-1])
+            axisindex[rank + 1] = axisindex[rank] + edgenodes.size - 1
+        axisnodes.append([coords[axis][last]])
+        nodes.append(np.concatenate(axisnodes))
+        index.append(axisindex)
+    blocks = {blk: tuple((index[axis][rank[axis]], index[axis][rank[axis] + 1]) for axis in range(dim)) for blk, rank in blkranks.items()}
+
+    # boundary geometry by plane (exact coordinate, planes within tolerance searched if not found): parts, lower and upper corners
+    planes = {}
+    for part, lower, upper in replay.getpatches():
+        for coord in range(dim):
+            if upper[coord] - lower[coord] <= tol:
+                planes.setdefault((coord, lower[coord]), []).append((part, lower, upper))
+    planes = {key: ([entry[0] for entry in entries], np.array([entry[1] for entry in entries]), np.array([entry[2] for entry in entries])) for key, entries in planes.items()}
+    
+    # boundary faces of blocks: lower face (cells at higher node index) and upper face of each axis
+    patches = []
+    for blk, rank in blkranks.items():
+        for axis in range(dim):
+            for side, line, other in ((1, rank[axis], rank[axis] - 1), (-1, rank[axis] + 1, rank[axis] + 1)):
+                if 0 <= other < len(lines[axis]) - 1 and replay.getfamily([lines[a][other if a == axis else rank[a]] for a in range(dim)]) == body:
+                    continue
+                plane = coords[axis][line]
+                others = [phys[a] for a in range(dim) if a != axis]
+                center = np.array([(coords[a][rank[a]] + coords[a][rank[a] + 1])/2 for a in range(dim) if a != axis])
+                keys = [(phys[axis], plane)] if (phys[axis], plane) in planes else [key for key in planes if key[0] == phys[axis] and abs(key[1] - plane) <= tol]
+                part = "default-wall"
+                for key in keys:
+                    parts, lower, upper = planes[key]
+                    inside = np.nonzero(np.all((lower[:, others] - tol <= center) & (center <= upper[:, others] + tol), axis=1))[0]
+                    if inside.size:
+                        part = parts[inside[0]]
+                        break
+                ranges = list(blocks[blk])
+                ranges[axis] = (index[axis][line], index[axis][line])
+                patches.append((part, axis, index[axis][line], side, tuple(ranges)))
+    return obj.StructMesh(body, phys, nodes, blocks, patches)
+
+
+# node numbers, cell numbers (0: no node or cell) and node coordinates of structured mesh in buffers (obj.MeshBuffer), filled block by block in rows of the first axis
+# dir: folder of memory-mapped .npy files (buffers in memory if empty), returns buffers of node numbers, cell numbers, node coordinates and number of nodes
+def meshbuffers(mesh, dir=""):
+    dim = mesh.getdim()
+    shape = mesh.getshape()
+    blocks = mesh.getblocks()
+    bound = sum(int(np.prod([stop - start + 1 for start, stop in ranges])) for ranges in blocks.values())     # nodes of blocks, shared nodes counted per block
+    dtype = np.int32 if max(bound, mesh.getcells()) < 2**31 else np.int64
+    nodeids = obj.MeshBuffer(os.path.join(dir, "nodeids.npy") if dir else "", dtype, shape)
+    cellids = obj.MeshBuffer(os.path.join(dir, "cellids.npy") if dir else "", dtype, tuple(n - 1 for n in shape))
+    coords = obj.MeshBuffer(os.path.join(dir, "coords.npy") if dir else "", np.float64, (bound, dim))
+    nodes = 0
+    cells = 0
+    for ranges in blocks.values():
+        (first, last), others = ranges[0], ranges[1:]
+
+        # nodes not numbered by previous blocks, numbered in order of the rows
+        window = (slice(None),) + tuple(slice(start, stop + 1) for start, stop in others)
+        step = max(1, obj.exportchunk//int(np.prod([stop - start + 1 for start, stop in others])))
+        for start in range(first, last + 1, step):
+            rows = nodeids.rows(start, min(start + step, last + 1), write=True)
+            region = rows[window]
+            new = np.nonzero(region == 0)
+            count = new[0].size
+            if count:
+                region[new] = np.arange(nodes + 1, nodes + count + 1)
+                chunk = coords.rows(nodes, nodes + count, write=True)
+                chunk[:] = mesh.getcoords([new[0] + start] + [idx + lower for idx, (lower, upper) in zip(new[1:], others)])
+                nodes += count
+                del chunk
+            del rows, region
+
+        # cells numbered in order of the rows
+        window = (slice(None),) + tuple(slice(start, stop) for start, stop in others)
+        step = max(1, obj.exportchunk//int(np.prod([stop - start for start, stop in others])))
+        for start in range(first, last, step):
+            rows = cellids.rows(start, min(start + step, last), write=True)
+            region = rows[window]
+            region[...] = np.arange(cells + 1, cells + region.size + 1).reshape(region.shape)
+            cells += region.size
+            del rows, region
+    return nodeids, cellids, coords, nodes
+
+
+# rows of faces of structured mesh normal to axis at node index plane: node numbers (right-hand normal pointing to c0) and cell numbers c0, c1
+# cells: cell indices of the faces per axis (arrays, entry of axis is ignored), plane: node index or array of node indices of the faces
+# side: 1 or -1 for boundary faces with cells at higher or lower index, 0 for interior faces
+# nodeids, cellids: rows of node and cell numbers starting at first rows (first node row, first cell row) of the first axis
+def mshfaces(mesh, nodeids, cellids, axis, plane, cells, side, first=(0, 0)):
+    dim = mesh.getdim()
+    others = [(axis + k) % dim for k in range(1, dim)]
+    corners = [(0, 0), (1, 0), (1, 1), (0, 1)] if dim == 3 else [(0,), (1,)]
+    orient = mesh.getorient(axis)
+    if side == -orient:
+        corners = corners[::-1]
+    cols = []
+    for corner in corners:
+        idx = list(cells)
+        idx[axis] = plane
+        for other, offset in zip(others, corner):
+            idx[other] = cells[other] + offset
+        idx[0] = idx[0] - first[0]
+        cols.append(nodeids[tuple(idx)])
+    lower = list(cells)
+    lower[axis] = plane - 1
+    lower[0] = lower[0] - first[1]
+    upper = list(cells)
+    upper[axis] = plane
+    upper[0] = upper[0] - first[1]
+    if side == 0:
+        c0, c1 = (cellids[tuple(upper)], cellids[tuple(lower)]) if orient == 1 else (cellids[tuple(lower)], cellids[tuple(upper)])
+    else:
+        c0 = cellids[tuple(upper if side == 1 else lower)]
+        c1 = np.zeros_like(c0)
+    return np.column_stack(cols + [c0, c1])
+
+
+# rows of boundary faces of patch of structured mesh (see obj.StructMesh), faces in chunks of rows of the first axis (obj.exportchunk faces)
+def mshpatch(mesh, nodeids, cellids, patch):
+    part, axis, plane, side, ranges = patch
+    counts = [1 if other == axis else stop - start for other, (start, stop) in enumerate(ranges)]
+    if axis == 0:
+        chunks = [(plane, plane + 1)]
+    else:
+        step = max(1, obj.exportchunk//int(np.prod(counts[1:])))
+        chunks = [(start, min(start + step, ranges[0][1])) for start in range(ranges[0][0], ranges[0][1], step)]
+    for start, stop in chunks:
+        grid = np.meshgrid(*[np.arange(start, stop) if other == 0 else [plane] if other == axis else np.arange(lower, upper) for other, (lower, upper) in enumerate(ranges)], indexing='ij')
+        if axis == 0:
+            cellrow = plane if side == 1 else plane - 1
+            rows = (nodeids.rows(plane, plane + 1), cellids.rows(cellrow, cellrow + 1))
+            first = (plane, cellrow)
+        else:
+            rows = (nodeids.rows(start, stop + 1), cellids.rows(start, stop))
+            first = (start, start)
+        faces = mshfaces(mesh, rows[0], rows[1], axis, plane, [idx.ravel() for idx in grid], side, first)
+        del rows
+        yield faces
+
+
+# write rows of numbers to open binary file, fmt: format of one row (ASCII, rows are formatted in chunks of obj.exportchunk rows)
+# or NumPy data type of the values (binary, e.g. "<f8")
+def mshrows(file, rows, fmt):
+    if "%" not in fmt:
+        np.ascontiguousarray(rows, dtype=fmt).tofile(file)
+        return
+    for start in range(0, len(rows), obj.exportchunk):
+        chunk = rows[start:start + obj.exportchunk]
+        file.write(((fmt*len(chunk)) % tuple(chunk.ravel().tolist())).encode())
+
+
+# periodic parts of structured mesh: two parts covering the boundary planes at both ends of the y axis (flow direction) with the same faces
+# (periodic variants of the scripts), returns part names [y = 0, y = max] or an empty list
+def periodicparts(mesh):
+    axis = mesh.getphys().index(1)
+    ends = []
+    for plane in (0, mesh.getnodes(axis).size - 1):
+        faces = {}
+        for part, patchaxis, patchplane, _, ranges in mesh.getpatches():
+            if patchaxis == axis and patchplane == plane:
+                faces.setdefault(part, []).append(ranges[:axis] + ranges[axis + 1:])
+        ends.append(faces)
+    if len(ends[0]) == 1 and len(ends[1]) == 1:
+        (lower, lowerfaces), = ends[0].items()
+        (upper, upperfaces), = ends[1].items()
+        if lower != upper and sorted(lowerfaces) == sorted(upperfaces):
+            return [lower, upper]
+    return []
+
+
+# write Fluent mesh file of structured mesh: cell zone of the meshed blocks, interior faces and one face zone per part of the boundary faces
+# zone types of parts as specified in obj (walls if not specified), indices in hexadecimal as in Fluent, raises ValueError for invalid zone types
+# node coordinates and faces in binary sections (3010, 2013, obj.mshbinary) or ASCII sections (10, 13), periodic parts are not paired
+# meshes of at least obj.mapcells cells are numbered in memory-mapped .npy files (obj.mapdir) and written row by row of the first axis (bounded memory)
+# returns numbers of nodes, cells and faces
+def writemsh(mesh, file):
+    dim = mesh.getdim()
+    parts = mesh.getparts()
+    for part in parts:
+        if obj.mshtypes.get(part, "wall") not in mshbctypes:
+            raise ValueError(f"Invalid Fluent zone type '{obj.mshtypes[part]}' of part {part} in rpl_gen_obj.py. Use {', '.join(mshbctypes)}.")
+    cells = mesh.getcells()
+    mapped = 0 <= obj.mapcells <= cells
+
+    # number of faces: boundary faces of blocks per part, interior faces shared by two cells (all other faces of the cells)
+    boundary = {part: sum(int(np.prod([stop - start for axis, (start, stop) in enumerate(ranges) if axis != patchaxis])) for _, patchaxis, _, _, ranges in mesh.getpatches(part)) for part in parts}
+    interior = (2*dim*cells - sum(boundary.values()))//2
+    faces = interior + sum(boundary.values())
+    facetype = 4 if dim == 3 else 2
+    if obj.mshbinary:
+        sections = {"nodes": 3010, "cells": 2012, "faces": 2013}
+        nodefmt, facefmt = "<f8", "<i4"
+        end = lambda section: f")\nEnd of Binary Section {section:6d})\n".encode()
+    else:
+        sections = {"nodes": 10, "cells": 12, "faces": 13}
+        nodefmt, facefmt = " ".join(["%.15g"]*dim) + "\n", " ".join(["%x"]*(2**(dim - 1) + 2)) + "\n"
+        end = lambda section: b"))\n"
+
+    with tempfile.TemporaryDirectory(dir=obj.mapdir or None) if mapped else contextlib.nullcontext("") as dir:
+        nodeids, cellids, coords, nodes = meshbuffers(mesh, dir)
+        try:
+            with open(file, 'wb', buffering=obj.writebuffer) as msh:
+                msh.write(f'(0 "structured mesh of {mesh.getname()} blocks")\n(2 {dim})\n'.encode())
+                msh.write(f"(10 (0 1 {nodes:x} 0 {dim}))\n(12 (0 1 {cells:x} 0))\n(13 (0 1 {faces:x} 0))\n".encode())
+
+                # nodes in order of node numbers
+                msh.write(f"({sections['nodes']} (1 1 {nodes:x} 1 {dim})(\n".encode())
+                for start in range(0, nodes, obj.exportchunk):
+                    rows = coords.rows(start, min(start + obj.exportchunk, nodes))
+                    mshrows(msh, rows, nodefmt)
+                    del rows
+                msh.write(end(sections["nodes"]))
+                msh.write(f"({sections['cells']} (2 1 {cells:x} 1 {4 if dim == 3 else 3}))\n".encode())
+
+                # interior faces per row of cells of the first axis: faces towards the previous row, faces normal to the other axes within the row
+                msh.write(f"({sections['faces']} (3 1 {interior:x} 2 {facetype})(\n".encode())
+                for row in range(cellids.getshape()[0]):
+                    first = (row, max(row - 1, 0))
+                    rows = (nodeids.rows(row, row + 2), cellids.rows(first[1], row + 1))
+                    active = rows[1][row - first[1]] > 0
+                    if row > 0:
+                        idx = list(np.nonzero((rows[1][0] > 0) & active))
+                        mshrows(msh, mshfaces(mesh, rows[0], rows[1], 0, row, [None] + idx, 0, first), facefmt)
+                    for axis in range(1, dim):
+                        lower = [slice(None)]*(dim - 1)
+                        upper = [slice(None)]*(dim - 1)
+                        lower[axis - 1] = slice(None, -1)
+                        upper[axis - 1] = slice(1, None)
+                        idx = list(np.nonzero(active[tuple(lower)] & active[tuple(upper)]))
+                        mshrows(msh, mshfaces(mesh, rows[0], rows[1], axis, idx[axis - 1] + 1, [np.full(idx[0].size, row)] + idx, 0, first), facefmt)
+                    del rows
+                msh.write(end(sections["faces"]))
+
+                # boundary faces per part
+                start = interior + 1
+                for zone, part in enumerate(parts, 4):
+                    msh.write(f"({sections['faces']} ({zone:x} {start:x} {start + boundary[part] - 1:x} {mshbctypes[obj.mshtypes.get(part, 'wall')]:x} {facetype})(\n".encode())
+                    for patch in mesh.getpatches(part):
+                        for rows in mshpatch(mesh, nodeids, cellids, patch):
+                            mshrows(msh, rows, facefmt)
+                    msh.write(end(sections["faces"]))
+                    start += boundary[part]
+
+                # zone names
+                msh.write(f"(39 (2 fluid {mesh.getname()})())\n(39 (3 interior default-interior)())\n".encode())
+                for zone, part in enumerate(parts, 4):
+                    msh.write(f"(39 ({zone} {obj.mshtypes.get(part, 'wall')} {part})())\n".encode())
+            msh.close()
+        finally:
+            for buffer in (nodeids, cellids, coords):
+                buffer.close()
+    return {"nodes": nodes, "cells": cells, "faces": faces}
+
+
+# CGNS boundary condition types of boundary parts (obj.mshtypes, Fluent zone types): BCType_t of family
+cgnsbctypes = {"wall": "BCWall", "pressure-inlet": "BCInflowSubsonic", "pressure-outlet": "BCOutflowSubsonic", "symmetry": "BCSymmetryPlane", 
+               "velocity-inlet": "BCInflow", "mass-flow-inlet": "BCInflow", "outflow": "BCOutflow"}
+
+
+# HDF5 string types of CGNS attributes by length (null-terminated as written by the CGNS library), created on first use
+cgnsstrings = {}
+
+
+# add CGNS attributes (name, label, data type and flags) to HDF5 node (h5py low-level group id)
+def cgnsattrs(node, name, label, type):
+    for key, value, size in ((b"name", name, 33), (b"label", label, 33), (b"type", type, 3)):
+        if size not in cgnsstrings:
+            cgnsstrings[size] = h5py.h5t.C_S1.copy()
+            cgnsstrings[size].set_size(size)
+            cgnsstrings[size].set_strpad(h5py.h5t.STR_NULLTERM)
+        h5py.h5a.create(node, key, cgnsstrings[size], h5py.h5s.create(h5py.h5s.SCALAR)).write(np.array(value.encode(), dtype=f"S{size}"))
+    h5py.h5a.create(node, b"flags", h5py.h5t.NATIVE_INT32, h5py.h5s.create_simple((1,))).write(np.array([1], dtype=np.int32))
+
+
+# add CGNS node (HDF5 group with CGNS attributes and dataset " data") to parent (h5py low-level group id), type: CGNS data type (MT: no data, C1: string)
+# low-level API of h5py, the CGNS file of a blocking with many blocks consists of many small nodes, returns group id of node
+def cgnsnode(parent, name, label, type="MT", data=None):
+    node = h5py.h5g.create(parent, name.encode())
+    cgnsattrs(node, name, label, type)
+    if type != "MT":
+        values = np.frombuffer(data.encode(), dtype=np.int8) if type == "C1" else np.ascontiguousarray(data, dtype={"I4": np.int32, "I8": np.int64, "R4": np.float32, "R8": np.float64}[type])
+        h5py.h5d.create(node, b" data", h5py.h5t.py_create(values.dtype), h5py.h5s.create_simple(values.shape)).write(h5py.h5s.ALL, h5py.h5s.ALL, values)
+    return node
+
+
+# node coordinates of block of structured mesh with node index ranges per axis (worker process of CGNS export)
+# returns arrays of the x, y(, z) coordinates with the shape of the block nodes (k, j, i: axes of the mesh)
+def cgnscoords(mesh, ranges):
+    grid = np.meshgrid(*[mesh.getnodes(axis)[start:stop + 1] for axis, (start, stop) in enumerate(ranges)], indexing='ij')
+    return [grid[mesh.getphys().index(coord)] for coord in range(mesh.getdim())]
+
+
+# faces of the blocks of structured mesh: (axis, node index, side, node index ranges of the other axes): block number
+# side 1: lower face of block (cells at higher index, as the boundary faces of obj.StructMesh), -1: upper face
+def blockfaces(mesh):
+    faces = {}
+    for blk, ranges in mesh.getblocks().items():
+        for axis in range(mesh.getdim()):
+            for side, plane in ((1, ranges[axis][0]), (-1, ranges[axis][1])):
+                faces[(axis, plane, side, tuple(ranges[:axis] + ranges[axis + 1:]))] = blk
+    return faces
+
+
+# CGNS point range of the face of a block normal to axis at node index plane, ranges: node index ranges of the block per axis (k, j, i)
+# returns first and last node of the face in the zone of the block (i, j(, k), starting at 1)
+def cgnsrange(ranges, axis, plane):
+    begin = [plane - start + 1 if other == axis else 1 for other, (start, stop) in enumerate(ranges)]
+    end = [plane - start + 1 if other == axis else stop - start + 1 for other, (start, stop) in enumerate(ranges)]
+    return [begin[::-1], end[::-1]]
+
+
+# zones of CGNS export: one structured zone per block, boundary faces (CGNS point range, part) and interfaces with neighbouring blocks (point ranges, donor)
+# point ranges: first and last node (i, j(, k), starting at 1) of the zone, i runs along the last axis of the mesh
+def cgnszones(mesh):
+    blocks = mesh.getblocks()
+    faces = blockfaces(mesh)
+    zones = {blk: {"name": f"block.{blk}", "bcs": [], "conns": []} for blk in blocks}
+    for part, axis, plane, side, ranges in mesh.getpatches():
+        blk = faces[(axis, plane, side, tuple(ranges[:axis] + ranges[axis + 1:]))]
+        zones[blk]["bcs"].append((part, cgnsrange(blocks[blk], axis, plane)))
+    for (axis, plane, side, others), blk in faces.items():
+        donor = faces.get((axis, plane, -side, others))
+        if donor is not None:
+            zones[blk]["conns"].append((zones[donor]["name"], cgnsrange(blocks[blk], axis, plane), cgnsrange(blocks[donor], axis, plane)))
+    return zones
+
+
+# write CGNS file (HDF5, requires h5py) of structured mesh: one structured zone per block with 1-to-1 interfaces to the neighbouring blocks,
+# boundary faces of the blocks as boundary conditions of the family of their part (BC types from the zone types of parts in obj)
+# node coordinates of the zones are computed in worker processes (obj.exportworkers) while the file is written, nodes of interfaces are counted per zone
+# returns numbers of zones, nodes, cells and faces, raises ValueError if h5py is not installed or for invalid zone types
+def writecgns(mesh, file):
+    if h5py is None:
+        raise ValueError("The CGNS export requires h5py, install it with: pip install h5py")
+    dim = mesh.getdim()
+    parts = mesh.getparts()
+    for part in parts:
+        if obj.mshtypes.get(part, "wall") not in cgnsbctypes:
+            raise ValueError(f"Invalid zone type '{obj.mshtypes[part]}' of part {part} in rpl_gen_obj.py. Use {', '.join(cgnsbctypes)}.")
+    blocks = mesh.getblocks()
+    zones = cgnszones(mesh)
+    cells = mesh.getcells()
+    boundary = sum(int(np.prod([stop - start for axis, (start, stop) in enumerate(ranges) if axis != patchaxis])) for _, patchaxis, _, _, ranges in mesh.getpatches())
+    faces = (2*dim*cells + boundary)//2
+    nodes = sum(int(np.prod([stop - start + 1 for start, stop in ranges])) for ranges in blocks.values())
+    sizetype = "I4" if nodes < 2**31 else "I8"
+
+    # worker processes are forked (spawned processes would run the scripts again), zones are computed in the main process otherwise
+    workers = min(obj.exportworkers or os.cpu_count() or 1, len(blocks))
+    forked = workers > 1 and "fork" in multiprocessing.get_all_start_methods()
+    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("fork")) if forked else contextlib.nullcontext() as pool:
+        coords = functools.partial(cgnscoords, mesh)
+        results = pool.map(coords, blocks.values(), chunksize=max(1, len(blocks)//(4*workers))) if forked else map(coords, blocks.values())
+        with h5py.File(file, 'w', libver=("v108", "v108")) as cgns:       # file format of HDF5 1.8 (CGNS library 4), compact groups
+            cgnsattrs(cgns.id, "HDF5 MotherNode", "Root Node of HDF5 File", "MT")
+            cgns.create_dataset(" format", data=np.frombuffer(b"IEEE_LITTLE_32\0", dtype=np.int8))
+            cgns.create_dataset(" hdf5version", data=np.frombuffer(f"HDF5 Version {h5py.version.hdf5_version}".encode().ljust(33, b"\0"), dtype=np.int8))
+            cgnsnode(cgns.id, "CGNSLibraryVersion", "CGNSLibraryVersion_t", "R4", [3.4])
+            base = cgnsnode(cgns.id, "Base", "CGNSBase_t", "I4", [dim, dim])
+
+            # families of parts with boundary condition type
+            for part in parts:
+                family = cgnsnode(base, part, "Family_t")
+                cgnsnode(family, "FamilyBC", "FamilyBC_t", "C1", cgnsbctypes[obj.mshtypes.get(part, "wall")])
+
+            # zones in order of block numbers: size, coordinates, boundary conditions, interfaces
+            for (blk, ranges), grid in zip(blocks.items(), results):
+                zone = zones[blk]
+                size = [stop - start + 1 for start, stop in ranges][::-1]
+                node = cgnsnode(base, zone["name"], "Zone_t", sizetype, [size, [n - 1 for n in size], [0]*dim])
+                cgnsnode(node, "ZoneType", "ZoneType_t", "C1", "Structured")
+                gridnode = cgnsnode(node, "GridCoordinates", "GridCoordinates_t")
+                for coord, values in enumerate(grid):
+                    cgnsnode(gridnode, f"Coordinate{'XYZ'[coord]}", "DataArray_t", "R8", values)
+                zonebc = cgnsnode(node, "ZoneBC", "ZoneBC_t")
+                for num, (part, pointrange) in enumerate(zone["bcs"], 1):
+                    bc = cgnsnode(zonebc, f"{part}.{num}", "BC_t", "C1", "FamilySpecified")
+                    cgnsnode(bc, "PointRange", "IndexRange_t", sizetype, pointrange)
+                    cgnsnode(bc, "FamilyName", "FamilyName_t", "C1", part)
+                if zone["conns"]:
+                    connectivity = cgnsnode(node, "ZoneGridConnectivity", "ZoneGridConnectivity_t")
+                    for num, (donor, pointrange, donorrange) in enumerate(zone["conns"], 1):
+                        conn = cgnsnode(connectivity, f"interface.{num}", "GridConnectivity1to1_t", "C1", donor)
+                        cgnsnode(conn, "PointRange", "IndexRange_t", sizetype, pointrange)
+                        cgnsnode(conn, "PointRangeDonor", "IndexRange_t", sizetype, donorrange)
+                        cgnsnode(conn, "Transform", '"int[IndexDimension]"', "I4", list(range(1, dim + 1)))
+        cgns.close()
+    return {"zones": len(blocks), "nodes": nodes, "cells": cells, "faces": faces}
+
+
+# OpenFOAM patch types of boundary parts (obj.mshtypes, Fluent zone types), parts of other zone types are written as patch
+foampatchtypes = {"wall": "wall", "symmetry": "symmetryPlane"}
+# corners of OpenFOAM hex blocks (local x, y, z), faces of hex blocks (local axis, -1: lower or 1: upper face): corners in order of outward normal
+foamcorners = [(0, 0, 0), (1, 0, 0), (1, 1, 0), (0, 1, 0), (0, 0, 1), (1, 0, 1), (1, 1, 1), (0, 1, 1)]
+foamfaces = {(0, -1): (0, 4, 7, 3), (0, 1): (1, 2, 6, 5), (1, -1): (0, 1, 5, 4), (1, 1): (3, 7, 6, 2), (2, -1): (0, 3, 2, 1), (2, 1): (4, 5, 6, 7)}
+
+
+# lines of OpenFOAM blockMeshDict of structured mesh: one hex block per block (local x, y, z: coordinates x, y, z), vertices of the blocking,
+# simpleGrading from the node distributions of the blocks (ratio of last to first cell size, exact for uniform and geometric distributions),
+# one patch per part of the boundary faces, 2D meshes are extruded in z by obj.foamdepth with one cell (patch frontAndBack of type empty)
+def foamlines(mesh):
+    dim = mesh.getdim()
+    phys = mesh.getphys()
+    axes = [phys.index(coord) if coord < dim else None for coord in range(3)]      # axis of mesh of local x, y, z
+    vertices = {}
+    blocks = {}
+    for blk, ranges in mesh.getblocks().items():
+        corners = []
+        for corner in foamcorners:
+            key = tuple(ranges[axis][corner[coord]] if axis is not None else corner[coord] for coord, axis in enumerate(axes))
+            corners.append(vertices.setdefault(key, len(vertices)))
+        blocks[blk] = corners
+
+    lines = ["/*--------------------------------*- C++ -*----------------------------------*\\", "FoamFile", "{", "    version     2.0;", "    format      ascii;", 
+             "    class       dictionary;", "    object      blockMeshDict;", "}", f"// blocks of {mesh.getname()} (structured mesh of .rpl file)", "", "scale 1;", "", "vertices", "("]
+    for key in vertices:
+        coords = [mesh.getnodes(axis)[idx] if axis is not None else idx*obj.foamdepth for idx, axis in zip(key, axes)]
+        lines.append("    (" + " ".join(f"{coord:.15g}" for coord in coords) + ")")
+    lines += [");", "", "blocks", "("]
+    for blk, ranges in mesh.getblocks().items():
+        counts = []
+        grading = []
+        for axis in axes:
+            if axis is None:
+                counts.append(1)
+                grading.append(1)
+                continue
+            start, stop = ranges[axis]
+            nodes = mesh.getnodes(axis)
+            counts.append(stop - start)
+            grading.append((nodes[stop] - nodes[stop - 1])/(nodes[start + 1] - nodes[start]) if stop - start > 1 else 1)
+        lines.append(f"    hex ({' '.join(str(vertex) for vertex in blocks[blk])}) {mesh.getname()} ({' '.join(str(count) for count in counts)}) simpleGrading ({' '.join(f'{ratio:.12g}' for ratio in grading)})")
+    lines += [");", "", "edges", "(", ");", "", "boundary", "("]
+
+    # boundary faces of blocks per part: local axis of face, outward normal (lower face of block for faces with cells at higher index)
+    faces = {}
+    patchblocks = blockfaces(mesh)
+    for part, axis, plane, side, ranges in mesh.getpatches():
+        blk = patchblocks[(axis, plane, side, tuple(ranges[:axis] + ranges[axis + 1:]))]
+        faces.setdefault(part, []).append([blocks[blk][corner] for corner in foamfaces[(phys[axis], -side)]])
+    if dim == 2:
+        faces["frontAndBack"] = [[blocks[blk][corner] for corner in foamfaces[(2, side)]] for blk in blocks for side in (-1, 1)]
+    for part, partfaces in faces.items():
+        patchtype = "empty" if part == "frontAndBack" and dim == 2 else foampatchtypes.get(obj.mshtypes.get(part, "wall"), "patch")
+        lines += [f"    {part}", "    {", f"        type {patchtype};", "        faces", "        ("]
+        lines += [f"            ({' '.join(str(vertex) for vertex in face)})" for face in partfaces]
+        lines += ["        );", "    }"]
+    lines += [");", "", "mergePatchPairs", "(", ");"]
+    return lines
+
+
+# numbers of vertices, blocks and cells of blockMeshDict lines (structural check of the OpenFOAM export)
+def foamcount(lines):
+    first = lines.index("vertices") + 2
+    vertices = lines.index(");", first) - first
+    counts = [re.match(r"\s*hex \([\d ]+\) \S+ \((\d+) (\d+) (\d+)\)", line) for line in lines]
+    counts = [[int(count) for count in match.groups()] for match in counts if match]
+    return {"vertices": vertices, "blocks": len(counts), "cells": sum(int(np.prod(count)) for count in counts)}
+
+
+# write OpenFOAM blockMeshDict of structured mesh (see foamlines), mesh of the case folder of the file with: blockMesh -case <folder>
+# returns numbers of vertices, blocks and cells
+def writefoam(mesh, file):
+    lines = foamlines(mesh)
+    if not os.path.exists(os.path.dirname(file)):
+        os.makedirs(os.path.dirname(file))
+    with open(file, 'w', buffering=obj.writebuffer) as foam:
+        foam.write("\n".join(lines) + "\n")
+    foam.close()
+    return foamcount(lines)
+
+
+# mesh export formats of option --export: format: writer function (structured mesh, file), returns numbers of entities of the mesh file
+meshexports = {"msh": writemsh, "cgns": writecgns, "foam": writefoam}
+
+
+# mesh file of export format, name: path of .rpl file without extension
+# OpenFOAM: blockMeshDict in folder system next to the .rpl file (case folder of blockMesh), other formats: name with extension of format
+def exportfile(name, fmt):
+    if fmt == "foam":
+        return os.path.join(os.path.dirname(name), "system", "blockMeshDict")
+    return f"{name}.{fmt}"
+
+
+# write mesh files of replayed .rpl file in formats of meshexports, file name: path without extension
+def writeexports(replay, name, formats):
+    try:
+        mesh = structmesh(replay)
+    except ValueError as error:
+        specerror(f"No mesh export: {error}")
+    periodic = periodicparts(mesh)
+    if periodic:
+        print(f"{Fore.RED}\nWarning: periodic parts {' and '.join(periodic)} are exported as unpaired boundaries ({', '.join(obj.mshtypes.get(part, 'wall') for part in periodic)}). "
+              f"Define the periodic boundaries in the solver.{Style.RESET_ALL}")
+    for fmt in formats:
+        file = exportfile(name, fmt)
+        print(f"\nWriting to file {os.path.basename(file)}...")
+        if os.path.exists(file):
+            print(f" - {Fore.RED}overwriting existing {os.path.basename(file)} file{Style.RESET_ALL}")
+        else:
+            print(f" - {Fore.GREEN}writing new {os.path.basename(file)} file{Style.RESET_ALL}")
+        try:
+            counts = meshexports[fmt](mesh, file)
+        except ValueError as error:
+            specerror(str(error))
+        print(f" - {', '.join(f'{count:,} {entity}' for entity, count in counts.items())}, boundary parts: {', '.join(mesh.getparts())}")
+        print(" - done write to file")
+
+
+################################################################## MESH PREVIEW #################################################################
+# entity types of cells of .vtp preview files (cell data "entity")
+previewentities = {"point": 0, "curve": 1, "surface": 2, "edge": 3}
+
+
+# blocking, associations and meshing of generated model (obj.Model) replayed from the model objects without .rpl lines (obj.Replay)
+# only the split points and one association per vertex line (points of moved vertices, curves of projected edges) are created
+# raises ValueError for invalid commands
+def previewreplay(model):
+    replay = obj.Replay()
+    store = model.getstore()
+    pnts = store.getpnts()
+    crvs = store.getcrvs()
+    pad = f"0{obj.namepad}d"                # format of zero-padded entity numbers
+    for part in [model.getbody()] + model.getprts():
+        replay.execute(["ic_geo_new_family", part.getname()], 0)
+
+    # blocking as written to the .rpl file
+    created = set()                         # names of created points
+    for op in model.getblkg():
+        if isinstance(op, obj.Split) and op.getpnt().getname() not in created:
+            created.add(op.getpnt().getname())
+            replay.execute(["ic_point", "", "GEOM", op.getpnt().getname(), f"{op.getpnt().getx()!r},{op.getpnt().gety()!r},{op.getpnt().getz()!r}"], 0)
+    replay.initialize(model.getdim(), model.getbody().getname())
+    for op in model.getblkg():
+        if isinstance(op, obj.Split):
+            replay.execute(["ic_hex_split_grid", op.getvert1(), op.getvert2(), op.getpnt().getname(), "m", "GEOM"] + op.partlist().split() + ["VORFN"], 0)
+        else:
+            replay.execute(["ic_hex_mark_blocks", "unmark"], 0)
+            replay.execute(["ic_hex_mark_blocks", "superblock", op.getblk()], 0)
+            replay.execute(["ic_hex_change_element_id", "VORFN"], 0)
+
+    # associations of vertex lines without associated geometry, (axis, vertex line) of vertex lines with associated geometry
+    xyz = pnts[["x", "y", "z"]].tolist()
+    nums = pnts["num"].tolist()
+    covered = set()
+    for num, pnt in zip(store.vertnums.tolist(), store.vertpnts.tolist()):
+        lines = set(enumerate(replay.getvert(num)))
+        if lines <= covered:
+            continue
+        covered |= lines
+        name = f"pnt.{nums[pnt]:{pad}}"
+        if name not in created:
+            created.add(name)
+            replay.execute(["ic_point", "", "GEOM", name, ",".join(repr(val) for val in xyz[pnt])], 0)
+        replay.execute(["ic_hex_move_node", num, name], 0)
+    for vert1, vert2, crv in zip(store.edgeverts[0::2].tolist(), store.edgeverts[1::2].tolist(), store.edgecrvs.tolist()):
+        lines = {(axis, line) for axis, line in enumerate(replay.getvert(vert1)) if line == replay.getvert(vert2)[axis]}
+        if lines <= covered:
+            continue
+        covered |= lines
+        ends = [int(crvs["pnt1"][crv]), int(crvs["pnt2"][crv])]
+        for pnt in ends:
+            if f"pnt.{nums[pnt]:{pad}}" not in created:
+                created.add(f"pnt.{nums[pnt]:{pad}}")
+                replay.execute(["ic_point", "", "GEOM", f"pnt.{nums[pnt]:{pad}}", ",".join(repr(val) for val in xyz[pnt])], 0)
+        replay.execute(["ic_curve", "", "GEOM", f"crv.{crvs['num'][crv]:{pad}}", " ".join(f"pnt.{nums[pnt]:{pad}}" for pnt in ends)], 0)
+        replay.execute(["ic_hex_set_edge_projection", vert1, vert2, "0", "1", f"crv.{crvs['num'][crv]:{pad}}"], 0)
+
+    # meshing as written to the .rpl file
+    for op in model.getmshg():
+        mesh = op.getmesh()
+        replay.execute(["ic_hex_set_mesh", op.getvert1(), op.getvert2(), "n", mesh[1], "h1rel", mesh[2], "h2rel", mesh[3], "r1", mesh[4], "r2", mesh[5], "lmax", mesh[6], mesh[0]], 0)
+    if replay.geterrors():
+        raise ValueError(f"Invalid blocking of model: {replay.geterrors()[0][1]}")
+    return replay
+
+
+# corner points of surfaces in order around the surface from their 4 curves (indices of points), surfaces with less than 4 curves are not returned
+# returns surface indices and corner points (surfaces x 4)
+def previewquads(srfs, crvs):
+    full = np.nonzero(np.all(srfs["crvs"] >= 0, axis=1))[0]
+    ends = np.stack((crvs["pnt1"][srfs["crvs"][full]], crvs["pnt2"][srfs["crvs"][full]]), axis=-1)
+    first, second = ends[:, 0, 0], ends[:, 0, 1]
+    rest = ends[:, 1:, :]
+    other = rest[:, :, ::-1]
+    third = np.sum(other*(rest == second[:, None, None]), axis=(1, 2))
+    fourth = np.sum(other*(rest == first[:, None, None]), axis=(1, 2))
+    return full, np.stack((first, second, third, fourth), axis=1)
+
+
+# data array of .vtp file, base64 encoded binary data with 64 bit byte count
+def vtkarray(name, data, type, comps=1):
+    raw = np.ascontiguousarray(data).tobytes()
+    return f'<DataArray type="{type}" Name="{name}" NumberOfComponents="{comps}" format="binary">' + base64.b64encode(np.uint64(len(raw)).tobytes() + raw).decode() + "</DataArray>\n"
+
+
+# .vtp preview file (VTK PolyData for ParaView) of generated model (obj.Model) without replay of the .rpl file
+# geometry: points as vertices, curves as lines, surfaces as quads with part ID (-1 without part, part names in field data "parts")
+# meshed edges: polylines through the nodes of the planned distributions of the meshing operations (copied to parallel edges by ICEM)
+# cell data "entity" distinguishes the cell types (previewentities), returns numbers of entities of the preview file
+def vtpfile(model, file):
+    store = model.getstore()
+    pnts = store.getpnts()
+    crvs = store.getcrvs()
+    srfs = store.getsrfs() if model.getdim() == 3 else store.getsrfs()[:0]
+    replay = previewreplay(model)
+    phys, coords = replay.getgrid()
+    ranks = [{line: rank for rank, line in enumerate(replay.getlines(axis))} for axis in range(model.getdim())]
+
+    # nodes of meshed edges from the coordinates of the vertex lines, edges at vertex lines without associated geometry are skipped
+    edgepnts = []
+    skipped = 0
+    for op in model.getmshg():
+        lines1, lines2 = replay.getvert(op.getvert1()), replay.getvert(op.getvert2())
+        vals1 = [coords[axis][ranks[axis][line]] for axis, line in enumerate(lines1)]
+        vals2 = [coords[axis][ranks[axis][line]] for axis, line in enumerate(lines2)]
+        if None in vals1 or None in vals2:
+            skipped += 1
+            continue
+        axis = next(axis for axis in range(model.getdim()) if lines1[axis] != lines2[axis])
+        nodes = np.zeros((op.getmesh()[1], 3))
+        for other in range(model.getdim()):
+            nodes[:, phys[other]] = vals1[other]
+        nodes[:, phys[axis]] = distrnodes(op.getmesh(), vals1[axis], vals2[axis])
+        edgepnts.append(nodes)
+    edgesizes = np.array([nodes.shape[0] for nodes in edgepnts], dtype="i8")
+
+    # points: geometry points followed by the nodes of the meshed edges
+    xyz = np.concatenate([np.stack((pnts["x"], pnts["y"], pnts["z"]), axis=1)] + edgepnts)
+    full, quads = previewquads(srfs, crvs)
+    lines = np.concatenate((np.stack((crvs["pnt1"], crvs["pnt2"]), axis=1).ravel(), pnts.size + np.arange(np.sum(edgesizes))))
+    lineoffsets = np.concatenate((2*np.arange(1, crvs.size + 1), 2*crvs.size + np.cumsum(edgesizes)))
+    parts = np.concatenate((np.full(pnts.size, -1), crvs["part"], np.full(edgesizes.size, -1), srfs["part"][full]))
+    entities = np.concatenate((np.full(pnts.size, previewentities["point"]), np.full(crvs.size, previewentities["curve"]), np.full(edgesizes.size, previewentities["edge"]), np.full(full.size, previewentities["surface"])))
+    names = b"".join(name.encode() + b"\0" for name in store.getparts())
+
+    with open(file, 'w') as vtp:
+        vtp.write('<?xml version="1.0"?>\n<VTKFile type="PolyData" version="1.0" byte_order="LittleEndian" header_type="UInt64">\n<PolyData>\n')
+        vtp.write(f'<FieldData>\n<DataArray type="String" Name="parts" NumberOfTuples="{len(store.getparts())}" format="binary">' + base64.b64encode(np.uint64(len(names)).tobytes() + names).decode() + "</DataArray>\n</FieldData>\n")
+        vtp.write(f'<Piece NumberOfPoints="{xyz.shape[0]}" NumberOfVerts="{pnts.size}" NumberOfLines="{lineoffsets.size}" NumberOfStrips="0" NumberOfPolys="{full.size}">\n')
+        vtp.write("<Points>\n" + vtkarray("Points", xyz.astype("<f8"), "Float64", 3) + "</Points>\n")
+        vtp.write("<Verts>\n" + vtkarray("connectivity", np.arange(pnts.size, dtype="<i8"), "Int64") + vtkarray("offsets", np.arange(1, pnts.size + 1, dtype="<i8"), "Int64") + "</Verts>\n")
+        vtp.write("<Lines>\n" + vtkarray("connectivity", lines.astype("<i8"), "Int64") + vtkarray("offsets", lineoffsets.astype("<i8"), "Int64") + "</Lines>\n")
+        vtp.write("<Polys>\n" + vtkarray("connectivity", quads.astype("<i8"), "Int64") + vtkarray("offsets", 4*np.arange(1, full.size + 1, dtype="<i8"), "Int64") + "</Polys>\n")
+        vtp.write('<CellData Scalars="part">\n' + vtkarray("part", parts.astype("<i4"), "Int32") + vtkarray("entity", entities.astype("<i4"), "Int32") + "</CellData>\n")
+        vtp.write("</Piece>\n</PolyData>\n</VTKFile>\n")
+    vtp.close()
+    return {"points": int(pnts.size), "curves": int(crvs.size), "surfaces": int(full.size), "meshed edges": int(edgesizes.size), "edges without geometry": skipped}
+
+
+# write .vtp preview file of generated model next to the .rpl file, file name: path without extension
+def writepreview(model, name):
+    file = f"{name}.vtp"
+    print(f"\nWriting to file {os.path.basename(file)}...")
+    if os.path.exists(file):
+        print(f" - {Fore.RED}overwriting existing .vtp file{Style.RESET_ALL}")
+    else:
+        print(f" - {Fore.GREEN}writing new .vtp file{Style.RESET_ALL}")
+    start = time.perf_counter()
+    try:
+        counts = vtpfile(model, file)
+    except ValueError as error:
+        specerror(f"No preview: {error}")
+    print(f" - {', '.join(f'{count:,} {entity}' for entity, count in counts.items())} in {(time.perf_counter() - start)*1000:.0f} ms")
+    print(" - done write to file")
+
+
+################################################################### BENCHMARK ###################################################################
+# settings of rpl_gen_obj.py changing the output, stored with the golden files (outputs of different settings are not compared)
+benchsettings = ["geomprec", "meshprec", "namepad", "mergeentities", "rplloops", "loopperiod", "looprepeat", "rplprune", "rplundo"]
+
+
+# benchmark cases of all scripts with default meshing: all inlet, outlet and periodic variants, horizontal structures for all numbers of structures
+# nsvalues: numbers of structures, returns case name: (script, parameter file), e.g. "3dh-i1-ns10-p": ("3D-horizontal-structures.py", {...})
+def benchcases(nsvalues):
+    xgeom = {"H": 3, "h_i": 0.5, "h_d": 0.3}
+    zgeom = {"W": 2, "w_c": 1}
+    cases = {}
+    variants = list(itertools.product((1, 2), (False, True)))
+    for inlet, periodic in variants:
+        ygeom = {"L": 10, "l_ag": 1.5} if inlet == 2 else {"L": 10}
+        cases[f"2ds-i{inlet}{'-p' if periodic else ''}"] = ("2D-smooth.py", {"inlet": inlet, "periodic": periodic, "xgeom": xgeom, "ygeom": ygeom})
+    # custom meshing of sections
+    cases["2ds-i1-sections"] = ("2D-smooth.py", {"inlet": 1, "xgeom": xgeom, "ygeom": {"L": 10}, "sections": {"h_i": {"rule": "geo2", "hmin": 0.01, "hmax": 0.1}, 
+                                "h_d": {"rule": "uni", "h": 0.02}, "h_g": {"rule": "geo1", "hmin": 0.02, "hmax": 0.3}, "l_t": {"rule": "uni", "h": 0.1}}})
+    # cell sizes of default meshing off the grid of the mesh precision
+    cases["2ds-i1-sizes"] = ("2D-smooth.py", {"inlet": 1, "xgeom": xgeom, "ygeom": {"L": 10}, "sizes": {"film": 0.0125, "distr": 0.10004, "xmax": 0.33333}})
+    # cell sizes rounding to the same values at the mesh precision as the previous case, meshed after it in the same process (separate mesh cache entries)
+    cases["2ds-i1-sizes-near"] = ("2D-smooth.py", {"inlet": 1, "xgeom": xgeom, "ygeom": {"L": 10}, "sizes": {"film": 0.013, "distr": 0.1, "xmax": 0.333}})
+    for inlet, periodic in variants:
+        for ns in nsvalues:
+            ygeom = {"n_s": ns, "l_s": 1, "l_gr": 0.5, "l_i": 2, "l_o": 2}
+            if inlet == 2:
+                ygeom["l_ag"] = 1.5
+            cases[f"2dh-i{inlet}-ns{ns}{'-p' if periodic else ''}"] = ("2D-horizontal-structures.py", {"inlet": inlet, "periodic": periodic, "xgeom": dict(xgeom, d_gr=0.2), "ygeom": ygeom})
+    for inlet, periodic in variants:
+        for outlet in (1, 2):
+            ygeom = {"L": 10}
+            if inlet == 2:
+                ygeom["l_ag"] = 1.5
+            if outlet == 2:
+                ygeom["l_ro"] = 1.0
+            cases[f"3ds-i{inlet}-o{outlet}{'-p' if periodic else ''}"] = ("3D-smooth.py", {"inlet": inlet, "outlet": outlet, "periodic": periodic, 
+                                                                             "xgeom": dict(xgeom, h_eo=0.1, h_ro=1.0) if outlet == 2 else xgeom, "ygeom": ygeom, "zgeom": zgeom})
+    for inlet, periodic in variants:
+        for ns in nsvalues:
+            ygeom = {"n_s": ns, "l_s": 1, "l_gr": 0.5, "l_i": 2, "l_o": 2}
+            if inlet == 2:
+                ygeom["l_ag"] = 1.5
+            cases[f"3dh-i{inlet}-ns{ns}{'-p' if periodic else ''}"] = ("3D-horizontal-structures.py", {"inlet": inlet, "periodic": periodic, "xgeom": dict(xgeom, d_gr=0.2), "ygeom": ygeom, "zgeom": zgeom})
+    return {name: (script, dict(spec, project=name)) for name, (script, spec) in cases.items()}
+
+
+# run benchmark case with build function of model source file: phases build (model), rpl (.rpl lines), conf (.conf lines) and replay (obj.Replay of .rpl lines)
+# run time per phase is the minimum of repeat runs, peak memory per phase (above the memory at the start of the phase) is traced in an additional run
+# returns run time [s] and peak memory [bytes] per phase, .rpl and .conf lines, replay and predicted number of cells
+def benchmember(build, spec, repeat=1):
+    entries = {"time": {}, "memory": {}}
+    for run in range(max(repeat, 1) + 1):
+        traced = run == max(repeat, 1)          # memory is traced in the last run, tracing slows down all phases
+        if traced:
+            tracemalloc.start()
+        resetcounts()
+        for phase in ["build", "rpl", "conf", "replay"]:
+            if traced:
+                tracemalloc.reset_peak()
+                current = tracemalloc.get_traced_memory()[0]
+            start = time.perf_counter()
+            if phase == "build":
+                model = build(json.loads(json.dumps(spec)))
+            elif phase == "rpl":
+                entries["rpl"] = rpl_model(model)
+            elif phase == "conf":
+                entries["conf"] = conf_model(model)
+            else:
+                entries["replay"] = replaylines(entries["rpl"])
+            duration = time.perf_counter() - start
+            if traced:
+                entries["memory"][phase] = tracemalloc.get_traced_memory()[1] - current
+            else:
+                entries["time"][phase] = min(entries["time"].get(phase, duration), duration)
+        if traced:
+            tracemalloc.stop()
+    entries["cells"] = cellcount(model.getgeomtype(), [sect for sects in model.getsects() for sect in sects], model.getns())
+    return entries
+
+
+# path of golden file of benchmark case, ext: "rpl" or "conf"
+def goldenfile(dir, name, ext):
+    return os.path.join(dir, f"{name}.{ext}.gz")
+
+
+# hash of output lines, identical for identical output
+def goldenhash(lines):
+    return hashlib.sha256("".join(lines).encode()).hexdigest()
+
+
+# write golden file, compressed without time stamp (identical files for identical output)
+def writegolden(file, lines):
+    with open(file, 'wb') as raw:
+        with gzip.GzipFile(os.path.basename(file)[:-3], 'wb', fileobj=raw, mtime=0) as gz:
+            gz.write("".join(lines).encode())
+    raw.close()
+
+
+# first line of output differing from golden file: line number (1 for first line), None if identical
+def comparegolden(file, lines):
+    with gzip.open(file, 'rt') as gz:
+        golden = gz.read().splitlines(keepends=True)
+    gz.close()
+    for lineno, (line, goldenline) in enumerate(zip(lines, golden), 1):
+        if line != goldenline:
+            return lineno
+    return None if len(lines) == len(golden) else min(len(lines), len(golden)) + 1
+
+
+# run times of previous benchmark runs from history file: (case, phase): run times [s] in order of runs
+def benchhistory(file):
+    history = {}
+    if os.path.isfile(file):
+        with open(file, 'r', newline='') as csvfile:
+            for row in csv.DictReader(csvfile):
+                history.setdefault((row["case"], row["phase"]), []).append(float(row["time"]))
+        csvfile.close()
+    return history
+
+
+# run time regression: run time above slowdown times the median of the last runs (and 1 ms above the median), returns median or None
+# at least 3 previous runs are required, run times of single runs scatter
+def benchregression(times, duration, slowdown, runs=5):
+    if len(times) < 3:
+        return None
+    median = float(np.median(times[-runs:]))
+    return median if duration > slowdown*median and duration - median > 0.001 else None
+
+
+# peak memory of the process [bytes] (resident set size), None without resource module (windows)
+def benchrss():
+    if resource is None:
+        return None
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss*(1 if sys.platform == "darwin" else 1024)
+
+
+# mesh export of model generated with build function of model source file (run in a new process per export, peak memory of the process)
+# fmt: export format, mapcells: obj.mapcells of the export (0: memory-mapped buffers, -1: buffers in memory), file: path of mesh file
+# returns export time [s], peak memory of the process before and after the export [bytes], number of cells and size of the mesh file [bytes]
+def benchexport(build, spec, file, fmt, mapcells):
+    obj.mapcells = mapcells
+    resetcounts()
+    mesh = structmesh(replaylines(rpl_model(build(spec))))
+    before = benchrss()
+    start = time.perf_counter()
+    counts = meshexports[fmt](mesh, file)
+    duration = time.perf_counter() - start
+    return {"time": duration, "before": before, "peak": benchrss(), "cells": counts["cells"], "size": os.path.getsize(file)}
+
+
+# previous search of node count and growth rate of a geometric distribution (single section, geomcalc before bisection)
+# nodes and growth rate are lowered in single steps, reference of geomcalc for geomfit-check.py and geomfit-benchmark.py
+# accumulate: growth rate lowered by repeated subtraction of the step as before (rounding errors add up), else rate - steps*step as in geomfit
+def geomcalc_loop(length, hmin, hmax, accumulate=True):
+    hrel_min = hmin/length                      # relative minimum cell size (fixed)
+    hrel_max = hmax/length                      # relative maximum cell size (max. allowed)
+    nodes = int(np.ceil(1.0/hrel_min) + 1)      # starting number of nodes, corresponding to uniform distribution with max. h1rel
+    rate = round(geomrate_calc(hrel_min, hrel_max, nodes), meshprec)
+    htot = round(geomsum_calc(hrel_min, nodes, rate), meshprec)
+    while htot > 1:
+        nodes -= 1
+        rate = round(geomrate_calc(hrel_min, hrel_max, nodes), meshprec)
+        htot = round(geomsum_calc(hrel_min, nodes, rate), meshprec)
+    nodes += 1
+    rate = round(geomrate_calc(hrel_min, hrel_max, nodes), meshprec)
+    htot = round(geomsum_calc(hrel_min, nodes, rate), meshprec)
+    start = rate
+    steps = 0
+    while htot > 1:
+        steps += 1
+        rate = rate - 10**(-meshprec) if accumulate else start - steps*10**(-meshprec)
+        htot = round(geomsum_calc(hrel_min, nodes, rate), meshprec)
+    return round(rate, meshprec), nodes
 
 
 ################################################################# WRITE TO FILE #################################################################
@@ -893,7 +2818,8 @@ def confmeshing(conffile, sects, factor):
 def rpl_start(list):
     #list.append("ic_set_global geo_cad 0 toptol_userset\n")
     list.append("ic_set_global geo_cad 0.0 toler\n")
-    list.append("ic_undo_group_begin\n")
+    if obj.rplundo != "none":
+        list.append("ic_undo_group_begin\n")
     list.append("ic_geo_new_family GEOM\n")
     list.append("ic_boco_set_part_color GEOM\n")
     list.append("ic_empty_tetin\n")
@@ -903,8 +2829,22 @@ def rpl_start(list):
 
 # add class object entries to .rpl file
 def rpl_obj(list, geoms):
-    for geom in geoms:
-        list = geom.print(list)
+    # repeated blocks of lines are written as Tcl loops (specify in obj!), lines of the objects are collected first
+    lines = [] if obj.rplloops else list
+
+    # entity lists are printed from the entity store at once
+    if isinstance(geoms, obj.EntityList):
+        lines = geoms.print(lines)
+    else:
+        for geom in geoms:
+            lines = geom.print(lines)
+
+    if obj.rplloops:
+        # redundant commands are removed before repeated blocks are detected
+        if isinstance(list, obj.Prune):
+            list.getlist().extend(rpl_loops(list.filter(lines), type(geoms[0]).__name__.lower()))
+        else:
+            list.extend(rpl_loops(lines, type(geoms[0]).__name__.lower()))
 
     if isinstance(geoms[0], obj.Part) or isinstance(geoms[0], obj.Body):
         list.append("ic_delete_empty_parts\n")
@@ -951,12 +2891,346 @@ def rpl_3Dblocking(list, body):
     return list
 
 
+# add list entries between phases of .rpl file (geometry, blocking, associations, meshing), one undo group per phase (specify in obj!)
+def rpl_phase(list):
+    if obj.rplundo == "phase":
+        list.append("ic_undo_group_end\n")
+        list.append("ic_undo_group_begin\n")
+    return list
+
+
 # add list entries at end of file to .rpl file
 def rpl_end(list):
-    list.append("ic_undo_group_end\n")
+    if obj.rplundo != "none":
+        list.append("ic_undo_group_end\n")
     return list
 
 
+# numbers in lines of .rpl files (entity numbers, coordinates, node counts, cell sizes)
+rplnumber = re.compile(r"(-?\d+(?:\.\d+)?(?:e[+-]?\d+)?)")
+
+
+# base of polynomial hashes of template sequences (repeated blocks of .rpl lines)
+rplhashbase = 1000003
+
+
+# type of number in line of .rpl file: "f" for decimal numbers, "d" for integers
+def rpl_numkind(num):
+    return "f" if "." in num or "e" in num else "d"
+
+
+# minimum number of digits of integer in line of .rpl file, e.g. 4 for "0012" (zero-padded entity numbers), else 0
+def rpl_numpad(num):
+    digits = num.lstrip("-")
+    return len(digits) if len(digits) > 1 and digits.startswith("0") else 0
+
+
+# number of decimals of decimal number in line of .rpl file, e.g. 4 for "0.0925" and 5 for "1e-05"
+def rpl_numdecimals(num):
+    mantissa, _, exp = num.partition("e")
+    return max(len(mantissa.partition(".")[2]) - int(exp or 0), 0)
+
+
+# increment of number per block as written in Tcl expression, None if the number is constant
+def rpl_loopstep(num, inc):
+    prec = max(geomprec, meshprec) + 3      # precision of increments of decimal numbers
+    if abs(inc) <= 10**-prec:
+        return None
+    return round(inc, prec) if rpl_numkind(num) == "f" else inc
+
+
+# value of number in block number i as computed by the Tcl expression of rpl_loopline, decimal numbers rounded to dec decimals by format
+def rpl_loopvalue(num, val, inc, dec, i):
+    step = rpl_loopstep(num, inc)
+    if step is None:
+        return val
+    if rpl_numkind(num) == "d":
+        return val + step*i
+    val = float(num) - abs(step)*i if step < 0 else float(num) + abs(step)*i
+    return float(f"{val:.{dec}f}")
+
+
+# line of Tcl procedure for block number i: numbers with increment are replaced by Tcl expressions, e.g. pnt.[format %04d [expr {12 + 10*$i}]]
+# decimal numbers are rounded to the decimals of the numbers of all blocks, e.g. [format %.4f [expr {0.0925 - 0.0015*$i}]]
+# parts: text and numbers of line (split by rplnumber), vals: numbers of first block, incs: increments per block, decs: decimals per number
+def rpl_loopline(parts, vals, incs, decs):
+    text = parts[0]
+    subs = []
+    for k, (num, val, inc, dec) in enumerate(zip(parts[1::2], vals, incs, decs)):
+        kind = rpl_numkind(num)
+        step = rpl_loopstep(num, inc)
+        if step is None:
+            text += num
+        else:
+            expr = f"[expr {{{num if kind == 'f' else val} {'-' if step < 0 else '+'} {abs(step)}*$i}}]"
+            if kind == "f":
+                expr = f"[format %.{dec}f {expr}]"
+            elif rpl_numpad(num):
+                expr = f"[format %0{rpl_numpad(num)}d {expr}]"
+            text += f"\x01{len(subs)}\x02"
+            subs.append(expr)
+        text += parts[2*k + 2]
+
+    # Tcl does not substitute within braces, braced lists with substitutions are written as [list ...]
+    # braced lists without substitutions are masked until all braces are processed (innermost first)
+    masks = []
+    def mask(match):
+        if "\x01" in match.group(1):
+            return f"[list {match.group(1)}]"
+        masks.append(match.group(0))
+        return f"\x03{len(masks) - 1}\x04"
+    inner = re.compile(r"\{([^{}]*)\}")
+    while inner.search(text):
+        text = inner.sub(mask, text)
+    while "\x03" in text:
+        text = re.sub(r"\x03(\d+)\x04", lambda match: masks[int(match.group(1))], text)
+    return re.sub(r"\x01(\d+)\x02", lambda match: subs[int(match.group(1))], text).rstrip("\n")
+
+
+# repeated blocks of .rpl lines: lines with identical text apart from numbers, all numbers change by a constant increment from block to block
+# blocks of up to obj.loopperiod lines repeated at least obj.looprepeat times are written as Tcl procedure, called in a loop with block number i
+# the Tcl procedure computes the numbers of all blocks exactly (decimal numbers rounded by format), otherwise the lines are written unchanged
+# lines: lines of one section of the .rpl file (e.g. points), name: name of Tcl procedures, returns lines of section
+def rpl_loops(lines, name):
+    tol = 10**-(max(geomprec, meshprec) + 3)    # tolerance of increments of decimal numbers
+
+    # lines are split into text and numbers, lines with identical text and types of numbers share a template
+    parts = []
+    tpls = []
+    vals = []
+    keys = {}
+    for line in lines:
+        split = rplnumber.split(line)
+        kinds = tuple(rpl_numkind(num) for num in split[1::2])
+        parts.append(split)
+        tpls.append(keys.setdefault((tuple(split[0::2]), kinds), len(keys)))
+        vals.append([float(num) if kind == "f" else int(num) for num, kind in zip(split[1::2], kinds)])
+
+    # polynomial hashes of the sequence of templates (skeletons of lines), blocks with different hashes differ in at least one line
+    hashes = [0]
+    powers = [1]
+    for tpl in tpls:
+        hashes.append((hashes[-1]*rplhashbase + tpl + 1) & 0xFFFFFFFFFFFFFFFF)
+        powers.append((powers[-1]*rplhashbase) & 0xFFFFFFFFFFFFFFFF)
+    hashes = np.array(hashes, dtype=np.uint64)
+    powers = np.array(powers, dtype=np.uint64)
+    def blockhash(first, size):                 # hashes of blocks of size lines at first (arrays), arithmetic modulo 2**64
+        return hashes[first + size] - hashes[first]*powers[size]
+    
+    # first and last numbers of lines (up to 4 each, unused entries 0), increments of the first line of candidate blocks are compared at once
+    heads = np.zeros((len(lines), 8))
+    for i, lineval in enumerate(vals):
+        heads[i, :min(len(lineval), 4)] = lineval[:4]
+        heads[i, 8 - min(len(lineval), 4):] = lineval[-4:] if lineval else []
+
+    # numbers of all lines in one array, lines with identical templates have the same number of numbers
+    tplarray = np.array(tpls, dtype=np.int64)
+    flat = np.array([val for lineval in vals for val in lineval], dtype=float)
+    offsets = np.cumsum([0] + [len(lineval) for lineval in vals])
+
+    # number of blocks of period lines at start repeated with constant increments of all numbers (at most bound blocks), 0 if less than 3
+    # increments of first two blocks, checked with third block, further blocks equal the first block with count times the increments
+    def repeats(start, period, bound):
+        blocks = tplarray[start:start + bound*period].reshape(bound, period)
+        same = np.all(blocks == blocks[0], axis=1)
+        bound = bound if same.all() else int(np.argmin(same))
+        if bound < 3:
+            return 0
+        size = offsets[start + period] - offsets[start]
+        blockvals = flat[offsets[start]:offsets[start] + bound*size].reshape(bound, size)
+        inc = blockvals[1] - blockvals[0]
+        same = np.ones(bound, dtype=bool)
+        same[2] = np.all(np.abs(blockvals[2] - blockvals[1] - inc) <= tol)
+        same[3:] = np.all(np.abs(blockvals[3:] - (blockvals[0] + np.arange(3, bound)[:, None]*inc)) <= tol, axis=1)
+        return bound if same.all() else int(np.argmin(same))
+
+    list = []
+    n = len(lines)
+    loop = 0
+    start = 0
+    while start < n:
+        # candidate periods: first three blocks with identical templates and constant increments of the first and last numbers of the first line
+        periods = np.arange(1, min(obj.loopperiod, (n - start)//max(obj.looprepeat, 3)) + 1)
+        headincs = heads[start + periods] - heads[start]
+        candidates = (blockhash(start, periods) == blockhash(start + periods, periods)) & (blockhash(start, periods) == blockhash(start + 2*periods, periods))
+        candidates &= np.all(np.abs(heads[start + 2*periods] - heads[start + periods] - headincs) <= tol, axis=1)
+
+        # upper bound of the number of blocks per candidate period: blocks with identical templates and constant increments of the first and
+        # last numbers of the first line (first three blocks already checked)
+        bounds = []
+        for period in periods[candidates].tolist():
+            blocks = np.arange(3, (n - start)//period)
+            same = blockhash(start + period*blocks, period) == blockhash(np.array([start]), period)
+            same &= np.all(np.abs(heads[start + period*blocks] - (heads[start] + blocks[:, None]*headincs[period - 1])) <= tol, axis=1)
+            bounds.append((3 + (same.size if same.all() else int(np.argmin(same))), period))
+
+        # longest repetition of blocks at start, blocks of period lines (shortest period if equal)
+        # periods in order of the number of lines they can cover, periods that cannot cover more lines than the best period are skipped
+        best = None
+        for bound, period in sorted(bounds, key=lambda entry: -entry[0]*entry[1]):
+            if best is not None and bound*period < best[0]*best[1]:
+                break
+            if best is not None and bound*period == best[0]*best[1] and period > best[0]:
+                continue
+            count = repeats(start, period, bound)
+            if count >= max(obj.looprepeat, 3) and (best is None or count*period > best[1]*best[0] or (count*period == best[1]*best[0] and period < best[0])):
+                best = (period, count)
+
+        # Tcl procedure of first block, called for all blocks, only used if shorter than the repeated lines and exact for all blocks
+        if best is not None:
+            period, count = best
+            incs = [[vb - va for va, vb in zip(vals[start + j], vals[start + period + j])] for j in range(period)]
+            decs = [[max(rpl_numdecimals(parts[start + i*period + j][2*k + 1]) for i in range(count)) if rpl_numkind(num) == "f" else 0 for k, num in enumerate(parts[start + j][1::2])] for j in range(period)]
+            exact = True
+            blocks = np.arange(count)
+            for j in range(period):
+                for k, (num, val, inc, dec) in enumerate(zip(parts[start + j][1::2], vals[start + j], incs[j], decs[j])):
+                    # values within a quarter of the last decimal are rounded to the value of the block, other values are computed one by one
+                    step = rpl_loopstep(num, inc) or 0
+                    blockvals = flat[offsets[start + period*blocks + j] + k]
+                    close = np.abs((float(num) if rpl_numkind(num) == "f" else val) + step*blocks - blockvals) <= 0.25*10**-dec
+                    exact = exact and all(rpl_loopvalue(num, val, inc, dec, i) == vals[start + i*period + j][k] for i in np.flatnonzero(~close).tolist())
+            proc = [f"proc rpl_{name}_{loop + 1} {{i}} {{\n"]
+            proc.extend(["    " + rpl_loopline(parts[start + j], vals[start + j], incs[j], decs[j]) + "\n" for j in range(period)])
+            proc.append("}\n")
+            proc.append(f"for {{set i 0}} {{$i < {count}}} {{incr i}} {{rpl_{name}_{loop + 1} $i}}\n")
+            if exact and sum(map(len, proc)) < sum(map(len, lines[start:start + count*period])):
+                list.extend(proc)
+                loop += 1
+                start += count*period
+                continue
+
+        # line without repetition
+        list.append(lines[start])
+        start += 1
+    return list
+
+
+# Tcl words of line of .rpl file, outer braces of lists are removed, e.g. ["ic_curve", "point", "GEOM", "crv.0000", "pnt.0000 pnt.0001"]
+def rpl_words(line):
+    words = []
+    word = None
+    depth = 0
+    for char in line.strip():
+        if depth == 0 and char.isspace():
+            if word is not None:
+                words.append(word)
+            word = None
+            continue
+        if word is None:
+            word = ""
+        if char == "{":
+            depth += 1
+            if depth == 1:
+                continue
+        elif char == "}" and depth > 0:
+            depth -= 1
+            if depth == 0:
+                continue
+        word += char
+    if word is not None:
+        words.append(word)
+    return words
+
+
+# Tcl substitution of line of Tcl procedure with variables vars (e.g. {"i": 3}), commands written by rpl_loopline (expr, format and list)
+def rpl_subst(line, vars):
+    line = re.sub(r"\$(\w+)", lambda match: str(vars[match.group(1)]), line)
+    def command(match):
+        words = rpl_words(match.group(1))
+        if words[0] == "expr" and re.fullmatch(r"[\d\s.e+\-*/()]+", words[1]):
+            return repr(eval(words[1], {"__builtins__": {}}))
+        if words[0] == "format" and len(words) == 3:
+            return words[1] % (int(words[2]) if words[1].endswith("d") else float(words[2]))
+        if words[0] == "list":
+            return "{" + " ".join(word if word and not re.search(r"\s", word) else "{" + word + "}" for word in words[1:]) + "}"
+        raise ValueError(f"unsupported Tcl command '{match.group(1)}'")
+    inner = re.compile(r"\[([^\[\]]*)\]")
+    while inner.search(line):
+        line = inner.sub(command, line)
+    return line
+
+
+# replay .rpl file without ICEM (obj.Replay), returns replay
+def replayrpl(file):
+    with open(file, 'r') as rpl:
+        replay = replaylines(rpl)
+    rpl.close()
+    return replay
+
+
+# replay lines of .rpl file without ICEM (obj.Replay), Tcl procedures and loops written with rplloops are expanded, returns replay
+def replaylines(lines):
+    replay = obj.Replay()
+    procs = {}
+    body = None
+    lineno = 0
+    for lineno, line in enumerate(lines, 1):
+        # lines of Tcl procedure, replayed by loop
+        if body is not None:
+            if line.strip() == "}":
+                body = None
+            else:
+                body.append((lineno, line))
+            continue
+        words = rpl_words(line)
+        if not words:
+            continue
+        replay.execute(words, lineno)
+        if words[0] == "proc":
+            body = procs[words[1]] = []
+            params = words[2].split()
+        
+        # loop: for {set i 0} {$i < count} {incr i} {procedure $i}
+        elif words[0] == "for":
+            loop = re.fullmatch(r"set (\w+) 0 \$\1 < (\d+) incr \1 (\w+) \$\1", " ".join(words[1:]))
+            if loop is None or loop.group(3) not in procs:
+                replay.adderror(lineno, f"unsupported Tcl loop '{line.strip()}'")
+                continue
+            for i in range(int(loop.group(2))):
+                for num, text in procs[loop.group(3)]:
+                    try:
+                        replay.execute(rpl_words(rpl_subst(text, {params[0]: i})), num)
+                    except (KeyError, ValueError, SyntaxError) as error:
+                        replay.adderror(num, f"invalid Tcl substitution ({error})")
+    
+    if body is not None:
+        replay.adderror(lineno, "Tcl procedure not closed at end of file")
+    if replay.getundo():
+        replay.adderror(lineno, f"undo groups or undo steps not closed at end of file ({', '.join(replay.getundo())})")
+    return replay
+
+
+# print replay of .rpl file: commands by run time, geometry, blocking and invalid commands
+def printreplay(replay, maxerrors=20):
+    counts = replay.getcounts()
+    times = replay.gettimes()
+    print(f"Commands ({sum(counts.values()):,} calls, {sum(times.values())*1000:.1f} ms):")
+    for command in sorted(counts, key=lambda command: -times[command]):
+        print(f"\t- {command}: {counts[command]:,} {'call' if counts[command] == 1 else 'calls'}, {times[command]*1000:.2f} ms")
+    
+    pnts, crvs, srfs, parts = replay.getentities()
+    print(f"\nGeometry: {pnts:,} points, {crvs:,} curves, {srfs:,} surfaces, {parts} parts")
+    if replay.getdim():
+        body = replay.getbody()
+        cells = replay.getcells(body)
+        print(f"Blocking ({replay.getdim()}D): {' x '.join(str(lines) for lines in replay.getlattice())} vertex lines, {replay.getverts():,} vertices, {len(replay.getblocks()):,} blocks ({len(replay.getblocks(body)):,} {body})")
+        print(f"Mesh of {body} blocks: {f'{cells:,} cells' if cells is not None else 'edges without meshing'}")
+    else:
+        print("Blocking: no blocking loaded")
+    
+    errors = replay.geterrors()
+    if errors:
+        print(f"{Fore.RED}\n{len(errors):,} invalid commands:{Style.RESET_ALL}")
+        for lineno, message in errors[:maxerrors]:
+            print(f"\t- line {lineno}: {message}")
+        if len(errors) > maxerrors:
+            print(f"\t- ... ({len(errors) - maxerrors:,} more)")
+    else:
+        print(f"{Fore.GREEN}\nNo invalid commands.{Style.RESET_ALL}")
+    return errors
+
+
 # add list entries at start of .conf file
 def conf_start(list, projname):
     list.append(f"Configuration file for {projname}\n")
@@ -1060,4 +3334,88 @@ def conf_meshdata(list, sects):
     for sect in sects:
         list.append(sect.export())
     list.append("\n")
-    return list
\ No newline at end of file
+    return list
+
+# list entries of .rpl file for generated model
+# list: list or obj.Stream of an open file handle, lines are written to the file as they are created
+# redundant commands are removed if specified in obj, number of removed lines is kept in the model
+# undo history as specified in obj (whole script, per phase or none), raises ValueError for invalid specification
+def rpl_model(model, list=None):
+    if obj.rplundo not in ("script", "phase", "none"):
+        raise ValueError(f"Invalid undo history '{obj.rplundo}' in rpl_gen_obj.py. Use 'script', 'phase' or 'none'.")
+    if list is None:
+        list = []
+    if obj.rplprune:
+        list = obj.Prune(list)
+    list = rpl_start(list)
+
+    # geometry
+    list = rpl_obj(list, model.getpnts())
+    list = rpl_obj(list, model.getcrvs())
+    if model.getdim() == 3:
+        list = rpl_obj(list, model.getsrfs())
+    list = rpl_obj(list, model.getprts())
+
+    # blocking
+    list = rpl_phase(list)
+    if model.getdim() == 3:
+        list = rpl_3Dblocking(list, model.getbody())
+    else:
+        list = rpl_2Dblocking(list, model.getbody())
+    list = rpl_obj(list, model.getblkg())
+
+    # associations
+    list = rpl_phase(list)
+    list = rpl_obj(list, model.getassoc())
+
+    # meshing
+    list = rpl_phase(list)
+    list = rpl_obj(list, model.getmshg())
+    list = rpl_end(list)
+    if obj.rplprune:
+        model.setpruned(list.getremoved())
+        list = list.flush()
+    return list
+
+
+# list entries of .conf file for generated model
+def conf_model(model):
+    list = []
+    list = conf_start(list, model.getname())
+
+    # configuration (user)
+    if model.getdim() == 3:
+        list = conf_geom3D(list, *model.getgeoms())
+        list = conf_mesh3D(list, *model.getsects())
+    else:
+        list = conf_geom2D(list, *model.getgeoms())
+        list = conf_mesh2D(list, *model.getsects())
+
+    # configuration (script)
+    list = conf_type(list, model.getgeomtype())
+    for type, geoms in zip(["xgeom", "ygeom", "zgeom"], model.getgeoms()):
+        list = conf_geomdata(list, type, geoms)
+    for sects in model.getsects():
+        list = conf_meshdata(list, sects)
+    return list
+
+
+# write .rpl and .conf file of generated model without console output, project folder in dir\geomtype
+# overwrite: use existing project folder, returns paths of .rpl and .conf file
+def writemodel(model, dir, overwrite=False):
+    projdir = os.path.join(dir, model.getgeomtype(), model.getname())
+    if os.path.exists(projdir) and not overwrite:
+        raise ValueError(f"A folder with the project name '{model.getname()}' already exists. Set 'overwrite' to use this folder anyway.")
+    if not os.path.exists(projdir):
+        os.makedirs(projdir)
+    
+    rplfile = os.path.join(projdir, model.getname() + ".rpl")
+    with open(rplfile, 'w', buffering=obj.writebuffer) as file:
+        rpl_model(model, obj.Stream(file))
+    file.close()
+    
+    conffile = os.path.join(projdir, model.getname() + ".conf")
+    with open(conffile, 'w') as file:
+        file.writelines(conf_model(model))
+    file.close()
+    return rplfile, conffile
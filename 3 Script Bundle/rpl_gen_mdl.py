@@ -0,0 +1,3361 @@
+# this file contains the model generation of all ICEM mesh creation scripts
+# models are generated without user input or console output, e.g. model = mdl.build_3d_horizontal(params)
+# the files rpl_gen_fnc.py and rpl_gen_obj.py are required to use this file
+
+
+############################################################### DO NOT EDIT BELOW ###############################################################
+# dependencies
+import rpl_gen_fnc as fnc                   # function source file
+import rpl_gen_obj as obj                   # class source file
+
+
+# default part names (as specified at the top of the scripts)
+partnames = {
+    "fluid": "FLUID",
+    "finlet": "FILMINLET",
+    "fwall": "FILMWALL",
+    "foutlet": "FILMOUTLET",
+    "owall": "FILMOUTLETWALL",
+    "gwall": "GASWALL",
+    "gtop": "GASTOP",
+    "gbottom": "GASBOTTOM",
+    "distr": "DISTRIBUTOR",
+    "sides": "SIDES",
+}
+
+
+# default cell sizes of default meshing in [m] (as specified at the top of the scripts)
+meshsizes_2D = {"film": 1.2e-5, "distr": 2.4e-5, "xmax": 1e-4, "ymax": 1e-4}
+meshsizes_3D = {"film": 1.2e-5, "distr": 1e-4, "xmax": 4e-4, "ymax": 4e-4, "zmax": 4e-4}
+
+
+################################################################# PROGRAM START #################################################################
+# geometry type and number of geometric variant
+def variant(geomtype, inlettype, outlettype="1"):
+    geomnum = int(inlettype) + 2*(int(outlettype) - 1)
+    return geomtype + str(geomnum), geomnum
+
+
+# part names and default cell sizes for models from parameter file
+# names and sizes override the defaults, cell sizes in the parameter file ('sizes', [mm]) override both
+def buildsettings(params, names, sizes, defaultsizes):
+    names = dict(partnames, **(names or {}))
+    sizes = dict(defaultsizes, **(sizes or {}))
+    
+    vals = params.get("sizes", {})
+    if not isinstance(vals, dict):
+        raise ValueError("Invalid values for 'sizes' in parameter file.")
+    for key in vals:
+        if key not in defaultsizes:
+            raise ValueError(f"Invalid cell size '{key}' in parameter file. Available sizes: {', '.join(defaultsizes)}.")
+        try:
+            sizes[key] = abs(float(vals[key])/1000.0)       # conversion from [mm] to [m]
+        except (TypeError, ValueError):
+            raise ValueError(f"Invalid value for '{key}' in 'sizes' of parameter file. Please enter a valid number.")
+    return names, sizes
+
+
+# meshing of sections from parameter file: reference config file ('meshing': 'reference'), closest config file ('meshing': 'nearest') or default meshing,
+# followed by custom meshing ('sections'), returns config file used for meshing (None for default meshing)
+def buildmeshing(params, refconffile, sects, defaultmeshing, geomtype, geoms):
+    if params.get("meshing") == "nearest":
+        refconffile = fnc.specnearest(geomtype, geoms, fnc.specproject(params))
+    if fnc.specconfmesh(params, refconffile) == "y":
+        factor = fnc.specfactor(params)
+        for dimsects in sects:
+            fnc.confmeshing(refconffile, dimsects, factor)
+    else:
+        refconffile = None
+        defaultmeshing()
+    fnc.specmeshing(params, [sect for dimsects in sects for sect in dimsects])
+    return refconffile
+
+
+################################################################### 2D SMOOTH ###################################################################
+# geometry objects of variant, geometry type: 2D, smooth film wall
+def geometry_2d_smooth(inlettype):
+    xgeom = []
+    ygeom = []
+
+    # add xgeom objects
+    xgeom.append(obj.Geometry(obj.ht_geomname, obj.ht_geomdescr))
+    xgeom.append(obj.Geometry(obj.hi_geomname, obj.hi_geomdescr))
+    xgeom.append(obj.Geometry(obj.hd_geomname, obj.hd_geomdescr))
+
+    # add ygeom objects
+    ygeom.append(obj.Geometry(obj.lt_geomname, obj.lt_geomdescr))
+    if inlettype == "2":
+        ygeom.append(obj.Geometry(obj.lag_geomname, obj.lag_geomdescr))         # inlet type 2
+    return xgeom, ygeom
+
+
+# meshing sections based on final geometric parameters, geometry type: 2D, smooth film wall
+def sections_2d_smooth(inlettype, xgeom, ygeom):
+    # final values of geometric parameters
+    # x geometry parameters
+    ht_geom = fnc.getobj(obj.ht_geomname, xgeom).getval()           # total domain size
+    hi_geom = fnc.getobj(obj.hi_geomname, xgeom).getval()           # film inlet
+    hd_geom = fnc.getobj(obj.hd_geomname, xgeom).getval()           # distributor
+    hg_geom = ht_geom - (hi_geom + hd_geom)                         # gas space
+
+    # y geometry parameters
+    lt_geom = fnc.getobj(obj.lt_geomname, ygeom).getval()           # film wall
+    if inlettype == "2":
+        lag_geom = fnc.getobj(obj.lag_geomname, ygeom).getval()     # inlet: additional gas space
+
+    # creating meshing sections based on final geometric parameters provided
+    xsects = []
+    ysects = []
+
+    # x-dimension
+    xsects.append(obj.Section(obj.hi_sectname, hi_geom))            # film inlet
+    xsects.append(obj.Section(obj.hd_sectname, hd_geom))            # distributor
+    xsects.append(obj.Section(obj.hg_sectname, hg_geom))            # gas space
+
+    # y-dimension
+    ysects.append(obj.Section(obj.lt_sectname, lt_geom))            # structures
+    if inlettype == "2":
+        ysects.append(obj.Section(obj.lag_sectname, lag_geom))      # inlet: additional gas space
+    return xsects, ysects
+
+
+# default meshing of sections, cell sizes in [m] (film, distr, xmax, ymax), geometry type: 2D, smooth film wall
+def defaultmeshing_2d_smooth(inlettype, xsects, ysects, sizes):
+    size_film = sizes["film"]
+    size_distr = sizes["distr"]
+    size_xmax = sizes["xmax"]
+    size_ymax = sizes["ymax"]
+
+    # x-dimension
+    fnc.uniform(fnc.getobj(obj.hi_sectname, xsects), size_film)                 # film inlet
+    fnc.geo1(fnc.getobj(obj.hd_sectname, xsects), size_film, size_distr)        # distributor
+    fnc.geo1(fnc.getobj(obj.hg_sectname, xsects), size_distr, size_xmax)        # gas space
+
+    # y-dimension
+    fnc.uniform(fnc.getobj(obj.lt_sectname, ysects), size_ymax)                 # total domain
+    if inlettype == "2":
+        fnc.uniform(fnc.getobj(obj.lag_sectname, ysects), size_ymax)            # inlet: additional gas space
+
+
+# model generation from final geometric and meshing parameters, geometry type: 2D, smooth film wall
+# names: part names, periodic boundaries are only used for geometric variant 1
+def model_2d_smooth(projname, inlettype, periodic, xgeom, ygeom, xsects, ysects, names):
+    outlettype = "1"                # simple film outlet
+    geomtype, geomnum = variant("2D-smooth-", inlettype, outlettype)
+    periodic = periodic and geomnum == 1
+
+    # part names
+    name_fluid = names["fluid"]
+    name_finlet = names["finlet"]
+    name_fwall = names["fwall"]
+    name_foutlet = names["foutlet"]
+    name_gwall = names["gwall"]
+    name_gtop = names["gtop"]
+    name_distr = names["distr"]
+
+    # names of points, curves and surfaces start from 0 for every model
+    fnc.resetcounts()
+
+    # final values of geometric parameters
+    # x geometry parameters
+    ht_geom = fnc.getobj(obj.ht_geomname, xgeom).getval()           # total domain size
+    hi_geom = fnc.getobj(obj.hi_geomname, xgeom).getval()           # film inlet
+    hd_geom = fnc.getobj(obj.hd_geomname, xgeom).getval()           # distributor
+    hg_geom = ht_geom - (hi_geom + hd_geom)                         # gas space
+
+    # y geometry parameters
+    lt_geom = fnc.getobj(obj.lt_geomname, ygeom).getval()           # film wall
+    if inlettype == "2":
+        lag_geom = fnc.getobj(obj.lag_geomname, ygeom).getval()     # inlet: additional gas space
+
+    # final values of meshing parameters
+    # x meshing parameters
+    hi_mesh = fnc.getobj(obj.hi_sectname, xsects).getmesh()         # film inlet
+    hd_mesh = fnc.getobj(obj.hd_sectname, xsects).getmesh()         # distributor
+    hg_mesh = fnc.getobj(obj.hg_sectname, xsects).getmesh()         # gas space
+
+    # y meshing parameters
+    lt_mesh = fnc.getobj(obj.lt_sectname, ysects).getmesh()         # film wall
+    if inlettype == "2":
+        lag_mesh = fnc.getobj(obj.lag_sectname, ysects).getmesh()   # additional gas space
+
+    model = obj.Model(projname, geomtype, [xgeom, ygeom], [xsects, ysects], 0)
+
+
+    # geometry object lists
+    prts = model.getprts()       # parts
+    pnts = model.getpnts()       # points
+    crvs = model.getcrvs()       # curves
+
+
+    # part creation
+    # body parts
+    prts.append(obj.Body(name_fluid, ht_geom/2.0, lt_geom/2.0, 0.0))    # fluid
+
+    # boundary parts
+    prts.append(obj.Part(name_finlet))      # inlet
+    prts.append(obj.Part(name_fwall))       # film wall
+    prts.append(obj.Part(name_foutlet))     # film outlet
+    prts.append(obj.Part(name_gwall))       # gas wall
+    if not periodic:
+        prts.append(obj.Part(name_gtop))        # gas top
+        prts.append(obj.Part(name_distr))       # distributor
+
+
+    # film inlet region
+    # inlet variant 1: simple film inlet
+    if inlettype == "1":
+        # point definition
+        # points at lt_geom
+        pnts.append(obj.Point(ht_geom, lt_geom, 0.0))
+        pnts.append(obj.Point((hi_geom + hd_geom), lt_geom, 0.0))
+        pnts.append(obj.Point(hi_geom, lt_geom, 0.0))
+        pnts.append(obj.Point(0.0, lt_geom, 0.0))
+
+
+        # curve definition
+        # curves in x direction
+        crvs.append(obj.Curve(pnts[-4], pnts[-3]))
+        if periodic:
+            fnc.getobj(name_finlet, prts).addgeom(crvs[-1])
+        else:
+            fnc.getobj(name_gtop, prts).addgeom(crvs[-1])
+        crvs.append(obj.Curve(pnts[-3], pnts[-2]))
+        if periodic:
+            fnc.getobj(name_finlet, prts).addgeom(crvs[-1])
+        else:
+            fnc.getobj(name_distr, prts).addgeom(crvs[-1])
+        crvs.append(obj.Curve(pnts[-2], pnts[-1]))
+        fnc.getobj(name_finlet, prts).addgeom(crvs[-1])
+
+
+    # inlet variant 2: additional gas space
+    elif inlettype == "2":
+        # point definition
+        # points at (lt_geom + lag_geom)
+        pnts.append(obj.Point(ht_geom, (lt_geom + lag_geom), 0.0))
+        pnts.append(obj.Point((hi_geom + hd_geom), (lt_geom + lag_geom), 0.0))
+
+        # points at lt_geom
+        pnts.append(obj.Point(ht_geom, lt_geom, 0.0))
+        pnts.append(obj.Point((hi_geom + hd_geom), lt_geom, 0.0))
+        pnts.append(obj.Point(hi_geom, lt_geom, 0.0))
+        pnts.append(obj.Point(0.0, lt_geom, 0.0))
+
+
+        # curve definition
+        # curves in y direction
+        crvs.append(obj.Curve(pnts[-6], pnts[-4]))
+        fnc.getobj(name_gwall, prts).addgeom(crvs[-1])
+        crvs.append(obj.Curve(pnts[-5], pnts[-3]))
+        fnc.getobj(name_distr, prts).addgeom(crvs[-1])
+
+        # curves in x direction
+        crvs.append(obj.Curve(pnts[-6], pnts[-5]))
+        fnc.getobj(name_gtop, prts).addgeom(crvs[-1])
+        crvs.append(obj.Curve(pnts[-3], pnts[-2]))
+        fnc.getobj(name_distr, prts).addgeom(crvs[-1])
+        crvs.append(obj.Curve(pnts[-2], pnts[-1]))
+        fnc.getobj(name_finlet, prts).addgeom(crvs[-1])
+
+
+
+    # film outlet region
+    # outlet variant 1: simple film outlet
+    if outlettype == "1":
+        # point definition
+        # points at lt_geom
+        pnts.append(obj.Point(ht_geom, 0.0, 0.0))
+        pnts.append(obj.Point((hi_geom + hd_geom), 0.0, 0.0))
+        pnts.append(obj.Point(hi_geom, 0.0, 0.0))
+        pnts.append(obj.Point(0.0, 0.0, 0.0))
+
+        # number of points of film outlet region
+        numpnts_foutlet = 4
+
+        # curve definition
+        # curves in y direction
+        crvs.append(obj.Curve(pnts[-numpnts_foutlet-4], pnts[-4]))
+        fnc.getobj(name_gwall, prts).addgeom(crvs[-1])
+        crvs.append(obj.Curve(pnts[-numpnts_foutlet-1], pnts[-1]))
+        fnc.getobj(name_fwall, prts).addgeom(crvs[-1])
+
+        # curves in x direction
+        crvs.append(obj.Curve(pnts[-4], pnts[-3]))
+        fnc.getobj(name_foutlet, prts).addgeom(crvs[-1])
+        crvs.append(obj.Curve(pnts[-3], pnts[-2]))
+        fnc.getobj(name_foutlet, prts).addgeom(crvs[-1])
+        crvs.append(obj.Curve(pnts[-2], pnts[-1]))
+        fnc.getobj(name_foutlet, prts).addgeom(crvs[-1])
+
+
+
+    # blocking
+    blkg = model.getblkg()        # blocking operations (split, deletion)
+    edges = model.getassoc()       # edge-curve associations
+
+
+    # block modification
+    # geometry type 1
+    if geomnum == 1:
+        # block splits
+        # film inlet region
+        # x splits
+        blkg.append(obj.Split(pnts[2], 13, 21, prts))       # hi_geom
+        blkg.append(obj.Split(pnts[1], 34, 21, prts))       # (hi_geom + hd_geom)
+
+
+    # geometry type 2
+    elif geomnum == 2:
+        # block splits
+        # film inlet region
+        # x splits
+        blkg.append(obj.Split(pnts[4], 13, 21, prts))       # hi_geom
+        blkg.append(obj.Split(pnts[3], 34, 21, prts))       # (hi_geom + hd_geom)
+
+        # y splits
+        blkg.append(obj.Split(pnts[5], 11, 13, prts))       # lt_geom
+
+
+        # block deletion
+        # film inlet region
+        blkg.append(obj.Delete(16))                         # delete block above inlet
+        blkg.append(obj.Delete(17))                         # delete block above inlet
+
+
+    # edge-curve associations
+
+
+    # geometry type 1
+    if geomnum == 1:
+        # film inlet region
+        # x direction
+        edges.append(obj.Edge(38, 21, crvs[0]))
+        edges.append(obj.Edge(34, 38, crvs[1]))
+        edges.append(obj.Edge(13, 34, crvs[2]))
+
+
+        # film outlet region
+        # y direction
+        edges.append(obj.Edge(19, 21, crvs[-5]))
+        edges.append(obj.Edge(11, 13, crvs[-4]))
+
+        # x direction
+        edges.append(obj.Edge(37, 19, crvs[-3]))
+        edges.append(obj.Edge(33, 37, crvs[-2]))
+        edges.append(obj.Edge(11, 33, crvs[-1]))
+
+
+    # geometry type 2
+    elif geomnum == 2:
+        # film inlet region
+        # y direction
+        edges.append(obj.Edge(44, 21, crvs[0]))
+        edges.append(obj.Edge(43, 38, crvs[1]))
+
+        # x direction
+        edges.append(obj.Edge(38, 21, crvs[2]))
+        edges.append(obj.Edge(42, 43, crvs[3]))
+        edges.append(obj.Edge(41, 42, crvs[4]))
+
+
+        # film outlet region
+        # y direction
+        edges.append(obj.Edge(19, 44, crvs[-5]))
+        edges.append(obj.Edge(11, 41, crvs[-4]))
+
+        # x direction
+        edges.append(obj.Edge(37, 19, crvs[-3]))
+        edges.append(obj.Edge(33, 37, crvs[-2]))
+        edges.append(obj.Edge(11, 33, crvs[-1]))
+
+
+    # meshing
+    mshg = model.getmshg()        # meshing operations
+
+
+    # geometry type 1
+    if geomnum == 1:
+        # x direction
+        mshg.append(obj.Mesh(13, 34, hi_mesh))      # film
+        mshg.append(obj.Mesh(34, 38, hd_mesh))      # distributor
+        mshg.append(obj.Mesh(38, 21, hg_mesh))      # gas space
+
+
+        # y direction
+        mshg.append(obj.Mesh(11, 13, lt_mesh))     # total domain
+
+
+    # geometry type 2
+    elif geomnum == 2:
+        # x direction
+        mshg.append(obj.Mesh(41, 42, hi_mesh))      # film
+        mshg.append(obj.Mesh(42, 43, hd_mesh))      # distributor
+        mshg.append(obj.Mesh(43, 44, hg_mesh))      # gas space
+
+
+        # y direction
+        mshg.append(obj.Mesh(43, 38, lag_mesh))     # additional gas space
+        mshg.append(obj.Mesh(11, 41, lt_mesh))      # total domain
+    return model
+
+
+# model generation from parameter file (see README), geometry type: 2D, smooth film wall
+# names: part names, sizes: default cell sizes in [m], raises ValueError for invalid parameters
+def build_2d_smooth(params, names=None, sizes=None):
+    names, sizes = buildsettings(params, names, sizes, meshsizes_2D)
+    projname = fnc.specproject(params)
+
+    # geometric variant
+    inlettype = fnc.specvariant(params, "inlet", ["1", "2"])
+    geomtype, geomnum = variant("2D-smooth-", inlettype)
+    periodic = fnc.specbool(params, "periodic") if geomnum == 1 else False
+    refconffile = fnc.specreference(params, geomtype)
+
+    # geometric parameters
+    xgeom, ygeom = geometry_2d_smooth(inlettype)
+    fnc.specxgeom(params, xgeom, refconffile)
+    fnc.specygeom_smooth(params, ygeom, refconffile)
+
+    # meshing parameters
+    xsects, ysects = sections_2d_smooth(inlettype, xgeom, ygeom)
+    meshref = buildmeshing(params, refconffile, [xsects, ysects], lambda: defaultmeshing_2d_smooth(inlettype, xsects, ysects, sizes), geomtype, [xgeom, ygeom])
+
+    model = model_2d_smooth(projname, inlettype, periodic, xgeom, ygeom, xsects, ysects, names)
+    model.setmeshref(meshref)
+    return model
+
+
+########################################################### 2D HORIZONTAL STRUCTURES ############################################################
+# geometry objects of variant, geometry type: 2D, horizontal structures
+def geometry_2d_horizontal(inlettype):
+    xgeom = []
+    ygeom = []
+
+    # add xgeom objects
+    xgeom.append(obj.Geometry(obj.ht_geomname, obj.ht_geomdescr))
+    xgeom.append(obj.Geometry(obj.hi_geomname, obj.hi_geomdescr))
+    xgeom.append(obj.Geometry(obj.hd_geomname, obj.hd_geomdescr))
+    xgeom.append(obj.Geometry(obj.dgr_geomname, obj.dgr_geomdescr))
+
+    # add ygeom objects
+    ygeom.append(obj.Geometry(obj.lt_geomname, obj.lt_geomdescr))
+    if inlettype == "2":
+        ygeom.append(obj.Geometry(obj.lag_geomname, obj.lag_geomdescr))         # inlet type 2
+    ygeom.append(obj.Geometry(obj.ls_geomname, obj.ls_geomdescr))
+    ygeom.append(obj.Geometry(obj.lgr_geomname, obj.lgr_geomdescr))
+    ygeom.append(obj.Geometry(obj.li_geomname, obj.li_geomdescr))
+    ygeom.append(obj.Geometry(obj.lo_geomname, obj.lo_geomdescr))
+    ygeom.append(obj.Geometry(obj.ns_geomname, obj.ns_geomdescr))
+    return xgeom, ygeom
+
+
+# meshing sections based on final geometric parameters, geometry type: 2D, horizontal structures
+def sections_2d_horizontal(inlettype, xgeom, ygeom):
+    # final values of geometric parameters
+    # x geometry parameters
+    ht_geom = fnc.getobj(obj.ht_geomname, xgeom).getval()           # total domain size
+    hi_geom = fnc.getobj(obj.hi_geomname, xgeom).getval()           # film inlet
+    hd_geom = fnc.getobj(obj.hd_geomname, xgeom).getval()           # distributor
+    hg_geom = ht_geom - (hi_geom + hd_geom)                         # gas space
+    dgr_geom = fnc.getobj(obj.dgr_geomname, xgeom).getval()         # grooves
+
+    # y geometry parameters
+    lt_geom = fnc.getobj(obj.lt_geomname, ygeom).getval()           # film wall
+    if inlettype == "2":
+        lag_geom = fnc.getobj(obj.lag_geomname, ygeom).getval()     # inlet: additional gas space
+    ls_geom = fnc.getobj(obj.ls_geomname, ygeom).getval()           # structures
+    lgr_geom = fnc.getobj(obj.lgr_geomname, ygeom).getval()         # grooves
+    li_geom = fnc.getobj(obj.li_geomname, ygeom).getval()           # smooth wall at inlet
+    lo_geom = fnc.getobj(obj.lo_geomname, ygeom).getval()           # smooth wall at outlet
+    ns = fnc.getobj(obj.ns_geomname, ygeom).getval()                # number of structures
+
+    # creating meshing sections based on final geometric parameters provided
+    xsects = []
+    ysects = []
+
+    # x-dimension
+    xsects.append(obj.Section(obj.hi_sectname, hi_geom))            # film inlet
+    xsects.append(obj.Section(obj.hd_sectname, hd_geom))            # distributor
+    xsects.append(obj.Section(obj.hg_sectname, hg_geom))            # gas space
+    xsects.append(obj.Section(obj.dgr_sectname, dgr_geom))          # grooves
+
+    # y-dimension
+    if inlettype == "2":
+        ysects.append(obj.Section(obj.lag_sectname, lag_geom))      # inlet: additional gas space
+    ysects.append(obj.Section(obj.ls_sectname, ls_geom))            # structures
+    ysects.append(obj.Section(obj.lgr_sectname, lgr_geom))          # grooves
+    ysects.append(obj.Section(obj.li_sectname, li_geom))            # smooth wall at inlet
+    ysects.append(obj.Section(obj.lo_sectname, lo_geom))            # smooth wall at outlet
+    return xsects, ysects
+
+
+# default meshing of sections, cell sizes in [m] (film, distr, xmax, ymax), geometry type: 2D, horizontal structures
+def defaultmeshing_2d_horizontal(inlettype, xsects, ysects, sizes):
+    size_film = sizes["film"]
+    size_distr = sizes["distr"]
+    size_xmax = sizes["xmax"]
+    size_ymax = sizes["ymax"]
+
+    # x-dimension
+    fnc.uniform(fnc.getobj(obj.hi_sectname, xsects), size_film)                 # film inlet
+    fnc.geo1(fnc.getobj(obj.hd_sectname, xsects), size_film, size_distr)        # distributor
+    fnc.geo1(fnc.getobj(obj.hg_sectname, xsects), size_distr, size_xmax)        # gas space
+    fnc.uniform(fnc.getobj(obj.dgr_sectname, xsects), size_film)                # grooves
+
+    # y-dimension
+    if inlettype == "2":
+        fnc.uniform(fnc.getobj(obj.lag_sectname, ysects), size_ymax)            # inlet: additional gas space
+    fnc.uniform(fnc.getobj(obj.ls_sectname, ysects), size_ymax)                 # structures
+    fnc.uniform(fnc.getobj(obj.lgr_sectname, ysects), size_ymax)                # grooves
+    fnc.uniform(fnc.getobj(obj.li_sectname, ysects), size_ymax)                 # smooth wall at inlet
+    fnc.uniform(fnc.getobj(obj.lo_sectname, ysects), size_ymax)                 # smooth wall at outlet
+
+
+# model generation from final geometric and meshing parameters, geometry type: 2D, horizontal structures
+# names: part names, periodic boundaries are only used for geometric variant 1
+def model_2d_horizontal(projname, inlettype, periodic, xgeom, ygeom, xsects, ysects, names):
+    outlettype = "1"                # simple film outlet
+    geomtype, geomnum = variant("2D-horizontal-", inlettype, outlettype)
+    periodic = periodic and geomnum == 1
+
+    # part names
+    name_fluid = names["fluid"]
+    name_finlet = names["finlet"]
+    name_fwall = names["fwall"]
+    name_foutlet = names["foutlet"]
+    name_gwall = names["gwall"]
+    name_gtop = names["gtop"]
+    name_distr = names["distr"]
+
+    # names of points, curves and surfaces start from 0 for every model
+    fnc.resetcounts()
+
+    # final values of geometric parameters
+    # x geometry parameters
+    ht_geom = fnc.getobj(obj.ht_geomname, xgeom).getval()           # total domain size
+    hi_geom = fnc.getobj(obj.hi_geomname, xgeom).getval()           # film inlet
+    hd_geom = fnc.getobj(obj.hd_geomname, xgeom).getval()           # distributor
+    hg_geom = ht_geom - (hi_geom + hd_geom)                         # gas space
+    dgr_geom = fnc.getobj(obj.dgr_geomname, xgeom).getval()         # grooves
+
+    # y geometry parameters
+    lt_geom = fnc.getobj(obj.lt_geomname, ygeom).getval()           # film wall
+    if inlettype == "2":
+        lag_geom = fnc.getobj(obj.lag_geomname, ygeom).getval()     # inlet: additional gas space
+    ls_geom = fnc.getobj(obj.ls_geomname, ygeom).getval()           # structures
+    lgr_geom = fnc.getobj(obj.lgr_geomname, ygeom).getval()         # grooves
+    li_geom = fnc.getobj(obj.li_geomname, ygeom).getval()           # smooth wall at inlet
+    lo_geom = fnc.getobj(obj.lo_geomname, ygeom).getval()           # smooth wall at outlet
+    ns = fnc.getobj(obj.ns_geomname, ygeom).getval()                # number of structures
+
+    # final values of meshing parameters
+    # x meshing parameters
+    hi_mesh = fnc.getobj(obj.hi_sectname, xsects).getmesh()         # film inlet
+    hd_mesh = fnc.getobj(obj.hd_sectname, xsects).getmesh()         # distributor
+    hg_mesh = fnc.getobj(obj.hg_sectname, xsects).getmesh()         # gas space
+    dgr_mesh = fnc.getobj(obj.dgr_sectname, xsects).getmesh()       # grooves
+
+    # y meshing parameters
+    if inlettype == "2":
+        lag_mesh = fnc.getobj(obj.lag_sectname, ysects).getmesh()   # additional gas space
+    ls_mesh = fnc.getobj(obj.ls_sectname, ysects).getmesh()         # structures
+    lgr_mesh = fnc.getobj(obj.lgr_sectname, ysects).getmesh()       # grooves
+    li_mesh = fnc.getobj(obj.li_sectname, ysects).getmesh()         # smooth wall at inlet
+    lo_mesh = fnc.getobj(obj.lo_sectname, ysects).getmesh()         # smooth wall at outlet
+
+    model = obj.Model(projname, geomtype, [xgeom, ygeom], [xsects, ysects], ns)
+
+
+    # geometry object lists
+    prts = model.getprts()       # parts
+    pnts = model.getpnts()       # points
+    crvs = model.getcrvs()       # curves
+
+
+    # part creation
+    # body parts
+    prts.append(obj.Body(name_fluid, ht_geom/2.0, lt_geom/2.0, 0.0))    # fluid
+
+    # boundary parts
+    prts.append(obj.Part(name_finlet))      # inlet
+    prts.append(obj.Part(name_fwall))       # film wall
+    prts.append(obj.Part(name_foutlet))     # film outlet
+    prts.append(obj.Part(name_gwall))       # gas wall
+    if not periodic:
+        prts.append(obj.Part(name_gtop))    # gas top
+        prts.append(obj.Part(name_distr))   # distributor
+
+
+    # film inlet region
+    # inlet variant 1: simple film inlet
+    if inlettype == "1":
+        # point definition
+        # points at lt_geom
+        pnts.append(obj.Point(ht_geom, lt_geom, 0.0))
+        pnts.append(obj.Point((hi_geom + hd_geom), lt_geom, 0.0))
+        pnts.append(obj.Point(hi_geom, lt_geom, 0.0))
+        pnts.append(obj.Point(0.0, lt_geom, 0.0))
+
+        # points at (lt_geom - li_geom)
+        pnts.append(obj.Point(ht_geom, (lt_geom - li_geom), 0.0))
+        pnts.append(obj.Point(0.0, (lt_geom - li_geom), 0.0))
+        pnts.append(obj.Point(-1.0*dgr_geom, (lt_geom - li_geom), 0.0))
+
+        # points at (lt_geom - li_geom - lgr_geom)
+        pnts.append(obj.Point(ht_geom, (lt_geom - li_geom - lgr_geom), 0.0))
+        pnts.append(obj.Point(0.0, (lt_geom - li_geom - lgr_geom), 0.0))
+        pnts.append(obj.Point(-1.0*dgr_geom, (lt_geom - li_geom - lgr_geom), 0.0))
+
+
+        # curve definition
+        # curves in y direction
+        crvs.append(obj.Curve(pnts[-10], pnts[-6]))
+        fnc.getobj(name_gwall, prts).addgeom(crvs[-1])
+        crvs.append(obj.Curve(pnts[-6], pnts[-3]))
+        fnc.getobj(name_gwall, prts).addgeom(crvs[-1])
+
+        crvs.append(obj.Curve(pnts[-7], pnts[-5]))
+        fnc.getobj(name_fwall, prts).addgeom(crvs[-1])
+
+        crvs.append(obj.Curve(pnts[-4], pnts[-1]))
+        fnc.getobj(name_fwall, prts).addgeom(crvs[-1])
+
+        # curves in x direction
+        crvs.append(obj.Curve(pnts[-10], pnts[-9]))
+        if periodic:
+            fnc.getobj(name_finlet, prts).addgeom(crvs[-1])
+        else:
+            fnc.getobj(name_gtop, prts).addgeom(crvs[-1])
+        crvs.append(obj.Curve(pnts[-9], pnts[-8]))
+        if periodic:
+            fnc.getobj(name_finlet, prts).addgeom(crvs[-1])
+        else:
+            fnc.getobj(name_distr, prts).addgeom(crvs[-1])
+        crvs.append(obj.Curve(pnts[-8], pnts[-7]))
+        fnc.getobj(name_finlet, prts).addgeom(crvs[-1])
+
+        crvs.append(obj.Curve(pnts[-5], pnts[-4]))
+        fnc.getobj(name_fwall, prts).addgeom(crvs[-1])
+
+        crvs.append(obj.Curve(pnts[-2], pnts[-1]))
+        fnc.getobj(name_fwall, prts).addgeom(crvs[-1])
+
+
+    # inlet variant 2: additional gas space
+    elif inlettype == "2":
+        # point definition
+        # points at (lt_geom + lag_geom)
+        pnts.append(obj.Point(ht_geom, (lt_geom + lag_geom), 0.0))
+        pnts.append(obj.Point((hi_geom + hd_geom), (lt_geom + lag_geom), 0.0))
+
+        # points at lt_geom
+        pnts.append(obj.Point(ht_geom, lt_geom, 0.0))
+        pnts.append(obj.Point((hi_geom + hd_geom), lt_geom, 0.0))
+        pnts.append(obj.Point(hi_geom, lt_geom, 0.0))
+        pnts.append(obj.Point(0.0, lt_geom, 0.0))
+
+        # points at (lt_geom - li_geom)
+        pnts.append(obj.Point(ht_geom, (lt_geom - li_geom), 0.0))
+        pnts.append(obj.Point(0.0, (lt_geom - li_geom), 0.0))
+        pnts.append(obj.Point(-1.0*dgr_geom, (lt_geom - li_geom), 0.0))
+
+        # points at (lt_geom - li_geom - lgr_geom)
+        pnts.append(obj.Point(ht_geom, (lt_geom - li_geom - lgr_geom), 0.0))
+        pnts.append(obj.Point(0.0, (lt_geom - li_geom - lgr_geom), 0.0))
+        pnts.append(obj.Point(-1.0*dgr_geom, (lt_geom - li_geom - lgr_geom), 0.0))
+
+
+        # curve definition
+        # curves in y direction
+        crvs.append(obj.Curve(pnts[-12], pnts[-10]))
+        fnc.getobj(name_gwall, prts).addgeom(crvs[-1])
+        crvs.append(obj.Curve(pnts[-10], pnts[-6]))
+        fnc.getobj(name_gwall, prts).addgeom(crvs[-1])
+        crvs.append(obj.Curve(pnts[-6], pnts[-3]))
+        fnc.getobj(name_gwall, prts).addgeom(crvs[-1])
+
+        crvs.append(obj.Curve(pnts[-11], pnts[-9]))
+        fnc.getobj(name_distr, prts).addgeom(crvs[-1])
+
+        crvs.append(obj.Curve(pnts[-7], pnts[-5]))
+        fnc.getobj(name_fwall, prts).addgeom(crvs[-1])
+
+        crvs.append(obj.Curve(pnts[-4], pnts[-1]))
+        fnc.getobj(name_fwall, prts).addgeom(crvs[-1])
+
+        # curves in x direction
+        crvs.append(obj.Curve(pnts[-12], pnts[-11]))
+        fnc.getobj(name_gtop, prts).addgeom(crvs[-1])
+
+        crvs.append(obj.Curve(pnts[-9], pnts[-8]))
+        fnc.getobj(name_distr, prts).addgeom(crvs[-1])
+        crvs.append(obj.Curve(pnts[-8], pnts[-7]))
+        fnc.getobj(name_finlet, prts).addgeom(crvs[-1])
+
+        crvs.append(obj.Curve(pnts[-5], pnts[-4]))
+        fnc.getobj(name_fwall, prts).addgeom(crvs[-1])
+
+        crvs.append(obj.Curve(pnts[-2], pnts[-1]))
+        fnc.getobj(name_fwall, prts).addgeom(crvs[-1])
+
+
+
+    # structures
+    for i in range(ns):
+        # point definition
+        # first row of points
+        for j in range(3):
+            pnts.append(obj.Point(pnts[-3].getx(), (pnts[-3].gety() - ls_geom), 0.0))      # structures
+        # second row of points
+        for j in range(3):
+            pnts.append(obj.Point(pnts[-3].getx(), (pnts[-3].gety() - lgr_geom), 0.0))       # grooves
+
+        # number of points of structures
+        numpnts_struc = 6
+
+        # curve definition
+        # gas wall
+        crvs.append(obj.Curve(pnts[-numpnts_struc-3], pnts[-6]))
+        fnc.getobj(name_gwall, prts).addgeom(crvs[-1])
+        crvs.append(obj.Curve(pnts[-6], pnts[-3]))
+        fnc.getobj(name_gwall, prts).addgeom(crvs[-1])
+
+        # film wall
+        crvs.append(obj.Curve(pnts[-numpnts_struc-2], pnts[-5]))
+        fnc.getobj(name_fwall, prts).addgeom(crvs[-1])
+        crvs.append(obj.Curve(pnts[-4], pnts[-1]))
+        fnc.getobj(name_fwall, prts).addgeom(crvs[-1])
+        crvs.append(obj.Curve(pnts[-5], pnts[-4]))
+        fnc.getobj(name_fwall, prts).addgeom(crvs[-1])
+        crvs.append(obj.Curve(pnts[-2], pnts[-1]))
+        fnc.getobj(name_fwall, prts).addgeom(crvs[-1])
+
+
+
+    # film outlet region
+    # outlet variant 1: simple film outlet
+    if outlettype == "1":
+        # point definition
+        # points at lt_geom
+        pnts.append(obj.Point(ht_geom, 0.0, 0.0))
+        pnts.append(obj.Point((hi_geom + hd_geom), 0.0, 0.0))
+        pnts.append(obj.Point(hi_geom, 0.0, 0.0))
+        pnts.append(obj.Point(0.0, 0.0, 0.0))
+
+        # number of points of film outlet region
+        numpnts_foutlet = 4
+
+        # curve definition
+        # curves in y direction
+        crvs.append(obj.Curve(pnts[-numpnts_foutlet-3], pnts[-4]))
+        fnc.getobj(name_gwall, prts).addgeom(crvs[-1])
+        crvs.append(obj.Curve(pnts[-numpnts_foutlet-2], pnts[-1]))
+        fnc.getobj(name_fwall, prts).addgeom(crvs[-1])
+
+        # curves in x direction
+        crvs.append(obj.Curve(pnts[-4], pnts[-3]))
+        fnc.getobj(name_foutlet, prts).addgeom(crvs[-1])
+        crvs.append(obj.Curve(pnts[-3], pnts[-2]))
+        fnc.getobj(name_foutlet, prts).addgeom(crvs[-1])
+        crvs.append(obj.Curve(pnts[-2], pnts[-1]))
+        fnc.getobj(name_foutlet, prts).addgeom(crvs[-1])
+
+
+
+    # blocking
+    blkg = model.getblkg()        # blocking operations (split, deletion)
+    edges = model.getassoc()       # edge-curve associations
+
+
+    # block modification
+    # geometry type 1
+    if geomnum == 1:
+        # block splits
+        # film inlet region
+        # x splits
+        blkg.append(obj.Split(pnts[3], 13, 21, prts))       # 0.0
+        blkg.append(obj.Split(pnts[2], 34, 21, prts))       # hi_geom
+        blkg.append(obj.Split(pnts[1], 38, 21, prts))       # (hi_geom + hd_geom)
+
+        # y splits
+        blkg.append(obj.Split(pnts[6], 11, 13, prts))       # (lt_geom - li_geom)
+        blkg.append(obj.Split(pnts[9], 11, 45, prts))       # (lt_geom - li_geom - lgr_geom)
+
+
+        # structures
+        for i in range(ns):
+            blkg.append(obj.Split(pnts[blkg[-1].getpnt().getnum()+3], 11, blkg[-1].getvert2()+7, prts))   # structures
+            blkg.append(obj.Split(pnts[blkg[-1].getpnt().getnum()+3], 11, blkg[-1].getvert2()+7, prts))   # grooves
+
+
+        # block deletion
+        # film inlet region
+        blkg.append(obj.Delete(19))                         # delete block below smooth wall at inlet
+
+        # structures
+        for i in range(ns):
+            blkg.append(obj.Delete(blkg[-1].getblk()+12))   # delete block below structure
+
+        # film outlet region
+        blkg.append(obj.Delete(4))                          # delete block below smooth wall at outlet
+
+
+    # geometry type 2
+    elif geomnum == 2:
+        # block splits
+        # film inlet region
+        # x splits
+        blkg.append(obj.Split(pnts[5], 13, 21, prts))       # 0.0
+        blkg.append(obj.Split(pnts[4], 34, 21, prts))       # hi_geom
+        blkg.append(obj.Split(pnts[3], 38, 21, prts))       # (hi_geom + hd_geom)
+
+        # y splits
+        blkg.append(obj.Split(pnts[5], 11, 13, prts))       # (lt_geom + lag_geom)
+        blkg.append(obj.Split(pnts[8], 11, 45, prts))       # (lt_geom - li_geom)
+        blkg.append(obj.Split(pnts[11], 11, 52, prts))      # (lt_geom - li_geom - lgr_geom)
+
+
+        # structures
+        for i in range(ns):
+            blkg.append(obj.Split(pnts[blkg[-1].getpnt().getnum()+3], 11, blkg[-1].getvert2()+7, prts))   # structures
+            blkg.append(obj.Split(pnts[blkg[-1].getpnt().getnum()+3], 11, blkg[-1].getvert2()+7, prts))   # grooves
+
+
+        # block deletion
+        # film inlet region
+        blkg.append(obj.Delete(19))                         # delete block above inlet
+        blkg.append(obj.Delete(20))                         # delete block above inlet
+        blkg.append(obj.Delete(21))                         # delete block above inlet
+        blkg.append(obj.Delete(25))                         # delete block below smooth wall at inlet
+
+        # structures
+        for i in range(ns):
+            blkg.append(obj.Delete(blkg[-1].getblk()+12))   # delete block below structure
+
+        # film outlet region
+        blkg.append(obj.Delete(4))                          # delete block below smooth wall at outlet
+
+
+    # edge-curve associations
+
+
+    # geometry type 1
+    if geomnum == 1:
+        # film inlet region
+        # y direction
+        edges.append(obj.Edge(49, 21, crvs[0]))
+        edges.append(obj.Edge(56, 49, crvs[1]))
+
+        edges.append(obj.Edge(46, 34, crvs[2]))
+
+        edges.append(obj.Edge(52, 45, crvs[3]))
+
+        # x direction
+        edges.append(obj.Edge(42, 21, crvs[4]))
+        edges.append(obj.Edge(38, 42, crvs[5]))
+        edges.append(obj.Edge(34, 38, crvs[6]))
+
+        edges.append(obj.Edge(45, 46, crvs[7]))
+
+        edges.append(obj.Edge(52, 53, crvs[8]))
+
+
+        # structures
+        v0 = 63         # starting verex
+        for i in range(ns):
+            # y direction
+            edges.append(obj.Edge(v0+i*14, v0+i*14-7, crvs[edges[-1].getcrv().getnum()+1]))
+            edges.append(obj.Edge(edges[-1].getvert1()+7, edges[-1].getvert1(), crvs[edges[-1].getcrv().getnum()+1]))
+            edges.append(obj.Edge(edges[-1].getvert1()-10, edges[-1].getvert1()-17, crvs[edges[-1].getcrv().getnum()+1]))
+            edges.append(obj.Edge(edges[-1].getvert1()+6, edges[-1].getvert1()-1, crvs[edges[-1].getcrv().getnum()+1]))
+
+            # x direction
+            edges.append(obj.Edge(edges[-1].getvert1()-7, edges[-1].getvert1()-6, crvs[edges[-1].getcrv().getnum()+1]))
+            edges.append(obj.Edge(edges[-1].getvert1()+7, edges[-1].getvert1()+8, crvs[edges[-1].getcrv().getnum()+1]))
+
+
+        # film outlet region
+        v1 = v0+14*ns-7
+        # y direction
+        edges.append(obj.Edge(19, v1, crvs[-5]))
+        edges.append(obj.Edge(33, v1-3, crvs[-4]))
+
+        # x direction
+        edges.append(obj.Edge(41, 19, crvs[-3]))
+        edges.append(obj.Edge(37, 41, crvs[-2]))
+        edges.append(obj.Edge(33, 37, crvs[-1]))
+
+
+    # geometry type 2
+    elif geomnum == 2:
+        # film inlet region
+        # y direction
+        edges.append(obj.Edge(49, 21, crvs[0]))
+        edges.append(obj.Edge(56, 49, crvs[1]))
+        edges.append(obj.Edge(63, 56, crvs[2]))
+
+        edges.append(obj.Edge(48, 42, crvs[3]))
+
+        edges.append(obj.Edge(53, 46, crvs[4]))
+
+        edges.append(obj.Edge(59, 52, crvs[5]))
+
+        # x direction
+        edges.append(obj.Edge(42, 21, crvs[6]))
+
+        edges.append(obj.Edge(47, 48, crvs[7]))
+        edges.append(obj.Edge(46, 47, crvs[8]))
+
+        edges.append(obj.Edge(52, 53, crvs[9]))
+
+        edges.append(obj.Edge(59, 60, crvs[10]))
+
+
+        # structures
+        v0 = 70         # starting vertex
+        for i in range(ns):
+            # y direction
+            edges.append(obj.Edge(v0+i*14, v0+i*14-7, crvs[edges[-1].getcrv().getnum()+1]))
+            edges.append(obj.Edge(edges[-1].getvert1()+7, edges[-1].getvert1(), crvs[edges[-1].getcrv().getnum()+1]))
+            edges.append(obj.Edge(edges[-1].getvert1()-10, edges[-1].getvert1()-17, crvs[edges[-1].getcrv().getnum()+1]))
+            edges.append(obj.Edge(edges[-1].getvert1()+6, edges[-1].getvert1()-1, crvs[edges[-1].getcrv().getnum()+1]))
+
+            # x direction
+            edges.append(obj.Edge(edges[-1].getvert1()-7, edges[-1].getvert1()-6, crvs[edges[-1].getcrv().getnum()+1]))
+            edges.append(obj.Edge(edges[-1].getvert1()+7, edges[-1].getvert1()+8, crvs[edges[-1].getcrv().getnum()+1]))
+
+
+        # film outlet region
+        v1 = v0+14*ns-7
+        # y direction
+        edges.append(obj.Edge(19, v1, crvs[-5]))
+        edges.append(obj.Edge(33, v1-3, crvs[-4]))
+
+        # x direction
+        edges.append(obj.Edge(41, 19, crvs[-3]))
+        edges.append(obj.Edge(37, 41, crvs[-2]))
+        edges.append(obj.Edge(33, 37, crvs[-1]))
+
+
+
+    # meshing
+    mshg = model.getmshg()        # meshing operations
+
+
+    # geometry type 1
+    if geomnum == 1:
+        # x direction
+        mshg.append(obj.Mesh(45, 46, dgr_mesh))     # grooves
+        mshg.append(obj.Mesh(46, 47, hi_mesh))      # film
+        mshg.append(obj.Mesh(47, 48, hd_mesh))      # distributor
+        mshg.append(obj.Mesh(48, 49, hg_mesh))      # gas space
+
+
+        # y direction
+        # film inlet region
+        mshg.append(obj.Mesh(46, 34, li_mesh))      # smooth wall at inlet
+        mshg.append(obj.Mesh(53, 46, lgr_mesh))     # first groove
+
+        # structures
+        for i in range(ns):
+            mshg.append(obj.Mesh(v0+14*i-3, v0+14*i-10, ls_mesh))                           # structures
+            mshg.append(obj.Mesh(mshg[-1].getvert1()+7, mshg[-1].getvert1(), lgr_mesh))     # grooves
+
+        # film outlet region
+        mshg.append(obj.Mesh(33, v1-3, lo_mesh))    # smooth wall at outlet
+
+
+
+    # geometry type 2
+    elif geomnum == 2:
+        # x direction
+        mshg.append(obj.Mesh(52, 53, dgr_mesh))     # grooves
+        mshg.append(obj.Mesh(53, 54, hi_mesh))      # film
+        mshg.append(obj.Mesh(54, 55, hd_mesh))      # distributor
+        mshg.append(obj.Mesh(55, 56, hg_mesh))      # gas space
+
+
+        # y direction
+        # film inlet region
+        mshg.append(obj.Mesh(48, 42, lag_mesh))     # additional gas space
+        mshg.append(obj.Mesh(53, 46, li_mesh))      # smooth wall at inlet
+        mshg.append(obj.Mesh(60, 53, lgr_mesh))     # first groove
+
+        # structures
+        for i in range(ns):
+            mshg.append(obj.Mesh(v0+14*i-3, v0+14*i-10, ls_mesh))                           # structures
+            mshg.append(obj.Mesh(mshg[-1].getvert1()+7, mshg[-1].getvert1(), lgr_mesh))     # grooves
+
+        # film outlet region
+        mshg.append(obj.Mesh(33, v1-3, lo_mesh))    # smooth wall at outlet
+    return model
+
+
+# model generation from parameter file (see README), geometry type: 2D, horizontal structures
+# names: part names, sizes: default cell sizes in [m], raises ValueError for invalid parameters
+def build_2d_horizontal(params, names=None, sizes=None):
+    names, sizes = buildsettings(params, names, sizes, meshsizes_2D)
+    projname = fnc.specproject(params)
+
+    # geometric variant
+    inlettype = fnc.specvariant(params, "inlet", ["1", "2"])
+    geomtype, geomnum = variant("2D-horizontal-", inlettype)
+    periodic = fnc.specbool(params, "periodic") if geomnum == 1 else False
+    refconffile = fnc.specreference(params, geomtype)
+
+    # geometric parameters
+    xgeom, ygeom = geometry_2d_horizontal(inlettype)
+    fnc.specxgeom(params, xgeom, refconffile)
+    fnc.specygeom_hstruc(params, ygeom, refconffile)
+
+    # meshing parameters
+    xsects, ysects = sections_2d_horizontal(inlettype, xgeom, ygeom)
+    meshref = buildmeshing(params, refconffile, [xsects, ysects], lambda: defaultmeshing_2d_horizontal(inlettype, xsects, ysects, sizes), geomtype, [xgeom, ygeom])
+
+    model = model_2d_horizontal(projname, inlettype, periodic, xgeom, ygeom, xsects, ysects, names)
+    model.setmeshref(meshref)
+    return model
+
+
+################################################################### 3D SMOOTH ###################################################################
+# geometry objects of variant, geometry type: 3D, smooth film wall
+def geometry_3d_smooth(inlettype, outlettype):
+    xgeom = []
+    ygeom = []
+    zgeom = []
+
+    # add xgeom objects
+    xgeom.append(obj.Geometry(obj.ht_geomname, obj.ht_geomdescr))
+    xgeom.append(obj.Geometry(obj.hi_geomname, obj.hi_geomdescr))
+    xgeom.append(obj.Geometry(obj.hd_geomname, obj.hd_geomdescr))
+    if outlettype == "2":                                                     # outlet type 2
+        xgeom.append(obj.Geometry(obj.heo_geomname, obj.heo_geomdescr))
+        xgeom.append(obj.Geometry(obj.hro_geomname, obj.hro_geomdescr))
+
+    # add ygeom objects
+    ygeom.append(obj.Geometry(obj.lt_geomname, obj.lt_geomdescr))
+    if inlettype == "2":                                                      # inlet type 2
+        ygeom.append(obj.Geometry(obj.lag_geomname, obj.lag_geomdescr))
+    if outlettype == "2":                                                     # outlet type 2
+        ygeom.append(obj.Geometry(obj.lro_geomname, obj.lro_geomdescr))
+
+    # add zgeom objects
+    zgeom.append(obj.Geometry(obj.wt_geomname, obj.wt_geomdescr))
+    zgeom.append(obj.Geometry(obj.wc_geomname, obj.wc_geomdescr))
+    zgeom.append(obj.Geometry(obj.ws_geomname, obj.ws_geomdescr))
+    return xgeom, ygeom, zgeom
+
+
+# meshing sections based on final geometric parameters, geometry type: 3D, smooth film wall
+def sections_3d_smooth(inlettype, outlettype, xgeom, ygeom, zgeom):
+    # final values of geometric parameters
+    # x geometry parameters
+    ht_geom = fnc.getobj(obj.ht_geomname, xgeom).getval()           # total domain size
+    hi_geom = fnc.getobj(obj.hi_geomname, xgeom).getval()           # film inlet
+    hd_geom = fnc.getobj(obj.hd_geomname, xgeom).getval()           # distributor
+    hg_geom = ht_geom - (hi_geom + hd_geom)                         # gas space
+    if outlettype == "2":
+        heo_geom = fnc.getobj(obj.heo_geomname, xgeom).getval()                 # outlet: edge region
+        hro_geom = fnc.getobj(obj.hro_geomname, xgeom).getval() - heo_geom      # outlet: recessed outlet
+
+    # y geometry parameters
+    lt_geom = fnc.getobj(obj.lt_geomname, ygeom).getval()           # film wall
+    if inlettype == "2":
+        lag_geom = fnc.getobj(obj.lag_geomname, ygeom).getval()     # inlet: additional gas space
+    if outlettype == "2":
+        lro_geom = fnc.getobj(obj.lro_geomname, ygeom).getval()      # outlet: recessed outlet
+
+    # z geometry parameters
+    wt_geom = fnc.getobj(obj.wt_geomname, zgeom).getval()           # total domain size
+    wc_geom = fnc.getobj(obj.wc_geomname, zgeom).getval()           # central section
+    ws_geom = fnc.getobj(obj.ws_geomname, zgeom).getval()           # side sections
+
+    # creating meshing sections based on final geometric parameters provided
+    xsects = []
+    ysects = []
+    zsects = []
+
+    # x-dimension
+    xsects.append(obj.Section(obj.hi_sectname, hi_geom))            # film inlet
+    xsects.append(obj.Section(obj.hd_sectname, hd_geom))            # distributor
+    xsects.append(obj.Section(obj.hg_sectname, hg_geom))            # gas space
+    if outlettype == "2":
+        xsects.append(obj.Section(obj.heo_sectname, heo_geom))      # outlet: edge region
+        xsects.append(obj.Section(obj.hro_sectname, hro_geom))      # outlet: remaining outlet
+
+    # y-dimension
+    ysects.append(obj.Section(obj.lt_sectname, lt_geom))            # film wall
+    if inlettype == "2":
+        ysects.append(obj.Section(obj.lag_sectname, lag_geom))      # inlet: additional gas space
+    if outlettype == "2":
+        ysects.append(obj.Section(obj.lro_sectname, lro_geom))      # outlet: recessed outlet
+
+    # z-dimension
+    zsects.append(obj.Section(obj.ws1_sectname, ws_geom))           # side section 1
+    zsects.append(obj.Section(obj.wc_sectname, wc_geom))            # central section
+    zsects.append(obj.Section(obj.ws2_sectname, ws_geom))           # side section 2
+    return xsects, ysects, zsects
+
+
+# default meshing of sections, cell sizes in [m] (film, distr, xmax, ymax, zmax), geometry type: 3D, smooth film wall
+def defaultmeshing_3d_smooth(inlettype, outlettype, xsects, ysects, zsects, sizes):
+    size_film = sizes["film"]
+    size_distr = sizes["distr"]
+    size_xmax = sizes["xmax"]
+    size_ymax = sizes["ymax"]
+    size_zmax = sizes["zmax"]
+
+    # x-dimension
+    fnc.uniform(fnc.getobj(obj.hi_sectname, xsects), size_film)                 # film inlet
+    fnc.geo1(fnc.getobj(obj.hd_sectname, xsects), size_film, size_distr)        # distributor
+    fnc.geo1(fnc.getobj(obj.hg_sectname, xsects), size_distr, size_xmax)        # gas space
+    if outlettype == "2":
+        fnc.uniform(fnc.getobj(obj.heo_sectname, xsects), size_film)            # outlet: edge region
+        fnc.geo2(fnc.getobj(obj.hro_sectname, xsects), size_film, size_xmax, True)  # outlet: remaining outlet (growth rate within maxrate)
+
+    # y-dimension
+    fnc.uniform(fnc.getobj(obj.lt_sectname, ysects), size_ymax)                 # structures
+    if inlettype == "2":
+        fnc.uniform(fnc.getobj(obj.lag_sectname, ysects), size_ymax)            # inlet: additional gas space
+    if outlettype == "2":
+        fnc.uniform(fnc.getobj(obj.lro_sectname, ysects), size_ymax)            # outlet: recessed outlet
+
+
+    # z-dimension
+    fnc.uniform(fnc.getobj(obj.wc_sectname, zsects), size_zmax)                 # center
+    fnc.geo1(fnc.getobj(obj.ws1_sectname, zsects), size_film, size_zmax, True)  # side section 1 (growth rate within maxrate)
+    fnc.geo2(fnc.getobj(obj.ws2_sectname, zsects), size_film, size_zmax, True)  # side section 2 (growth rate within maxrate)
+
+
+# model generation from final geometric and meshing parameters, geometry type: 3D, smooth film wall
+# names: part names, periodic boundaries are only used for geometric variant 1
+def model_3d_smooth(projname, inlettype, outlettype, periodic, xgeom, ygeom, zgeom, xsects, ysects, zsects, names):
+    geomtype, geomnum = variant("3D-smooth-", inlettype, outlettype)
+    periodic = periodic and geomnum == 1
+
+    # part names
+    name_fluid = names["fluid"]
+    name_finlet = names["finlet"]
+    name_fwall = names["fwall"]
+    name_foutlet = names["foutlet"]
+    name_owall = names["owall"]
+    name_gwall = names["gwall"]
+    name_gtop = names["gtop"]
+    name_gbottom = names["gbottom"]
+    name_distr = names["distr"]
+    name_sides = names["sides"]
+
+    # names of points, curves and surfaces start from 0 for every model
+    fnc.resetcounts()
+
+    # final values of geometric parameters
+    # x geometry parameters
+    ht_geom = fnc.getobj(obj.ht_geomname, xgeom).getval()           # total domain size
+    hi_geom = fnc.getobj(obj.hi_geomname, xgeom).getval()           # film inlet
+    hd_geom = fnc.getobj(obj.hd_geomname, xgeom).getval()           # distributor
+    hg_geom = ht_geom - (hi_geom + hd_geom)                         # gas space
+    if outlettype == "2":
+        heo_geom = fnc.getobj(obj.heo_geomname, xgeom).getval()                 # outlet: edge region
+        hro_geom = fnc.getobj(obj.hro_geomname, xgeom).getval() - heo_geom      # outlet: recessed outlet
+
+    # y geometry parameters
+    lt_geom = fnc.getobj(obj.lt_geomname, ygeom).getval()           # film wall
+    if inlettype == "2":
+        lag_geom = fnc.getobj(obj.lag_geomname, ygeom).getval()     # inlet: additional gas space
+    if outlettype == "2":
+        lro_geom = fnc.getobj(obj.lro_geomname, ygeom).getval()      # outlet: recessed outlet
+
+    # z geometry parameters
+    wt_geom = fnc.getobj(obj.wt_geomname, zgeom).getval()           # total domain size
+    wc_geom = fnc.getobj(obj.wc_geomname, zgeom).getval()           # central section
+    ws_geom = fnc.getobj(obj.ws_geomname, zgeom).getval()           # side sections
+
+    # final values of meshing parameters
+    # x meshing parameters
+    hi_mesh = fnc.getobj(obj.hi_sectname, xsects).getmesh()         # film inlet
+    hd_mesh = fnc.getobj(obj.hd_sectname, xsects).getmesh()         # distributor
+    hg_mesh = fnc.getobj(obj.hg_sectname, xsects).getmesh()         # gas space
+    if outlettype == "2":
+        heo_mesh = fnc.getobj(obj.heo_sectname, xsects).getmesh()   # outlet: edge region
+        hro_mesh = fnc.getobj(obj.hro_sectname, xsects).getmesh()   # outlet: remaining outlet
+
+    # y meshing parameters
+    lt_mesh = fnc.getobj(obj.lt_sectname, ysects).getmesh()         # total domain
+    if inlettype == "2":
+        lag_mesh = fnc.getobj(obj.lag_sectname, ysects).getmesh()   # inlet: additional gas space
+    if outlettype == "2":
+        lro_mesh = fnc.getobj(obj.lro_sectname, ysects).getmesh()   # outlet: recessed outlet
+
+    # z meshing parameters
+    wc_mesh = fnc.getobj(obj.wc_sectname, zsects).getmesh()         # central section
+    ws1_mesh = fnc.getobj(obj.ws1_sectname, zsects).getmesh()       # side section 1
+    ws2_mesh = fnc.getobj(obj.ws2_sectname, zsects).getmesh()       # side section 2
+
+    model = obj.Model(projname, geomtype, [xgeom, ygeom, zgeom], [xsects, ysects, zsects], 0)
+
+
+    # geometry object lists
+    prts = model.getprts()       # parts
+    pnts = model.getpnts()       # points
+    crvs = model.getcrvs()       # curves
+    srfs = model.getsrfs()       # surfaces
+
+
+    # part creation
+    # body parts
+    prts.append(obj.Body(name_fluid, ht_geom/2.0, lt_geom/2.0, wt_geom/2.0))    # fluid
+
+    # boundary parts
+    prts.append(obj.Part(name_finlet))          # inlet
+    prts.append(obj.Part(name_fwall))           # film wall
+    prts.append(obj.Part(name_foutlet))         # film outlet
+    prts.append(obj.Part(name_gwall))           # gas wall
+    if not periodic:
+        prts.append(obj.Part(name_gtop))        # gas top
+        prts.append(obj.Part(name_distr))       # distributor
+    prts.append(obj.Part(name_sides))           # sides
+    if outlettype == "2":
+        prts.append(obj.Part(name_owall))       # outlet wall
+        prts.append(obj.Part(name_gbottom))     # gas bottom
+
+
+
+    # outer z coordinates
+    zbounds = [0.0, wt_geom]
+
+
+    # film inlet region
+    # inlet variant 1: simple film inlet
+    if inlettype == "1":
+        for bound in zbounds:
+            # point definition
+            # points at lt_geom
+            pnts.append(obj.Point(ht_geom, lt_geom, bound))
+            pnts.append(obj.Point((hi_geom + hd_geom), lt_geom, bound))
+            pnts.append(obj.Point(hi_geom, lt_geom, bound))
+            pnts.append(obj.Point(0.0, lt_geom, bound))
+
+
+            # curve definition
+            # curves in x direction
+            crvs.append(obj.Curve(pnts[-4], pnts[-3]))
+            crvs.append(obj.Curve(pnts[-3], pnts[-2]))
+            crvs.append(obj.Curve(pnts[-2], pnts[-1]))
+
+        # number of points and curves of film inlet region
+        numpnts_finlet_bounds = 4           # number of points per bound
+        numcrvs_finlet_bounds = 3           # number of curves per bound
+
+        # curves in z direction
+        zpnts_finlet = [-4, -3, -2, -1]     # points for curves between zbounds of film inlet region
+        for pnt in zpnts_finlet:
+            crvs.append(obj.Curve(pnts[pnt], pnts[pnt-numpnts_finlet_bounds]))
+        numcrvs_finlet_vert = int(len(zpnts_finlet))        # number of curves between bounds
+
+        # surfaces between zbounds
+        # gas top
+        srfs.append(obj.Surface([crvs[-4], crvs[-3], crvs[-numcrvs_finlet_vert-3], crvs[-numcrvs_finlet_vert-numcrvs_finlet_bounds-3]]))
+        if periodic:
+            fnc.getobj(name_finlet, prts).addgeom(srfs[-1])
+        else:
+            fnc.getobj(name_gtop, prts).addgeom(srfs[-1])
+
+        # distributor
+        srfs.append(obj.Surface([crvs[-3], crvs[-2], crvs[-numcrvs_finlet_vert-2], crvs[-numcrvs_finlet_vert-numcrvs_finlet_bounds-2]]))
+        if periodic:
+            fnc.getobj(name_finlet, prts).addgeom(srfs[-1])
+        else:
+            fnc.getobj(name_distr, prts).addgeom(srfs[-1])
+
+        # film inlet
+        srfs.append(obj.Surface([crvs[-2], crvs[-1], crvs[-numcrvs_finlet_vert-1], crvs[-numcrvs_finlet_vert-numcrvs_finlet_bounds-1]]))
+        fnc.getobj(name_finlet, prts).addgeom(srfs[-1])
+
+
+    # inlet variant 2: additional gas space
+    elif inlettype == "2":
+        for bound in zbounds:
+            # point definition
+            # points at (lt_geom + lag_geom)
+            pnts.append(obj.Point(ht_geom, (lt_geom + lag_geom), bound))
+            pnts.append(obj.Point((hi_geom + hd_geom), (lt_geom + lag_geom), bound))
+
+            # points at lt_geom
+            pnts.append(obj.Point(ht_geom, lt_geom, bound))
+            pnts.append(obj.Point((hi_geom + hd_geom), lt_geom, bound))
+            pnts.append(obj.Point(hi_geom, lt_geom, bound))
+            pnts.append(obj.Point(0.0, lt_geom, bound))
+
+
+            # curve definition
+            # curves in y direction
+            crvs.append(obj.Curve(pnts[-6], pnts[-4]))
+            crvs.append(obj.Curve(pnts[-5], pnts[-3]))
+
+            # curves in x direction
+            crvs.append(obj.Curve(pnts[-6], pnts[-5]))
+            crvs.append(obj.Curve(pnts[-4], pnts[-3]))
+            crvs.append(obj.Curve(pnts[-3], pnts[-2]))
+            crvs.append(obj.Curve(pnts[-2], pnts[-1]))
+
+
+            # surface definition (sides)
+            # surface of additional gas space
+            srfs.append(obj.Surface([crvs[-6], crvs[-4], crvs[-3], crvs[-5]]))
+            fnc.getobj(name_sides, prts).addgeom(srfs[-1])
+
+        # number of points and curves of film inlet region
+        numpnts_finlet_bounds = 6           # number of points per bound
+        numcrvs_finlet_bounds = 6           # number of curves per bound
+
+        # curves in z direction
+        zpnts_finlet = [-6, -5, -4, -3, -2, -1]     # points for curves between zbounds of film inlet region
+        for pnt in zpnts_finlet:
+            crvs.append(obj.Curve(pnts[pnt], pnts[pnt-numpnts_finlet_bounds]))
+        numcrvs_finlet_vert = int(len(zpnts_finlet))        # number of curves between bounds
+
+        # surfaces between zbounds
+        # gas wall
+        srfs.append(obj.Surface([crvs[-6], crvs[-4], crvs[-numcrvs_finlet_vert-6], crvs[-numcrvs_finlet_vert-numcrvs_finlet_bounds-6]]))
+        fnc.getobj(name_gwall, prts).addgeom(srfs[-1])
+
+        # gas top
+        srfs.append(obj.Surface([crvs[-6], crvs[-5], crvs[-numcrvs_finlet_vert-4], crvs[-numcrvs_finlet_vert-numcrvs_finlet_bounds-4]]))
+        fnc.getobj(name_gtop, prts).addgeom(srfs[-1])
+
+        # distributor
+        srfs.append(obj.Surface([crvs[-5], crvs[-3], crvs[-numcrvs_finlet_vert-5], crvs[-numcrvs_finlet_vert-numcrvs_finlet_bounds-5]]))
+        fnc.getobj(name_distr, prts).addgeom(srfs[-1])
+        srfs.append(obj.Surface([crvs[-3], crvs[-2], crvs[-numcrvs_finlet_vert-2], crvs[-numcrvs_finlet_vert-numcrvs_finlet_bounds-2]]))
+        fnc.getobj(name_distr, prts).addgeom(srfs[-1])
+
+        # film inlet
+        srfs.append(obj.Surface([crvs[-2], crvs[-1], crvs[-numcrvs_finlet_vert-1], crvs[-numcrvs_finlet_vert-numcrvs_finlet_bounds-1]]))
+        fnc.getobj(name_finlet, prts).addgeom(srfs[-1])
+
+
+
+    # film outlet region
+    # outlet variant 1: simple film outlet
+    if outlettype == "1":
+        # point definition
+        for zbound in zbounds:
+            pnts.append(obj.Point(ht_geom, 0.0, zbound))
+            pnts.append(obj.Point((hi_geom + hd_geom), 0.0, zbound))
+            pnts.append(obj.Point(hi_geom, 0.0, zbound))
+            pnts.append(obj.Point(0.0, 0.0, zbound))
+
+            # curve definition
+            # curves in x direction
+            crvs.append(obj.Curve(pnts[-4], pnts[-3]))
+            crvs.append(obj.Curve(pnts[-3], pnts[-2]))
+            crvs.append(obj.Curve(pnts[-2], pnts[-1]))
+
+        # number of points and curves of film outlet region
+        numpnts_foutlet_bounds = 4          # number of points per bound
+        numcrvs_foutlet_bounds = 3          # number of curves per bound
+
+        # curve definition
+        # curves in y direction, lower zbound
+        crvs.append(obj.Curve(pnts[-numpnts_foutlet_bounds-4], pnts[-2*numpnts_foutlet_bounds-numpnts_finlet_bounds-4]))
+        crvs.append(obj.Curve(pnts[-numpnts_foutlet_bounds-3], pnts[-2*numpnts_foutlet_bounds-numpnts_finlet_bounds-3]))
+        crvs.append(obj.Curve(pnts[-numpnts_foutlet_bounds-2], pnts[-2*numpnts_foutlet_bounds-numpnts_finlet_bounds-2]))
+        crvs.append(obj.Curve(pnts[-numpnts_foutlet_bounds-1], pnts[-2*numpnts_foutlet_bounds-numpnts_finlet_bounds-1]))
+
+        # curves in y direction, upper zbound
+        crvs.append(obj.Curve(pnts[-4], pnts[-2*numpnts_foutlet_bounds-4]))
+        crvs.append(obj.Curve(pnts[-3], pnts[-2*numpnts_foutlet_bounds-3]))
+        crvs.append(obj.Curve(pnts[-2], pnts[-2*numpnts_foutlet_bounds-2]))
+        crvs.append(obj.Curve(pnts[-1], pnts[-2*numpnts_foutlet_bounds-1]))
+
+        # number of remaining y curves of film outlet region
+        numcrvs_foutlet_sides = 4          # number of curves per bound
+
+
+        # surface definition (sides)
+        # lower zbound
+        srfs.append(obj.Surface([crvs[-numcrvs_foutlet_sides-4], crvs[-numcrvs_foutlet_sides-3], crvs[-2*numcrvs_foutlet_sides-numcrvs_foutlet_bounds-3], crvs[-2*numcrvs_foutlet_sides-2*numcrvs_foutlet_bounds-numcrvs_finlet_vert-numcrvs_finlet_bounds-3]]))
+        fnc.getobj(name_sides, prts).addgeom(srfs[-1])
+        srfs.append(obj.Surface([crvs[-numcrvs_foutlet_sides-3], crvs[-numcrvs_foutlet_sides-2], crvs[-2*numcrvs_foutlet_sides-numcrvs_foutlet_bounds-2], crvs[-2*numcrvs_foutlet_sides-2*numcrvs_foutlet_bounds-numcrvs_finlet_vert-numcrvs_finlet_bounds-2]]))
+        fnc.getobj(name_sides, prts).addgeom(srfs[-1])
+        srfs.append(obj.Surface([crvs[-numcrvs_foutlet_sides-2], crvs[-numcrvs_foutlet_sides-1], crvs[-2*numcrvs_foutlet_sides-numcrvs_foutlet_bounds-1], crvs[-2*numcrvs_foutlet_sides-2*numcrvs_foutlet_bounds-numcrvs_finlet_vert-numcrvs_finlet_bounds-1]]))
+        fnc.getobj(name_sides, prts).addgeom(srfs[-1])
+
+        # upper zbound
+        srfs.append(obj.Surface([crvs[-4], crvs[-3], crvs[-2*numcrvs_foutlet_sides-3], crvs[-2*numcrvs_foutlet_sides-2*numcrvs_foutlet_bounds-numcrvs_finlet_vert-3]]))
+        fnc.getobj(name_sides, prts).addgeom(srfs[-1])
+        srfs.append(obj.Surface([crvs[-3], crvs[-2], crvs[-2*numcrvs_foutlet_sides-2], crvs[-2*numcrvs_foutlet_sides-2*numcrvs_foutlet_bounds-numcrvs_finlet_vert-2]]))
+        fnc.getobj(name_sides, prts).addgeom(srfs[-1])
+        srfs.append(obj.Surface([crvs[-2], crvs[-1], crvs[-2*numcrvs_foutlet_sides-1], crvs[-2*numcrvs_foutlet_sides-2*numcrvs_foutlet_bounds-numcrvs_finlet_vert-1]]))
+        fnc.getobj(name_sides, prts).addgeom(srfs[-1])
+
+
+        # curves in z direction
+        zpnts_foutlet = [-4, -3, -2, -1]
+        for pnt in zpnts_foutlet:
+            crvs.append(obj.Curve(pnts[pnt], pnts[pnt-numpnts_foutlet_bounds]))
+        numcrvs_foutlet_vert = len(zpnts_foutlet)
+
+        # surfaces between bounds
+        # gas wall
+        srfs.append(obj.Surface([crvs[-4], crvs[-numcrvs_foutlet_vert-numcrvs_foutlet_sides-4], crvs[-numcrvs_foutlet_vert-4], crvs[-numcrvs_foutlet_vert-2*numcrvs_foutlet_sides-2*numcrvs_foutlet_bounds-4]]))
+        fnc.getobj(name_gwall, prts).addgeom(srfs[-1])
+
+        # film outlet
+        srfs.append(obj.Surface([crvs[-4], crvs[-3], crvs[-numcrvs_foutlet_vert-2*numcrvs_foutlet_sides-numcrvs_foutlet_bounds-3], crvs[-numcrvs_foutlet_vert-2*numcrvs_foutlet_sides-3]]))
+        fnc.getobj(name_foutlet, prts).addgeom(srfs[-1])
+        srfs.append(obj.Surface([crvs[-3], crvs[-2], crvs[-numcrvs_foutlet_vert-2*numcrvs_foutlet_sides-numcrvs_foutlet_bounds-2], crvs[-numcrvs_foutlet_vert-2*numcrvs_foutlet_sides-2]]))
+        fnc.getobj(name_foutlet, prts).addgeom(srfs[-1])
+        srfs.append(obj.Surface([crvs[-2], crvs[-1], crvs[-numcrvs_foutlet_vert-2*numcrvs_foutlet_sides-numcrvs_foutlet_bounds-1], crvs[-numcrvs_foutlet_vert-2*numcrvs_foutlet_sides-1]]))
+        fnc.getobj(name_foutlet, prts).addgeom(srfs[-1])
+
+        # film wall
+        srfs.append(obj.Surface([crvs[-1], crvs[-numcrvs_foutlet_vert-numcrvs_foutlet_sides-1], crvs[-numcrvs_foutlet_vert-1], crvs[-numcrvs_foutlet_vert-2*numcrvs_foutlet_sides-2*numcrvs_foutlet_bounds-1]]))
+        fnc.getobj(name_fwall, prts).addgeom(srfs[-1])
+
+
+    # outlet variant 2: recessed film outlet
+    elif outlettype == "2":
+        # point definition
+        for zbound in zbounds:
+            # points at the end of filmwall
+            pnts.append(obj.Point(ht_geom, 0.0, zbound))
+            pnts.append(obj.Point((hi_geom + hd_geom), 0.0, zbound))
+            pnts.append(obj.Point(hi_geom, 0.0, zbound))
+            pnts.append(obj.Point(0.0, 0.0, zbound))
+            pnts.append(obj.Point(-1.0*heo_geom, 0.0, zbound))
+            pnts.append(obj.Point(-1.0*(heo_geom + hro_geom), 0.0, zbound))
+
+            # points at the end of domain
+            pnts.append(obj.Point(ht_geom, -1.0*lro_geom, zbound))
+            pnts.append(obj.Point((hi_geom + hd_geom), -1.0*lro_geom, zbound))
+            pnts.append(obj.Point(hi_geom, -1.0*lro_geom, zbound))
+            pnts.append(obj.Point(0.0, -1.0*lro_geom, zbound))
+            pnts.append(obj.Point(-1.0*heo_geom, -1.0*lro_geom, zbound))
+            pnts.append(obj.Point(-1.0*(heo_geom + hro_geom), -1.0*lro_geom, zbound))
+
+
+            # curve definition
+            # curves in y direction
+            crvs.append(obj.Curve(pnts[-12], pnts[-6]))
+            crvs.append(obj.Curve(pnts[-11], pnts[-5]))
+            crvs.append(obj.Curve(pnts[-10], pnts[-4]))
+            crvs.append(obj.Curve(pnts[-9], pnts[-3]))
+            crvs.append(obj.Curve(pnts[-8], pnts[-2]))
+            crvs.append(obj.Curve(pnts[-7], pnts[-1]))
+
+            # curves in x direction
+            crvs.append(obj.Curve(pnts[-12], pnts[-11]))
+            crvs.append(obj.Curve(pnts[-11], pnts[-10]))
+            crvs.append(obj.Curve(pnts[-10], pnts[-9]))
+            crvs.append(obj.Curve(pnts[-9], pnts[-8]))
+            crvs.append(obj.Curve(pnts[-8], pnts[-7]))
+
+            crvs.append(obj.Curve(pnts[-6], pnts[-5]))
+            crvs.append(obj.Curve(pnts[-5], pnts[-4]))
+            crvs.append(obj.Curve(pnts[-4], pnts[-3]))
+            crvs.append(obj.Curve(pnts[-3], pnts[-2]))
+            crvs.append(obj.Curve(pnts[-2], pnts[-1]))
+
+
+            # surface definition (sides)
+            srfs.append(obj.Surface([crvs[-16], crvs[-10], crvs[-5], crvs[-15]]))
+            fnc.getobj(name_sides, prts).addgeom(srfs[-1])
+            srfs.append(obj.Surface([crvs[-15], crvs[-9], crvs[-4], crvs[-14]]))
+            fnc.getobj(name_sides, prts).addgeom(srfs[-1])
+            srfs.append(obj.Surface([crvs[-14], crvs[-8], crvs[-3], crvs[-13]]))
+            fnc.getobj(name_sides, prts).addgeom(srfs[-1])
+            srfs.append(obj.Surface([crvs[-13], crvs[-7], crvs[-2], crvs[-12]]))
+            fnc.getobj(name_sides, prts).addgeom(srfs[-1])
+            srfs.append(obj.Surface([crvs[-12], crvs[-6], crvs[-1], crvs[-11]]))
+            fnc.getobj(name_sides, prts).addgeom(srfs[-1])
+
+        # number of points and curves of film outlet region
+        numpnts_foutlet_bounds = 12         # number of points per bound
+        numcrvs_foutlet_bounds = 16         # number of curves per bound
+
+        # curve definition
+        # curves in y direction, lower zbound
+        crvs.append(obj.Curve(pnts[-numpnts_foutlet_bounds-12], pnts[-2*numpnts_foutlet_bounds-numpnts_finlet_bounds-4]))
+        crvs.append(obj.Curve(pnts[-numpnts_foutlet_bounds-11], pnts[-2*numpnts_foutlet_bounds-numpnts_finlet_bounds-3]))
+        crvs.append(obj.Curve(pnts[-numpnts_foutlet_bounds-10], pnts[-2*numpnts_foutlet_bounds-numpnts_finlet_bounds-2]))
+        crvs.append(obj.Curve(pnts[-numpnts_foutlet_bounds-9], pnts[-2*numpnts_foutlet_bounds-numpnts_finlet_bounds-1]))
+
+        # curves in y direction, upper zbound
+        crvs.append(obj.Curve(pnts[-12], pnts[-2*numpnts_foutlet_bounds-4]))
+        crvs.append(obj.Curve(pnts[-11], pnts[-2*numpnts_foutlet_bounds-3]))
+        crvs.append(obj.Curve(pnts[-10], pnts[-2*numpnts_foutlet_bounds-2]))
+        crvs.append(obj.Curve(pnts[-9], pnts[-2*numpnts_foutlet_bounds-1]))
+
+
+        # number of remaining y curves of film outlet region
+        numcrvs_foutlet_sides = 4          # number of curves per bound
+
+
+        # surface definition (sides)
+        # lower zbound
+        srfs.append(obj.Surface([crvs[-numcrvs_foutlet_sides-4], crvs[-numcrvs_foutlet_sides-3], crvs[-2*numcrvs_foutlet_sides-numcrvs_foutlet_bounds-10], crvs[-2*numcrvs_foutlet_sides-2*numcrvs_foutlet_bounds-numcrvs_finlet_vert-numcrvs_finlet_bounds-3]]))
+        fnc.getobj(name_sides, prts).addgeom(srfs[-1])
+        srfs.append(obj.Surface([crvs[-numcrvs_foutlet_sides-3], crvs[-numcrvs_foutlet_sides-2], crvs[-2*numcrvs_foutlet_sides-numcrvs_foutlet_bounds-9], crvs[-2*numcrvs_foutlet_sides-2*numcrvs_foutlet_bounds-numcrvs_finlet_vert-numcrvs_finlet_bounds-2]]))
+        fnc.getobj(name_sides, prts).addgeom(srfs[-1])
+        srfs.append(obj.Surface([crvs[-numcrvs_foutlet_sides-2], crvs[-numcrvs_foutlet_sides-1], crvs[-2*numcrvs_foutlet_sides-numcrvs_foutlet_bounds-8], crvs[-2*numcrvs_foutlet_sides-2*numcrvs_foutlet_bounds-numcrvs_finlet_vert-numcrvs_finlet_bounds-1]]))
+        fnc.getobj(name_sides, prts).addgeom(srfs[-1])
+
+        # upper zbound
+        srfs.append(obj.Surface([crvs[-4], crvs[-3], crvs[-2*numcrvs_foutlet_sides-10], crvs[-2*numcrvs_foutlet_sides-2*numcrvs_foutlet_bounds-numcrvs_finlet_vert-3]]))
+        fnc.getobj(name_sides, prts).addgeom(srfs[-1])
+        srfs.append(obj.Surface([crvs[-3], crvs[-2], crvs[-2*numcrvs_foutlet_sides-9], crvs[-2*numcrvs_foutlet_sides-2*numcrvs_foutlet_bounds-numcrvs_finlet_vert-2]]))
+        fnc.getobj(name_sides, prts).addgeom(srfs[-1])
+        srfs.append(obj.Surface([crvs[-2], crvs[-1], crvs[-2*numcrvs_foutlet_sides-8], crvs[-2*numcrvs_foutlet_sides-2*numcrvs_foutlet_bounds-numcrvs_finlet_vert-1]]))
+        fnc.getobj(name_sides, prts).addgeom(srfs[-1])
+
+        # curves in z direction
+        zpnts_foutlet = [-12, -9, -8, -7, -6, -5, -4, -3, -2, -1]
+        for pnt in zpnts_foutlet:
+            crvs.append(obj.Curve(pnts[pnt], pnts[pnt-numpnts_foutlet_bounds]))
+        numcrvs_foutlet_vert = len(zpnts_foutlet)
+
+
+        # surfaces between bounds
+        # gas wall
+        srfs.append(obj.Surface([crvs[-10], crvs[-numcrvs_foutlet_vert-2*numcrvs_foutlet_sides-2*numcrvs_foutlet_bounds-4], crvs[-numcrvs_foutlet_vert-4], crvs[-numcrvs_foutlet_vert-numcrvs_foutlet_sides-4]]))
+        fnc.getobj(name_gwall, prts).addgeom(srfs[-1])
+        srfs.append(obj.Surface([crvs[-10], crvs[-6], crvs[-numcrvs_foutlet_vert-2*numcrvs_foutlet_sides-16], crvs[-numcrvs_foutlet_vert-2*numcrvs_foutlet_sides-numcrvs_foutlet_bounds-16]]))
+        fnc.getobj(name_gwall, prts).addgeom(srfs[-1])
+
+        # film outlet
+        srfs.append(obj.Surface([crvs[-7], crvs[-1], crvs[-numcrvs_foutlet_vert-2*numcrvs_foutlet_sides-11], crvs[-numcrvs_foutlet_vert-2*numcrvs_foutlet_sides-numcrvs_foutlet_bounds-11]]))
+        fnc.getobj(name_foutlet, prts).addgeom(srfs[-1])
+
+        # film wall
+        srfs.append(obj.Surface([crvs[-numcrvs_foutlet_vert-2*numcrvs_foutlet_sides-2*numcrvs_foutlet_bounds-1], crvs[-9], crvs[-numcrvs_foutlet_vert-1], crvs[-numcrvs_foutlet_vert-numcrvs_foutlet_sides-1]]))
+        fnc.getobj(name_fwall, prts).addgeom(srfs[-1])
+
+        # gas bottom
+        srfs.append(obj.Surface([crvs[-6], crvs[-5], crvs[-numcrvs_foutlet_vert-2*numcrvs_foutlet_sides-5], crvs[-numcrvs_foutlet_vert-2*numcrvs_foutlet_sides-numcrvs_foutlet_bounds-5]]))
+        fnc.getobj(name_gbottom, prts).addgeom(srfs[-1])
+
+        # outlet wall
+        srfs.append(obj.Surface([crvs[-9], crvs[-8], crvs[-numcrvs_foutlet_vert-2*numcrvs_foutlet_sides-7], crvs[-numcrvs_foutlet_vert-2*numcrvs_foutlet_sides-numcrvs_foutlet_bounds-7]]))
+        fnc.getobj(name_owall, prts).addgeom(srfs[-1])
+        srfs.append(obj.Surface([crvs[-8], crvs[-7], crvs[-numcrvs_foutlet_vert-2*numcrvs_foutlet_sides-6], crvs[-numcrvs_foutlet_vert-2*numcrvs_foutlet_sides-numcrvs_foutlet_bounds-6]]))
+        fnc.getobj(name_owall, prts).addgeom(srfs[-1])
+        srfs.append(obj.Surface([crvs[-5], crvs[-4], crvs[-numcrvs_foutlet_vert-2*numcrvs_foutlet_sides-4], crvs[-numcrvs_foutlet_vert-2*numcrvs_foutlet_sides-numcrvs_foutlet_bounds-4]]))
+        fnc.getobj(name_owall, prts).addgeom(srfs[-1])
+        srfs.append(obj.Surface([crvs[-4], crvs[-3], crvs[-numcrvs_foutlet_vert-2*numcrvs_foutlet_sides-3], crvs[-numcrvs_foutlet_vert-2*numcrvs_foutlet_sides-numcrvs_foutlet_bounds-3]]))
+        fnc.getobj(name_owall, prts).addgeom(srfs[-1])
+        srfs.append(obj.Surface([crvs[-3], crvs[-2], crvs[-numcrvs_foutlet_vert-2*numcrvs_foutlet_sides-2], crvs[-numcrvs_foutlet_vert-2*numcrvs_foutlet_sides-numcrvs_foutlet_bounds-2]]))
+        fnc.getobj(name_owall, prts).addgeom(srfs[-1])
+        srfs.append(obj.Surface([crvs[-2], crvs[-1], crvs[-numcrvs_foutlet_vert-2*numcrvs_foutlet_sides-1], crvs[-numcrvs_foutlet_vert-2*numcrvs_foutlet_sides-numcrvs_foutlet_bounds-1]]))
+        fnc.getobj(name_owall, prts).addgeom(srfs[-1])
+
+    numpnts_bounds = len(pnts)              # number of all points on bounds
+
+
+
+    # inner z coordinates
+    zints = [ws_geom, ws_geom + wc_geom]
+
+
+    # definition of additional points of inner z coordinates
+    # film inlet region
+    # inlet variant 1: simple film inlet
+    if inlettype == "1":
+        for zint in zints:
+            # point definition
+            # points at lt_geom
+            pnts.append(obj.Point(ht_geom, lt_geom, zint))
+            pnts.append(obj.Point((hi_geom + hd_geom), lt_geom, zint))
+            pnts.append(obj.Point(hi_geom, lt_geom, zint))
+            pnts.append(obj.Point(0.0, lt_geom, zint))
+
+
+    # inlet variant 2: additional gas space
+    elif inlettype == "2":
+        for zint in zints:
+            # point definition
+            # points at (lt_geom + lag_geom)
+            pnts.append(obj.Point(ht_geom, (lt_geom + lag_geom), zint))
+            pnts.append(obj.Point((hi_geom + hd_geom), (lt_geom + lag_geom), zint))
+
+            # points at lt_geom
+            pnts.append(obj.Point(ht_geom, lt_geom, zint))
+            pnts.append(obj.Point((hi_geom + hd_geom), lt_geom, zint))
+            pnts.append(obj.Point(hi_geom, lt_geom, zint))
+            pnts.append(obj.Point(0.0, lt_geom, zint))
+
+
+
+    # film outlet region
+    # outlet variant 1: simple outlet
+    if outlettype == "1":
+        for zint in zints:
+            pnts.append(obj.Point(ht_geom, 0.0, zint))
+            pnts.append(obj.Point((hi_geom + hd_geom), 0.0, zint))
+            pnts.append(obj.Point(hi_geom, 0.0, zint))
+            pnts.append(obj.Point(0.0, 0.0, zint))
+
+
+    # outlet variant 2: recessed outlet
+    elif outlettype == "2":
+        for zint in zints:
+            # points at the end of filmwall
+            pnts.append(obj.Point(ht_geom, 0.0, zint))
+            pnts.append(obj.Point(0.0, 0.0, zint))
+            pnts.append(obj.Point(-1.0*heo_geom, 0.0, zint))
+            pnts.append(obj.Point(-1.0*(heo_geom + hro_geom), 0.0, zint))
+
+            # points at the end of domain
+            pnts.append(obj.Point(ht_geom, -1.0*lro_geom, zint))
+            pnts.append(obj.Point((hi_geom + hd_geom), -1.0*lro_geom, zint))
+            pnts.append(obj.Point(hi_geom, -1.0*lro_geom, zint))
+            pnts.append(obj.Point(0.0, -1.0*lro_geom, zint))
+            pnts.append(obj.Point(-1.0*heo_geom, -1.0*lro_geom, zint))
+            pnts.append(obj.Point(-1.0*(heo_geom + hro_geom), -1.0*lro_geom, zint))
+
+
+
+    # blocking
+    blkg = model.getblkg()        # blocking operations (split, deletion)
+    verts = model.getassoc()       # vertex-point associations
+
+
+    # block modification
+    # geometry type 1
+    if geomnum == 1:
+        # x splits
+        blkg.append(obj.Split(pnts[6], 26, 42, prts))       # hi_geom
+        blkg.append(obj.Split(pnts[5], 74, 42, prts))       # (hi_geom + hd_geom)
+
+        # z splits
+        blkg.append(obj.Split(pnts[16], 41, 42, prts))      # ws_geom
+        blkg.append(obj.Split(pnts[20], 112, 42, prts))     # (ws_geom + wc_geom)
+
+
+    # geometry type 2
+    elif geomnum == 2:
+        # x split
+        blkg.append(obj.Split(pnts[1], 25, 41, prts))       # (hi_geom + hd_geom)
+
+        # y split
+        blkg.append(obj.Split(pnts[5], 21, 25, prts))       # lt_geom
+
+        # block deletion
+        blkg.append(obj.Delete(41))                         # delete block above inlet
+
+        # x split
+        blkg.append(obj.Split(pnts[4], 86, 87, prts))       # hi_geom
+
+        # z splits
+        blkg.append(obj.Split(pnts[20], 41, 42, prts))      # ws_geom
+        blkg.append(obj.Split(pnts[26], 142, 42, prts))     # (ws_geom + wc_geom)
+
+
+    # geometry type 3
+    elif geomnum == 3:
+        # x split
+        blkg.append(obj.Split(pnts[3], 25, 41, prts))       # 0.0
+
+        # y split
+        blkg.append(obj.Split(pnts[13], 21, 25, prts))      # 0.0
+
+        # block deletion
+        blkg.append(obj.Delete(41))                         # delete block below film wall
+
+        # x splits
+        blkg.append(obj.Split(pnts[12], 86, 87, prts))      # heo_geom
+        blkg.append(obj.Split(pnts[10], 87, 88, prts))      # hi_geom
+        blkg.append(obj.Split(pnts[9], 127, 88, prts))      # (hi_geom + hd_geom)
+
+        # z splits
+        blkg.append(obj.Split(pnts[32], 41, 42, prts))      # ws_geom
+        blkg.append(obj.Split(pnts[36], 190, 42, prts))     # (ws_geom + wc_geom)
+
+
+    # geometry type 4
+    elif geomnum == 4:
+        # x split
+        blkg.append(obj.Split(pnts[5], 25, 41, prts))       # 0.0
+
+        # y split
+        blkg.append(obj.Split(pnts[17], 21, 25, prts))      # 0.0
+
+        # block deletion
+        blkg.append(obj.Delete(41))                         # delete block below film wall
+
+        # y split
+        blkg.append(obj.Split(pnts[5], 87, 70, prts))       # lt_geom
+
+        # x split
+        blkg.append(obj.Split(pnts[1], 70, 41, prts))       # (hi_geom + hd_geom)
+
+        # block deletion
+        blkg.append(obj.Delete(54))                         # delete block above film inlet
+
+        # x split
+        blkg.append(obj.Split(pnts[16], 86, 87, prts))      # hi_geom
+        blkg.append(obj.Split(pnts[14], 87, 128, prts))     # (hi_geom + hd_geom)
+
+        # z splits
+        blkg.append(obj.Split(pnts[36], 41, 42, prts))      # ws_geom
+        blkg.append(obj.Split(pnts[42], 230, 42, prts))     # (ws_geom + wc_geom)
+
+
+
+
+    # vertex-point associations
+
+
+    # geometry type 1
+    if geomnum == 1:
+        # film inlet region
+        # lower zbound
+        verts.append(obj.Vert(41, pnts[0]))
+        verts.append(obj.Vert(86, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(70, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(25, pnts[verts[-1].getpnt().getnum()+1]))
+
+        # upper zbound
+        verts.append(obj.Vert(42, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(90, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(74, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(26, pnts[verts[-1].getpnt().getnum()+1]))
+
+        # film outlet region
+        # lower zbound
+        verts.append(obj.Vert(37, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(85, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(69, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(21, pnts[verts[-1].getpnt().getnum()+1]))
+
+        # upper zbound
+        verts.append(obj.Vert(38, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(89, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(73, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(22, pnts[verts[-1].getpnt().getnum()+1]))
+
+
+        # film inlet region
+        # lower zint
+        verts.append(obj.Vert(112, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(111, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(110, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(109, pnts[verts[-1].getpnt().getnum()+1]))
+
+        # upper zint
+        verts.append(obj.Vert(136, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(135, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(134, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(133, pnts[verts[-1].getpnt().getnum()+1]))
+
+        # film outlet region
+        # lower zint
+        verts.append(obj.Vert(106, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(105, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(104, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(103, pnts[verts[-1].getpnt().getnum()+1]))
+
+        # upper zint
+        verts.append(obj.Vert(130, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(129, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(128, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(127, pnts[verts[-1].getpnt().getnum()+1]))
+
+
+    # geometry type 2
+    elif geomnum == 2:
+        # film inlet region
+        # lower zbound
+        verts.append(obj.Vert(41, pnts[0]))
+        verts.append(obj.Vert(70, pnts[verts[-1].getpnt().getnum()+1]))
+
+        verts.append(obj.Vert(88, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(87, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(107, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(86, pnts[verts[-1].getpnt().getnum()+1]))
+
+        # upper zbound
+        verts.append(obj.Vert(42, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(74, pnts[verts[-1].getpnt().getnum()+1]))
+
+        verts.append(obj.Vert(93, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(92, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(112, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(91, pnts[verts[-1].getpnt().getnum()+1]))
+
+        # film outlet region
+        # lower zbound
+        verts.append(obj.Vert(37, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(69, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(106, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(21, pnts[verts[-1].getpnt().getnum()+1]))
+
+        # upper zbound
+        verts.append(obj.Vert(38, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(73, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(111, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(22, pnts[verts[-1].getpnt().getnum()+1]))
+
+
+        # film inlet region
+        # lower zint
+        verts.append(obj.Vert(142, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(141, pnts[verts[-1].getpnt().getnum()+1]))
+
+        verts.append(obj.Vert(136, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(135, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(134, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(133, pnts[verts[-1].getpnt().getnum()+1]))
+
+        # upper zint
+        verts.append(obj.Vert(172, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(171, pnts[verts[-1].getpnt().getnum()+1]))
+
+        verts.append(obj.Vert(166, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(165, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(164, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(163, pnts[verts[-1].getpnt().getnum()+1]))
+
+        # film outlet region
+        # lower zint
+        verts.append(obj.Vert(130, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(129, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(128, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(127, pnts[verts[-1].getpnt().getnum()+1]))
+
+        # upper zint
+        verts.append(obj.Vert(160, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(159, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(158, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(157, pnts[verts[-1].getpnt().getnum()+1]))
+
+
+    # geometry type 3
+    elif geomnum == 3:
+        # film inlet region
+        # lower zbound
+        verts.append(obj.Vert(41, pnts[0]))
+        verts.append(obj.Vert(148, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(128, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(70, pnts[verts[-1].getpnt().getnum()+1]))
+
+        # upper zbound
+        verts.append(obj.Vert(42, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(153, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(133, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(74, pnts[verts[-1].getpnt().getnum()+1]))
+
+        # film outlet region
+        # lower zbound
+        verts.append(obj.Vert(88, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(147, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(127, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(87, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(107, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(86, pnts[verts[-1].getpnt().getnum()+1]))
+
+        verts.append(obj.Vert(37, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(146, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(126, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(69, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(106, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(21, pnts[verts[-1].getpnt().getnum()+1]))
+
+        # upper zbound
+        verts.append(obj.Vert(93, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(152, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(132, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(92, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(112, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(91, pnts[verts[-1].getpnt().getnum()+1]))
+
+        verts.append(obj.Vert(38, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(151, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(131, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(73, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(111, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(22, pnts[verts[-1].getpnt().getnum()+1]))
+
+
+        # film inlet region
+        # lower zint
+        verts.append(obj.Vert(190, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(189, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(188, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(187, pnts[verts[-1].getpnt().getnum()+1]))
+
+        # upper zint
+        verts.append(obj.Vert(230, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(229, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(228, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(227, pnts[verts[-1].getpnt().getnum()+1]))
+
+        # film outlet region
+        # lower zint
+        verts.append(obj.Vert(182, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(179, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(178, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(177, pnts[verts[-1].getpnt().getnum()+1]))
+
+        verts.append(obj.Vert(174, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(173, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(172, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(171, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(170, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(169, pnts[verts[-1].getpnt().getnum()+1]))
+
+        # upper zint
+        verts.append(obj.Vert(222, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(219, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(218, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(217, pnts[verts[-1].getpnt().getnum()+1]))
+
+        verts.append(obj.Vert(214, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(213, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(212, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(211, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(210, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(209, pnts[verts[-1].getpnt().getnum()+1]))
+
+
+
+    # geometry type 4
+    elif geomnum == 4:
+        # film inlet region
+        # lower zbound
+        verts.append(obj.Vert(41, pnts[0]))
+        verts.append(obj.Vert(130, pnts[verts[-1].getpnt().getnum()+1]))
+
+        verts.append(obj.Vert(108, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(129, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(177, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(107, pnts[verts[-1].getpnt().getnum()+1]))
+
+        # upper zbound
+        verts.append(obj.Vert(42, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(136, pnts[verts[-1].getpnt().getnum()+1]))
+
+        verts.append(obj.Vert(113, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(135, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(183, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(112, pnts[verts[-1].getpnt().getnum()+1]))
+
+        # film outlet region
+        # lower zbound
+        verts.append(obj.Vert(88, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(128, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(176, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(87, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(152, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(86, pnts[verts[-1].getpnt().getnum()+1]))
+
+        verts.append(obj.Vert(37, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(127, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(175, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(69, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(151, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(21, pnts[verts[-1].getpnt().getnum()+1]))
+
+        # upper zbound
+        verts.append(obj.Vert(93, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(134, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(182, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(92, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(158, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(91, pnts[verts[-1].getpnt().getnum()+1]))
+
+        verts.append(obj.Vert(38, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(133, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(181, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(73, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(157, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(22, pnts[verts[-1].getpnt().getnum()+1]))
+
+
+        # film inlet region
+        # lower zint
+        verts.append(obj.Vert(230, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(229, pnts[verts[-1].getpnt().getnum()+1]))
+
+        verts.append(obj.Vert(222, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(221, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(220, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(219, pnts[verts[-1].getpnt().getnum()+1]))
+
+        # upper zint
+        verts.append(obj.Vert(278, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(277, pnts[verts[-1].getpnt().getnum()+1]))
+
+        verts.append(obj.Vert(270, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(269, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(268, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(267, pnts[verts[-1].getpnt().getnum()+1]))
+
+        # film outlet region
+        # lower zint
+        verts.append(obj.Vert(214, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(211, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(210, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(209, pnts[verts[-1].getpnt().getnum()+1]))
+
+        verts.append(obj.Vert(206, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(205, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(204, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(203, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(202, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(201, pnts[verts[-1].getpnt().getnum()+1]))
+
+        # upper zint
+        verts.append(obj.Vert(262, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(259, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(258, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(257, pnts[verts[-1].getpnt().getnum()+1]))
+
+        verts.append(obj.Vert(254, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(253, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(252, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(251, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(250, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(249, pnts[verts[-1].getpnt().getnum()+1]))
+
+
+
+    # meshing
+    mshg = model.getmshg()        # meshing operations
+
+
+    # geometry type 1
+    if geomnum == 1:
+        # x direction
+        mshg.append(obj.Mesh(26, 74, hi_mesh))          # film
+        mshg.append(obj.Mesh(74, 90, hd_mesh))          # distributor
+        mshg.append(obj.Mesh(90, 42, hg_mesh))          # gas space
+
+        # y direction
+        mshg.append(obj.Mesh(22, 26, lt_mesh))          # total domain
+
+        # z direction
+        mshg.append(obj.Mesh(41, 112, ws1_mesh))        # side section 1 (at lower zbound)
+        mshg.append(obj.Mesh(112, 136, wc_mesh))        # central section
+        mshg.append(obj.Mesh(136, 42, ws2_mesh))        # side section 2 (at upper zbound)
+
+
+    # geometry type 2
+    elif geomnum == 2:
+        # x direction
+        mshg.append(obj.Mesh(91, 112, hi_mesh))         # film
+        mshg.append(obj.Mesh(112, 92, hd_mesh))         # distributor
+        mshg.append(obj.Mesh(92, 93, hg_mesh))          # gas space
+
+        # y direction
+        mshg.append(obj.Mesh(92, 74, lag_mesh))         # additional gas space
+        mshg.append(obj.Mesh(22, 91, lt_mesh))          # total domain
+
+        # z direction
+        mshg.append(obj.Mesh(41, 142, ws1_mesh))        # side section 1 (at lower zbound)
+        mshg.append(obj.Mesh(142, 172, wc_mesh))        # central section
+        mshg.append(obj.Mesh(172, 42, ws2_mesh))        # side section 2 (at upper zbound)
+
+
+    # geometry type 3
+    elif geomnum == 3:
+        # x direction
+        mshg.append(obj.Mesh(87, 127, hi_mesh))         # film
+        mshg.append(obj.Mesh(127, 147, hd_mesh))        # distributor
+        mshg.append(obj.Mesh(147, 88, hg_mesh))         # gas space
+        mshg.append(obj.Mesh(107, 87, heo_mesh))        # edge of outlet
+        mshg.append(obj.Mesh(86, 107, hro_mesh))        # recessed outlet
+
+        # y direction
+        mshg.append(obj.Mesh(87, 70, lt_mesh))          # total domain
+        mshg.append(obj.Mesh(69, 87, lro_mesh))         # recessed outlet
+
+        # z direction
+        mshg.append(obj.Mesh(41, 190, ws1_mesh))        # side section 1 (at lower zbound)
+        mshg.append(obj.Mesh(190, 230, wc_mesh))        # central section
+        mshg.append(obj.Mesh(230, 42, ws2_mesh))        # side section 2 (at upper zbound)
+
+
+    # geometry type 4
+    elif geomnum == 4:
+        # x direction
+        mshg.append(obj.Mesh(87, 176, hi_mesh))         # film
+        mshg.append(obj.Mesh(176, 128, hd_mesh))        # distributor
+        mshg.append(obj.Mesh(128, 88, hg_mesh))         # gas space
+        mshg.append(obj.Mesh(152, 87, heo_mesh))        # edge of outlet
+        mshg.append(obj.Mesh(86, 152, hro_mesh))        # recessed outlet
+
+        # y direction
+        mshg.append(obj.Mesh(129, 130, lag_mesh))       # additional gas space
+        mshg.append(obj.Mesh(87, 107, lt_mesh))         # total domain
+        mshg.append(obj.Mesh(69, 87, lro_mesh))         # recessed outlet
+
+        # z direction
+        mshg.append(obj.Mesh(41, 230, ws1_mesh))        # side section 1 (at lower zbound)
+        mshg.append(obj.Mesh(230, 278, wc_mesh))        # central section
+        mshg.append(obj.Mesh(278, 42, ws2_mesh))        # side section 2 (at upper zbound)
+    return model
+
+
+# model generation from parameter file (see README), geometry type: 3D, smooth film wall
+# names: part names, sizes: default cell sizes in [m], raises ValueError for invalid parameters
+def build_3d_smooth(params, names=None, sizes=None):
+    names, sizes = buildsettings(params, names, sizes, meshsizes_3D)
+    projname = fnc.specproject(params)
+
+    # geometric variant
+    inlettype = fnc.specvariant(params, "inlet", ["1", "2"])
+    outlettype = fnc.specvariant(params, "outlet", ["1", "2"])
+    geomtype, geomnum = variant("3D-smooth-", inlettype, outlettype)
+    periodic = fnc.specbool(params, "periodic") if geomnum == 1 else False
+    refconffile = fnc.specreference(params, geomtype)
+
+    # geometric parameters
+    xgeom, ygeom, zgeom = geometry_3d_smooth(inlettype, outlettype)
+    fnc.specxgeom(params, xgeom, refconffile)
+    fnc.specygeom_smooth(params, ygeom, refconffile)
+    fnc.speczgeom(params, zgeom, refconffile)
+
+    # meshing parameters
+    xsects, ysects, zsects = sections_3d_smooth(inlettype, outlettype, xgeom, ygeom, zgeom)
+    meshref = buildmeshing(params, refconffile, [xsects, ysects, zsects], lambda: defaultmeshing_3d_smooth(inlettype, outlettype, xsects, ysects, zsects, sizes), geomtype, [xgeom, ygeom, zgeom])
+
+    model = model_3d_smooth(projname, inlettype, outlettype, periodic, xgeom, ygeom, zgeom, xsects, ysects, zsects, names)
+    model.setmeshref(meshref)
+    return model
+
+
+########################################################### 3D HORIZONTAL STRUCTURES ############################################################
+# geometry objects of variant, geometry type: 3D, horizontal structures
+def geometry_3d_horizontal(inlettype):
+    xgeom = []
+    ygeom = []
+    zgeom = []
+
+    # add xgeom objects
+    xgeom.append(obj.Geometry(obj.ht_geomname, obj.ht_geomdescr))
+    xgeom.append(obj.Geometry(obj.hi_geomname, obj.hi_geomdescr))
+    xgeom.append(obj.Geometry(obj.hd_geomname, obj.hd_geomdescr))
+    xgeom.append(obj.Geometry(obj.dgr_geomname, obj.dgr_geomdescr))
+
+    # add ygeom objects
+    ygeom.append(obj.Geometry(obj.lt_geomname, obj.lt_geomdescr))
+    if inlettype == "2":
+        ygeom.append(obj.Geometry(obj.lag_geomname, obj.lag_geomdescr))         # inlet type 2
+    ygeom.append(obj.Geometry(obj.ls_geomname, obj.ls_geomdescr))
+    ygeom.append(obj.Geometry(obj.lgr_geomname, obj.lgr_geomdescr))
+    ygeom.append(obj.Geometry(obj.li_geomname, obj.li_geomdescr))
+    ygeom.append(obj.Geometry(obj.lo_geomname, obj.lo_geomdescr))
+    ygeom.append(obj.Geometry(obj.ns_geomname, obj.ns_geomdescr))
+
+    # add zgeom objects
+    zgeom.append(obj.Geometry(obj.wt_geomname, obj.wt_geomdescr))
+    zgeom.append(obj.Geometry(obj.wc_geomname, obj.wc_geomdescr))
+    zgeom.append(obj.Geometry(obj.ws_geomname, obj.ws_geomdescr))
+    return xgeom, ygeom, zgeom
+
+
+# meshing sections based on final geometric parameters, geometry type: 3D, horizontal structures
+def sections_3d_horizontal(inlettype, xgeom, ygeom, zgeom):
+    # final values of geometric parameters
+    # x geometry parameters
+    ht_geom = fnc.getobj(obj.ht_geomname, xgeom).getval()           # total domain size
+    hi_geom = fnc.getobj(obj.hi_geomname, xgeom).getval()           # film inlet
+    hd_geom = fnc.getobj(obj.hd_geomname, xgeom).getval()           # distributor
+    hg_geom = ht_geom - (hi_geom + hd_geom)                         # gas space
+    dgr_geom = fnc.getobj(obj.dgr_geomname, xgeom).getval()         # grooves
+
+    # y geometry parameters
+    lt_geom = fnc.getobj(obj.lt_geomname, ygeom).getval()           # film wall
+    if inlettype == "2":
+        lag_geom = fnc.getobj(obj.lag_geomname, ygeom).getval()     # inlet: additional gas space
+    ls_geom = fnc.getobj(obj.ls_geomname, ygeom).getval()           # structures
+    lgr_geom = fnc.getobj(obj.lgr_geomname, ygeom).getval()         # grooves
+    li_geom = fnc.getobj(obj.li_geomname, ygeom).getval()           # smooth wall at inlet
+    lo_geom = fnc.getobj(obj.lo_geomname, ygeom).getval()           # smooth wall at outlet
+    ns = fnc.getobj(obj.ns_geomname, ygeom).getval()                # number of structures
+
+    # z geometry parameters
+    wt_geom = fnc.getobj(obj.wt_geomname, zgeom).getval()           # total domain size
+    wc_geom = fnc.getobj(obj.wc_geomname, zgeom).getval()           # central section
+    ws_geom = fnc.getobj(obj.ws_geomname, zgeom).getval()           # side sections
+
+    # creating meshing sections based on final geometric parameters provided
+    xsects = []
+    ysects = []
+    zsects = []
+
+    # x-dimension
+    xsects.append(obj.Section(obj.hi_sectname, hi_geom))            # film inlet
+    xsects.append(obj.Section(obj.hd_sectname, hd_geom))            # distributor
+    xsects.append(obj.Section(obj.hg_sectname, hg_geom))            # gas space
+    xsects.append(obj.Section(obj.dgr_sectname, dgr_geom))          # grooves
+
+    # y-dimension
+    if inlettype == "2":
+        ysects.append(obj.Section(obj.lag_sectname, lag_geom))      # inlet: additional gas space
+    ysects.append(obj.Section(obj.ls_sectname, ls_geom))            # structures
+    ysects.append(obj.Section(obj.lgr_sectname, lgr_geom))          # grooves
+    ysects.append(obj.Section(obj.li_sectname, li_geom))            # smooth wall at inlet
+    ysects.append(obj.Section(obj.lo_sectname, lo_geom))            # smooth wall at outlet
+
+    # z-dimension
+    zsects.append(obj.Section(obj.ws1_sectname, ws_geom))           # side section 1
+    zsects.append(obj.Section(obj.wc_sectname, wc_geom))            # central section
+    zsects.append(obj.Section(obj.ws2_sectname, ws_geom))           # side section 2
+    return xsects, ysects, zsects
+
+
+# default meshing of sections, cell sizes in [m] (film, distr, xmax, ymax, zmax), geometry type: 3D, horizontal structures
+def defaultmeshing_3d_horizontal(inlettype, xsects, ysects, zsects, sizes):
+    size_film = sizes["film"]
+    size_distr = sizes["distr"]
+    size_xmax = sizes["xmax"]
+    size_ymax = sizes["ymax"]
+    size_zmax = sizes["zmax"]
+
+    # x-dimension
+    fnc.uniform(fnc.getobj(obj.hi_sectname, xsects), size_film)                 # film inlet
+    fnc.geo1(fnc.getobj(obj.hd_sectname, xsects), size_film, size_distr)        # distributor
+    fnc.geo1(fnc.getobj(obj.hg_sectname, xsects), size_distr, size_xmax)        # gas space
+    fnc.uniform(fnc.getobj(obj.dgr_sectname, xsects), size_film)                # grooves
+
+    # y-dimension
+    if inlettype == "2":
+        fnc.uniform(fnc.getobj(obj.lag_sectname, ysects), size_ymax)            # inlet: additional gas space
+    fnc.uniform(fnc.getobj(obj.ls_sectname, ysects), size_ymax)                 # structures
+    fnc.uniform(fnc.getobj(obj.lgr_sectname, ysects), size_ymax)                # grooves
+    fnc.uniform(fnc.getobj(obj.li_sectname, ysects), size_ymax)                 # smooth wall at inlet
+    fnc.uniform(fnc.getobj(obj.lo_sectname, ysects), size_ymax)                 # smooth wall at outlet
+
+    # z-dimension
+    fnc.uniform(fnc.getobj(obj.wc_sectname, zsects), size_zmax)                 # center
+    fnc.geo1(fnc.getobj(obj.ws1_sectname, zsects), size_film, size_zmax, True)  # side section 1 (growth rate within maxrate)
+    fnc.geo2(fnc.getobj(obj.ws2_sectname, zsects), size_film, size_zmax, True)  # side section 2 (growth rate within maxrate)
+
+
+# model generation from final geometric and meshing parameters, geometry type: 3D, horizontal structures
+# names: part names, periodic boundaries are only used for geometric variant 1
+def model_3d_horizontal(projname, inlettype, periodic, xgeom, ygeom, zgeom, xsects, ysects, zsects, names):
+    outlettype = "1"                # simple film outlet
+    geomtype, geomnum = variant("3D-horizontal-", inlettype, outlettype)
+    periodic = periodic and geomnum == 1
+
+    # part names
+    name_fluid = names["fluid"]
+    name_finlet = names["finlet"]
+    name_fwall = names["fwall"]
+    name_foutlet = names["foutlet"]
+    name_gwall = names["gwall"]
+    name_gtop = names["gtop"]
+    name_distr = names["distr"]
+    name_sides = names["sides"]
+
+    # names of points, curves and surfaces start from 0 for every model
+    fnc.resetcounts()
+
+    # final values of geometric parameters
+    # x geometry parameters
+    ht_geom = fnc.getobj(obj.ht_geomname, xgeom).getval()           # total domain size
+    hi_geom = fnc.getobj(obj.hi_geomname, xgeom).getval()           # film inlet
+    hd_geom = fnc.getobj(obj.hd_geomname, xgeom).getval()           # distributor
+    hg_geom = ht_geom - (hi_geom + hd_geom)                         # gas space
+    dgr_geom = fnc.getobj(obj.dgr_geomname, xgeom).getval()         # grooves
+
+    # y geometry parameters
+    lt_geom = fnc.getobj(obj.lt_geomname, ygeom).getval()           # film wall
+    if inlettype == "2":
+        lag_geom = fnc.getobj(obj.lag_geomname, ygeom).getval()     # inlet: additional gas space
+    ls_geom = fnc.getobj(obj.ls_geomname, ygeom).getval()           # structures
+    lgr_geom = fnc.getobj(obj.lgr_geomname, ygeom).getval()         # grooves
+    li_geom = fnc.getobj(obj.li_geomname, ygeom).getval()           # smooth wall at inlet
+    lo_geom = fnc.getobj(obj.lo_geomname, ygeom).getval()           # smooth wall at outlet
+    ns = fnc.getobj(obj.ns_geomname, ygeom).getval()                # number of structures
+
+    # z geometry parameters
+    wt_geom = fnc.getobj(obj.wt_geomname, zgeom).getval()           # total domain size
+    wc_geom = fnc.getobj(obj.wc_geomname, zgeom).getval()           # central section
+    ws_geom = fnc.getobj(obj.ws_geomname, zgeom).getval()           # side sections
+
+    # final values of meshing parameters
+    # x meshing parameters
+    hi_mesh = fnc.getobj(obj.hi_sectname, xsects).getmesh()         # film inlet
+    hd_mesh = fnc.getobj(obj.hd_sectname, xsects).getmesh()         # distributor
+    hg_mesh = fnc.getobj(obj.hg_sectname, xsects).getmesh()         # gas space
+    dgr_mesh = fnc.getobj(obj.dgr_sectname, xsects).getmesh()       # grooves
+
+    # y meshing parameters
+    if inlettype == "2":
+        lag_mesh = fnc.getobj(obj.lag_sectname, ysects).getmesh()   # additional gas space
+    ls_mesh = fnc.getobj(obj.ls_sectname, ysects).getmesh()         # structures
+    lgr_mesh = fnc.getobj(obj.lgr_sectname, ysects).getmesh()       # grooves
+    li_mesh = fnc.getobj(obj.li_sectname, ysects).getmesh()         # smooth wall at inlet
+    lo_mesh = fnc.getobj(obj.lo_sectname, ysects).getmesh()         # smooth wall at outlet
+
+    # z meshing parameters
+    wc_mesh = fnc.getobj(obj.wc_sectname, zsects).getmesh()         # central section
+    ws1_mesh = fnc.getobj(obj.ws1_sectname, zsects).getmesh()       # side section 1
+    ws2_mesh = fnc.getobj(obj.ws2_sectname, zsects).getmesh()       # side section 2
+
+    model = obj.Model(projname, geomtype, [xgeom, ygeom, zgeom], [xsects, ysects, zsects], ns)
+
+
+    # geometry object lists
+    prts = model.getprts()       # parts
+    pnts = model.getpnts()       # points
+    crvs = model.getcrvs()       # curves
+    srfs = model.getsrfs()       # surfaces
+
+
+    # part creation
+    # body parts
+    prts.append(obj.Body(name_fluid, ht_geom/2.0, lt_geom/2.0, wt_geom/2.0))    # fluid
+
+    # boundary parts
+    prts.append(obj.Part(name_finlet))      # inlet
+    prts.append(obj.Part(name_fwall))       # film wall
+    prts.append(obj.Part(name_foutlet))     # film outlet
+    prts.append(obj.Part(name_gwall))       # gas wall
+    if not periodic:
+        prts.append(obj.Part(name_gtop))    # gas top
+        prts.append(obj.Part(name_distr))   # distributor
+    prts.append(obj.Part(name_sides))       # sides
+
+
+
+    # outer z coordinates
+    zbounds = [0.0, wt_geom]
+
+
+    # film inlet region
+    # inlet variant 1: simple film inlet
+    if inlettype == "1":
+        for bound in zbounds:
+            # point definition
+            # points at lt_geom
+            pnts.append(obj.Point(ht_geom, lt_geom, bound))
+            pnts.append(obj.Point((hi_geom + hd_geom), lt_geom, bound))
+            pnts.append(obj.Point(hi_geom, lt_geom, bound))
+            pnts.append(obj.Point(0.0, lt_geom, bound))
+
+            # points at (lt_geom - li_geom)
+            pnts.append(obj.Point(ht_geom, (lt_geom - li_geom), bound))
+            pnts.append(obj.Point((hi_geom + hd_geom), (lt_geom - li_geom), bound))
+            pnts.append(obj.Point(hi_geom, (lt_geom - li_geom), bound))
+            pnts.append(obj.Point(0.0, (lt_geom - li_geom), bound))
+            pnts.append(obj.Point(-1.0*dgr_geom, (lt_geom - li_geom), bound))
+
+            # points at (lt_geom - li_geom - lgr_geom)
+            pnts.append(obj.Point(ht_geom, (lt_geom - li_geom - lgr_geom), bound))
+            pnts.append(obj.Point((hi_geom + hd_geom), (lt_geom - li_geom - lgr_geom), bound))
+            pnts.append(obj.Point(hi_geom, (lt_geom - li_geom - lgr_geom), bound))
+            pnts.append(obj.Point(0.0, (lt_geom - li_geom - lgr_geom), bound))
+            pnts.append(obj.Point(-1.0*dgr_geom, (lt_geom - li_geom - lgr_geom), bound))
+
+
+            # curve definition
+            # curves in y direction
+            crvs.append(obj.Curve(pnts[-14], pnts[-10]))
+            crvs.append(obj.Curve(pnts[-10], pnts[-5]))
+
+            crvs.append(obj.Curve(pnts[-13], pnts[-9]))
+            crvs.append(obj.Curve(pnts[-9], pnts[-4]))
+
+            crvs.append(obj.Curve(pnts[-12], pnts[-8]))
+            crvs.append(obj.Curve(pnts[-8], pnts[-3]))
+
+            crvs.append(obj.Curve(pnts[-11], pnts[-7]))
+            crvs.append(obj.Curve(pnts[-7], pnts[-2]))
+
+            crvs.append(obj.Curve(pnts[-6], pnts[-1]))
+
+            # curves in x direction
+            crvs.append(obj.Curve(pnts[-14], pnts[-13]))
+            crvs.append(obj.Curve(pnts[-13], pnts[-12]))
+            crvs.append(obj.Curve(pnts[-12], pnts[-11]))
+
+            crvs.append(obj.Curve(pnts[-10], pnts[-9]))
+            crvs.append(obj.Curve(pnts[-9], pnts[-8]))
+            crvs.append(obj.Curve(pnts[-8], pnts[-7]))
+            crvs.append(obj.Curve(pnts[-7], pnts[-6]))
+
+            crvs.append(obj.Curve(pnts[-5], pnts[-4]))
+            crvs.append(obj.Curve(pnts[-4], pnts[-3]))
+            crvs.append(obj.Curve(pnts[-3], pnts[-2]))
+            crvs.append(obj.Curve(pnts[-2], pnts[-1]))
+
+
+            # surface definition (sides)
+            # surfaces at film inlet
+            srfs.append(obj.Surface([crvs[-20], crvs[-11], crvs[-8], crvs[-18]]))
+            fnc.getobj(name_sides, prts).addgeom(srfs[-1])
+            srfs.append(obj.Surface([crvs[-18], crvs[-10], crvs[-7], crvs[-16]]))
+            fnc.getobj(name_sides, prts).addgeom(srfs[-1])
+            srfs.append(obj.Surface([crvs[-16], crvs[-9], crvs[-6], crvs[-14]]))
+            fnc.getobj(name_sides, prts).addgeom(srfs[-1])
+
+            # surfaces at first groove
+            srfs.append(obj.Surface([crvs[-19], crvs[-8], crvs[-4], crvs[-17]]))
+            fnc.getobj(name_sides, prts).addgeom(srfs[-1])
+            srfs.append(obj.Surface([crvs[-17], crvs[-7], crvs[-3], crvs[-15]]))
+            fnc.getobj(name_sides, prts).addgeom(srfs[-1])
+            srfs.append(obj.Surface([crvs[-15], crvs[-6], crvs[-2], crvs[-13]]))
+            fnc.getobj(name_sides, prts).addgeom(srfs[-1])
+            srfs.append(obj.Surface([crvs[-13], crvs[-5], crvs[-1], crvs[-12]]))
+            fnc.getobj(name_sides, prts).addgeom(srfs[-1])
+
+        # number of points and curves of film inlet region
+        numpnts_finlet_bounds = 14          # number of points per bound
+        numcrvs_finlet_bounds = 20          # number of curves per bound
+
+        # curves in z direction
+        zpnts_finlet = [-14, -13, -12, -11, -10, -7, -6, -5, -2, -1]        # points for curves between zbounds of film inlet region
+        for pnt in zpnts_finlet:
+            crvs.append(obj.Curve(pnts[pnt], pnts[pnt-numpnts_finlet_bounds]))
+        numcrvs_finlet_vert = int(len(zpnts_finlet))        # number of curves between bounds
+
+        # surfaces between zbounds
+        # film wall
+        srfs.append(obj.Surface([crvs[-7], crvs[-5], crvs[-numcrvs_finlet_vert-14], crvs[-numcrvs_finlet_vert-numcrvs_finlet_bounds-14]]))
+        fnc.getobj(name_fwall, prts).addgeom(srfs[-1])
+        srfs.append(obj.Surface([crvs[-5], crvs[-4], crvs[-numcrvs_finlet_vert-5], crvs[-numcrvs_finlet_vert-numcrvs_finlet_bounds-5]]))
+        fnc.getobj(name_fwall, prts).addgeom(srfs[-1])
+        srfs.append(obj.Surface([crvs[-4], crvs[-1], crvs[-numcrvs_finlet_vert-12], crvs[-numcrvs_finlet_vert-numcrvs_finlet_bounds-12]]))
+        fnc.getobj(name_fwall, prts).addgeom(srfs[-1])
+        srfs.append(obj.Surface([crvs[-1], crvs[-2], crvs[-numcrvs_finlet_vert-1], crvs[-numcrvs_finlet_vert-numcrvs_finlet_bounds-1]]))
+        fnc.getobj(name_fwall, prts).addgeom(srfs[-1])
+
+        # film inlet
+        srfs.append(obj.Surface([crvs[-7], crvs[-8], crvs[-numcrvs_finlet_vert-9], crvs[-numcrvs_finlet_vert-numcrvs_finlet_bounds-9]]))
+        fnc.getobj(name_finlet, prts).addgeom(srfs[-1])
+
+        # distributor
+        srfs.append(obj.Surface([crvs[-8], crvs[-9], crvs[-numcrvs_finlet_vert-10], crvs[-numcrvs_finlet_vert-numcrvs_finlet_bounds-10]]))
+        if periodic:
+            fnc.getobj(name_finlet, prts).addgeom(srfs[-1])
+        else:
+            fnc.getobj(name_distr, prts).addgeom(srfs[-1])
+
+        # gas top
+        srfs.append(obj.Surface([crvs[-9], crvs[-10], crvs[-numcrvs_finlet_vert-11], crvs[-numcrvs_finlet_vert-numcrvs_finlet_bounds-11]]))
+        if periodic:
+            fnc.getobj(name_finlet, prts).addgeom(srfs[-1])
+        else:
+            fnc.getobj(name_gtop, prts).addgeom(srfs[-1])
+
+        # gas wall
+        srfs.append(obj.Surface([crvs[-10], crvs[-6], crvs[-numcrvs_finlet_vert-20], crvs[-numcrvs_finlet_vert-numcrvs_finlet_bounds-20]]))
+        fnc.getobj(name_gwall, prts).addgeom(srfs[-1])
+        srfs.append(obj.Surface([crvs[-6], crvs[-3], crvs[-numcrvs_finlet_vert-19], crvs[-numcrvs_finlet_vert-numcrvs_finlet_bounds-19]]))
+        fnc.getobj(name_gwall, prts).addgeom(srfs[-1])
+
+
+    # inlet variant 2: additional gas space
+    elif inlettype == "2":
+        for bound in zbounds:
+            # point definition
+            # points at (lt_geom + lag_geom)
+            pnts.append(obj.Point(ht_geom, (lt_geom + lag_geom), bound))
+            pnts.append(obj.Point((hi_geom + hd_geom), (lt_geom + lag_geom), bound))
+
+            # points at lt_geom
+            pnts.append(obj.Point(ht_geom, lt_geom, bound))
+            pnts.append(obj.Point((hi_geom + hd_geom), lt_geom, bound))
+            pnts.append(obj.Point(hi_geom, lt_geom, bound))
+            pnts.append(obj.Point(0.0, lt_geom, bound))
+
+            # points at (lt_geom - li_geom)
+            pnts.append(obj.Point(ht_geom, (lt_geom - li_geom), bound))
+            pnts.append(obj.Point((hi_geom + hd_geom), (lt_geom - li_geom), bound))
+            pnts.append(obj.Point(hi_geom, (lt_geom - li_geom), bound))
+            pnts.append(obj.Point(0.0, (lt_geom - li_geom), bound))
+            pnts.append(obj.Point(-1.0*dgr_geom, (lt_geom - li_geom), bound))
+
+            # points at (lt_geom - li_geom - lgr_geom)
+            pnts.append(obj.Point(ht_geom, (lt_geom - li_geom - lgr_geom), bound))
+            pnts.append(obj.Point((hi_geom + hd_geom), (lt_geom - li_geom - lgr_geom), bound))
+            pnts.append(obj.Point(hi_geom, (lt_geom - li_geom - lgr_geom), bound))
+            pnts.append(obj.Point(0.0, (lt_geom - li_geom - lgr_geom), bound))
+            pnts.append(obj.Point(-1.0*dgr_geom, (lt_geom - li_geom - lgr_geom), bound))
+
+
+            # curve definition
+            # curves in y direction
+            crvs.append(obj.Curve(pnts[-16], pnts[-14]))
+            crvs.append(obj.Curve(pnts[-14], pnts[-10]))
+            crvs.append(obj.Curve(pnts[-10], pnts[-5]))
+
+            crvs.append(obj.Curve(pnts[-15], pnts[-13]))
+            crvs.append(obj.Curve(pnts[-13], pnts[-9]))
+            crvs.append(obj.Curve(pnts[-9], pnts[-4]))
+
+            crvs.append(obj.Curve(pnts[-12], pnts[-8]))
+            crvs.append(obj.Curve(pnts[-8], pnts[-3]))
+
+            crvs.append(obj.Curve(pnts[-11], pnts[-7]))
+            crvs.append(obj.Curve(pnts[-7], pnts[-2]))
+
+            crvs.append(obj.Curve(pnts[-6], pnts[-1]))
+
+            # curves in x direction
+            crvs.append(obj.Curve(pnts[-16], pnts[-15]))
+            crvs.append(obj.Curve(pnts[-14], pnts[-13]))
+            crvs.append(obj.Curve(pnts[-13], pnts[-12]))
+            crvs.append(obj.Curve(pnts[-12], pnts[-11]))
+
+            crvs.append(obj.Curve(pnts[-10], pnts[-9]))
+            crvs.append(obj.Curve(pnts[-9], pnts[-8]))
+            crvs.append(obj.Curve(pnts[-8], pnts[-7]))
+            crvs.append(obj.Curve(pnts[-7], pnts[-6]))
+
+            crvs.append(obj.Curve(pnts[-5], pnts[-4]))
+            crvs.append(obj.Curve(pnts[-4], pnts[-3]))
+            crvs.append(obj.Curve(pnts[-3], pnts[-2]))
+            crvs.append(obj.Curve(pnts[-2], pnts[-1]))
+
+
+            # surface definition (sides)
+            # surface of additional gas space
+            srfs.append(obj.Surface([crvs[-23], crvs[-12], crvs[-11], crvs[-20]]))
+            fnc.getobj(name_sides, prts).addgeom(srfs[-1])
+
+            # surfaces at film inlet
+            srfs.append(obj.Surface([crvs[-22], crvs[-11], crvs[-8], crvs[-19]]))
+            fnc.getobj(name_sides, prts).addgeom(srfs[-1])
+            srfs.append(obj.Surface([crvs[-19], crvs[-10], crvs[-7], crvs[-17]]))
+            fnc.getobj(name_sides, prts).addgeom(srfs[-1])
+            srfs.append(obj.Surface([crvs[-17], crvs[-9], crvs[-6], crvs[-15]]))
+            fnc.getobj(name_sides, prts).addgeom(srfs[-1])
+
+            # surfaces at first groove
+            srfs.append(obj.Surface([crvs[-21], crvs[-8], crvs[-4], crvs[-18]]))
+            fnc.getobj(name_sides, prts).addgeom(srfs[-1])
+            srfs.append(obj.Surface([crvs[-18], crvs[-7], crvs[-3], crvs[-16]]))
+            fnc.getobj(name_sides, prts).addgeom(srfs[-1])
+            srfs.append(obj.Surface([crvs[-16], crvs[-6], crvs[-2], crvs[-14]]))
+            fnc.getobj(name_sides, prts).addgeom(srfs[-1])
+            srfs.append(obj.Surface([crvs[-14], crvs[-5], crvs[-1], crvs[-13]]))
+            fnc.getobj(name_sides, prts).addgeom(srfs[-1])
+
+        # number of points and curves of film inlet region
+        numpnts_finlet_bounds = 16          # number of points per bound
+        numcrvs_finlet_bounds = 23          # number of curves per bound
+
+        # curves in z direction
+        zpnts_finlet = [-16, -15, -14, -13, -12, -11, -10, -7, -6, -5, -2, -1]      # points for curves between zbounds of film inlet region
+        for pnt in zpnts_finlet:
+            crvs.append(obj.Curve(pnts[pnt], pnts[pnt-numpnts_finlet_bounds]))
+        numcrvs_finlet_vert = int(len(zpnts_finlet))        # number of curves between bounds
+
+        # surfaces between zbounds
+        # film wall
+        srfs.append(obj.Surface([crvs[-7], crvs[-5], crvs[-numcrvs_finlet_vert-15], crvs[-numcrvs_finlet_vert-numcrvs_finlet_bounds-15]]))
+        fnc.getobj(name_fwall, prts).addgeom(srfs[-1])
+        srfs.append(obj.Surface([crvs[-5], crvs[-4], crvs[-numcrvs_finlet_vert-5], crvs[-numcrvs_finlet_vert-numcrvs_finlet_bounds-5]]))
+        fnc.getobj(name_fwall, prts).addgeom(srfs[-1])
+        srfs.append(obj.Surface([crvs[-4], crvs[-1], crvs[-numcrvs_finlet_vert-13], crvs[-numcrvs_finlet_vert-numcrvs_finlet_bounds-13]]))
+        fnc.getobj(name_fwall, prts).addgeom(srfs[-1])
+        srfs.append(obj.Surface([crvs[-1], crvs[-2], crvs[-numcrvs_finlet_vert-1], crvs[-numcrvs_finlet_vert-numcrvs_finlet_bounds-1]]))
+        fnc.getobj(name_fwall, prts).addgeom(srfs[-1])
+
+        # film inlet
+        srfs.append(obj.Surface([crvs[-7], crvs[-8], crvs[-numcrvs_finlet_vert-9], crvs[-numcrvs_finlet_vert-numcrvs_finlet_bounds-9]]))
+        fnc.getobj(name_finlet, prts).addgeom(srfs[-1])
+
+        # distributor
+        srfs.append(obj.Surface([crvs[-8], crvs[-9], crvs[-numcrvs_finlet_vert-10], crvs[-numcrvs_finlet_vert-numcrvs_finlet_bounds-10]]))
+        fnc.getobj(name_distr, prts).addgeom(srfs[-1])
+        srfs.append(obj.Surface([crvs[-9], crvs[-11], crvs[-numcrvs_finlet_vert-20], crvs[-numcrvs_finlet_vert-numcrvs_finlet_bounds-20]]))
+        fnc.getobj(name_distr, prts).addgeom(srfs[-1])
+
+        # gas top
+        srfs.append(obj.Surface([crvs[-11], crvs[-12], crvs[-numcrvs_finlet_vert-12], crvs[-numcrvs_finlet_vert-numcrvs_finlet_bounds-12]]))
+        fnc.getobj(name_gtop, prts).addgeom(srfs[-1])
+
+        # gas wall
+        srfs.append(obj.Surface([crvs[-12], crvs[-10], crvs[-numcrvs_finlet_vert-23], crvs[-numcrvs_finlet_vert-numcrvs_finlet_bounds-23]]))
+        fnc.getobj(name_gwall, prts).addgeom(srfs[-1])
+        srfs.append(obj.Surface([crvs[-10], crvs[-6], crvs[-numcrvs_finlet_vert-22], crvs[-numcrvs_finlet_vert-numcrvs_finlet_bounds-22]]))
+        fnc.getobj(name_gwall, prts).addgeom(srfs[-1])
+        srfs.append(obj.Surface([crvs[-6], crvs[-3], crvs[-numcrvs_finlet_vert-21], crvs[-numcrvs_finlet_vert-numcrvs_finlet_bounds-21]]))
+        fnc.getobj(name_gwall, prts).addgeom(srfs[-1])
+
+
+
+    # structures
+    for i in range(ns):
+        # points for curves between zbounds of structures
+        zpnts_struc = [-10, -7, -6, -5, -2, -1]
+        numcrvs_struc_vert = len(zpnts_struc)
+
+
+        for j in range(len(zbounds)):
+            # point definition
+            # first row of points, first structure, first zbound
+            if i == 0 and j == 0:
+                for k in range(5):
+                    pnts.append(obj.Point(pnts[-numpnts_finlet_bounds-5].getx(), (pnts[-numpnts_finlet_bounds-5].gety() - ls_geom), zbounds[j]))
+            # first row of points, rest of structures
+            else:
+                for k in range(5):
+                    pnts.append(obj.Point(pnts[-15].getx(), (pnts[-15].gety() - ls_geom), zbounds[j]))
+
+            # second row of points
+            for k in range(5):
+                pnts.append(obj.Point(pnts[-5].getx(), (pnts[-5].gety() - lgr_geom), zbounds[j]))
+
+            # number of points of structures
+            numpnts_struc_bounds = 10          # number of points per bound
+
+            # curve definition
+            # first structure, first zbound
+            if i == 0 and j == 0:
+                pnt1 = -numpnts_struc_bounds-numpnts_finlet_bounds-5
+                pnt2 = -numpnts_struc_bounds-numpnts_finlet_bounds-4
+                pnt3 = -numpnts_struc_bounds-numpnts_finlet_bounds-3
+                pnt4 = -numpnts_struc_bounds-numpnts_finlet_bounds-2
+            # rest of structures
+            else:
+                pnt1 = -2*numpnts_struc_bounds-5
+                pnt2 = -2*numpnts_struc_bounds-4
+                pnt3 = -2*numpnts_struc_bounds-3
+                pnt4 = -2*numpnts_struc_bounds-2
+
+            # curves in y direction
+            crvs.append(obj.Curve(pnts[pnt1], pnts[-10]))
+            crvs.append(obj.Curve(pnts[-10], pnts[-5]))
+            crvs.append(obj.Curve(pnts[pnt2], pnts[-9]))
+            crvs.append(obj.Curve(pnts[-9], pnts[-4]))
+            crvs.append(obj.Curve(pnts[pnt3], pnts[-8]))
+            crvs.append(obj.Curve(pnts[-8], pnts[-3]))
+            crvs.append(obj.Curve(pnts[pnt4], pnts[-7]))
+            crvs.append(obj.Curve(pnts[-7], pnts[-2]))
+            crvs.append(obj.Curve(pnts[-6], pnts[-1]))
+
+            # curves in x direction
+            crvs.append(obj.Curve(pnts[-10], pnts[-9]))
+            crvs.append(obj.Curve(pnts[-9], pnts[-8]))
+            crvs.append(obj.Curve(pnts[-8], pnts[-7]))
+            crvs.append(obj.Curve(pnts[-7], pnts[-6]))
+
+            crvs.append(obj.Curve(pnts[-5], pnts[-4]))
+            crvs.append(obj.Curve(pnts[-4], pnts[-3]))
+            crvs.append(obj.Curve(pnts[-3], pnts[-2]))
+            crvs.append(obj.Curve(pnts[-2], pnts[-1]))
+
+            # number of curves of structures
+            numcrvs_struc_bounds = 17          # number of curves per bound
+
+
+            # surface definition (sides)
+            # first structure, first zbound
+            if i == 0 and j == 0:
+                crv1 = -numcrvs_struc_bounds-numcrvs_finlet_vert-numcrvs_finlet_bounds-4
+                crv2 = -numcrvs_struc_bounds-numcrvs_finlet_vert-numcrvs_finlet_bounds-3
+                crv3 = -numcrvs_struc_bounds-numcrvs_finlet_vert-numcrvs_finlet_bounds-2
+            # first structure, second zbound
+            elif i == 0 and j == 1:
+                crv1 = -2*numcrvs_struc_bounds-numcrvs_finlet_vert-4
+                crv2 = -2*numcrvs_struc_bounds-numcrvs_finlet_vert-3
+                crv3 = -2*numcrvs_struc_bounds-numcrvs_finlet_vert-2
+            # rest of structures
+            else:
+                crv1 = -numcrvs_struc_vert-2*numcrvs_struc_bounds-4
+                crv2 = -numcrvs_struc_vert-2*numcrvs_struc_bounds-3
+                crv3 = -numcrvs_struc_vert-2*numcrvs_struc_bounds-2
+
+            # surfaces at structure
+            srfs.append(obj.Surface([crvs[crv1], crvs[-17], crvs[-8], crvs[-15]]))
+            fnc.getobj(name_sides, prts).addgeom(srfs[-1])
+            srfs.append(obj.Surface([crvs[crv2], crvs[-15], crvs[-7], crvs[-13]]))
+            fnc.getobj(name_sides, prts).addgeom(srfs[-1])
+            srfs.append(obj.Surface([crvs[crv3], crvs[-13], crvs[-6], crvs[-11]]))
+            fnc.getobj(name_sides, prts).addgeom(srfs[-1])
+
+            # surfaces at groove
+            srfs.append(obj.Surface([crvs[-8], crvs[-16], crvs[-4], crvs[-14]]))
+            fnc.getobj(name_sides, prts).addgeom(srfs[-1])
+            srfs.append(obj.Surface([crvs[-7], crvs[-14], crvs[-3], crvs[-12]]))
+            fnc.getobj(name_sides, prts).addgeom(srfs[-1])
+            srfs.append(obj.Surface([crvs[-6], crvs[-12], crvs[-2], crvs[-10]]))
+            fnc.getobj(name_sides, prts).addgeom(srfs[-1])
+            srfs.append(obj.Surface([crvs[-5], crvs[-10], crvs[-1], crvs[-9]]))
+            fnc.getobj(name_sides, prts).addgeom(srfs[-1])
+
+
+        # curves in z direction
+        for pnt in zpnts_struc:
+            crvs.append(obj.Curve(pnts[pnt], pnts[pnt-10]))
+
+
+        # surfaces between bounds
+        # gas wall
+        srfs.append(obj.Surface([crvs[-numcrvs_struc_vert-2*numcrvs_struc_bounds-3], crvs[-6], crvs[-numcrvs_struc_vert-17], crvs[-numcrvs_struc_vert-numcrvs_struc_bounds-17]]))
+        fnc.getobj(name_gwall, prts).addgeom(srfs[-1])
+        srfs.append(obj.Surface([crvs[-6], crvs[-3], crvs[-numcrvs_struc_vert-16], crvs[-numcrvs_struc_vert-numcrvs_struc_bounds-16]]))
+        fnc.getobj(name_gwall, prts).addgeom(srfs[-1])
+
+        # film wall
+        srfs.append(obj.Surface([crvs[-numcrvs_struc_vert-2*numcrvs_struc_bounds-2], crvs[-5], crvs[-numcrvs_struc_vert-11], crvs[-numcrvs_struc_vert-numcrvs_struc_bounds-11]]))
+        fnc.getobj(name_fwall, prts).addgeom(srfs[-1])
+        srfs.append(obj.Surface([crvs[-5], crvs[-4], crvs[-numcrvs_struc_vert-5], crvs[-numcrvs_struc_vert-numcrvs_struc_bounds-5]]))
+        fnc.getobj(name_fwall, prts).addgeom(srfs[-1])
+        srfs.append(obj.Surface([crvs[-4], crvs[-1], crvs[-numcrvs_struc_vert-9], crvs[-numcrvs_struc_vert-numcrvs_struc_bounds-9]]))
+        fnc.getobj(name_fwall, prts).addgeom(srfs[-1])
+        srfs.append(obj.Surface([crvs[-1], crvs[-2], crvs[-numcrvs_struc_vert-1], crvs[-numcrvs_struc_vert-numcrvs_struc_bounds-1]]))
+        fnc.getobj(name_fwall, prts).addgeom(srfs[-1])
+
+
+
+    # film outlet region
+    # outlet variant 1: simple film outlet
+    if outlettype == "1":
+        # point definition
+        for zbound in zbounds:
+            pnts.append(obj.Point(ht_geom, 0.0, zbound))
+            pnts.append(obj.Point((hi_geom + hd_geom), 0.0, zbound))
+            pnts.append(obj.Point(hi_geom, 0.0, zbound))
+            pnts.append(obj.Point(0.0, 0.0, zbound))
+
+        # number of points of film outlet region
+        numpnts_foutlet_bounds = 4          # number of points per bound
+
+        # curve definition
+        # lower zbound
+        # curves in y direction
+        crvs.append(obj.Curve(pnts[-numpnts_foutlet_bounds-4], pnts[-2*numpnts_foutlet_bounds-numpnts_struc_bounds-5]))
+        crvs.append(obj.Curve(pnts[-numpnts_foutlet_bounds-3], pnts[-2*numpnts_foutlet_bounds-numpnts_struc_bounds-4]))
+        crvs.append(obj.Curve(pnts[-numpnts_foutlet_bounds-2], pnts[-2*numpnts_foutlet_bounds-numpnts_struc_bounds-3]))
+        crvs.append(obj.Curve(pnts[-numpnts_foutlet_bounds-1], pnts[-2*numpnts_foutlet_bounds-numpnts_struc_bounds-2]))
+        # curves in x direction
+        crvs.append(obj.Curve(pnts[-numpnts_foutlet_bounds-4], pnts[-numpnts_foutlet_bounds-3]))
+        crvs.append(obj.Curve(pnts[-numpnts_foutlet_bounds-3], pnts[-numpnts_foutlet_bounds-2]))
+        crvs.append(obj.Curve(pnts[-numpnts_foutlet_bounds-2], pnts[-numpnts_foutlet_bounds-1]))
+
+        # upper zbound
+        # curves in y direction
+        crvs.append(obj.Curve(pnts[-4], pnts[-2*numpnts_foutlet_bounds-5]))
+        crvs.append(obj.Curve(pnts[-3], pnts[-2*numpnts_foutlet_bounds-4]))
+        crvs.append(obj.Curve(pnts[-2], pnts[-2*numpnts_foutlet_bounds-3]))
+        crvs.append(obj.Curve(pnts[-1], pnts[-2*numpnts_foutlet_bounds-2]))
+        # curves in x direction
+        crvs.append(obj.Curve(pnts[-4], pnts[-3]))
+        crvs.append(obj.Curve(pnts[-3], pnts[-2]))
+        crvs.append(obj.Curve(pnts[-2], pnts[-1]))
+
+        # number of curves of film outlet region
+        numcrvs_foutlet_bounds = 7          # number of curves per bound
+
+
+        # surface definition (sides)
+        # lower zbound
+        srfs.append(obj.Surface([crvs[-2*numcrvs_foutlet_bounds-numcrvs_struc_vert-numcrvs_struc_bounds-4], crvs[-numcrvs_foutlet_bounds-7], crvs[-numcrvs_foutlet_bounds-3], crvs[-numcrvs_foutlet_bounds-6]]))
+        fnc.getobj(name_sides, prts).addgeom(srfs[-1])
+        srfs.append(obj.Surface([crvs[-2*numcrvs_foutlet_bounds-numcrvs_struc_vert-numcrvs_struc_bounds-3], crvs[-numcrvs_foutlet_bounds-6], crvs[-numcrvs_foutlet_bounds-2], crvs[-numcrvs_foutlet_bounds-5]]))
+        fnc.getobj(name_sides, prts).addgeom(srfs[-1])
+        srfs.append(obj.Surface([crvs[-2*numcrvs_foutlet_bounds-numcrvs_struc_vert-numcrvs_struc_bounds-2], crvs[-numcrvs_foutlet_bounds-5], crvs[-numcrvs_foutlet_bounds-1], crvs[-numcrvs_foutlet_bounds-4]]))
+        fnc.getobj(name_sides, prts).addgeom(srfs[-1])
+        # upper zbound
+        srfs.append(obj.Surface([crvs[-2*numcrvs_foutlet_bounds-numcrvs_struc_vert-4], crvs[-7], crvs[-3], crvs[-6]]))
+        fnc.getobj(name_sides, prts).addgeom(srfs[-1])
+        srfs.append(obj.Surface([crvs[-2*numcrvs_foutlet_bounds-numcrvs_struc_vert-3], crvs[-6], crvs[-2], crvs[-5]]))
+        fnc.getobj(name_sides, prts).addgeom(srfs[-1])
+        srfs.append(obj.Surface([crvs[-2*numcrvs_foutlet_bounds-numcrvs_struc_vert-2], crvs[-5], crvs[-1], crvs[-4]]))
+        fnc.getobj(name_sides, prts).addgeom(srfs[-1])
+
+
+        # curves in z direction
+        zpnts_foutlet = [-4, -3, -2, -1]
+        for pnt in zpnts_foutlet:
+            crvs.append(obj.Curve(pnts[pnt], pnts[pnt-4]))
+        numcrvs_foutlet_vert = len(zpnts_foutlet)
+
+
+        # surfaces between bounds
+        # gaswall
+        srfs.append(obj.Surface([crvs[-numcrvs_foutlet_vert-2*numcrvs_foutlet_bounds-3], crvs[-4], crvs[-numcrvs_foutlet_vert-7], crvs[-numcrvs_foutlet_vert-numcrvs_foutlet_bounds-7]]))
+        fnc.getobj(name_gwall, prts).addgeom(srfs[-1])
+
+        # film outlet
+        srfs.append(obj.Surface([crvs[-4], crvs[-3], crvs[-numcrvs_foutlet_vert-3], crvs[-numcrvs_foutlet_vert-numcrvs_foutlet_bounds-3]]))
+        fnc.getobj(name_foutlet, prts).addgeom(srfs[-1])
+        srfs.append(obj.Surface([crvs[-3], crvs[-2], crvs[-numcrvs_foutlet_vert-2], crvs[-numcrvs_foutlet_vert-numcrvs_foutlet_bounds-2]]))
+        fnc.getobj(name_foutlet, prts).addgeom(srfs[-1])
+        srfs.append(obj.Surface([crvs[-2], crvs[-1], crvs[-numcrvs_foutlet_vert-1], crvs[-numcrvs_foutlet_vert-numcrvs_foutlet_bounds-1]]))
+        fnc.getobj(name_foutlet, prts).addgeom(srfs[-1])
+
+        # film wall
+        srfs.append(obj.Surface([crvs[-numcrvs_foutlet_vert-2*numcrvs_foutlet_bounds-2], crvs[-1], crvs[-numcrvs_foutlet_vert-4], crvs[-numcrvs_foutlet_vert-numcrvs_foutlet_bounds-4]]))
+        fnc.getobj(name_fwall, prts).addgeom(srfs[-1])
+
+    numpnts_bounds = len(pnts)              # number of all points on bounds
+
+
+
+    # inner z coordinates
+    zints = [ws_geom, ws_geom + wc_geom]
+
+
+    # definition of additional points of inner z coordinates
+    # film inlet region
+    # inlet variant 1: simple film inlet
+    if inlettype == "1":
+        for zint in zints:
+            # points at lt_geom
+            pnts.append(obj.Point(ht_geom, lt_geom, zint))
+            pnts.append(obj.Point((hi_geom + hd_geom), lt_geom, zint))
+            pnts.append(obj.Point(hi_geom, lt_geom, zint))
+            pnts.append(obj.Point(0.0, lt_geom, zint))
+
+            # points at (lt_geom - li_geom)
+            pnts.append(obj.Point(ht_geom, (lt_geom - li_geom), zint))
+            pnts.append(obj.Point(0.0, (lt_geom - li_geom), zint))
+            pnts.append(obj.Point(-1.0*dgr_geom, (lt_geom - li_geom), zint))
+
+            # points at (lt_geom - li_geom - lgr_geom)
+            pnts.append(obj.Point(ht_geom, (lt_geom - li_geom - lgr_geom), zint))
+            pnts.append(obj.Point(0.0, (lt_geom - li_geom - lgr_geom), zint))
+            pnts.append(obj.Point(-1.0*dgr_geom, (lt_geom - li_geom - lgr_geom), zint))
+
+        # number of points of film inlet region
+        numpnts_finlet_ints = 10            # number of points per int
+
+
+    # inlet variant 2: additional gas space
+    elif inlettype == "2":
+        for zint in zints:
+            # points at (lt_geom + lag_geom)
+            pnts.append(obj.Point(ht_geom, (lt_geom + lag_geom), zint))
+            pnts.append(obj.Point((hi_geom + hd_geom), (lt_geom + lag_geom), zint))
+
+            # points at lt_geom
+            pnts.append(obj.Point(ht_geom, lt_geom, zint))
+            pnts.append(obj.Point((hi_geom + hd_geom), lt_geom, zint))
+            pnts.append(obj.Point(hi_geom, lt_geom, zint))
+            pnts.append(obj.Point(0.0, lt_geom, zint))
+
+            # points at (lt_geom - li_geom)
+            pnts.append(obj.Point(ht_geom, (lt_geom - li_geom), zint))
+            pnts.append(obj.Point(0.0, (lt_geom - li_geom), zint))
+            pnts.append(obj.Point(-1.0*dgr_geom, (lt_geom - li_geom), zint))
+
+            # points at (lt_geom - li_geom - lgr_geom)
+            pnts.append(obj.Point(ht_geom, (lt_geom - li_geom - lgr_geom), zint))
+            pnts.append(obj.Point(0.0, (lt_geom - li_geom - lgr_geom), zint))
+            pnts.append(obj.Point(-1.0*dgr_geom, (lt_geom - li_geom - lgr_geom), zint))
+
+        # number of points of film inlet region
+        numpnts_finlet_ints = 12            # number of points per int
+
+
+    # structures
+    for i in range(ns):
+        for j in range(len(zints)):
+            # first row of points, first structure, first zint
+            if i == 0 and j == 0:
+                for k in range(3):
+                    pnts.append(obj.Point(pnts[-numpnts_finlet_ints-3].getx(), (pnts[-numpnts_finlet_ints-3].gety() - ls_geom), zints[j]))
+            # first row of points, rest of structures
+            else:
+                for k in range(3):
+                    pnts.append(obj.Point(pnts[-9].getx(), (pnts[-9].gety() - ls_geom), zints[j]))
+
+            # second row of points
+            for k in range(3):
+                pnts.append(obj.Point(pnts[-3].getx(), (pnts[-3].gety() - lgr_geom), zints[j]))
+
+
+    # film outlet region
+    # outlet variant 1: simple outlet
+    if outlettype == "1":
+        for zint in zints:
+            pnts.append(obj.Point(ht_geom, 0.0, zint))
+            pnts.append(obj.Point((hi_geom + hd_geom), 0.0, zint))
+            pnts.append(obj.Point(hi_geom, 0.0, zint))
+            pnts.append(obj.Point(0.0, 0.0, zint))
+
+
+
+    # blocking
+    blkg = model.getblkg()        # blocking operations (split, deletion)
+    verts = model.getassoc()       # vertex-point associations
+
+
+    # block modification
+    # geometry type 1
+    if geomnum == 1:
+        # block splits
+        # film inlet region
+        # x splits
+        blkg.append(obj.Split(pnts[3], 25, 41, prts))       # 0.0
+        blkg.append(obj.Split(pnts[2], 70, 41, prts))       # hi_geom
+        blkg.append(obj.Split(pnts[1], 86, 41, prts))       # (hi_geom + hd_geom)
+
+        # y splits
+        blkg.append(obj.Split(pnts[8], 21, 25, prts))       # (lt_geom - li_geom)
+        blkg.append(obj.Split(pnts[13], 21, 120, prts))     # (lt_geom - li_geom - lgr_geom)
+
+        # structures
+        for i in range(ns):
+            blkg.append(obj.Split(pnts[2*numpnts_struc_bounds*i+4+2*numpnts_finlet_bounds], 21, blkg[-1].getvert2()+28, prts))      # y split (structures)
+            blkg.append(obj.Split(pnts[blkg[-1].getpnt().getnum()+5], 21, blkg[-1].getvert2()+28, prts))                            # y split (grooves)
+
+
+        # block deletion
+        # film inlet region
+        blkg.append(obj.Delete(61))                 # delete block below smooth wall at inlet
+
+        # structures
+        for i in range(ns):
+            blkg.append(obj.Delete(97+i*36))        # delete block below structure
+
+        # film outlet region
+        blkg.append(obj.Delete(13))                 # delete block below smooth wall at outlet
+
+
+        # remaining splits
+        blkg.append(obj.Split(pnts[numpnts_bounds], 41, 42, prts))                                  # z split (ws_geom)
+        blkg.append(obj.Split(pnts[numpnts_bounds+numpnts_finlet_ints], 201+70*ns, 42, prts))       # z split (ws_geom + wc_geom)
+
+
+    # geometry type 2
+    elif geomnum == 2:
+
+        # film inlet region# x splits
+        blkg.append(obj.Split(pnts[5], 25, 41, prts))       # 0.0
+        blkg.append(obj.Split(pnts[4], 70, 41, prts))       # hi_geom
+        blkg.append(obj.Split(pnts[3], 86, 41, prts))       # (hi_geom + hd_geom)
+
+        # y splits
+        blkg.append(obj.Split(pnts[5], 21, 25, prts))       # lt_geom
+        blkg.append(obj.Split(pnts[10], 21, 120, prts))     # (lt_geom - li_geom)
+        blkg.append(obj.Split(pnts[15], 21, 148, prts))     # (lt_geom - li_geom - lgr_geom)
+
+
+        # structures
+        for i in range(ns):
+            blkg.append(obj.Split(pnts[2*numpnts_struc_bounds*i+4+2*numpnts_finlet_bounds], 21, blkg[-1].getvert2()+28, prts))      # y split (structures)
+            blkg.append(obj.Split(pnts[blkg[-1].getpnt().getnum()+5], 21, blkg[-1].getvert2()+28, prts))                            # y split (grooves)
+
+
+        # block deletion
+        # film inlet region
+        blkg.append(obj.Delete(61))                 # delete block above inlet
+        blkg.append(obj.Delete(62))                 # delete block above inlet
+        blkg.append(obj.Delete(63))                 # delete block above inlet
+        blkg.append(obj.Delete(79))                 # delete block below smooth wall at inlet
+
+        # structures
+        for i in range(ns):
+            blkg.append(obj.Delete(115+i*36))       # delete block below structure
+
+        # block deletions of film outlet region
+        blkg.append(obj.Delete(13))                 # delete block below smooth wall at outlet
+
+
+        # remaining splits
+        blkg.append(obj.Split(pnts[numpnts_bounds], 41, 42, prts))                                  # z split (ws_geom)
+        blkg.append(obj.Split(pnts[numpnts_bounds+numpnts_finlet_ints], 236+70*ns, 42, prts))       # z split (ws_geom + wc_geom)
+
+
+
+
+    # vertex-point associations
+
+
+    # geometry type 1
+    if geomnum == 1:
+        # film inlet region
+        # lower zbound
+        verts.append(obj.Vert(41, pnts[0]))
+        verts.append(obj.Vert(102, pnts[1]))
+        verts.append(obj.Vert(86, pnts[2]))
+        verts.append(obj.Vert(70, pnts[3]))
+
+        verts.append(obj.Vert(124, pnts[4]))
+        verts.append(obj.Vert(123, pnts[5]))
+        verts.append(obj.Vert(122, pnts[6]))
+        verts.append(obj.Vert(121, pnts[7]))
+        verts.append(obj.Vert(120, pnts[8]))
+
+        verts.append(obj.Vert(152, pnts[9]))
+        verts.append(obj.Vert(151, pnts[10]))
+        verts.append(obj.Vert(150, pnts[11]))
+        verts.append(obj.Vert(149, pnts[12]))
+        verts.append(obj.Vert(148, pnts[13]))
+
+        # upper zbound
+        verts.append(obj.Vert(42, pnts[14]))
+        verts.append(obj.Vert(106, pnts[15]))
+        verts.append(obj.Vert(90, pnts[16]))
+        verts.append(obj.Vert(74, pnts[17]))
+
+        verts.append(obj.Vert(131, pnts[18]))
+        verts.append(obj.Vert(130, pnts[19]))
+        verts.append(obj.Vert(129, pnts[20]))
+        verts.append(obj.Vert(128, pnts[21]))
+        verts.append(obj.Vert(127, pnts[22]))
+
+        verts.append(obj.Vert(159, pnts[23]))
+        verts.append(obj.Vert(158, pnts[24]))
+        verts.append(obj.Vert(157, pnts[25]))
+        verts.append(obj.Vert(156, pnts[26]))
+        verts.append(obj.Vert(155, pnts[27]))
+
+
+        # structures
+        for i in range(ns):
+            # first row of points, lower zbound
+            for k in range(5):
+                verts.append(obj.Vert(180+56*i-k, pnts[verts[-1].getpnt().getnum()+1]))
+
+            # second row of points, lower zbound
+            for k in range(5):
+                verts.append(obj.Vert(verts[-5].getnum()+28, pnts[verts[-1].getpnt().getnum() + 1]))
+
+            # first row of points, upper zbound
+            for k in range(5):
+                verts.append(obj.Vert(187+56*i-k, pnts[verts[-1].getpnt().getnum()+1]))
+
+            # second row of points, upper zbound
+            for k in range(5):
+                verts.append(obj.Vert(verts[-5].getnum()+28, pnts[verts[-1].getpnt().getnum()+1]))
+
+
+        # film outlet region
+        # lower zbound
+        verts.append(obj.Vert(37, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(101, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(85, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(69, pnts[verts[-1].getpnt().getnum()+1]))
+
+        # upper zbound
+        verts.append(obj.Vert(38, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(105, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(89, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(73, pnts[verts[-1].getpnt().getnum()+1]))
+
+
+        # film inlet region
+        # lower zint
+        v0 = 201 + ns*70
+        verts.append(obj.Vert(v0, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(v0-1, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(v0-2, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(v0-3, pnts[verts[-1].getpnt().getnum()+1]))
+
+        verts.append(obj.Vert(v0-7, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(v0-10, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(v0-11, pnts[verts[-1].getpnt().getnum()+1]))
+
+        verts.append(obj.Vert(v0-14, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(v0-17, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(v0-18, pnts[verts[-1].getpnt().getnum()+1]))
+
+        # upper zint
+        v1 = 243 + ns*84
+        verts.append(obj.Vert(v1, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(v1-1, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(v1-2, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(v1-3, pnts[verts[-1].getpnt().getnum()+1]))
+
+        verts.append(obj.Vert(v1-7, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(v1-10, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(v1-11, pnts[verts[-1].getpnt().getnum()+1]))
+
+        verts.append(obj.Vert(v1-14, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(v1-17, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(v1-18, pnts[verts[-1].getpnt().getnum()+1]))
+
+
+        # structures
+        for i in range(ns):
+            # first row of points, lower zint
+            verts.append(obj.Vert(v0-21-i*14, pnts[verts[-1].getpnt().getnum()+1]))
+            verts.append(obj.Vert(v0-24-i*14, pnts[verts[-1].getpnt().getnum()+1]))
+            verts.append(obj.Vert(v0-25-i*14, pnts[verts[-1].getpnt().getnum()+1]))
+
+            # second row of points, lower zint
+            verts.append(obj.Vert(v0-21-7-i*14, pnts[verts[-1].getpnt().getnum()+1]))
+            verts.append(obj.Vert(v0-24-7-i*14, pnts[verts[-1].getpnt().getnum()+1]))
+            verts.append(obj.Vert(v0-25-7-i*14, pnts[verts[-1].getpnt().getnum()+1]))
+
+            # first row of points, upper zint
+            verts.append(obj.Vert(v1-21-i*14, pnts[verts[-1].getpnt().getnum()+1]))
+            verts.append(obj.Vert(v1-24-i*14, pnts[verts[-1].getpnt().getnum()+1]))
+            verts.append(obj.Vert(v1-25-i*14, pnts[verts[-1].getpnt().getnum()+1]))
+
+            # second row of points, upper zint
+            verts.append(obj.Vert(v1-21-7-i*14, pnts[verts[-1].getpnt().getnum()+1]))
+            verts.append(obj.Vert(v1-24-7-i*14, pnts[verts[-1].getpnt().getnum()+1]))
+            verts.append(obj.Vert(v1-25-7-i*14, pnts[verts[-1].getpnt().getnum()+1]))
+
+
+        # bottom section at outlet
+        # lower zint
+        verts.append(obj.Vert(v0-21-ns*14, pnts[-8]))
+        verts.append(obj.Vert(v0-22-ns*14, pnts[-7]))
+        verts.append(obj.Vert(v0-23-ns*14, pnts[-6]))
+        verts.append(obj.Vert(v0-24-ns*14, pnts[-5]))
+
+        # upper zint
+        verts.append(obj.Vert(v1-21-ns*14, pnts[-4]))
+        verts.append(obj.Vert(v1-22-ns*14, pnts[-3]))
+        verts.append(obj.Vert(v1-23-ns*14, pnts[-2]))
+        verts.append(obj.Vert(v1-24-ns*14, pnts[-1]))
+
+
+    # geometry type 2
+    elif geomnum == 2:
+        # film inlet region
+        # lower zbound
+        verts.append(obj.Vert(41, pnts[0]))
+        verts.append(obj.Vert(102, pnts[1]))
+
+        verts.append(obj.Vert(124, pnts[2]))
+        verts.append(obj.Vert(123, pnts[3]))
+        verts.append(obj.Vert(122, pnts[4]))
+        verts.append(obj.Vert(121, pnts[5]))
+
+        verts.append(obj.Vert(152, pnts[6]))
+        verts.append(obj.Vert(151, pnts[7]))
+        verts.append(obj.Vert(150, pnts[8]))
+        verts.append(obj.Vert(149, pnts[9]))
+        verts.append(obj.Vert(148, pnts[10]))
+
+        verts.append(obj.Vert(180, pnts[11]))
+        verts.append(obj.Vert(179, pnts[12]))
+        verts.append(obj.Vert(178, pnts[13]))
+        verts.append(obj.Vert(177, pnts[14]))
+        verts.append(obj.Vert(176, pnts[15]))
+
+        # upper zbound
+        verts.append(obj.Vert(42, pnts[16]))
+        verts.append(obj.Vert(106, pnts[17]))
+
+        verts.append(obj.Vert(131, pnts[18]))
+        verts.append(obj.Vert(130, pnts[19]))
+        verts.append(obj.Vert(129, pnts[20]))
+        verts.append(obj.Vert(128, pnts[21]))
+
+        verts.append(obj.Vert(159, pnts[22]))
+        verts.append(obj.Vert(158, pnts[23]))
+        verts.append(obj.Vert(157, pnts[24]))
+        verts.append(obj.Vert(156, pnts[25]))
+        verts.append(obj.Vert(155, pnts[26]))
+
+        verts.append(obj.Vert(187, pnts[27]))
+        verts.append(obj.Vert(186, pnts[28]))
+        verts.append(obj.Vert(185, pnts[29]))
+        verts.append(obj.Vert(184, pnts[30]))
+        verts.append(obj.Vert(183, pnts[31]))
+
+
+        # structures
+        for i in range(ns):
+            # first row of points, lower zbound
+            for k in range(5):
+                verts.append(obj.Vert(208+56*i-k, pnts[verts[-1].getpnt().getnum()+1]))
+
+            # second row of points, lower zbound
+            for k in range(5):
+                verts.append(obj.Vert(verts[-5].getnum()+28, pnts[verts[-1].getpnt().getnum()+1]))
+
+            # first row of points, upper zbound
+            for k in range(5):
+                verts.append(obj.Vert(215+56*i-k, pnts[verts[-1].getpnt().getnum()+1]))
+
+            # second row of points, upper zbound
+            for k in range(5):
+                verts.append(obj.Vert(verts[-5].getnum()+28, pnts[verts[-1].getpnt().getnum()+1]))
+
+
+        # film outlet region
+        # lower zbound
+        verts.append(obj.Vert(37, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(101, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(85, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(69, pnts[verts[-1].getpnt().getnum()+1]))
+
+        # upper zbound
+        verts.append(obj.Vert(38, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(105, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(89, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(73, pnts[verts[-1].getpnt().getnum()+1]))
+
+
+        # film inlet region
+        # lower zint
+        v0 = 236 + ns*70
+        verts.append(obj.Vert(v0, pnts[numpnts_bounds]))
+        verts.append(obj.Vert(v0-1, pnts[verts[-1].getpnt().getnum()+1]))
+
+        verts.append(obj.Vert(v0-7, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(v0-8, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(v0-9, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(v0-10, pnts[verts[-1].getpnt().getnum()+1]))
+
+        verts.append(obj.Vert(v0-14, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(v0-17, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(v0-18, pnts[verts[-1].getpnt().getnum()+1]))
+
+        verts.append(obj.Vert(v0-21, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(v0-24, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(v0-25, pnts[verts[-1].getpnt().getnum()+1]))
+
+        # upper zint
+        v1 = 285 + ns*84
+        verts.append(obj.Vert(v1, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(v1-1, pnts[verts[-1].getpnt().getnum()+1]))
+
+        verts.append(obj.Vert(v1-7, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(v1-8, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(v1-9, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(v1-10, pnts[verts[-1].getpnt().getnum()+1]))
+
+        verts.append(obj.Vert(v1-14, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(v1-17, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(v1-18, pnts[verts[-1].getpnt().getnum()+1]))
+
+        verts.append(obj.Vert(v1-21, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(v1-24, pnts[verts[-1].getpnt().getnum()+1]))
+        verts.append(obj.Vert(v1-25, pnts[verts[-1].getpnt().getnum()+1]))
+
+
+        # structures
+        for i in range(ns):
+            # first row of points, lower zint
+            verts.append(obj.Vert(v0-28-i*14, pnts[verts[-1].getpnt().getnum()+1]))
+            verts.append(obj.Vert(v0-31-i*14, pnts[verts[-1].getpnt().getnum()+1]))
+            verts.append(obj.Vert(v0-32-i*14, pnts[verts[-1].getpnt().getnum()+1]))
+
+            # second row of points, lower zint
+            verts.append(obj.Vert(v0-28-7-i*14, pnts[verts[-1].getpnt().getnum()+1]))
+            verts.append(obj.Vert(v0-31-7-i*14, pnts[verts[-1].getpnt().getnum()+1]))
+            verts.append(obj.Vert(v0-32-7-i*14, pnts[verts[-1].getpnt().getnum()+1]))
+
+            # first row of points, upper zint
+            verts.append(obj.Vert(v1-28-i*14, pnts[verts[-1].getpnt().getnum()+1]))
+            verts.append(obj.Vert(v1-31-i*14, pnts[verts[-1].getpnt().getnum()+1]))
+            verts.append(obj.Vert(v1-32-i*14, pnts[verts[-1].getpnt().getnum()+1]))
+
+            # second row of points, upper zint
+            verts.append(obj.Vert(v1-28-7-i*14, pnts[verts[-1].getpnt().getnum()+1]))
+            verts.append(obj.Vert(v1-31-7-i*14, pnts[verts[-1].getpnt().getnum()+1]))
+            verts.append(obj.Vert(v1-32-7-i*14, pnts[verts[-1].getpnt().getnum()+1]))
+
+        # bottom section at outlet
+        # lower zint
+        verts.append(obj.Vert(v0-28-ns*14, pnts[-8]))
+        verts.append(obj.Vert(v0-29-ns*14, pnts[-7]))
+        verts.append(obj.Vert(v0-30-ns*14, pnts[-6]))
+        verts.append(obj.Vert(v0-31-ns*14, pnts[-5]))
+
+        # upper zint
+        verts.append(obj.Vert(v1-28-ns*14, pnts[-4]))
+        verts.append(obj.Vert(v1-29-ns*14, pnts[-3]))
+        verts.append(obj.Vert(v1-30-ns*14, pnts[-2]))
+        verts.append(obj.Vert(v1-31-ns*14, pnts[-1]))
+
+
+    # meshing
+    mshg = model.getmshg()        # meshing operations
+
+
+    # geometry type 1
+    if geomnum == 1:
+        # x direction
+        mshg.append(obj.Mesh(120, 121, dgr_mesh))       # grooves
+        mshg.append(obj.Mesh(121, 122, hi_mesh))        # film
+        mshg.append(obj.Mesh(122, 123, hd_mesh))        # distributor
+        mshg.append(obj.Mesh(123, 124, hg_mesh))        # gas space
+
+
+        # y direction
+        # top section at inlet
+        mshg.append(obj.Mesh(121, 70, li_mesh))         # smooth inlet
+        mshg.append(obj.Mesh(149, 121, lgr_mesh))       # first groove
+
+        # structures
+        for i in range(ns):
+            mshg.append(obj.Mesh(177+56*i, mshg[-1].getvert1(), ls_mesh))                   # structure
+            mshg.append(obj.Mesh(mshg[-1].getvert1()+28, mshg[-1].getvert1(), lgr_mesh))    # groove
+
+        # bottom section at outlet
+        mshg.append(obj.Mesh(69, mshg[-1].getvert1(), lo_mesh))                             # smooth outlet
+
+
+        # z direction
+        mshg.append(obj.Mesh(41, v0, ws1_mesh))         # side section 1 (at lower zbound)
+        mshg.append(obj.Mesh(v0, v1, wc_mesh))          # central section
+        mshg.append(obj.Mesh(v1, 42, ws2_mesh))         # side section 2 (at upper zbound)
+
+
+
+    # geometry type 2
+    elif geomnum == 2:
+        # x direction
+        mshg.append(obj.Mesh(148, 149, dgr_mesh))       # grooves
+        mshg.append(obj.Mesh(149, 150, hi_mesh))        # film
+        mshg.append(obj.Mesh(150, 151, hd_mesh))        # distributor
+        mshg.append(obj.Mesh(151, 152, hg_mesh))        # gas space
+
+
+        # y direction
+        # top section at inlet
+        mshg.append(obj.Mesh(123, 102, lag_mesh))       # gas space
+        mshg.append(obj.Mesh(149, 121, li_mesh))        # smooth inlet
+        mshg.append(obj.Mesh(177, 149, lgr_mesh))       # first groove
+
+        # structures
+        for i in range(ns):
+            mshg.append(obj.Mesh(205+56*i, mshg[-1].getvert1(), ls_mesh))                   # structure
+            mshg.append(obj.Mesh(mshg[-1].getvert1()+28, mshg[-1].getvert1(), lgr_mesh))    # groove
+
+        # bottom section at outlet
+        mshg.append(obj.Mesh(69, mshg[-1].getvert1(), lo_mesh))                             # smooth outlet
+
+
+        # z direction
+        mshg.append(obj.Mesh(41, v0, ws1_mesh))         # side section 1 (at lower zbound)
+        mshg.append(obj.Mesh(v0, v1, wc_mesh))          # central section
+        mshg.append(obj.Mesh(v1, 42, ws2_mesh))         # side section 2 (at upper zbound)
+    return model
+
+
+# model generation from parameter file (see README), geometry type: 3D, horizontal structures
+# names: part names, sizes: default cell sizes in [m], raises ValueError for invalid parameters
+def build_3d_horizontal(params, names=None, sizes=None):
+    names, sizes = buildsettings(params, names, sizes, meshsizes_3D)
+    projname = fnc.specproject(params)
+
+    # geometric variant
+    inlettype = fnc.specvariant(params, "inlet", ["1", "2"])
+    geomtype, geomnum = variant("3D-horizontal-", inlettype)
+    periodic = fnc.specbool(params, "periodic") if geomnum == 1 else False
+    refconffile = fnc.specreference(params, geomtype)
+
+    # geometric parameters
+    xgeom, ygeom, zgeom = geometry_3d_horizontal(inlettype)
+    fnc.specxgeom(params, xgeom, refconffile)
+    fnc.specygeom_hstruc(params, ygeom, refconffile)
+    fnc.speczgeom(params, zgeom, refconffile)
+
+    # meshing parameters
+    xsects, ysects, zsects = sections_3d_horizontal(inlettype, xgeom, ygeom, zgeom)
+    meshref = buildmeshing(params, refconffile, [xsects, ysects, zsects], lambda: defaultmeshing_3d_horizontal(inlettype, xsects, ysects, zsects, sizes), geomtype, [xgeom, ygeom, zgeom])
+
+    model = model_3d_horizontal(projname, inlettype, periodic, xgeom, ygeom, zgeom, xsects, ysects, zsects, names)
+    model.setmeshref(meshref)
+    return model
+
+
+#################################################################### SCRIPTS ####################################################################
+# model generation from parameter file by script name
+builds = {
+    "2D-smooth.py": build_2d_smooth,
+    "2D-horizontal-structures.py": build_2d_horizontal,
+    "3D-smooth.py": build_3d_smooth,
+    "3D-horizontal-structures.py": build_3d_horizontal,
+}
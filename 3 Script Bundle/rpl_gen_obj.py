@@ -2,11 +2,75 @@
 # it is required to run any ICEM mesh creation script
 
 
+# dependencies
+import sqlite3                              # persistent mesh cache and config file catalog
+import os                                   # paths of config file catalog
+from array import array                     # entity store
+from collections import OrderedDict         # in-process mesh cache
+import numpy as np                          # entity store export
+import itertools                            # blocking lattice of .rpl replay
+import time                                 # run time of replayed commands
+import mmap                                 # rows of memory-mapped mesh buffers
+
+
 # definition of global precision
 # numerical precision of point locations, default = 6
 geomprec = 6        
 # numerical precision for mesh calculations, default = 6
-meshprec = 6            # potentially higher runtime with higher values!   
+meshprec = 6
+
+
+# definition of mesh cache (node distributions of identical sections are reused between sections and runs)
+meshcache_size = 4096               # maximum number of node distributions kept in memory, default = 4096 (0 disables the cache)
+meshcache_file = ""                 # optional SQLite file next to the scripts, keeping node distributions between runs, e.g. "meshcache.db", default = "" (disabled)
+meshcache_filesize = 100000         # maximum number of node distributions kept in the SQLite file, default = 100000
+
+
+# definition of config file catalog (.conf files in the script folder and subfolders are indexed for reference lookup)
+confcatalog_file = ""                # optional SQLite file next to the scripts, updated with new and modified .conf files on lookup, e.g. "confcatalog.db", default = "" (folders are searched on lookup)
+
+
+# definition of mesh quality check (node distributions of all sections are checked before the files are written)
+meshcheck = True                    # abort scripts before the files are written if a limit is exceeded (False: exceeded limits are printed as warnings), default = True
+maxrate = 1.5                       # maximum growth rate of neighbouring cells within a section (also limits the side sections of the default 3D meshing), default = 1.5
+maxjump = 2.5                       # maximum ratio of cell sizes at the interface of two sections, default = 2.5
+maxaspect = 100.0                   # maximum aspect ratio of cells, default = 100.0
+
+
+# definition of mesh export (option --export of the scripts, structured mesh computed from the blocking and meshing of the .rpl file)
+mshtypes = {}                       # Fluent zone type per part name (boundary condition type of .cgns files), e.g. {"FILMINLET": "velocity-inlet", "GASTOP": "pressure-outlet"}, parts not listed are walls, default = {}
+mshbinary = True                    # node coordinates and faces of Fluent mesh files in binary sections (False: ASCII sections), default = True
+exportchunk = 262144                # number of nodes and faces formatted or written at once, default = 262144
+mapcells = 10000000                 # meshes with at least this number of cells are exported out-of-core (node and cell numbers in memory-mapped .npy files), default = 10000000 (0: always, -1: never)
+mapdir = ""                         # folder of the temporary .npy files (removed after the export), default = "" (temporary folder of the system)
+exportworkers = None                # number of processes computing the zones of .cgns files, default = None (number of processors)
+foamdepth = 0.001                   # thickness in z of 2D meshes in blockMeshDict files (one cell) [m], default = 0.001
+
+
+# definition of entity names (points, curves and surfaces)
+namepad = 4                         # minimum number of digits of entity numbers, e.g. "pnt.0001", default = 4
+# coincident entities: points with identical coordinates (rounded to geomprec) and curves with identical end points
+mergeentities = False               # reuse existing points and curves instead of creating coincident ones, default = False (the scripts create no coincident entities)
+
+
+# definition of output buffer (lines of .rpl files are streamed to the file as they are created)
+writebuffer = 1048576               # buffer size of the .rpl file handle in bytes, default = 1048576
+printchunk = 65536                  # number of points, curves, surfaces and associations formatted at once, default = 65536
+
+
+# definition of Tcl loops (blocks of lines repeated with constant increments of all numbers, e.g. structures, are written as Tcl procedure called in a loop)
+rplloops = False                    # write repeated blocks of .rpl lines as Tcl loops (run .rpl file via File > Replay Scripts > Run from script file), default = False
+loopperiod = 1000                   # maximum number of lines of a repeated block, default = 1000
+looprepeat = 3                      # minimum number of repetitions of a block written as loop, default = 3
+
+
+# definition of redundant-command pass (commands without effect are removed from .rpl files)
+rplprune = True                     # remove deletion of geometry not yet created and merge consecutive undo steps of the same blocking operation, default = True
+
+
+# definition of undo history of .rpl files (replay without undo history is faster and needs less memory in ICEM, the resulting model is identical)
+rplundo = "script"                  # "script": one undo group for the whole script, "phase": one undo group per phase (geometry, blocking, associations, meshing),
+                                    # "none": no undo groups and no undo steps of blocking operations (unattended batch replay), default = "script"
 
 
 # definition of global geometry names (retain default names recommended to ensure reference config file compatibility)
@@ -78,6 +142,193 @@ wc_geomdescr = "size of central section [mm]"                   # central sectio
 ws_geomdescr = "size of side sections [mm]"                     # side sections required for meshing
 
 
+################################################################# ENTITY STORE ##################################################################
+# entity store class definition, points, curves, surfaces and associations of one model kept in typed arrays
+# entities are referenced by their index in the store, the entity classes below are views of one index
+# the index of a point, curve or surface is also its number (entity counts and store are reset together by fnc.resetcounts), no numbers are stored
+class EntityStore:
+    # entity store constructor
+    def __init__(self):
+        self.xyz = array("d")               # point coordinates, x, y, z per point
+        self.crvpnts = array("i")           # curve points, indices of first and second point per curve
+        self.crvparts = array("i")          # curve part IDs, -1 if not associated to a part
+        self.srfcrvs = array("i")           # surface curves, indices of 4 curves per surface, unused entries -1
+        self.srfparts = array("i")          # surface part IDs, -1 if not associated to a part
+        self.vertnums = array("i")          # vertex associations (3D), vertex numbers
+        self.vertpnts = array("i")          # vertex associations (3D), indices of associated points
+        self.edgeverts = array("i")         # edge associations (2D), first and second vertex per edge
+        self.edgecrvs = array("i")          # edge associations (2D), indices of associated curves
+        self.parts = []                     # part names, index is part ID
+        self.pntkeys = {} if mergeentities else None    # spatial hash of points, {(x, y, z): index}, only if coincident entities are merged
+        self.crvkeys = {} if mergeentities else None    # curves by end points, {(pnt1, pnt2): index} with pnt1 < pnt2, only if coincident entities are merged
+        self.mergedpnts = 0                 # number of merged coincident points
+        self.mergedcrvs = 0                 # number of merged coincident curves
+
+    # entity store destructor
+    def __del__(self):
+        pass
+
+    # add entities, returns index of entity
+    def addpnt(self, x, y, z):
+        self.xyz.extend((x, y, z))
+        if self.pntkeys is not None:
+            self.pntkeys[(x, y, z)] = len(self.xyz)//3 - 1
+        return len(self.xyz)//3 - 1
+    def addcrv(self, pnt1, pnt2):
+        self.crvpnts.extend((pnt1, pnt2))
+        self.crvparts.append(-1)
+        if self.crvkeys is not None:
+            self.crvkeys[(min(pnt1, pnt2), max(pnt1, pnt2))] = len(self.crvparts) - 1
+        return len(self.crvparts) - 1
+    def addsrf(self, crvs):
+        if not 0 < len(crvs) <= 4:
+            raise ValueError(f"surfaces are defined by 1 to 4 curves, got {len(crvs)}")
+        self.srfcrvs.extend(crvs + [-1]*(4 - len(crvs)))
+        self.srfparts.append(-1)
+        return len(self.srfparts) - 1
+    def addvert(self, num, pnt):
+        self.vertnums.append(num)
+        self.vertpnts.append(pnt)
+        return len(self.vertnums) - 1
+    def addedge(self, vert1, vert2, crv):
+        self.edgeverts.extend((vert1, vert2))
+        self.edgecrvs.append(crv)
+        return len(self.edgecrvs) - 1
+    def addpart(self, name):
+        self.parts.append(name)
+        return len(self.parts) - 1
+
+    # find coincident entities, returns index of existing entity or None
+    def findpnt(self, x, y, z):             # point with coordinates x, y, z
+        if self.pntkeys is None:
+            return None
+        idx = self.pntkeys.get((x, y, z))
+        if idx is not None:
+            self.mergedpnts += 1
+        return idx
+    def findcrv(self, pnt1, pnt2):          # curve between points pnt1 and pnt2 (indices, either direction)
+        if self.crvkeys is None:
+            return None
+        idx = self.crvkeys.get((min(pnt1, pnt2), max(pnt1, pnt2)))
+        if idx is not None:
+            self.mergedcrvs += 1
+        return idx
+
+    # part ID of curve or surface, -1 if not associated to a part
+    def getpart(self, geom):
+        if isinstance(geom, Curve):
+            return self.crvparts[geom.idx]
+        elif isinstance(geom, Surface):
+            return self.srfparts[geom.idx]
+        return -1
+
+    # set part ID of curve or surface
+    def setpart(self, geom, part):
+        if isinstance(geom, Curve):
+            self.crvparts[geom.idx] = part
+        elif isinstance(geom, Surface):
+            self.srfparts[geom.idx] = part
+
+    # getter functions, copies of the store as numpy structured arrays
+    def getpnts(self):                      # points: x, y, z, num
+        pnts = np.empty(len(self.xyz)//3, dtype=[("x", "f8"), ("y", "f8"), ("z", "f8"), ("num", "i4")])
+        xyz = np.array(self.xyz, dtype="f8").reshape(-1, 3)
+        pnts["x"], pnts["y"], pnts["z"] = xyz[:, 0], xyz[:, 1], xyz[:, 2]
+        pnts["num"] = np.arange(len(pnts))
+        return pnts
+    def getcrvs(self):                      # curves: point indices pnt1, pnt2, num, part
+        crvs = np.empty(len(self.crvparts), dtype=[("pnt1", "i4"), ("pnt2", "i4"), ("num", "i4"), ("part", "i4")])
+        pnts = np.array(self.crvpnts, dtype="i4").reshape(-1, 2)
+        crvs["pnt1"], crvs["pnt2"] = pnts[:, 0], pnts[:, 1]
+        crvs["num"], crvs["part"] = np.arange(len(crvs)), self.crvparts
+        return crvs
+    def getsrfs(self):                      # surfaces: curve indices crvs (4, unused entries -1), num, part
+        srfs = np.empty(len(self.srfparts), dtype=[("crvs", "i4", (4,)), ("num", "i4"), ("part", "i4")])
+        srfs["crvs"] = np.array(self.srfcrvs, dtype="i4").reshape(-1, 4)
+        srfs["num"], srfs["part"] = np.arange(len(srfs)), self.srfparts
+        return srfs
+    def getparts(self):                     # part names, index is part ID
+        return self.parts
+    def getmerged(self):                    # number of merged coincident points and curves
+        return self.mergedpnts, self.mergedcrvs
+
+
+# entity view class definition, base class of all entities kept in the entity store
+class View:
+    __slots__ = ("store", "idx")
+
+    # view of existing entity in entity store
+    @classmethod
+    def view(cls, store, idx):
+        ent = cls.__new__(cls)
+        ent.store = store                   # entity store
+        ent.idx = idx                       # index of entity in entity store
+        return ent
+
+    # views are equal if they refer to the same entity
+    def __eq__(self, other):
+        return type(self) is type(other) and self.store is other.store and self.idx == other.idx
+    def __hash__(self):
+        return hash((type(self), id(self.store), self.idx))
+
+
+# entity list class definition, list of all entities of one type in the entity store, entities are added in order of creation
+class EntityList:
+    # entity list constructor
+    def __init__(self, store, cls):
+        self.store = store                  # entity store
+        self.cls = cls                      # entity class, e.g. Point
+        self.size = 0                       # number of entries in list
+        self.count = 0                      # number of distinct entities in list, less than size if coincident entities were merged
+        self.slots = None                   # entity index per entry, only if coincident entities were merged (else identical to entry)
+
+    # entity list destructor
+    def __del__(self):
+        pass
+
+    # getter functions
+    def getcount(self):                     # number of distinct entities
+        return self.count
+
+    # add entity to list, new entities in order of creation or existing (merged) entities
+    def append(self, ent):
+        if ent.store is not self.store or ent.idx > self.count:
+            raise ValueError(f"{self.cls.__name__.lower()} entities must be added to the list in order of creation")
+        if ent.idx == self.count:
+            self.count += 1
+        elif self.slots is None:
+            self.slots = array("i", range(self.size))
+        if self.slots is not None:
+            self.slots.append(ent.idx)
+        self.size += 1
+
+    # list functions, entities are returned as views
+    def __len__(self):
+        return self.size
+    def __getitem__(self, idx):
+        if idx.__class__ is slice:
+            return [self.cls.view(self.store, i) for i in range(*idx.indices(self.size))]
+        if idx < 0:
+            idx += self.size
+        if idx < 0 or idx >= self.size:
+            raise IndexError(f"{self.cls.__name__.lower()} index out of range")
+        ent = self.cls.__new__(self.cls)
+        ent.store = self.store
+        ent.idx = idx if self.slots is None else self.slots[idx]
+        return ent
+    def __iter__(self):
+        for idx in range(self.size):
+            yield self[idx]
+
+    # print function for .rpl, all distinct entities at once
+    def print(self, list):
+        return self.cls.printrange(self.store, 0, self.count, list)
+
+
+# entity store of the model currently generated, replaced by fnc.resetcounts()
+store = EntityStore()
+
+
 ############################################################### GEOMETRY OBJECTS ################################################################
 # geometry class definition
 class Geometry:
@@ -132,147 +383,147 @@ class Geometry:
         print(self.geominfo())
 
 
-# point class definition
-class Point:
+# point class definition, view of a point in the entity store
+class Point(View):
+    __slots__ = ()
     count = 0
     
     # point constructor
     def __init__(self, x, y, z):
-        # set coordinates 
-        self.x = round(x, geomprec)     # x coordinate of point
-        self.y = round(y, geomprec)     # y coordinate of point
-        self.z = round(z, geomprec)     # z coordinate of point
-        
-        # set point name and number. expecting maximum of 9999 points. 
-        if Point.count >= 0 and Point.count <= 9:
-            self.name = "pnt.000" + str(Point.count)
-        elif Point.count >= 10 and Point.count <= 99:
-            self.name = "pnt.00" + str(Point.count)
-        elif Point.count >= 100 and Point.count <= 999:
-            self.name = "pnt.0" + str(Point.count)
-        else:
-            self.name = "pnt." + str(Point.count)
-        self.num = Point.count
+        x, y, z = round(x, geomprec), round(y, geomprec), round(z, geomprec)
+        self.store = store
 
-        # increase point count everytime a point gets created
-        Point.count += 1
+        # coincident point, existing point is used instead (if mergeentities)
+        self.idx = store.findpnt(x, y, z)
+        if self.idx is None:
+            # add coordinates to entity store, number (index in entity store) zero-padded to namepad digits in name (larger numbers use more digits)
+            self.idx = store.addpnt(x, y, z)
 
-    # point destructor
-    def __del__(self):
-        pass
+            # increase point count everytime a point gets created
+            Point.count += 1
 
     # getter functions
     def getx(self):                     # x coordinate of point
-        return self.x
+        return self.store.xyz[3*self.idx]
     def gety(self):                     # y coordinate of point
-        return self.y
+        return self.store.xyz[3*self.idx + 1]
     def getz(self):                     # z coordinate of point
-        return self.z
+        return self.store.xyz[3*self.idx + 2]
     def getname(self):                  # name of point
-        return self.name
+        return f"pnt.{self.getnum():0{namepad}d}"
     def getnum(self):                   # number of point
-        return self.num
+        return self.idx
     
     # print function for .rpl
     def print(self, list):
-        line = "ic_point {} GEOM " + f"{self.name} {self.x},{self.y},{self.z}\n"    
-        list.append(line)
+        return Point.printrange(self.store, self.idx, self.idx + 1, list)
+
+    # print function for .rpl, points start to stop of entity store
+    @staticmethod
+    def printrange(store, start, stop, list):
+        pad = f"0{namepad}d"                  # format of zero-padded entity numbers
+        for first in range(start, stop, printchunk):
+            last = min(first + printchunk, stop)
+            xyz = store.xyz[3*first:3*last].tolist()
+            nums = range(first, last)
+            list.extend(["ic_point {} GEOM " + f"pnt.{num:{pad}} {x},{y},{z}\n" for num, x, y, z in zip(nums, xyz[0::3], xyz[1::3], xyz[2::3])])
         return list
 
 
-# curve class definition
-class Curve:
+# curve class definition, view of a curve in the entity store
+class Curve(View):
+    __slots__ = ()
     count = 0
 
     # curve constructor
     def __init__(self, pnt1, pnt2):
-        # set point association
-        self.pnt1 = pnt1                # first point
-        self.pnt2 = pnt2                # second point
-        
-        # set curve name and number. expecting maximum of 9999 curves. 
-        if Curve.count >= 0 and Curve.count <= 9:
-            self.name = "crv.000" + str(Curve.count)
-        elif Curve.count >= 10 and Curve.count <= 99:
-            self.name = "crv.00" + str(Curve.count)
-        elif Curve.count >= 100 and Curve.count <= 999:
-            self.name = "crv.0" + str(Curve.count)
-        else:
-            self.name = "crv." + str(Curve.count)
-        self.num = Curve.count
-        
-        # increase curve count everytime a curve gets created
-        Curve.count += 1
+        self.store = pnt1.store
 
-    # curve destructor
-    def __del__(self):
-        pass
+        # coincident curve, existing curve is used instead (if mergeentities)
+        self.idx = self.store.findcrv(pnt1.idx, pnt2.idx)
+        if self.idx is None:
+            # add point association to entity store, number (index in entity store) zero-padded to namepad digits in name (larger numbers use more digits)
+            self.idx = self.store.addcrv(pnt1.idx, pnt2.idx)
+        
+            # increase curve count everytime a curve gets created
+            Curve.count += 1
 
     # getter functions
     def getpnt1(self):                  # first point                     
-        return self.pnt1
+        return Point.view(self.store, self.store.crvpnts[2*self.idx])
     def getpnt2(self):                  # second point
-        return self.pnt2
+        return Point.view(self.store, self.store.crvpnts[2*self.idx + 1])
     def getname(self):                  # name of curve
-        return self.name
+        return f"crv.{self.getnum():0{namepad}d}"
     def getnum(self):                   # number of curve
-        return self.num
+        return self.idx
+    def getpart(self):                  # part ID of curve, -1 if not associated to a part
+        return self.store.crvparts[self.idx]
     
     # print function for .rpl
     def print(self, list):
-        line1 = f"ic_delete_geometry curve names {self.name} 0\n"
-        line2 = f"ic_curve point GEOM {self.name} " + "{" + f"{self.pnt1.getname()} {self.pnt2.getname()}" + "}\n"
-        list.append(line1)
-        list.append(line2)
+        return Curve.printrange(self.store, self.idx, self.idx + 1, list)
+
+    # print function for .rpl, curves start to stop of entity store
+    @staticmethod
+    def printrange(store, start, stop, list):
+        pad = f"0{namepad}d"                  # format of zero-padded entity numbers
+        for first in range(start, stop, printchunk):
+            last = min(first + printchunk, stop)
+            pnts = store.crvpnts[2*first:2*last].tolist()
+            nums = range(first, last)
+            lines = []
+            for num, pnt1, pnt2 in zip(nums, pnts[0::2], pnts[1::2]):
+                name = f"crv.{num:{pad}}"
+                lines.append(f"ic_delete_geometry curve names {name} 0\n")
+                lines.append(f"ic_curve point GEOM {name} " + "{" + f"pnt.{pnt1:{pad}} pnt.{pnt2:{pad}}" + "}\n")
+            list.extend(lines)
         return list
 
 
-# surface class definition
-class Surface:
+# surface class definition, view of a surface in the entity store
+class Surface(View):
+    __slots__ = ()
     count = 0
 
     # surface constructor
     def __init__(self, curves):
-        self.curves = curves            # list of curves
-        
-        # set surface name and number. expecting maximum of 9999 surfaces. 
-        if Surface.count >= 0 and Surface.count <= 9:
-            self.name = "srf.000" + str(Surface.count)
-        elif Surface.count >= 10 and Surface.count <= 99:
-            self.name = "srf.00" + str(Surface.count)
-        elif Surface.count >= 100 and Surface.count <= 999:
-            self.name = "srf.0" + str(Surface.count)
-        else:
-            self.name = "srf." + str(Surface.count)
-        self.num = Surface.count
+        # add curve association to entity store, number (index in entity store) zero-padded to namepad digits in name (larger numbers use more digits)
+        self.store = curves[0].store
+        self.idx = self.store.addsrf([crv.idx for crv in curves])
         
         # increase surface count everytime a surface gets created
         Surface.count += 1
 
-    # surface destructor
-    def __del__(self):
-        pass
-
     # getter functions
     def getcrvs(self):                  # list of curves
-        return self.curves
+        crvs = self.store.srfcrvs[4*self.idx:4*self.idx + 4]
+        return [Curve.view(self.store, crv) for crv in crvs if crv >= 0]
     def getname(self):                  # name of surface
-        return self.name
+        return f"srf.{self.getnum():0{namepad}d}"
     def getnum(self):                   # number of surface
-        return self.num
+        return self.idx
+    def getpart(self):                  # part ID of surface, -1 if not associated to a part
+        return self.store.srfparts[self.idx]
     
     # print function for .rpl
     def print(self, list):
-        # list of curves in one string
-        if len(self.curves) > 1:
-            crvlist = "{"
-            for crv in self.curves[:-1]:
-                crvlist += crv.getname() + " "
-            crvlist += self.curves[-1].getname() + "}"
-        else:
-            crvlist = "{" + self.curves[0].getname() + "}"
-        line = f"ic_surface 2-4crvs GEOM {self.name} " + "{0.0 " + crvlist + "}\n"
-        list.append(line)
+        return Surface.printrange(self.store, self.idx, self.idx + 1, list)
+
+    # print function for .rpl, surfaces start to stop of entity store
+    @staticmethod
+    def printrange(store, start, stop, list):
+        pad = f"0{namepad}d"                  # format of zero-padded entity numbers
+        for first in range(start, stop, printchunk):
+            last = min(first + printchunk, stop)
+            crvs = store.srfcrvs[4*first:4*last].tolist()
+            nums = range(first, last)
+            lines = []
+            for i, num in enumerate(nums):
+                # list of curves in one string
+                crvlist = "{" + " ".join([f"crv.{crv:{pad}}" for crv in crvs[4*i:4*i + 4] if crv >= 0]) + "}"
+                lines.append(f"ic_surface 2-4crvs GEOM srf.{num:{pad}} " + "{0.0 " + crvlist + "}\n")
+            list.extend(lines)
         return list
 
 
@@ -315,7 +566,10 @@ class Part:
     # part constructor
     def __init__(self, name):
         self.name = name                # name of part
-        self.geom = []                  # list of geometry associated with this part
+        self.store = store              # entity store of associated geometry
+        self.id = store.addpart(name)   # part ID in entity store
+        self.kind = None                # class of associated geometry, curves or surfaces
+        self.geom = array("i")          # indices of geometry associated with this part
 
     # part destructor
     def __del__(self):
@@ -324,35 +578,47 @@ class Part:
     # getter functions
     def getname(self):                  # name of part
         return self.name
+    def getid(self):                    # part ID in entity store
+        return self.id
     def getgeom(self):                  # list of geometry associated with this part
-        return self.geom
+        return [self.kind.view(self.store, idx) for idx in self.geom]
     
     # setter functions
     def setgeom(self, geom):            # list of geometry
-        self.geom = geom
-    def addgeom(self, obj):             # additional entry to list of geometry
-        self.geom.append(obj)
+        self.kind = None
+        self.geom = array("i")
+        for obj in geom:
+            self.addgeom(obj)
+    def addgeom(self, obj):             # additional entry to list of geometry, geometry already associated with this part is skipped
+        if self.store.getpart(obj) == self.id:
+            return
+        # parts can be either curves or surfaces, ic_geo_set_part sets one type per command
+        if self.kind is not None and type(obj) is not self.kind:
+            raise ValueError(f"part {self.name} contains {self.kind.__name__.lower()}s, cannot add {type(obj).__name__.lower()} {obj.getname()}")
+        self.kind = type(obj)
+        self.geom.append(obj.idx)
+        self.store.setpart(obj, self.id)
     
     # print function for .rpl
     def print(self, list): 
         if len(self.geom) > 0:
             # parts can be either curves or surfaces
-            if isinstance(self.geom[0], Curve):
+            if self.kind is Curve:
                 line = "ic_geo_set_part curve "
-            elif isinstance(self.geom[0], Surface):
+                prefix = "crv"
+            elif self.kind is Surface:
                 line = "ic_geo_set_part surface "
+                prefix = "srf"
         # empty part list
         else:
             return list
         
         # make list of geometry
+        pad = f"0{namepad}d"                  # format of zero-padded entity numbers
         if len(self.geom) > 1:
-            geomlist = "{"
-            for prt in self.geom[:-1]:
-                geomlist += prt.getname() + " "
-            geomlist += self.geom[-1].getname() + "}"
+            geomlist = "{" + " ".join([f"{prefix}.{idx:{pad}}" for idx in self.geom]) + "}"
         else:            
-            geomlist = self.geom[0].getname()
+            geomlist = f"{prefix}.{self.geom[0]:{pad}}"
         
         line += geomlist + f" {self.name} 0\n"
         list.append(line)
@@ -362,6 +628,8 @@ class Part:
 ############################################################### BLOCKING OBJECTS ################################################################
 # split block operation class definition
 class Split:
+    __slots__ = ("pnt", "vert1", "vert2", "parts")
+
     # split constructor
     def __init__(self, pnt, vert1, vert2, parts):
         # set point and vertice associations
@@ -395,6 +663,9 @@ class Split:
         line1 = "ic_hex_undo_major_start split_grid\n"
         line2 = f"ic_hex_split_grid {self.vert1} {self.vert2} {self.pnt.getname()} m GEOM {partlist} VORFN\n"
         line3 = "ic_hex_undo_major_end split_grid\n"
+        if rplundo == "none":
+            list.append(line2)
+            return list
         list.append(line1)
         list.append(line2)
         list.append(line3)
@@ -403,6 +674,8 @@ class Split:
 
 # delete block operation class definition
 class Delete:
+    __slots__ = ("blk",)
+
     # delete constructor
     def __init__(self, blk):
         # set point and vertice associations
@@ -427,58 +700,77 @@ class Delete:
         return list
 
 
-# vertex association operation class definition (3D)
-class Vert:
+# vertex association operation class definition (3D), view of a vertex association in the entity store
+class Vert(View):
+    __slots__ = ()
+
     # vertex constructor
     def __init__(self, num, pnt):
-        self.num = num                  # number of vertex
-        self.pnt = pnt                  # vertex associated point
-
-    # vertex destructor
-    def __del__(self):
-        pass
+        # add vertex number and associated point to entity store
+        self.store = pnt.store
+        self.idx = self.store.addvert(num, pnt.idx)
 
     # getter functions
     def getnum(self):                  # number of vertex
-        return self.num
+        return self.store.vertnums[self.idx]
     def getpnt(self):                  # vertex associated point
-        return self.pnt
+        return Point.view(self.store, self.store.vertpnts[self.idx])
     
     # print function for .rpl
     def print(self, list): 
-        line = f"ic_hex_move_node {self.num} {self.pnt.getname()}\n"
-        list.append(line)
+        return Vert.printrange(self.store, self.idx, self.idx + 1, list)
+
+    # print function for .rpl, vertex associations start to stop of entity store
+    @staticmethod
+    def printrange(store, start, stop, list):
+        pad = f"0{namepad}d"                  # format of zero-padded entity numbers
+        for first in range(start, stop, printchunk):
+            last = min(first + printchunk, stop)
+            nums = store.vertnums[first:last].tolist()
+            pnts = store.vertpnts[first:last].tolist()
+            list.extend([f"ic_hex_move_node {num} pnt.{pnt:{pad}}\n" for num, pnt in zip(nums, pnts)])
         return list
 
 
-# edge association operation class definition (2D)
-class Edge:
+# edge association operation class definition (2D), view of an edge association in the entity store
+class Edge(View):
+    __slots__ = ()
+
     # edge constructor
     def __init__(self, vert1, vert2, crv):
-        self.vert1 = vert1              # first vertex of edge
-        self.vert2 = vert2              # second vertex of edge
-        self.crv = crv                  # edge associated curve
-
-    # edge destructor
-    def __del__(self):
-        pass
+        # add vertices and associated curve to entity store
+        self.store = crv.store
+        self.idx = self.store.addedge(vert1, vert2, crv.idx)
 
     # getter functions
     def getvert1(self):                 # first vertex of edge
-        return self.vert1
+        return self.store.edgeverts[2*self.idx]
     def getvert2(self):                 # second vertex of edge
-        return self.vert2
+        return self.store.edgeverts[2*self.idx + 1]
     def getcrv(self):                   # edge associated curve
-        return self.crv
+        return Curve.view(self.store, self.store.edgecrvs[self.idx])
     
     # print function for .rpl
     def print(self, list): 
-        line1 = "ic_hex_undo_major_start set_edge_projection\n"
-        line2 = f"ic_hex_set_edge_projection {self.vert1} {self.vert2} 0 1 {self.crv.getname()}\n"
-        line3 = "ic_hex_undo_major_end set_edge_projection\n"     
-        list.append(line1)
-        list.append(line2)
-        list.append(line3)
+        return Edge.printrange(self.store, self.idx, self.idx + 1, list)
+
+    # print function for .rpl, edge associations start to stop of entity store
+    @staticmethod
+    def printrange(store, start, stop, list):
+        pad = f"0{namepad}d"                  # format of zero-padded entity numbers
+        for first in range(start, stop, printchunk):
+            last = min(first + printchunk, stop)
+            verts = store.edgeverts[2*first:2*last].tolist()
+            crvs = store.edgecrvs[first:last].tolist()
+            lines = []
+            for vert1, vert2, crv in zip(verts[0::2], verts[1::2], crvs):
+                if rplundo == "none":
+                    lines.append(f"ic_hex_set_edge_projection {vert1} {vert2} 0 1 crv.{crv:{pad}}\n")
+                    continue
+                lines.append("ic_hex_undo_major_start set_edge_projection\n")
+                lines.append(f"ic_hex_set_edge_projection {vert1} {vert2} 0 1 crv.{crv:{pad}}\n")
+                lines.append("ic_hex_undo_major_end set_edge_projection\n")
+            list.extend(lines)
         return list
 
 
@@ -559,6 +851,8 @@ class Section:
 
 # mesh class definition
 class Mesh():
+    __slots__ = ("vert1", "vert2", "mesh")
+
     # mesh constructor
     def __init__(self, vert1, vert2, mesh):
         self.vert1 = vert1                  # first vertex of edge to be meshed
@@ -589,4 +883,843 @@ class Mesh():
         line = f"ic_hex_set_mesh {self.vert1} {self.vert2} n {self.mesh[1]} h1rel {self.mesh[2]} h2rel {self.mesh[3]} r1 {self.mesh[4]} r2 {self.mesh[5]} lmax {self.mesh[6]} {self.mesh[0]} copy_to_parallel unlocked\n"
         list.append(line)
         return list
-    
\ No newline at end of file
+
+
+################################################################# MODEL OBJECTS #################################################################
+# model class definition, generated geometry, blocking and meshing of one ICEM project
+class Model:
+    # model constructor
+    def __init__(self, name, geomtype, geoms, sects, ns=0):
+        self.name = name                    # project name
+        self.geomtype = geomtype            # geometry type, e.g. "3D-horizontal-1"
+        self.geoms = geoms                  # geometries per dimension [xgeom, ygeom] or [xgeom, ygeom, zgeom]
+        self.sects = sects                  # meshing sections per dimension [xsects, ysects] or [xsects, ysects, zsects]
+        self.ns = ns                        # number of structures
+        self.store = store                  # entity store of points, curves, surfaces and associations
+        self.prts = []                      # parts
+        self.pnts = EntityList(store, Point)        # points
+        self.crvs = EntityList(store, Curve)        # curves
+        self.srfs = EntityList(store, Surface)      # surfaces (3D)
+        self.blkg = []                      # blocking operations (split, deletion)
+        self.assoc = EntityList(store, Vert if len(geoms) == 3 else Edge)   # edge-curve (2D) or vertex-point (3D) associations
+        self.mshg = []                      # meshing operations
+        self.meshref = None                 # config file used as reference for meshing, None if not meshed with reference
+        self.pruned = 0                     # number of lines removed from the .rpl file by the redundant-command pass
+
+    # model destructor
+    def __del__(self):
+        pass
+
+    # getter functions
+    def getname(self):                      # project name
+        return self.name
+    def getgeomtype(self):                  # geometry type
+        return self.geomtype
+    def getdim(self):                       # number of dimensions
+        return len(self.geoms)
+    def getgeoms(self):                     # geometries per dimension
+        return self.geoms
+    def getsects(self):                     # meshing sections per dimension
+        return self.sects
+    def getns(self):                        # number of structures
+        return self.ns
+    def getstore(self):                     # entity store
+        return self.store
+    def getprts(self):                      # parts
+        return self.prts
+    def getpnts(self):                      # points
+        return self.pnts
+    def getcrvs(self):                      # curves
+        return self.crvs
+    def getsrfs(self):                      # surfaces
+        return self.srfs
+    def getblkg(self):                      # blocking operations
+        return self.blkg
+    def getassoc(self):                     # edge or vertex associations
+        return self.assoc
+    def getmshg(self):                      # meshing operations
+        return self.mshg
+    def getmeshref(self):                   # config file used as reference for meshing
+        return self.meshref
+    def getpruned(self):                    # number of lines removed from the .rpl file by the redundant-command pass
+        return self.pruned
+    def getbody(self):                      # body part (fluid)
+        for prt in self.prts:
+            if isinstance(prt, Body):
+                return prt
+
+    # setter functions
+    def setmeshref(self, meshref):          # config file used as reference for meshing
+        self.meshref = meshref
+    def setpruned(self, pruned):            # number of lines removed from the .rpl file by the redundant-command pass
+        self.pruned = pruned
+
+    # print model info to console
+    def printinfo(self):
+        print(f"\t- points: {self.pnts.getcount()}")
+        print(f"\t- curves: {self.crvs.getcount()}")
+        if self.getdim() == 3:
+            print(f"\t- surfaces: {self.srfs.getcount()}")
+        print(f"\t- blocking operations: {len(self.blkg)}")
+        print(f"\t- {'vertex' if self.getdim() == 3 else 'edge'} associations: {self.assoc.getcount()}")
+        print(f"\t- meshing operations: {len(self.mshg)}")
+        if mergeentities:
+            print(f"\t- merged coincident points: {self.store.getmerged()[0]}, curves: {self.store.getmerged()[1]}")
+
+
+# stream class definition, lines added by the print functions are written to a file handle instead of a list
+class Stream:
+    # stream constructor
+    def __init__(self, file):
+        self.file = file                    # file handle opened for writing
+        self.lines = 0                      # number of lines written
+
+    # stream destructor
+    def __del__(self):
+        pass
+
+    # getter functions
+    def getlines(self):                     # number of lines written
+        return self.lines
+
+    # add line to file, replacing list.append
+    def append(self, line):
+        self.file.write(line)
+        self.lines += 1
+
+    # add lines to file, replacing list.extend
+    def extend(self, lines):
+        self.file.writelines(lines)
+        self.lines += len(lines)
+
+
+# redundant-command pass of .rpl files, replacing the list or stream the lines are added to
+# lines without effect are removed before they are passed on:
+# - deletion of geometry not created since the last ic_empty_tetin (every entity is created once)
+# - end of undo step of a blocking operation, directly followed by the start of the same operation (one undo step for consecutive operations)
+class Prune:
+    # prune constructor
+    def __init__(self, list):
+        self.list = list                    # list or stream receiving the remaining lines
+        self.created = None                 # names of geometry created since the last ic_empty_tetin, None if the geometry is unknown
+        self.pending = None                 # end of undo step, held back until the next line is known
+        self.removed = 0                    # number of lines removed
+
+    # prune destructor
+    def __del__(self):
+        pass
+
+    # getter functions
+    def getlist(self):                      # list or stream receiving the remaining lines
+        return self.list
+    def getremoved(self):                   # number of lines removed
+        return self.removed
+
+    # remaining lines of lines, held back end of undo step is added to the next lines (or by flush)
+    def filter(self, lines):
+        kept = []
+        for line in lines:
+            # end of undo step is held back, removed with the start of the same operation
+            if self.pending is not None:
+                if line.startswith("ic_hex_undo_major_start") and line[23:] == self.pending[21:]:
+                    self.pending = None
+                    self.removed += 2
+                    continue
+                kept.append(self.pending)
+                self.pending = None
+            if line.startswith("ic_hex_undo_major_end"):
+                self.pending = line
+                continue
+
+            # geometry
+            if line.startswith("ic_empty_tetin"):
+                self.created = set()
+            elif line.startswith(("ic_point ", "ic_curve ", "ic_surface ")):
+                if self.created is not None:
+                    self.created.add(line.split()[3])
+            elif line.startswith("ic_delete_geometry ") and self.created is not None:
+                words = line.split()
+                if len(words) == 5 and words[2] == "names" and words[3] not in self.created:
+                    self.removed += 1
+                    continue
+            kept.append(line)
+        return kept
+
+    # add line, replacing list.append
+    def append(self, line):
+        self.list.extend(self.filter([line]))
+
+    # add lines, replacing list.extend
+    def extend(self, lines):
+        self.list.extend(self.filter(lines))
+
+    # add held back line at end of file
+    def flush(self):
+        if self.pending is not None:
+            self.list.append(self.pending)
+            self.pending = None
+        return self.list
+
+
+# replay class definition, stand-in for ICEM replaying a .rpl file (subset of ICEM Tcl written by the scripts) to validate and benchmark scripts
+# entities and vertices are kept in hash maps, the blocking is a lattice of vertex lines per axis (vertex and block numbers as in ICEM)
+class Replay:
+    # replay constructor
+    def __init__(self):
+        self.pnts = {}                      # point name: coordinates
+        self.crvs = {}                      # curve name: point names
+        self.srfs = {}                      # surface name: curve names
+        self.parts = {"VORFN": 0}           # part name: number of associated entities (VORFN: internal part of deleted blocks)
+        self.geomparts = {}                 # entity name: part name
+        self.dim = 0                        # dimensions of blocking, 0 if no blocking is loaded
+        self.body = None                    # part of initial block (fluid)
+        self.lines = []                     # vertex lines per axis in order, lines are numbered per axis
+        self.ranks = []                     # vertex line: position per axis
+        self.verts = {}                     # vertex number: vertex lines
+        self.blks = {}                      # block number: first vertex lines of block
+        self.cells = {}                     # first vertex lines of block: block number
+        self.families = {}                  # block number: part
+        self.meshes = []                    # first vertex line of edge: meshing list [rule, n, h1rel, h2rel, r1, r2, lmax] and reversed direction per axis (copied to parallel edges)
+        self.splits = {}                    # (axis, vertex line) created by split: split point
+        self.moved = {}                     # vertex number: associated point
+        self.projected = {}                 # edge (vertex numbers): associated curve
+        self.marked = []                    # marked blocks
+        self.nextvert = 0                   # number of next created vertex
+        self.nextblk = 0                    # number of next created block
+        self.undo = []                      # open undo groups and undo steps
+        self.counts = {}                    # command: number of calls
+        self.times = {}                     # command: run time [s]
+        self.errors = []                    # (line number, message)
+
+    # replay destructor
+    def __del__(self):
+        pass
+
+    # getter functions
+    def getcounts(self):                    # command: number of calls
+        return self.counts
+    def gettimes(self):                     # command: run time [s]
+        return self.times
+    def geterrors(self):                    # (line number, message) of invalid commands
+        return self.errors
+    def getentities(self):                  # number of points, curves, surfaces and parts
+        return len(self.pnts), len(self.crvs), len(self.srfs), len(self.parts) - 1
+    def getdim(self):                       # dimensions of blocking, 0 if no blocking is loaded
+        return self.dim
+    def getlattice(self):                   # number of vertex lines per axis
+        return [len(lines) for lines in self.lines]
+    def getverts(self):                     # number of vertices
+        return len(self.verts)
+    def getvert(self, num):                 # vertex lines of vertex
+        return self.verts[num]
+    def getblocks(self, family=None):       # block numbers (of part family)
+        return [blk for blk in self.blks if family is None or self.families[blk] == family]
+    def getundo(self):                      # undo groups and undo steps not closed
+        return self.undo
+    def getbody(self):                      # part of initial block (fluid), None if no blocking is loaded
+        return self.body if self.dim else None
+    def getlines(self, axis):               # vertex lines of axis in order
+        return self.lines[axis]
+    def getblock(self, blk):                # first vertex lines of block
+        return self.blks[blk]
+    def getfamily(self, lines):             # part of block with first vertex lines, None outside of the blocking
+        return self.families.get(self.cells.get(tuple(lines)))
+    def getmesh(self, axis, line):          # meshing list and reversed direction of edges from vertex line, None if not meshed
+        return self.meshes[axis].get(line)
+
+    # invalid line outside of commands (e.g. Tcl loops)
+    def adderror(self, lineno, message):
+        self.errors.append((lineno, message))
+
+    # number of cells of blocks of part family from the node counts of the edges, None if an edge is not meshed
+    def getcells(self, family):
+        cells = 0
+        for blk in self.getblocks(family):
+            count = 1
+            for axis, line in enumerate(self.blks[blk]):
+                if line not in self.meshes[axis]:
+                    return None
+                count *= self.meshes[axis][line][0][1] - 1
+            cells += count
+        return cells
+
+    # physical coordinate (0: x, 1: y, 2: z) and coordinates of the vertex lines per axis, None for vertex lines without associated geometry
+    # the coordinates are taken from the points of moved vertices, the split points and the curves of projected edges (constant along vertex lines)
+    # raises ValueError if the axes or coordinates are ambiguous (blocking not aligned with the coordinate axes)
+    def getgrid(self, tol=1e-9):
+        # physical coordinate of axis: varying along projected edges, constant along vertex lines
+        phys = [set(range(self.dim)) for axis in range(self.dim)]
+        for (vert1, vert2), crv in self.projected.items():
+            axis = self.edge(vert1, vert2)[0]
+            pnt1, pnt2 = (self.pnts[pnt] for pnt in self.crvs[crv])
+            varying = {coord for coord in range(self.dim) if abs(pnt1[coord] - pnt2[coord]) > tol}
+            for other in range(self.dim):
+                phys[other] = phys[other] & varying if other == axis else phys[other] - varying
+        points = [{} for axis in range(self.dim)]
+        for vert, pnt in self.moved.items():
+            for axis, line in enumerate(self.verts[vert]):
+                points[axis].setdefault(line, []).append(self.pnts[pnt])
+        for (axis, line), pnt in self.splits.items():
+            points[axis].setdefault(line, []).append(self.pnts[pnt])
+        for axis in range(self.dim):
+            phys[axis] = {coord for coord in phys[axis] if all(max(pnt[coord] for pnt in pnts) - min(pnt[coord] for pnt in pnts) <= tol for pnts in points[axis].values())}
+        if any(len(coords) != 1 for coords in phys) or len(set.union(*phys)) != self.dim:
+            raise ValueError("axes of blocking not aligned with the coordinate axes")
+        phys = [coords.pop() for coords in phys]
+
+        # coordinates of vertex lines, projected edges lie on their curves
+        for (vert1, vert2), crv in self.projected.items():
+            axis = self.edge(vert1, vert2)[0]
+            for other, line in enumerate(self.verts[vert1]):
+                if other != axis:
+                    points[other].setdefault(line, []).append(self.pnts[self.crvs[crv][0]])
+        coords = []
+        for axis in range(self.dim):
+            coords.append([])
+            for line in self.lines[axis]:
+                vals = [pnt[phys[axis]] for pnt in points[axis].get(line, [])]
+                if vals and max(vals) - min(vals) > tol:
+                    raise ValueError(f"vertex line {line} of axis {axis} not planar")
+                coords[axis].append(vals[0] if vals else None)
+        return phys, coords
+
+    # boundary geometry: part and lower and upper corner of the bounding box of surfaces (3D) or curves (2D) associated to parts
+    def getpatches(self):
+        patches = []
+        for name, ents in (self.srfs if self.dim == 3 else self.crvs).items():
+            pnts = [self.pnts[pnt] for crv in ents for pnt in self.crvs[crv]] if self.dim == 3 else [self.pnts[pnt] for pnt in ents]
+            patches.append((self.geomparts[name], np.min(pnts, axis=0), np.max(pnts, axis=0)))
+        return patches
+
+    # replay command (list of Tcl words, braces of lists removed), lineno: line number in .rpl file for error messages
+    def execute(self, words, lineno):
+        start = time.perf_counter()
+        command = words[0]
+        handler = getattr(self, command, None) if command.startswith("ic_") else None
+        try:
+            if handler is not None:
+                handler(words[1:])
+        except (IndexError, KeyError, ValueError) as error:
+            self.errors.append((lineno, f"{command}: {error if str(error) else 'invalid arguments'}"))
+        self.counts[command] = self.counts.get(command, 0) + 1
+        self.times[command] = self.times.get(command, 0.0) + time.perf_counter() - start
+
+    # check functions, raise ValueError for missing entities
+    def pnt(self, name):
+        if name not in self.pnts:
+            raise ValueError(f"point {name} does not exist")
+        return name
+    def crv(self, name):
+        if name not in self.crvs:
+            raise ValueError(f"curve {name} does not exist")
+        return name
+    def part(self, name):
+        if name not in self.parts:
+            raise ValueError(f"part {name} does not exist")
+        return name
+    def vert(self, num):
+        if self.dim == 0:
+            raise ValueError("no blocking loaded")
+        if int(num) not in self.verts:
+            raise ValueError(f"vertex {num} does not exist")
+        return int(num)
+
+    # axis and first vertex line of the edge between vertices vert1 and vert2, ValueError if the vertices are not neighbours
+    def edge(self, vert1, vert2):
+        lines1, lines2 = self.verts[self.vert(vert1)], self.verts[self.vert(vert2)]
+        axes = [axis for axis in range(self.dim) if lines1[axis] != lines2[axis]]
+        if len(axes) != 1 or abs(self.ranks[axes[0]][lines1[axes[0]]] - self.ranks[axes[0]][lines2[axes[0]]]) != 1:
+            raise ValueError(f"vertices {vert1} and {vert2} are not connected by an edge")
+        axis = axes[0]
+        return axis, self.lines[axis][min(self.ranks[axis][lines1[axis]], self.ranks[axis][lines2[axis]])]
+
+    # entity created in part, existing entities are reported
+    def create(self, entities, name, val, part):
+        if name in entities:
+            raise ValueError(f"{name} already exists")
+        entities[name] = val
+        self.parts[part] = self.parts.get(part, 0) + 1
+        self.geomparts[name] = part
+
+    # geometry
+    def ic_empty_tetin(self, args):
+        self.pnts.clear()
+        self.crvs.clear()
+        self.srfs.clear()
+        self.geomparts.clear()
+        self.parts = {part: 0 for part in self.parts}
+    def ic_geo_new_family(self, args):
+        self.parts.setdefault(args[0], 0)
+    def ic_boco_set_part_color(self, args):
+        self.part(args[0])
+    def ic_point(self, args):
+        self.create(self.pnts, args[2], tuple(float(val) for val in args[3].split(",")), args[1])
+    def ic_curve(self, args):
+        self.create(self.crvs, args[2], tuple(self.pnt(name) for name in args[3].split()), args[1])
+    def ic_surface(self, args):
+        self.create(self.srfs, args[2], tuple(self.crv(name) for name in args[3].split("{")[-1].strip("} ").split()), args[1])
+    def ic_delete_geometry(self, args):
+        for name in args[2].split():
+            for entities in (self.pnts, self.crvs, self.srfs):
+                if entities.pop(name, None) is not None:
+                    self.parts[self.geomparts.pop(name)] -= 1
+    def ic_geo_create_volume(self, args):
+        self.parts[args[2]] = self.parts.get(args[2], 0) + 1
+    def ic_geo_set_part(self, args):
+        entities = {"point": self.pnts, "curve": self.crvs, "surface": self.srfs}[args[0]]
+        for name in args[1].split():
+            if name not in entities:
+                raise ValueError(f"{args[0]} {name} does not exist")
+            self.parts[self.geomparts[name]] -= 1
+            self.parts[args[2]] = self.parts.get(args[2], 0) + 1
+            self.geomparts[name] = args[2]
+    def ic_delete_empty_parts(self, args):
+        self.parts = {part: count for part, count in self.parts.items() if count > 0 or part == "VORFN"}
+
+    # undo groups and undo steps
+    def ic_undo_group_begin(self, args):
+        self.undo.append("group")
+    def ic_undo_group_end(self, args):
+        if not self.undo or self.undo.pop() != "group":
+            raise ValueError("no open undo group")
+    def ic_hex_undo_major_start(self, args):
+        self.undo.append(args[0])
+    def ic_hex_undo_major_end(self, args):
+        if not self.undo or self.undo.pop() != args[0]:
+            raise ValueError(f"no open undo step {args[0]}")
+
+    # blocking: initial block surrounded by VORFN blocks (4 vertex lines per axis), numbering of 2D blocking as in ICEM
+    def initialize(self, dim, part):
+        self.part(part)
+        self.dim = dim
+        self.body = part
+        self.lines = [list(range(4)) for axis in range(dim)]
+        self.ranks = [{line: line for line in range(4)} for axis in range(dim)]
+        self.verts = {(idx[0] + 4*idx[1] + 16*idx[2] if dim == 3 else 1 + 2*idx[0] + 8*idx[1]): idx for idx in itertools.product(range(4), repeat=dim)}
+        self.blks = {sum(idx[axis]*3**axis for axis in range(dim)): idx for idx in itertools.product(range(3), repeat=dim)}
+        self.cells = {idx: blk for blk, idx in self.blks.items()}
+        self.families = {blk: part if idx == (1,)*dim else "VORFN" for blk, idx in self.blks.items()}
+        self.meshes = [{} for axis in range(dim)]
+        self.splits.clear()
+        self.moved.clear()
+        self.projected.clear()
+        self.marked = []
+        self.nextvert = 64 if dim == 3 else 32
+        self.nextblk = 27 if dim == 3 else 9
+    def ic_hex_initialize_blocking(self, args):
+        self.initialize(3, args[1])
+    def ic_hex_initialize_mesh(self, args):
+        self.initialize(2, args[3])
+    def ic_hex_unload_blocking(self, args):
+        self.dim = 0
+        self.verts = {}
+        self.blks = {}
+
+    # split of all blocks along the edge between vertices, new vertices and blocks are numbered across the other axes (last axis fastest)
+    # the new blocks are placed after the split (in direction of the axis), the existing blocks keep their numbers
+    def ic_hex_split_grid(self, args):
+        axis, first = self.edge(args[0], args[1])
+        self.pnt(args[2])
+        for part in args[4:]:
+            self.part(part)
+        line = len(self.lines[axis])
+        start = self.ranks[axis][first] + 1
+        self.lines[axis].insert(start, line)
+        self.splits[(axis, line)] = args[2]
+        self.ranks[axis].update(zip(self.lines[axis][start:], range(start, len(self.lines[axis]))))     # positions of vertex lines after the split
+        others = [lines for other, lines in enumerate(self.lines) if other != axis]
+        for idx in itertools.product(*others):
+            self.verts[self.nextvert] = idx[:axis] + (line,) + idx[axis:]
+            self.nextvert += 1
+        for idx in itertools.product(*[lines[:-1] for lines in others]):
+            blk = self.cells[idx[:axis] + (first,) + idx[axis:]]
+            self.blks[self.nextblk] = idx[:axis] + (line,) + idx[axis:]
+            self.cells[self.blks[self.nextblk]] = self.nextblk
+            self.families[self.nextblk] = self.families[blk]
+            self.nextblk += 1
+        if first in self.meshes[axis]:
+            del self.meshes[axis][first]
+    def ic_hex_mark_blocks(self, args):
+        if args[0] == "unmark":
+            self.marked = []
+        elif args[0] == "superblock":
+            if self.dim == 0 or int(args[1]) not in self.blks:
+                raise ValueError(f"block {args[1]} does not exist")
+            self.marked.append(int(args[1]))
+    def ic_hex_change_element_id(self, args):
+        for blk in self.marked:
+            self.families[blk] = args[0]
+
+    # associations and meshing
+    def ic_hex_move_node(self, args):
+        self.moved[self.vert(args[0])] = self.pnt(args[1])
+    def ic_hex_set_edge_projection(self, args):
+        self.edge(args[0], args[1])
+        self.projected[(int(args[0]), int(args[1]))] = self.crv(args[4])
+    def ic_hex_set_mesh(self, args):
+        axis, first = self.edge(args[0], args[1])
+        vals = dict(zip(args[2:14:2], args[3:14:2]))
+        mesh = [args[14], int(vals["n"]), float(vals["h1rel"]), float(vals["h2rel"]), float(vals["r1"]), float(vals["r2"]), float(vals["lmax"])]
+        self.meshes[axis][first] = (mesh, self.verts[int(args[0])][axis] != first)
+
+
+################################################################ EXPORT OBJECTS #################################################################
+# structured mesh class definition, nodes and cells of the blocks of one part on the lattice of vertex lines (mesh export without ICEM)
+# node indices per axis run over the vertex lines spanned by the blocks, cells of other blocks within this range are inactive
+class StructMesh:
+    # structured mesh constructor
+    def __init__(self, name, phys, nodes, blocks, patches):
+        self.name = name                    # part of meshed blocks (fluid)
+        self.dim = len(nodes)               # dimensions of mesh
+        self.phys = phys                    # physical coordinate (0: x, 1: y, 2: z) per axis
+        self.nodes = nodes                  # node coordinates per axis in order
+        self.blocks = blocks                # block number: node index ranges (start, stop) per axis
+        self.patches = patches              # boundary faces of blocks: (part, axis, node index, side, node index ranges per axis), side 1: cells at higher index
+
+    # structured mesh destructor
+    def __del__(self):
+        pass
+
+    # getter functions
+    def getname(self):                      # part of meshed blocks
+        return self.name
+    def getdim(self):                       # dimensions of mesh
+        return self.dim
+    def getphys(self):                      # physical coordinate per axis
+        return self.phys
+    def getnodes(self, axis):               # node coordinates of axis
+        return self.nodes[axis]
+    def getblocks(self):                    # block number: node index ranges per axis
+        return self.blocks
+    def getpatches(self, part=None):        # boundary faces of blocks (of part)
+        return [patch for patch in self.patches if part is None or patch[0] == part]
+    def getparts(self):                     # parts of boundary faces in order of first occurrence
+        return list(dict.fromkeys(patch[0] for patch in self.patches))
+    def getshape(self):                     # number of nodes per axis
+        return tuple(axisnodes.size for axisnodes in self.nodes)
+    def getcells(self):                     # number of cells
+        return sum(int(np.prod([stop - start for start, stop in ranges])) for ranges in self.blocks.values())
+
+    # cells of meshed blocks (boolean array, cell indices per axis)
+    def getactive(self):
+        active = np.zeros(tuple(n - 1 for n in self.getshape()), dtype=bool)
+        for ranges in self.blocks.values():
+            active[tuple(slice(start, stop) for start, stop in ranges)] = True
+        return active
+
+    # nodes of cells of meshed blocks (boolean array, node indices per axis)
+    def getused(self):
+        used = np.zeros(self.getshape(), dtype=bool)
+        for ranges in self.blocks.values():
+            used[tuple(slice(start, stop + 1) for start, stop in ranges)] = True
+        return used
+
+    # coordinates of nodes (rows x, y(, z)), idx: node indices per axis (arrays of equal size)
+    def getcoords(self, idx):
+        coords = np.empty((idx[0].size, self.dim))
+        for axis in range(self.dim):
+            coords[:, self.phys[axis]] = self.nodes[axis][idx[axis]]
+        return coords
+
+    # direction of the normal of faces normal to axis, nodes in order of the other axes (cyclic, 3D: (0, 0), (1, 0), (1, 1), (0, 1), 2D: 0, 1)
+    # 2D normal: (n1 - n0) x z, returns 1 if the right-hand normal points to higher node indices of axis, otherwise -1
+    def getorient(self, axis):
+        others = [(axis + k) % self.dim for k in range(1, self.dim)]
+        corners = [(0, 0), (1, 0), (1, 1), (0, 1)] if self.dim == 3 else [(0,), (1,)]
+        idx = [np.zeros(len(corners), dtype=np.int64) for other in range(self.dim)]
+        for k, corner in enumerate(corners):
+            for other, offset in zip(others, corner):
+                idx[other][k] = offset
+        pnts = self.getcoords(idx)
+        if self.dim == 3:
+            normal = np.cross(pnts[2] - pnts[0], pnts[3] - pnts[1])
+        else:
+            normal = np.array([pnts[1][1] - pnts[0][1], pnts[0][0] - pnts[1][0]])
+        return 1 if normal[self.phys[axis]]*(self.nodes[axis][1] - self.nodes[axis][0]) > 0 else -1
+
+
+# mesh buffer class definition, array of the mesh export in memory or in a memory-mapped .npy file (out-of-core export of large meshes)
+# rows of the first axis of .npy files are mapped on access only, memory of the process stays bounded by the rows in use
+class MeshBuffer:
+    # mesh buffer constructor, file: path of new .npy file (filled with zeros), array in memory if empty
+    def __init__(self, file, dtype, shape):
+        self.file = file                    # path of .npy file, array in memory if empty
+        self.dtype = np.dtype(dtype)        # data type of entries
+        self.shape = tuple(shape)           # shape of array
+        self.array = None                   # array in memory
+        self.handle = None                  # open .npy file
+        self.offset = 0                     # start of data in .npy file [bytes]
+        if file:
+            mapped = np.lib.format.open_memmap(file, mode='w+', dtype=self.dtype, shape=self.shape)
+            self.offset = mapped.offset
+            del mapped
+            self.handle = open(file, 'r+b')
+        else:
+            self.array = np.zeros(self.shape, dtype=self.dtype)
+
+    # mesh buffer destructor
+    def __del__(self):
+        pass
+
+    # getter functions
+    def getfile(self):                      # path of .npy file
+        return self.file
+    def getdtype(self):                     # data type of entries
+        return self.dtype
+    def getshape(self):                     # shape of array
+        return self.shape
+    def getmapped(self):                    # array in memory-mapped file
+        return self.array is None
+
+    # rows start to stop of the first axis (view of array or mapped part of file), changes of mapped rows are written to the file when the rows are deleted
+    def rows(self, start, stop, write=False):
+        if self.array is not None:
+            return self.array[start:stop]
+        shape = (max(stop - start, 0),) + self.shape[1:]
+        size = int(np.prod(shape, dtype=np.int64))*self.dtype.itemsize
+        if not size:
+            return np.zeros(shape, dtype=self.dtype)
+        first = self.offset + start*(size//shape[0])
+        aligned = first - first % mmap.ALLOCATIONGRANULARITY
+        mapped = mmap.mmap(self.handle.fileno(), first - aligned + size, access=mmap.ACCESS_WRITE if write else mmap.ACCESS_READ, offset=aligned)
+        return np.ndarray(shape, dtype=self.dtype, buffer=mapped, offset=first - aligned)
+
+    # close .npy file (rows of the file are no longer accessible)
+    def close(self):
+        if self.handle is not None:
+            self.handle.close()
+            self.handle = None
+
+
+################################################################ CONFIG OBJECTS #################################################################
+# config file class definition, contents of a .conf file parsed once
+class ConfFile:
+    # config file constructor
+    def __init__(self, file, geomtype, geoms, meshes):
+        self.file = file                    # path of config file
+        self.geomtype = geomtype            # geometry type, e.g. "3D-horizontal-1", None if not specified
+        self.geoms = geoms                  # geometry values per dimension in [m], {"xgeom": {name: val}, ...}, None if no value
+        self.meshes = meshes                # meshing list per section, {name: [rule, n, h1rel, h2rel, r1, r2, lmax]}, ["N/A"] if not meshed
+
+    # config file destructor
+    def __del__(self):
+        pass
+
+    # getter functions
+    def getfile(self):                      # path of config file
+        return self.file
+    def getgeomtype(self):                  # geometry type
+        return self.geomtype
+    def getgeoms(self, dim):                # geometry values of dimension ("xgeom", "ygeom" or "zgeom"), empty if not specified
+        return self.geoms.get(dim, {})
+    def getmesh(self, name):                # meshing list of section, None if not specified
+        return self.meshes.get(name)
+    def getsects(self):                     # names of meshed sections
+        return list(self.meshes)
+
+
+################################################################# CACHE OBJECTS #################################################################
+# mesh cache class definition
+class MeshCache:
+    # mesh cache constructor
+    def __init__(self, size, file, filesize):
+        self.size = size                    # maximum number of entries in memory
+        self.file = file                    # path of SQLite file, no persistent cache if empty
+        self.filesize = filesize            # maximum number of entries in SQLite file
+        self.entries = OrderedDict()        # entries in memory, least recently used first
+        self.db = None                      # connection to SQLite file, opened on first use
+        self.hits = 0                       # number of entries found in memory
+        self.diskhits = 0                   # number of entries found in SQLite file
+        self.misses = 0                     # number of entries not found
+
+    # mesh cache destructor
+    def __del__(self):
+        if self.db is not None:
+            self.db.close()
+
+    # getter functions
+    def gethits(self):                      # number of entries found (memory and SQLite file)
+        return self.hits + self.diskhits
+    def getdiskhits(self):                  # number of entries found in SQLite file
+        return self.diskhits
+    def getmisses(self):                    # number of entries not found
+        return self.misses
+    
+    # open SQLite file
+    def connect(self):
+        if self.db is None and self.file:
+            self.db = sqlite3.connect(self.file, timeout=30.0)
+            self.db.execute("DROP TABLE IF EXISTS mesh")        # entries of earlier versions, keyed on inputs rounded to the mesh precision
+            self.db.execute("CREATE TABLE IF NOT EXISTS distr (key TEXT PRIMARY KEY, rule TEXT, n INTEGER, h1rel REAL, h2rel REAL, r1 REAL, r2 REAL, lmax REAL, used INTEGER)")
+            self.db.execute("CREATE INDEX IF NOT EXISTS distr_used ON distr (used)")
+        return self.db
+    
+    # look up list of keys, returns list of entries (None if not found)
+    def getmany(self, keys):
+        found = [None]*len(keys)
+        if self.size <= 0:
+            self.misses += len(keys)
+            return found
+        
+        # entries in memory
+        missing = []
+        for i, key in enumerate(keys):
+            if key in self.entries:
+                self.entries.move_to_end(key)
+                found[i] = self.entries[key]
+                self.hits += 1
+            else:
+                missing.append(i)
+        
+        # entries in SQLite file
+        db = self.connect()
+        if db is not None and len(missing) > 0:
+            stored = {}
+            for start in range(0, len(missing), 500):
+                dbkeys = [repr(keys[i]) for i in missing[start:start + 500]]
+                query = "SELECT key, rule, n, h1rel, h2rel, r1, r2, lmax FROM distr WHERE key IN (" + ",".join("?"*len(dbkeys)) + ")"
+                for row in db.execute(query, dbkeys):
+                    stored[row[0]] = row[1:]
+            if len(stored) > 0:
+                # mark entries as recently used
+                db.executemany("UPDATE distr SET used = (SELECT IFNULL(MAX(used), 0) + 1 FROM distr) WHERE key = ?", [(key,) for key in stored])
+                db.commit()
+            for i in missing:
+                entry = stored.get(repr(keys[i]))
+                if entry is not None:
+                    found[i] = entry
+                    self.store(keys[i], entry)
+                    self.diskhits += 1
+        
+        self.misses += sum(entry is None for entry in found)
+        return found
+    
+    # add entry to memory
+    def store(self, key, entry):
+        self.entries[key] = entry
+        self.entries.move_to_end(key)
+        # evict least recently used entries
+        while len(self.entries) > self.size:
+            self.entries.popitem(last=False)
+
+    # add list of keys and entries
+    def putmany(self, keys, entries):
+        if self.size <= 0:
+            return
+        for key, entry in zip(keys, entries):
+            self.store(key, entry)
+        
+        # entries in SQLite file
+        db = self.connect()
+        if db is not None and len(keys) > 0:
+            used = db.execute("SELECT IFNULL(MAX(used), 0) + 1 FROM distr").fetchone()[0]
+            db.executemany("INSERT OR REPLACE INTO distr VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", [(repr(key),) + tuple(entry) + (used,) for key, entry in zip(keys, entries)])
+            # evict least recently used entries
+            count = db.execute("SELECT COUNT(*) FROM distr").fetchone()[0]
+            if count > self.filesize:
+                db.execute("DELETE FROM distr WHERE key IN (SELECT key FROM distr ORDER BY used LIMIT ?)", (count - self.filesize,))
+            db.commit()
+
+    # remove all entries and reset counters
+    def clear(self):
+        self.entries.clear()
+        db = self.connect()
+        if db is not None:
+            db.execute("DELETE FROM distr")
+            db.commit()
+        self.hits = 0
+        self.diskhits = 0
+        self.misses = 0
+
+
+# config file catalog class definition, paths, geometry types and geometry values of .conf files in SQLite file
+class ConfCatalog:
+    # config file catalog constructor
+    def __init__(self, file):
+        self.file = file                    # path of SQLite file, no catalog if empty
+        self.db = None                      # connection to SQLite file, opened on first use
+
+    # config file catalog destructor
+    def __del__(self):
+        if self.db is not None:
+            self.db.close()
+
+    # getter functions
+    def getfile(self):                      # path of SQLite file
+        return self.file
+    
+    # open SQLite file
+    def connect(self):
+        if self.db is None and self.file:
+            self.db = sqlite3.connect(self.file, timeout=30.0)
+            self.db.execute("CREATE TABLE IF NOT EXISTS dirs (path TEXT PRIMARY KEY, parent TEXT, mtime INTEGER)")
+            self.db.execute("CREATE TABLE IF NOT EXISTS confs (path TEXT PRIMARY KEY, dir TEXT, name TEXT, mtime INTEGER, size INTEGER, geomtype TEXT)")
+            self.db.execute("CREATE TABLE IF NOT EXISTS params (path TEXT, dim TEXT, name TEXT, val REAL)")
+            self.db.execute("CREATE INDEX IF NOT EXISTS params_path ON params (path)")
+            self.db.execute("CREATE INDEX IF NOT EXISTS params_val ON params (name, val)")
+        return self.db
+
+    # condition for paths in root folder and subfolders
+    def inroot(self, root, column="path"):
+        return f"({column} = ? OR substr({column}, 1, ?) = ?)", [root, len(root) + len(os.sep), root + os.sep]
+    
+    # directories in root folder and subfolders, {path: (parent, mtime)}
+    def getdirs(self, root):
+        cond, args = self.inroot(root)
+        return {row[0]: row[1:] for row in self.connect().execute(f"SELECT path, parent, mtime FROM dirs WHERE {cond}", args)}
+    
+    # config files in root folder and subfolders, {path: (dir, mtime, size)}
+    def getconfs(self, root):
+        cond, args = self.inroot(root)
+        return {row[0]: row[1:] for row in self.connect().execute(f"SELECT path, dir, mtime, size FROM confs WHERE {cond}", args)}
+    
+    # geometry type of config file with modification time and size of the file when it was read, ((mtime, size), geomtype), None if not in catalog
+    def getgeomtype(self, path):
+        row = self.connect().execute("SELECT mtime, size, geomtype FROM confs WHERE path = ?", (path,)).fetchone()
+        return None if row is None else (tuple(row[:2]), row[2])
+
+    # add and remove directories and config files
+    # dirs: [(path, parent, mtime)], confs: [(path, dir, mtime, size, obj.ConfFile)], olddirs and oldconfs: paths to be removed
+    def update(self, dirs, confs, olddirs, oldconfs):
+        db = self.connect()
+        if len(dirs) + len(confs) + len(olddirs) + len(oldconfs) == 0:
+            return
+        paths = [(path,) for path in oldconfs] + [(conf[0],) for conf in confs]
+        db.executemany("DELETE FROM dirs WHERE path = ?", [(path,) for path in olddirs])
+        db.executemany("DELETE FROM confs WHERE path = ?", paths)
+        db.executemany("DELETE FROM params WHERE path = ?", paths)
+        db.executemany("INSERT OR REPLACE INTO dirs VALUES (?, ?, ?)", dirs)
+        db.executemany("INSERT INTO confs VALUES (?, ?, ?, ?, ?, ?)", [(path, dir, os.path.basename(path), mtime, size, conf.getgeomtype()) for path, dir, mtime, size, conf in confs])
+        db.executemany("INSERT INTO params VALUES (?, ?, ?, ?)", [(path, dim, name, val) for path, dir, mtime, size, conf in confs for dim in ["xgeom", "ygeom", "zgeom"] for name, val in conf.getgeoms(dim).items()])
+        db.commit()
+
+    # config files in root folder and subfolders with filename containing name (exact: filename equal to name)
+    def find(self, root, name, exact=False):
+        cond, args = self.inroot(root)
+        match = "name = ?" if exact else "instr(name, ?) > 0"
+        return [row[0] for row in self.connect().execute(f"SELECT path FROM confs WHERE {cond} AND {match} ORDER BY path", args + [name])]
+    
+    # geometry values of config files in root folder and subfolders with geometry type, {path: {name: val}} in [m]
+    def getvalues(self, root, geomtype):
+        cond, args = self.inroot(root, "confs.path")
+        values = {}
+        for path, name, val in self.connect().execute(f"SELECT confs.path, params.name, params.val FROM confs JOIN params ON params.path = confs.path WHERE {cond} AND confs.geomtype = ?", args + [geomtype]):
+            values.setdefault(path, {})[name] = val
+        return values
+    
+    # state of config files in root folder and subfolders with geometry type, changes if files are added, removed or modified
+    def getstate(self, root, geomtype):
+        cond, args = self.inroot(root)
+        return self.connect().execute(f"SELECT COUNT(*), MAX(mtime), SUM(size) FROM confs WHERE {cond} AND geomtype = ?", args + [geomtype]).fetchone()
+
+    # config files in root folder and subfolders by geometry type (None: all types) and geometry values, params: {name: (min, max)} in [m]
+    def search(self, root, geomtype=None, params=None):
+        cond, args = self.inroot(root)
+        query = f"SELECT path FROM confs WHERE {cond}"
+        if geomtype is not None:
+            query += " AND geomtype = ?"
+            args.append(geomtype)
+        for name, (valmin, valmax) in (params or {}).items():
+            query += " AND EXISTS (SELECT 1 FROM params WHERE params.path = confs.path AND params.name = ? AND params.val BETWEEN ? AND ?)"
+            args += [name, valmin, valmax]
+        return [row[0] for row in self.connect().execute(query + " ORDER BY path", args)]